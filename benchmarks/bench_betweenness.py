@@ -0,0 +1,56 @@
+"""Benchmarks for exact betweenness centrality across worker processes.
+
+Exact betweenness runs one BFS per source node; ``parallel_betweenness``
+splits the sources over a process pool. The suite times it for 1, 2, 4
+and 8 workers on sparse scale-free graphs of 10K and 50K nodes. Speedup
+is bounded by the machine's cores, and every worker pays for process
+start-up and one copy of the graph.
+
+Sequential Brandes takes minutes on the 10K-node graph and hours on the
+50K-node one; run a single size with ``python bench_betweenness.py 10000``.
+"""
+
+import os
+import sys
+import time
+
+import networkx as nx
+
+from networkx_mcp.core.betweenness import parallel_betweenness
+
+
+def scale_free_graph(nodes):
+    return nx.barabasi_albert_graph(nodes, 2, seed=42)
+
+
+class ParallelBetweennessSuite:
+    """Wall time of exact betweenness by number of worker processes."""
+
+    params = ([10_000, 50_000], [1, 2, 4, 8])
+    param_names = ["nodes", "workers"]
+    timeout = 6 * 3600
+    number = 1
+    repeat = 1
+
+    def setup(self, nodes, workers):
+        self.graph = scale_free_graph(nodes)
+
+    def time_parallel_betweenness(self, nodes, workers):
+        parallel_betweenness(self.graph, workers)
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or ParallelBetweennessSuite.params[0]
+    print(f"{os.cpu_count()} CPUs")
+    for nodes in sizes:
+        graph = scale_free_graph(nodes)
+        baseline = None
+        for workers in ParallelBetweennessSuite.params[1]:
+            start = time.perf_counter()
+            parallel_betweenness(graph, workers)
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            print(
+                f"{nodes:>6} nodes, {workers} workers: {seconds:8.1f} s "
+                f"({baseline / seconds:.2f}x)"
+            )
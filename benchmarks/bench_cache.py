@@ -0,0 +1,227 @@
+"""Benchmarks for GraphCache.
+
+CacheContentionSuite: reader threads look up a fixed set of hot graphs while a writer thread
+keeps putting other graphs into a full cache, so every put evicts and
+spills a graph to disk. Compares lookups per second of:
+
+- the lock-striped cache, where each tool call does one ``get_or_raise``
+- the previous design, where every lookup held the cache-wide lock and
+  tool calls looked the graph up twice (``name in graphs`` then
+  ``graphs[name]``)
+
+Both share the write path, so the difference is the read path alone.
+
+EvictionPolicySuite: replays a synthetic trace shaped like our traffic
+through a memory-bounded cache under each eviction policy. A few large
+reference graphs, expensive to rebuild, are queried in bursts and then go
+quiet while floods of small scratch graphs come and go. Reports the hit
+rate overall and on reference graphs (most scratch accesses are first
+uses, which no policy can hit), and the total rebuild time of the misses.
+"""
+
+import random
+import tempfile
+import threading
+import time
+
+import networkx as nx
+
+from networkx_mcp.eviction import make_policy
+from networkx_mcp.graph_cache import GraphCache, SpillStore, estimate_graph_bytes
+
+HOT_KEYS = 16
+DURATION = 1.0
+
+
+class SingleLockCache(GraphCache):
+    """The previous read path: every lookup holds the cache-wide lock."""
+
+    def get(self, key):
+        with self._lock:
+            return super().get(key)
+
+
+def _striped_lookup(cache, key):
+    return cache.get_or_raise(key)
+
+
+def _double_lookup(cache, key):
+    if cache.get(key) is None:
+        raise KeyError(key)
+    return cache.get(key)
+
+
+def lookups_per_second(cache_class, lookup, threads, duration=DURATION):
+    """Total lookup rate of ``threads`` readers against one busy writer."""
+    with tempfile.TemporaryDirectory() as spill_dir:
+        cache = cache_class(
+            max_size=HOT_KEYS + 4,
+            max_memory_mb=10**6,
+            cleanup_interval=3600,
+            spill=SpillStore(base_dir=spill_dir),
+        )
+        keys = [f"hot_{i}" for i in range(HOT_KEYS)]
+        for key in keys:
+            cache.put(key, nx.path_graph(10))
+        cold = nx.gnm_random_graph(2000, 8000, seed=1)
+
+        stop = threading.Event()
+        counts = [0] * threads
+
+        def reader(index):
+            n = 0
+            while not stop.is_set():
+                for key in keys:
+                    lookup(cache, key)
+                n += len(keys)
+            counts[index] = n
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                cache.put(f"cold_{i % 8}", cold)
+                # Keep the hot graphs most recently used, so only cold
+                # graphs are evicted
+                for key in keys:
+                    cache.get(key)
+                i += 1
+
+        workers = [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+        workers.append(threading.Thread(target=writer))
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        time.sleep(duration)
+        stop.set()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - start
+        cache.shutdown()
+        return sum(counts) / elapsed
+
+
+class CacheContentionSuite:
+    """Lookups per second with a concurrent writer."""
+
+    params = [1, 4, 8]
+    param_names = ["threads"]
+    timeout = 60
+
+    def track_single_lock_lookups_per_second(self, threads):
+        return lookups_per_second(SingleLockCache, _double_lookup, threads)
+
+    track_single_lock_lookups_per_second.unit = "lookups/s"
+
+    def track_striped_lookups_per_second(self, threads):
+        return lookups_per_second(GraphCache, _striped_lookup, threads)
+
+    track_striped_lookups_per_second.unit = "lookups/s"
+
+
+REFERENCE_GRAPHS = 4
+REFERENCE_BUILD_SECONDS = 5.0
+SCRATCH_BUILD_SECONDS = 0.01
+
+
+def synthetic_trace(events=20_000, seed=0):
+    """Graph keys in access order: reference bursts between scratch floods."""
+    rng = random.Random(seed)
+    trace = []
+    scratch = 0
+    while len(trace) < events:
+        if rng.random() < 0.3:
+            ref = f"ref_{rng.randrange(REFERENCE_GRAPHS)}"
+            for _ in range(rng.randint(10, 40)):
+                trace.append(ref)
+                # The odd scratch graph is used during a burst too
+                if rng.random() < 0.2:
+                    trace.append(f"scratch_{scratch}")
+                    scratch += 1
+        else:
+            for _ in range(rng.randint(20, 120)):
+                key = f"scratch_{scratch}"
+                scratch += 1
+                trace.extend([key] * rng.randint(1, 3))
+    return trace[:events]
+
+
+def replay(trace, policy, pin_references=False):
+    """Hit rate, reference graph hit rate and rebuild seconds of the misses."""
+    reference = nx.gnm_random_graph(5000, 20000, seed=1)
+    scratch = nx.gnm_random_graph(200, 800, seed=2)
+    # Room for half of the reference graphs, or a flood of scratch graphs
+    budget = 2.5 * estimate_graph_bytes(reference)
+    cache = GraphCache(
+        max_size=10**6,
+        max_memory_mb=budget / 1024 / 1024,
+        cleanup_interval=3600,
+        policy=make_policy(policy),
+    )
+    miss_seconds = 0.0
+    reference_accesses = reference_hits = 0
+    for key in trace:
+        is_reference = key.startswith("ref_")
+        reference_accesses += is_reference
+        if cache.get(key) is not None:
+            reference_hits += is_reference
+            continue
+        build_seconds = (
+            REFERENCE_BUILD_SECONDS if is_reference else SCRATCH_BUILD_SECONDS
+        )
+        miss_seconds += build_seconds
+        cache.put(key, reference if is_reference else scratch, build_seconds)
+        if is_reference and pin_references and not cache.pinned():
+            # Pin the first reference graph seen
+            cache.pin(key)
+    stats = cache.get_stats()
+    cache.shutdown()
+    return stats["hit_rate"], reference_hits / reference_accesses, miss_seconds
+
+
+class EvictionPolicySuite:
+    """Hit rates of the eviction policies on a replayed trace."""
+
+    params = ["lru", "lfu", "cost", "lru+pin"]
+    param_names = ["policy"]
+    timeout = 300
+
+    def setup(self, policy):
+        name, _, pin = policy.partition("+")
+        self.hit_rate, self.reference_hit_rate, self.miss_seconds = replay(
+            synthetic_trace(), name, pin_references=bool(pin)
+        )
+
+    def track_hit_rate(self, policy):
+        return self.hit_rate
+
+    track_hit_rate.unit = "ratio"
+
+    def track_reference_hit_rate(self, policy):
+        return self.reference_hit_rate
+
+    track_reference_hit_rate.unit = "ratio"
+
+    def track_miss_seconds(self, policy):
+        return self.miss_seconds
+
+    track_miss_seconds.unit = "seconds"
+
+
+if __name__ == "__main__":
+    suite = CacheContentionSuite()
+    for threads in CacheContentionSuite.params:
+        single = suite.track_single_lock_lookups_per_second(threads)
+        striped = suite.track_striped_lookups_per_second(threads)
+        print(
+            f"{threads} readers: single lock {single:>10,.0f}/s, "
+            f"striped {striped:>10,.0f}/s ({striped / single:.1f}x)"
+        )
+    print()
+    policies = EvictionPolicySuite()
+    for policy in EvictionPolicySuite.params:
+        policies.setup(policy)
+        print(
+            f"{policy:>8}: hit rate {policies.track_hit_rate(policy):.3f}, "
+            f"reference {policies.track_reference_hit_rate(policy):.3f}, "
+            f"rebuild time of misses {policies.track_miss_seconds(policy):6.1f} s"
+        )
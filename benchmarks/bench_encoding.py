@@ -0,0 +1,73 @@
+"""Benchmarks for encoding tool responses.
+
+Compares the old path (``json.dumps`` the result into the text block, then
+``json.dumps`` the whole envelope again) with the single-pass encoder, for
+``export_json`` responses of graphs up to 100K edges.
+"""
+
+import json
+import time
+
+import networkx as nx
+
+from networkx_mcp.core.basic_operations import export_json
+from networkx_mcp.encoding import HAS_ORJSON, dumps, encode_response, text_content
+
+
+def _legacy_encode(result):
+    content = {"content": [{"type": "text", "text": json.dumps(result)}]}
+    return json.dumps({"jsonrpc": "2.0", "id": 1, "result": content}).encode()
+
+
+def _single_pass_encode(result):
+    content = text_content(dumps(result))
+    return encode_response({"jsonrpc": "2.0", "id": 1, "result": content})
+
+
+class ResponseEncodingSuite:
+    """Encoding an export_json response."""
+
+    params = [1_000, 100_000]
+    param_names = ["edges"]
+
+    def setup(self, edges):
+        graph = nx.gnm_random_graph(edges // 4, edges, seed=42)
+        self.result = export_json("g", {"g": graph})
+
+    def time_legacy_double_encode(self, edges):
+        _legacy_encode(self.result)
+
+    def time_single_pass_encode(self, edges):
+        _single_pass_encode(self.result)
+
+    def track_legacy_bytes_per_second(self, edges):
+        return _bytes_per_second(_legacy_encode, self.result)
+
+    track_legacy_bytes_per_second.unit = "bytes/s"
+
+    def track_single_pass_bytes_per_second(self, edges):
+        return _bytes_per_second(_single_pass_encode, self.result)
+
+    track_single_pass_bytes_per_second.unit = "bytes/s"
+
+
+def _bytes_per_second(encode, result, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(encode(result))
+        best = min(best, time.perf_counter() - start)
+    return size / best
+
+
+if __name__ == "__main__":
+    print(f"orjson available: {HAS_ORJSON}")
+    suite = ResponseEncodingSuite()
+    for edges in ResponseEncodingSuite.params:
+        suite.setup(edges)
+        legacy = suite.track_legacy_bytes_per_second(edges)
+        single = suite.track_single_pass_bytes_per_second(edges)
+        print(
+            f"{edges:>7} edges: legacy {legacy / 1e6:7.1f} MB/s, "
+            f"single pass {single / 1e6:7.1f} MB/s ({single / legacy:.1f}x)"
+        )
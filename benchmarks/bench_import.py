@@ -0,0 +1,119 @@
+"""Cold-start benchmark for importing the server.
+
+Runs ``python -X importtime -c "import networkx_mcp.server"`` in a fresh
+interpreter, parses the per-module timings and reports the cumulative
+import time against a target, the slowest modules, and any heavy optional
+stack (plotting, HTTP, pandas/yaml I/O) that got loaded although nothing
+has used it yet. Run as a script to get the report; it exits non-zero
+when the target is missed or a heavy stack is loaded.
+"""
+
+import re
+import subprocess
+import sys
+from typing import List, NamedTuple
+
+MODULE = "networkx_mcp.server"
+
+# Cumulative import time of MODULE that counts as a regression
+TARGET_MS = 500.0
+
+# Stacks that must only load on first use
+HEAVY = (
+    "matplotlib",
+    "requests",
+    "bibtexparser",
+    "pandas",
+    "yaml",
+    "scipy",
+    "numpy",
+    "PIL",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+class ImportRecord(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def import_times(module: str = MODULE) -> List[ImportRecord]:
+    """Per-module import times of ``module`` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    records = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(
+                ImportRecord(
+                    name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2
+                )
+            )
+    return records
+
+
+def cumulative_ms(records: List[ImportRecord], module: str = MODULE) -> float:
+    return next(r.cumulative_us for r in records if r.name == module) / 1000
+
+
+def heavy_modules(records: List[ImportRecord]) -> List[str]:
+    """Top-level heavy packages that were imported."""
+    loaded = {r.name.split(".")[0] for r in records}
+    return [name for name in HEAVY if name in loaded]
+
+
+class ServerImportSuite:
+    """Cold import of the server module."""
+
+    timeout = 120
+
+    def setup(self):
+        # Best of a few runs: the first one also warms the disk cache
+        runs = [import_times() for _ in range(5)]
+        self.records = min(runs, key=cumulative_ms)
+
+    def track_server_import_ms(self):
+        return cumulative_ms(self.records)
+
+    track_server_import_ms.unit = "ms"
+
+    def track_heavy_modules_loaded(self):
+        return len(heavy_modules(self.records))
+
+    track_heavy_modules_loaded.unit = "modules"
+
+
+def report(records: List[ImportRecord], top: int = 15) -> str:
+    total = cumulative_ms(records)
+    lines = [
+        f"{MODULE}: {total:.1f} ms cumulative (target {TARGET_MS:.0f} ms)",
+        "",
+        f"Slowest {top} modules by self time:",
+    ]
+    for r in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]:
+        lines.append(
+            f"  {r.self_us / 1000:8.1f} ms self {r.cumulative_us / 1000:8.1f} ms "
+            f"cumulative  {r.name}"
+        )
+    heavy = heavy_modules(records)
+    lines.append("")
+    lines.append(f"Heavy stacks loaded: {', '.join(heavy) if heavy else 'none'}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    suite = ServerImportSuite()
+    suite.setup()
+    print(report(suite.records))
+    over = suite.track_server_import_ms() > TARGET_MS
+    if over or suite.track_heavy_modules_loaded():
+        sys.exit(1)
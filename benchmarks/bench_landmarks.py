@@ -0,0 +1,94 @@
+"""Benchmarks for point-to-point queries with and without a landmark index.
+
+``LandmarkIndex.shortest_path`` runs A* with lower bounds from the
+distances to a few landmarks; without an index, ``shortest_path`` runs
+``nx.shortest_path`` (bidirectional BFS, or bidirectional Dijkstra with a
+weight). The suite times 100 random pairs on a road-like grid (300 x 300)
+and a scale-free graph (100K nodes) both ways, and the index build per
+landmark count; the index is built in ``setup``, as it is kept on the
+graph between queries.
+"""
+
+import random
+import sys
+import time
+
+import networkx as nx
+
+from networkx_mcp.core.landmarks import build_index
+
+QUERIES = 100
+
+
+def make_graph(kind):
+    if kind == "grid":
+        graph = nx.convert_node_labels_to_integers(nx.grid_2d_graph(300, 300))
+    else:
+        graph = nx.barabasi_albert_graph(100_000, 3, seed=42)
+    rng = random.Random(42)
+    for _, _, data in graph.edges(data=True):
+        data["weight"] = rng.uniform(1, 10)
+    return graph
+
+
+def make_pairs(graph):
+    rng = random.Random(7)
+    nodes = list(graph)
+    return [(rng.choice(nodes), rng.choice(nodes)) for _ in range(QUERIES)]
+
+
+def plain(graph, pairs, weight):
+    for source, target in pairs:
+        nx.shortest_path(graph, source, target, weight=weight)
+
+
+def indexed(graph, index, pairs):
+    for source, target in pairs:
+        index.shortest_path(graph, source, target)
+
+
+class LandmarkQuerySuite:
+    """Wall time of 100 point-to-point queries, indexed or not."""
+
+    params = (["grid", "scale_free"], [None, "weight"], [8, 16])
+    param_names = ["graph", "weight", "landmarks"]
+    timeout = 600
+    number = 1
+    repeat = 1
+
+    def setup(self, kind, weight, landmarks):
+        self.graph = make_graph(kind)
+        self.pairs = make_pairs(self.graph)
+        self.index = build_index(self.graph, landmarks, weight, version=1)
+
+    def time_build(self, kind, weight, landmarks):
+        build_index(self.graph, landmarks, weight, version=2)
+
+    def time_indexed(self, kind, weight, landmarks):
+        indexed(self.graph, self.index, self.pairs)
+
+    def time_plain(self, kind, weight, landmarks):
+        plain(self.graph, self.pairs, weight)
+
+
+if __name__ == "__main__":
+    kinds = sys.argv[1:] or LandmarkQuerySuite.params[0]
+    for kind in kinds:
+        graph = make_graph(kind)
+        pairs = make_pairs(graph)
+        for weight in LandmarkQuerySuite.params[1]:
+            started = time.perf_counter()
+            plain(graph, pairs, weight)
+            single = time.perf_counter() - started
+            print(f"{kind:<10} weight={weight}: plain {single:6.2f} s")
+            for landmarks in LandmarkQuerySuite.params[2]:
+                index = build_index(graph, landmarks, weight, version=1)
+                started = time.perf_counter()
+                indexed(graph, index, pairs)
+                seconds = time.perf_counter() - started
+                print(
+                    f"{kind:<10} weight={weight}, {landmarks:>2} landmarks: "
+                    f"build {index.build_seconds:5.2f} s "
+                    f"({index.stats()['memory_mb']:.1f} MB), "
+                    f"speedup {index.speedup:5.1f}, indexed {seconds:6.2f} s"
+                )
@@ -0,0 +1,83 @@
+"""Benchmarks for batched shortest paths against one query per pair.
+
+``shortest_paths_batch`` runs one search per distinct source and hands
+far targets over to bidirectional pair searches when those are cheaper.
+The suite times batches of 20 sources with 1, 5 and 25 targets each on a
+road-like grid (300 x 300) and a scale-free graph (100K nodes), against
+calling ``nx.shortest_path`` for every pair.
+"""
+
+import random
+import sys
+import time
+
+import networkx as nx
+
+from networkx_mcp.core.paths import shortest_paths_batch
+
+SOURCES = 20
+
+
+def make_graph(kind):
+    if kind == "grid":
+        graph = nx.convert_node_labels_to_integers(nx.grid_2d_graph(300, 300))
+    else:
+        graph = nx.barabasi_albert_graph(100_000, 3, seed=42)
+    rng = random.Random(42)
+    for _, _, data in graph.edges(data=True):
+        data["weight"] = rng.uniform(1, 10)
+    return graph
+
+
+def make_pairs(graph, targets):
+    rng = random.Random(7)
+    nodes = list(graph)
+    return [
+        (s, rng.choice(nodes))
+        for s in rng.sample(nodes, SOURCES)
+        for _ in range(targets)
+    ]
+
+
+def per_pair(graph, pairs, weight):
+    for source, target in pairs:
+        nx.shortest_path(graph, source, target, weight=weight)
+
+
+class ShortestPathsBatchSuite:
+    """Wall time of a batch of pairs, batched or one query per pair."""
+
+    params = (["grid", "scale_free"], [1, 5, 25], [None, "weight"])
+    param_names = ["graph", "targets", "weight"]
+    timeout = 600
+    number = 1
+    repeat = 1
+
+    def setup(self, kind, targets, weight):
+        self.graph = make_graph(kind)
+        self.pairs = make_pairs(self.graph, targets)
+
+    def time_batch(self, kind, targets, weight):
+        shortest_paths_batch(self.graph, self.pairs, weight)
+
+    def time_per_pair(self, kind, targets, weight):
+        per_pair(self.graph, self.pairs, weight)
+
+
+if __name__ == "__main__":
+    kinds = sys.argv[1:] or ShortestPathsBatchSuite.params[0]
+    for kind in kinds:
+        graph = make_graph(kind)
+        for targets in ShortestPathsBatchSuite.params[1]:
+            pairs = make_pairs(graph, targets)
+            for weight in ShortestPathsBatchSuite.params[2]:
+                started = time.perf_counter()
+                shortest_paths_batch(graph, pairs, weight)
+                batch = time.perf_counter() - started
+                started = time.perf_counter()
+                per_pair(graph, pairs, weight)
+                single = time.perf_counter() - started
+                print(
+                    f"{kind:<10} {targets:>2} targets/source, weight={weight}: "
+                    f"batch {batch:6.2f} s, per pair {single:6.2f} s"
+                )
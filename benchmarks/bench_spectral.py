@@ -0,0 +1,69 @@
+"""Benchmarks for PageRank, eigenvector and Katz centrality by engine.
+
+``GraphAlgorithms.centrality_measures`` computes these either with the
+pure-Python NetworkX power iterations (``engine="numpy"``) or, with ``engine="sparse"``, on
+SciPy sparse matrices built from a CSR snapshot: PageRank steps as
+sparse products, eigenvector centrality with ARPACK and Katz centrality
+with a sparse iterative solve. The suite times both engines on random
+digraphs with five edges per node; the snapshot is built in ``setup``,
+as it is kept per graph version between calls.
+
+NetworkX Katz takes about 40 s on the 200K-node graph; run a single size
+with ``python bench_spectral.py 10000``.
+"""
+
+import sys
+import time
+
+import networkx as nx
+
+from networkx_mcp.core.algorithms import GraphAlgorithms
+from networkx_mcp.core.csr import snapshot_of
+
+
+def random_digraph(nodes):
+    return nx.gnm_random_graph(nodes, 5 * nodes, seed=42, directed=True)
+
+
+class SpectralCentralitySuite:
+    """Wall time of one centrality measure by engine."""
+
+    params = (
+        [10_000, 200_000],
+        ["pagerank", "eigenvector", "katz"],
+        ["numpy", "sparse"],
+    )
+    param_names = ["nodes", "measure", "engine"]
+    timeout = 600
+    number = 1
+    repeat = 1
+
+    def setup(self, nodes, measure, engine):
+        self.graph = random_digraph(nodes)
+        if engine == "sparse":
+            # Matrices are built once per graph version, so warm them up
+            GraphAlgorithms.centrality_measures(
+                self.graph, [measure], engine=engine, version=1
+            )
+
+    def time_centrality(self, nodes, measure, engine):
+        GraphAlgorithms.centrality_measures(
+            self.graph, [measure], engine=engine, version=1
+        )
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SpectralCentralitySuite.params[0]
+    for nodes in sizes:
+        graph = random_digraph(nodes)
+        started = time.perf_counter()
+        snapshot_of(graph, version=1)
+        print(f"{nodes:>7} nodes: snapshot {time.perf_counter() - started:.2f} s")
+        for measure in SpectralCentralitySuite.params[1]:
+            for engine in SpectralCentralitySuite.params[2]:
+                started = time.perf_counter()
+                GraphAlgorithms.centrality_measures(
+                    graph, [measure], engine=engine, version=1
+                )
+                seconds = time.perf_counter() - started
+                print(f"{nodes:>7} nodes, {measure:<11} {engine:<8}: {seconds:8.2f} s")
@@ -0,0 +1,104 @@
+"""Latency benchmarks for the stdio transports.
+
+Starts the server as a subprocess and measures the round trip of
+``get_info`` calls, one at a time, with the asyncio stream transport and
+with the reader-thread + ``print`` loop it replaces.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+def _start_server(stream_transport):
+    env = dict(
+        os.environ,
+        NETWORKX_MCP_STREAM_TRANSPORT="true" if stream_transport else "false",
+        NETWORKX_MCP_SUPPRESS_AUTH_WARNING="1",
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "networkx_mcp.server"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        bufsize=0,
+    )
+    _round_trip(proc, {"jsonrpc": "2.0", "id": 0, "method": "initialize"})
+    _round_trip(
+        proc,
+        {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "tools/call",
+            "params": {"name": "create_graph", "arguments": {"name": "bench"}},
+        },
+    )
+    return proc
+
+
+def _round_trip(proc, request):
+    proc.stdin.write(json.dumps(request).encode() + b"\n")
+    return proc.stdout.readline()
+
+
+def _get_info_latencies(proc, count):
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "get_info", "arguments": {"graph": "bench"}},
+    }
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        _round_trip(proc, request)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies
+
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[
+        min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    ]
+
+
+class StdioLatencySuite:
+    """Round trip of get_info over stdin/stdout."""
+
+    params = [True, False]
+    param_names = ["stream_transport"]
+    timeout = 120
+
+    def setup(self, stream_transport):
+        self.proc = _start_server(stream_transport)
+        self.latencies = _get_info_latencies(self.proc, 2000)
+
+    def teardown(self, stream_transport):
+        self.proc.stdin.close()
+        self.proc.wait(timeout=10)
+
+    def track_get_info_p50(self, stream_transport):
+        return _percentile(self.latencies, 0.50) * 1e6
+
+    track_get_info_p50.unit = "us"
+
+    def track_get_info_p99(self, stream_transport):
+        return _percentile(self.latencies, 0.99) * 1e6
+
+    track_get_info_p99.unit = "us"
+
+
+if __name__ == "__main__":
+    suite = StdioLatencySuite()
+    for stream_transport in StdioLatencySuite.params:
+        suite.setup(stream_transport)
+        name = "stream" if stream_transport else "thread+print"
+        print(
+            f"{name:>12}: p50 {suite.track_get_info_p50(stream_transport):7.1f} us, "
+            f"p99 {suite.track_get_info_p99(stream_transport):7.1f} us"
+        )
+        suite.teardown(stream_transport)
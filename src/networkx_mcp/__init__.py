@@ -29,13 +29,21 @@ def _get_graph_manager() -> Any:
 # Only expose version for build-time compatibility
 __all__ = [
     "__version__",
+    "GraphAlgorithms",
+    "GraphManager",
 ]
 
-# Conditionally add classes if dependencies are available
-GraphAlgorithms = _get_graph_algorithms()
-GraphManager = _get_graph_manager()
+_LAZY = {
+    "GraphAlgorithms": _get_graph_algorithms,
+    "GraphManager": _get_graph_manager,
+}
 
-if GraphAlgorithms is not None:
-    __all__.append("GraphAlgorithms")
-if GraphManager is not None:
-    __all__.append("GraphManager")
+
+def __getattr__(name: str) -> Any:
+    # Loaded on first use so that importing the server does not pull in
+    # numpy and the rest of the core package (None if unavailable)
+    if name in _LAZY:
+        value = _LAZY[name]()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,17 +8,18 @@ This module provides specialized functions for academic research including:
 - BibTeX export capabilities
 """
 
+from typing import Any
+
 from .analytics import (
     analyze_author_impact,
     calculate_h_index,
     detect_research_trends,
     find_collaboration_patterns,
 )
-from .citations import (
-    build_citation_network,
-    export_bibtex,
-    recommend_papers,
-    resolve_doi,
+
+# Loaded on first use: citations imports requests and bibtexparser
+_CITATIONS = frozenset(
+    {"build_citation_network", "export_bibtex", "recommend_papers", "resolve_doi"}
 )
 
 __all__ = [
@@ -33,3 +34,11 @@ __all__ = [
     "find_collaboration_patterns",
     "detect_research_trends",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CITATIONS:
+        from . import citations
+
+        return getattr(citations, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
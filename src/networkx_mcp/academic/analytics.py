@@ -7,6 +7,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import networkx as nx
 
+from ..cancellation import checkpoint
+from ..core.basic_operations import require_graph
+
 
 def calculate_h_index(author_citations: List[int]) -> int:
     """Calculate h-index from List[Any] of citation counts."""
@@ -29,10 +32,7 @@ def analyze_author_impact(
     if graphs is None:
         graphs = {}
 
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
     # Find papers by author
     author_papers = []
@@ -78,19 +78,17 @@ def find_collaboration_patterns(
     if graphs is None:
         graphs = {}
 
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
     # Build co-authorship network
     coauthor_graph: nx.Graph[Any] = nx.Graph()
     collaboration_counts: Dict[Tuple[str, str], int] = defaultdict(int)
 
     for node in graph.nodes(data=True):
+        checkpoint()
         node_id, data = node
         # Handle both Dict[str, Any] and non-Dict[str, Any] node data
-        if not isinstance(data, Dict[str, Any]):
+        if not isinstance(data, dict):
             data = {}
         authors = data.get("authors", [])
 
@@ -117,7 +115,7 @@ def find_collaboration_patterns(
     # If no authors found, analyze graph structure as collaboration
     if coauthor_graph.number_of_nodes() == 0:
         # Treat graph connections as collaborations
-        collaboration_clusters = List[Any](
+        collaboration_clusters = list(
             nx.connected_components(
                 graph.to_undirected() if graph.is_directed() else graph
             )
@@ -131,7 +129,7 @@ def find_collaboration_patterns(
                     "edges": 0,
                 },
                 "collaboration_clusters": [
-                    List[Any](cluster)[:10] for cluster in collaboration_clusters[:10]
+                    list(cluster)[:10] for cluster in collaboration_clusters[:10]
                 ],  # Limit size
                 "num_clusters": len(collaboration_clusters),
             },
@@ -142,7 +140,7 @@ def find_collaboration_patterns(
             "top_collaborations": [],
             "most_central_authors": [],
             "collaboration_clusters": [
-                List[Any](cluster)[:10] for cluster in collaboration_clusters[:10]
+                list(cluster)[:10] for cluster in collaboration_clusters[:10]
             ],
             "note": "No author data found; showing graph structure as collaboration patterns",
         }
@@ -154,7 +152,7 @@ def find_collaboration_patterns(
                 "edges": coauthor_graph.number_of_edges(),
             },
             "top_collaborations": [
-                {"authors": List[Any](authors), "collaborations": count}
+                {"authors": list(authors), "collaborations": count}
                 for authors, count in top_collaborations
             ],
             "most_central_authors": [
@@ -167,7 +165,7 @@ def find_collaboration_patterns(
             "edges": coauthor_graph.number_of_edges(),
         },
         "top_collaborations": [
-            {"authors": List[Any](authors), "collaborations": count}
+            {"authors": list(authors), "collaborations": count}
             for authors, count in top_collaborations
         ],
         "most_central_authors": [
@@ -185,19 +183,16 @@ def detect_research_trends(
     if graphs is None:
         graphs = {}
 
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
     # Group papers by year
     year_counts: Dict[int, int] = defaultdict(int)
-    yearly_citations: Dict[int, List[int]] = defaultdict(List[Any])
+    yearly_citations: Dict[int, List[int]] = defaultdict(list)
 
     for node in graph.nodes(data=True):
         node_id, data = node
         # Handle both Dict[str, Any] and non-Dict[str, Any] node data
-        if not isinstance(data, Dict[str, Any]):
+        if not isinstance(data, dict):
             data = {}
         year = data.get("year")
         citations = data.get("citations", 0)
@@ -210,7 +205,7 @@ def detect_research_trends(
     years = sorted(year_counts.keys())
     if len(years) < 2:
         # If no year data, analyze graph growth patterns
-        components = List[Any](
+        components = list(
             nx.connected_components(
                 graph.to_undirected() if graph.is_directed() else graph
             )
@@ -13,6 +13,10 @@ import requests
 from bibtexparser.bwriter import BibTexWriter
 from requests.exceptions import HTTPError, RequestException, Timeout
 
+from ..cancellation import checkpoint
+from ..core.basic_operations import require_graph
+from ..progress import report_progress
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +61,7 @@ def resolve_doi(
     last_error = None
 
     for attempt in range(retry_count):
+        checkpoint()
         try:
             response = requests.get(url, headers=headers, timeout=10)
 
@@ -150,15 +155,18 @@ def build_citation_network(
 
     # Create directed graph for citations
     citation_graph: nx.DiGraph[Any] = nx.DiGraph()
-    processed = Set[Any]()
+    processed: Set[Any] = set()
     to_process = [(doi, 0) for doi in seed_dois]
 
     nodes_added = 0
     edges_added = 0
     errors = []
     resolution_failures = 0
+    # Nodes added since the last progress notification
+    new_nodes: List[Dict[str, Any]] = []
 
     while to_process and nodes_added < 1000:  # Limit to prevent overload
+        checkpoint()
         current_doi, depth = to_process.pop(0)
 
         if current_doi in processed or depth > max_depth:
@@ -189,6 +197,18 @@ def build_citation_network(
                 if depth < max_depth:
                     to_process.append((ref_doi, depth + 1))
 
+        new_nodes.append(
+            {"doi": current_doi, "title": paper.get("title"), "depth": depth}
+        )
+        if report_progress(
+            nodes_added,
+            message=f"{nodes_added} papers, {len(to_process)} queued",
+            partial=lambda: {"nodes": list(new_nodes), "edges": edges_added},
+        ):
+            new_nodes.clear()
+
+    # A cancelled build must not replace the graph
+    checkpoint()
     graphs[graph_name] = citation_graph
 
     result = {
@@ -215,10 +235,7 @@ def export_bibtex(
     if graphs is None:
         graphs = {}
 
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
     # Create BibTeX database
     bib_db = bibtexparser.bibdatabase.BibDatabase()
@@ -262,10 +279,7 @@ def recommend_papers(
     if graphs is None:
         graphs = {}
 
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
     # Handle alternative parameter names for compatibility
     # Check if seed_doi is actually present, if not return empty recommendations
@@ -283,10 +297,10 @@ def recommend_papers(
         }
 
     # Find papers cited by seed paper
-    cited_papers = List[Any](graph.successors(seed_doi))
+    cited_papers = list(graph.successors(seed_doi))
 
     # Find papers that cite the seed paper
-    citing_papers = List[Any](graph.predecessors(seed_doi))
+    citing_papers = list(graph.predecessors(seed_doi))
 
     # Calculate recommendation scores based on citation patterns
     recommendations = []
@@ -294,7 +308,7 @@ def recommend_papers(
     # Score papers that are co-cited with seed paper
     for cited in cited_papers:
         # Find other papers that also cite this paper
-        co_citing = List[Any](graph.predecessors(cited))
+        co_citing = list(graph.predecessors(cited))
 
         for paper in co_citing:
             if paper != seed_doi and paper not in cited_papers:
@@ -304,17 +318,13 @@ def recommend_papers(
                 paper_data = graph.nodes.get(paper, {})
                 citation_count = (
                     paper_data.get("citations", 0)
-                    if isinstance(paper_data, Dict[str, Any])
+                    if isinstance(paper_data, dict)
                     else 0
                 )
                 score += min(citation_count / 100, 2.0)  # Max boost of 2.0
 
                 # Boost score based on recency
-                year = (
-                    paper_data.get("year")
-                    if isinstance(paper_data, Dict[str, Any])
-                    else None
-                )
+                year = paper_data.get("year") if isinstance(paper_data, dict) else None
                 if year:
                     current_year = datetime.now().year
                     recency_score = max(0, (year - (current_year - 10)) / 10)
@@ -325,10 +335,10 @@ def recommend_papers(
                         "paper": paper,  # Use 'paper' for compatibility
                         "doi": paper,
                         "title": paper_data.get("title", paper)
-                        if isinstance(paper_data, Dict[str, Any])
+                        if isinstance(paper_data, dict)
                         else paper,
                         "authors": paper_data.get("authors", [])
-                        if isinstance(paper_data, Dict[str, Any])
+                        if isinstance(paper_data, dict)
                         else [],
                         "year": year,
                         "citations": citation_count,
@@ -0,0 +1,59 @@
+"""Cooperative cancellation of tool calls.
+
+When a client sends ``notifications/cancelled`` the server cancels the
+asyncio task of that request, which frees its concurrency slot and graph
+lock at once. Work that already runs on a worker thread cannot be
+interrupted from outside, so long pure-Python loops call ``checkpoint()``;
+it raises ``RequestCancelled`` once the request they serve has been
+cancelled. Work in a worker process is stopped by the execution engine
+killing the process.
+
+The token of the request being served travels in a context variable,
+which the execution engine copies onto the worker thread.
+"""
+
+import threading
+from contextvars import ContextVar
+from typing import Optional
+
+
+class RequestCancelled(Exception):
+    """Raised at a checkpoint when the current request has been cancelled."""
+
+
+class CancelToken:
+    """Thread-safe cancellation flag for one request."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        self.reason = reason
+        self._event.set()
+
+
+_current_token: ContextVar[Optional[CancelToken]] = ContextVar(
+    "networkx_mcp_cancel_token", default=None
+)
+
+
+def current_token() -> Optional[CancelToken]:
+    """Token of the request being served, if any."""
+    return _current_token.get()
+
+
+def set_current_token(token: Optional[CancelToken]) -> None:
+    """Make ``token`` the current request's token in this context."""
+    _current_token.set(token)
+
+
+def checkpoint() -> None:
+    """Raise ``RequestCancelled`` if the current request has been cancelled."""
+    token = _current_token.get()
+    if token is not None and token.cancelled:
+        raise RequestCancelled(token.reason or "Request cancelled")
@@ -2,15 +2,25 @@
 
 from typing import Any
 
-from networkx_mcp.core.algorithms import GraphAlgorithms
-from networkx_mcp.core.graph_operations import GraphManager
-
 # DO NOT import GraphIOHandler here - it loads pandas (+35MB)!
 # Use get_io_handler() for lazy loading when actually needed
 
 __all__ = ["GraphAlgorithms", "GraphManager", "get_io_handler"]
 
 
+def __getattr__(name: str) -> Any:
+    # GraphAlgorithms loads numpy; neither is needed to import the server
+    if name == "GraphAlgorithms":
+        from networkx_mcp.core.algorithms import GraphAlgorithms
+
+        return GraphAlgorithms
+    if name == "GraphManager":
+        from networkx_mcp.core.graph_operations import GraphManager
+
+        return GraphManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_io_handler() -> Any:
     """
     Lazy load IO handler only when needed.
@@ -2,11 +2,18 @@
 
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import networkx as nx
 import numpy as np
 
+from .betweenness import parallel_betweenness
+from .csr import clustering as csr_clustering
+from .csr import eigenvector as csr_eigenvector
+from .csr import katz as csr_katz
+from .csr import snapshot_of, use_sparse
+from .pagerank import ENGINES, power_iteration
+
 logger = logging.getLogger(__name__)
 
 # Try to import community algorithms - they might not be available in all NetworkX versions
@@ -167,11 +174,37 @@ class GraphAlgorithms:
 
     @staticmethod
     def centrality_measures(
-        graph: nx.Graph, measures: List[str] | None = None
+        graph: nx.Graph,
+        measures: List[str] | None = None,
+        workers: int = 1,
+        engine: str = "auto",
+        version: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Calculate various centrality measures."""
+        """Calculate various centrality measures.
+
+        With ``workers`` > 1, betweenness is computed exactly with its
+        sources split across that many processes.
+
+        Eigenvector, Katz and PageRank run on SciPy sparse matrices with
+        ``engine="sparse"``, and with ``"auto"`` from ``SPARSE_MIN_NODES``
+        nodes up; ``"numpy"`` (one of ``ENGINES``, shared with the PageRank
+        tool) always uses NetworkX. Pass the graph's ``version`` to reuse
+        the matrices of an earlier call.
+        """
         if measures is None:
             measures = ["degree", "betweenness", "closeness", "eigenvector"]
+        if engine not in ENGINES:
+            msg = f"Unknown engine {engine!r}, expected one of {ENGINES}"
+            raise ValueError(msg)
+        # Only measures that run below need the snapshot
+        spectral = (
+            "katz" in measures
+            or ("eigenvector" in measures and graph.number_of_edges() > 0)
+            or ("pagerank" in measures and graph.is_directed())
+        )
+        snapshot = None
+        if spectral and use_sparse(engine, graph.number_of_nodes()):
+            snapshot = snapshot_of(graph, version)
 
         results = {}
 
@@ -183,21 +216,48 @@ class GraphAlgorithms:
                 results["degree_centrality"] = nx.degree_centrality(graph)
 
         if "betweenness" in measures:
-            results["betweenness_centrality"] = nx.betweenness_centrality(graph)
+            if workers > 1:
+                results["betweenness_centrality"] = parallel_betweenness(graph, workers)
+            else:
+                results["betweenness_centrality"] = nx.betweenness_centrality(graph)
 
         if "closeness" in measures:
             results["closeness_centrality"] = nx.closeness_centrality(graph)
 
         if "eigenvector" in measures and graph.number_of_edges() > 0:
             try:
-                results["eigenvector_centrality"] = nx.eigenvector_centrality(
-                    graph, max_iter=1000
-                )
-            except nx.PowerIterationFailedConvergence:
+                if snapshot is not None:
+                    values = csr_eigenvector(snapshot)
+                    results["eigenvector_centrality"] = dict(
+                        zip(snapshot.nodes, values.tolist())
+                    )
+                else:
+                    results["eigenvector_centrality"] = nx.eigenvector_centrality(
+                        graph, max_iter=1000
+                    )
+            except nx.ExceededMaxIterations:
                 results["eigenvector_centrality"] = {"error": "Failed to converge"}
 
+        if "katz" in measures:
+            try:
+                if snapshot is not None:
+                    values = csr_katz(snapshot)
+                    results["katz_centrality"] = dict(
+                        zip(snapshot.nodes, values.tolist())
+                    )
+                else:
+                    results["katz_centrality"] = nx.katz_centrality(
+                        graph, max_iter=1000
+                    )
+            except nx.ExceededMaxIterations:
+                results["katz_centrality"] = {"error": "Failed to converge"}
+
         if "pagerank" in measures and graph.is_directed():
-            results["pagerank"] = nx.pagerank(graph)
+            if snapshot is not None:
+                (nodes, values), _, _ = power_iteration(snapshot, engine="sparse")
+                results["pagerank"] = dict(zip(nodes, values.tolist()))
+            else:
+                results["pagerank"] = nx.pagerank(graph)
 
         return results
 
@@ -212,7 +272,14 @@ class GraphAlgorithms:
                 "transitivity": 0.0,
             }
 
-        if graph.is_directed():
+        if not graph.is_multigraph() and use_sparse("auto", graph.number_of_nodes()):
+            # Triangles from sparse products on a CSR snapshot; directed
+            # edges count as undirected, as with to_undirected() below
+            snapshot = snapshot_of(graph)
+            values = csr_clustering(snapshot)
+            clustering = dict(zip(snapshot.nodes, values.tolist()))
+            avg_clustering = float(values.mean())
+        elif graph.is_directed():
             clustering = nx.clustering(graph.to_undirected())
             avg_clustering = nx.average_clustering(graph.to_undirected())
         else:
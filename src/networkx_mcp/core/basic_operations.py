@@ -6,14 +6,72 @@ These are compatibility functions for existing code.
 import base64
 import csv
 import io
-from typing import Any, Dict, List, Optional, Union
+import random
+import threading
+import weakref
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import matplotlib
-import matplotlib.pyplot as plt
 import networkx as nx
 import networkx.algorithms.community as nx_comm
 
-matplotlib.use("Agg")  # Use non-interactive backend
+from ..cancellation import checkpoint
+from ..progress import current_reporter, report_progress
+from ..result_cache import memoized
+from .betweenness import (
+    DEFAULT_DELTA,
+    DEFAULT_EPSILON,
+    approximate_betweenness,
+    parallel_betweenness,
+)
+from .components import component_index, extend_components, graph_size
+from .pagerank import (
+    DEFAULT_MAX_ITER,
+    DEFAULT_TOL,
+    PageRankRun,
+    RankVector,
+    last_vector,
+    remember_vector,
+    run_pagerank,
+)
+from .pagination import DEFAULT_PAGE_SIZE, GraphPositions, edge_key, paginate
+
+# CSV rows parsed by import_csv between cancellation checkpoints
+CSV_CHECKPOINT_ROWS = 10_000
+
+# Measures of spectral_centrality
+SPECTRAL_MEASURES = ("eigenvector", "katz")
+
+# Summary statistics per graph object, with the node count they were taken at
+_summaries: "weakref.WeakKeyDictionary[Any, Tuple[int, Dict[str, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_summaries_lock = threading.Lock()
+# Node positions per graph object, for paging at the version they were taken at
+_positions: "weakref.WeakKeyDictionary[Any, GraphPositions]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def graph_version(graphs: Any, graph_name: str) -> Optional[int]:
+    """Version of a graph in a versioned store (see ``snapshots.py``).
+
+    None for plain dicts of graphs and for a write in progress.
+    """
+    version_of = getattr(graphs, "version", None)
+    return version_of(graph_name) if callable(version_of) else None
+
+
+def require_graph(graphs: Dict[str, Any], graph_name: str) -> Any:
+    """Look up a graph, raising ValueError if it does not exist.
+
+    A single ``graphs[graph_name]`` access: on the shared ``GraphDict``
+    that is one cache lookup, where ``in`` followed by ``[]`` was two.
+    """
+    try:
+        return graphs[graph_name]
+    except KeyError:
+        raise ValueError(f"Graph '{graph_name}' not found") from None
 
 
 def create_graph(
@@ -38,15 +96,16 @@ def add_nodes(
     """Add nodes - compatibility function."""
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
     # Count only new nodes
     existing_nodes = set(graph.nodes())
     new_nodes = [node for node in nodes if node not in existing_nodes]
 
+    before = graph_size(graph)
     graph.add_nodes_from(nodes)
+    extend_components(graph, before, nodes=nodes)
+    invalidate_summary(graph)
     return {
         "success": True,
         "nodes_added": len(new_nodes),
@@ -62,11 +121,12 @@ def add_edges(
     """Add edges - compatibility function."""
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
     edge_tuples = [(e[0], e[1]) for e in edges if len(e) >= 2]
+    before = graph_size(graph)
     graph.add_edges_from(edge_tuples)
+    extend_components(graph, before, edges=edge_tuples)
+    invalidate_summary(graph)
     return {
         "success": True,
         "edges_added": len(edge_tuples),
@@ -74,25 +134,210 @@ def add_edges(
     }
 
 
+def graph_summary(graph: Any) -> Dict[str, Any]:
+    """Counts, density and degree statistics of a graph.
+
+    Computed once per graph and cached until ``invalidate_summary`` is
+    called for it (or its node count changes).
+    """
+    num_nodes = graph.number_of_nodes()
+    with _summaries_lock:
+        cached = _summaries.get(graph)
+    if cached is not None and cached[0] == num_nodes:
+        return cached[1]
+
+    degrees = [degree for _, degree in graph.degree()]
+    num_edges = graph.number_of_edges()
+    summary = {
+        "num_nodes": num_nodes,
+        "num_edges": num_edges,
+        "density": nx.density(graph),
+        "degree": {
+            "min": min(degrees, default=0),
+            "max": max(degrees, default=0),
+            "mean": sum(degrees) / num_nodes if num_nodes else 0.0,
+        },
+    }
+    with _summaries_lock:
+        _summaries[graph] = (num_nodes, summary)
+    return summary
+
+
+def invalidate_summary(graph: Any) -> None:
+    """Drop the cached summary of a graph after it has been mutated."""
+    with _summaries_lock:
+        _summaries.pop(graph, None)
+        _positions.pop(graph, None)
+
+
+def graph_positions(graph: Any, version: Optional[int]) -> Optional[GraphPositions]:
+    """Position index of a graph for paging, shared by the pages of a version.
+
+    None if the version is unknown (a plain dict of graphs, or a write in
+    progress): the graph may change under the index between pages.
+    """
+    if version is None:
+        return None
+    with _summaries_lock:
+        positions = _positions.get(graph)
+    if positions is None or positions.version != version:
+        positions = GraphPositions(graph, version)
+        with _summaries_lock:
+            _positions[graph] = positions
+    return positions
+
+
 def get_graph_info(
-    graph_name: str, graphs: Optional[Dict[str, Any]] = None
+    graph_name: str,
+    graphs: Optional[Dict[str, Any]] = None,
+    include_elements: bool = False,
 ) -> Dict[str, Any]:
-    """Get graph info - compatibility function."""
+    """Get graph info - compatibility function.
+
+    Returns the cached summary only; the full node and edge lists are
+    included with ``include_elements=True`` (use ``list_nodes`` and
+    ``list_edges`` to page through large graphs instead).
+    """
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
+    try:
+        graph = graphs[graph_name]
+    except KeyError:
         return {"success": False, "error": f"Graph '{graph_name}' not found"}
-    graph = graphs[graph_name]
-    return {
+    summary = graph_summary(graph)
+    info = {
         "graph_id": graph_name,
-        "num_nodes": graph.number_of_nodes(),
-        "num_edges": graph.number_of_edges(),
-        "nodes": list(graph.nodes()),  # Return actual nodes list
-        "edges": [[u, v] for u, v in graph.edges()],  # Return edges as list of lists
+        "num_nodes": summary["num_nodes"],
+        "num_edges": summary["num_edges"],
+        "density": summary["density"],
+        "degree": summary["degree"],
         "is_directed": graph.is_directed(),  # Use is_directed as expected by test
         "directed": graph.is_directed(),  # Keep for backward compatibility
         "metadata": {"attributes": {"directed": graph.is_directed()}},
     }
+    if include_elements:
+        info["nodes"] = list(graph.nodes())
+        info["edges"] = [[u, v] for u, v in graph.edges()]
+    return info
+
+
+def list_nodes(
+    graph_name: str,
+    cursor: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    attributes: Optional[List[str]] = None,
+    graphs: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """One page of the nodes of a graph.
+
+    Args:
+        graph_name: Graph to list
+        cursor: ``next_cursor`` of the previous page, None for the first one
+        page_size: Maximum number of nodes in the page
+        attributes: Node attributes to include; None for node ids only
+        graphs: Dictionary the graph is stored in
+
+    Returns:
+        Dictionary with the nodes, the total count and ``next_cursor``
+        (None on the last page)
+    """
+    if graphs is None:
+        graphs = {}
+    graph = require_graph(graphs, graph_name)
+
+    positions = graph_positions(graph, graph_version(graphs, graph_name))
+    if positions is None:
+        page, next_cursor = paginate(
+            lambda start: islice(graph.nodes(data=True), start, None),
+            cursor,
+            page_size,
+        )
+    else:
+        page, next_cursor = paginate(
+            lambda start: positions.node_items(graph, start),
+            cursor,
+            page_size,
+            locate=positions.locate_node,
+        )
+    if attributes is None:
+        nodes: List[Any] = [node for node, _ in page]
+    else:
+        nodes = [
+            {"id": node, "attributes": _project(data, attributes)}
+            for node, data in page
+        ]
+    return {
+        "graph_id": graph_name,
+        "nodes": nodes,
+        "total": graph_summary(graph)["num_nodes"],
+        "next_cursor": next_cursor,
+    }
+
+
+def list_edges(
+    graph_name: str,
+    cursor: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    attributes: Optional[List[str]] = None,
+    graphs: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """One page of the edges of a graph.
+
+    Takes the same arguments as ``list_nodes``. Edges are ``[source,
+    target]`` pairs (``[source, target, key]`` for multigraphs), or objects
+    with ``source``, ``target`` and ``attributes`` when attributes are
+    requested.
+    """
+    if graphs is None:
+        graphs = {}
+    graph = require_graph(graphs, graph_name)
+
+    directed = graph.is_directed()
+
+    def key_of(edge: Tuple[Any, ...]) -> str:
+        return edge_key(edge, directed)
+
+    positions = graph_positions(graph, graph_version(graphs, graph_name))
+    if positions is not None:
+        page, next_cursor = paginate(
+            lambda start: positions.edge_items(graph, start),
+            cursor,
+            page_size,
+            key_of,
+            lambda key: positions.locate_edge(graph, key),
+        )
+    else:
+
+        def items(start: int) -> Any:
+            if graph.is_multigraph():
+                edges = graph.edges(keys=True, data=True)
+                return islice((((u, v, k), d) for u, v, k, d in edges), start, None)
+            edges = graph.edges(data=True)
+            return islice((((u, v), d) for u, v, d in edges), start, None)
+
+        page, next_cursor = paginate(items, cursor, page_size, key_of)
+    if attributes is None:
+        edges: List[Any] = [list(edge) for edge, _ in page]
+    else:
+        edges = [
+            {
+                "source": edge[0],
+                "target": edge[1],
+                **({"key": edge[2]} if len(edge) > 2 else {}),
+                "attributes": _project(data, attributes),
+            }
+            for edge, data in page
+        ]
+    return {
+        "graph_id": graph_name,
+        "edges": edges,
+        "total": graph_summary(graph)["num_edges"],
+        "next_cursor": next_cursor,
+    }
+
+
+def _project(data: Dict[str, Any], names: List[str]) -> Dict[str, Any]:
+    return {name: data[name] for name in names if name in data}
 
 
 def shortest_path(
@@ -104,10 +349,10 @@ def shortest_path(
     """Find shortest path - compatibility function."""
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
+    try:
+        graph = graphs[graph_name]
+    except KeyError:
         return {"success": False, "error": f"Graph '{graph_name}' not found"}
-
-    graph = graphs[graph_name]
     try:
         path = nx.shortest_path(graph, source, target)
         return {"success": True, "path": path, "length": len(path) - 1}
@@ -120,16 +365,28 @@ def shortest_path(
         return {"success": False, "error": f"Node not found: {e}"}
 
 
+@memoized("degree_centrality")
 def degree_centrality(
     graph_name: str, graphs: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    """Calculate degree centrality - compatibility function."""
+    """Calculate degree centrality - compatibility function.
+
+    Read off the graph's CSR snapshot if one was already built for this
+    version; building one only for degrees would not pay off.
+    """
+    from .csr import cached_snapshot, degrees
+
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
-    centrality = nx.degree_centrality(graph)
+    graph = require_graph(graphs, graph_name)
+    snapshot = cached_snapshot(graph, graph_version(graphs, graph_name))
+    if snapshot is not None and snapshot.n > 1 and not graph.is_multigraph():
+        values = degrees(snapshot) * (1.0 / (snapshot.n - 1))
+        # Stable, so ties keep node order like sorting the full dict does
+        top = (-values).argsort(kind="stable")[:10].tolist()
+        centrality = {snapshot.nodes[i]: float(values[i]) for i in top}
+    else:
+        centrality = nx.degree_centrality(graph)
     # Convert to serializable format and sort by centrality
     sorted_nodes = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
     return {
@@ -138,63 +395,282 @@ def degree_centrality(
     }
 
 
-def betweenness_centrality(
-    graph_name: str, graphs: Optional[Dict[str, Any]] = None
+@memoized("spectral_centrality")
+def spectral_centrality(
+    graph_name: str,
+    measure: str = "eigenvector",
+    engine: str = "auto",
+    graphs: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Calculate betweenness centrality - compatibility function."""
+    """Eigenvector or Katz centrality (unweighted), top 10 nodes.
+
+    Options come before ``graphs``, so this is also the worker of the
+    tool.
+
+    Args:
+        graph_name: Graph to analyze
+        measure: One of ``SPECTRAL_MEASURES``
+        engine: ``"numpy"``, ``"sparse"`` (SciPy) or ``"auto"`` (see
+            ``GraphAlgorithms.centrality_measures``)
+        graphs: Graph store
+
+    Raises:
+        ValueError: If ``measure`` or ``engine`` is unknown, or the
+            iteration does not converge
+    """
+    from .algorithms import GraphAlgorithms
+
+    if measure not in SPECTRAL_MEASURES:
+        raise ValueError(
+            f"Unknown measure {measure!r}, expected one of {SPECTRAL_MEASURES}"
+        )
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
-    centrality = nx.betweenness_centrality(graph)
+    graph = require_graph(graphs, graph_name)
+    results = GraphAlgorithms.centrality_measures(
+        graph, [measure], engine=engine, version=graph_version(graphs, graph_name)
+    )
+    # Eigenvector centrality is undefined without edges
+    centrality = results.get(f"{measure}_centrality", {})
+    if "error" in centrality:
+        raise ValueError(f"{measure.capitalize()} centrality did not converge")
     sorted_nodes = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
     return {
+        "measure": measure,
+        "centrality": dict(sorted_nodes[:10]),
+        "most_central": sorted_nodes[0] if sorted_nodes else None,
+    }
+
+
+@memoized("betweenness_centrality")
+def betweenness_centrality(
+    graph_name: str,
+    graphs: Optional[Dict[str, Any]] = None,
+    approximate: bool = False,
+    epsilon: Optional[float] = DEFAULT_EPSILON,
+    delta: float = DEFAULT_DELTA,
+    max_seconds: Optional[float] = None,
+    seed: int = 0,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """Calculate betweenness centrality - compatibility function.
+
+    Args:
+        graph_name: Graph to analyze
+        graphs: Graph store
+        approximate: Estimate from a sample of source nodes (see
+            ``core/betweenness.py``) instead of computing exactly
+        epsilon: Approximate mode: target bound on the error of every
+            node's estimate; None to sample until ``max_seconds``
+        delta: Approximate mode: the bound holds with probability
+            ``1 - delta``
+        max_seconds: Approximate mode: time target
+        seed: Approximate mode: seed of the sample
+        workers: Exact mode: split the sources across this many worker
+            processes
+
+    Returns:
+        Top 10 nodes and the most central node; in approximate mode also
+        the sample size and error bound under ``approximation``
+    """
+    if graphs is None:
+        graphs = {}
+    graph = require_graph(graphs, graph_name)
+    estimate = None
+    if approximate:
+        estimate = approximate_betweenness(
+            graph, epsilon, delta, max_seconds, seed, on_batch=_report_sample
+        )
+        centrality = estimate.centrality
+    elif workers > 1:
+        centrality = parallel_betweenness(graph, workers, on_chunk=_report_chunk)
+    elif current_reporter() is None:
+        centrality = nx.betweenness_centrality(graph)
+    else:
+        centrality = _betweenness_with_progress(graph)
+    sorted_nodes = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
+    result = {
         "centrality": dict(sorted_nodes[:10]),  # Top 10 nodes
         "most_central": sorted_nodes[0] if sorted_nodes else None,
     }
+    if estimate is not None:
+        result["approximation"] = estimate.report()
+    return result
+
+
+def betweenness_job(
+    graph_name: str,
+    approximate: bool,
+    epsilon: Optional[float],
+    delta: float,
+    max_seconds: Optional[float],
+    seed: int,
+    workers: int,
+    graphs: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Worker form of ``betweenness_centrality``, options before ``graphs``."""
+    return betweenness_centrality(
+        graph_name, graphs, approximate, epsilon, delta, max_seconds, seed, workers
+    )
+
+
+betweenness_job.result_key = (  # type: ignore[attr-defined]
+    lambda graph_name, *options, graphs=None: betweenness_centrality.result_key(
+        graph_name, graphs, *options
+    )
+)
+
+
+def _report_chunk(done: int, chunks: int) -> None:
+    """Progress of parallel betweenness."""
+    checkpoint()
+    report_progress(done, chunks, f"{done}/{chunks} chunks of sources")
+
+
+def _report_sample(done: int, planned: int, estimate: Any) -> None:
+    """Progress of approximate betweenness, with the estimate's top 10."""
+    checkpoint()
+
+    def top_estimate() -> Dict[str, Any]:
+        top = sorted(estimate().items(), key=lambda x: x[1], reverse=True)[:10]
+        return {"sources_done": done, "centrality": dict(top)}
+
+    report_progress(done, planned, f"{done}/{planned} sources", partial=top_estimate)
+
+
+def _betweenness_with_progress(graph: Any, chunks: int = 100) -> Dict[Any, float]:
+    """Normalized betweenness centrality, accumulated over chunks of sources.
+
+    Gives the same result as ``nx.betweenness_centrality`` while reporting
+    progress after each chunk. Sources are taken in random order, so the
+    partial result - the top 10 of the estimate extrapolated from the
+    sources done so far - is that of a growing uniform sample.
+    """
+    nodes = list(graph)
+    n = len(nodes)
+    raw = dict.fromkeys(nodes, 0.0)
+    if n <= 2:
+        return raw
+    # Subset betweenness already halves undirected pair counts
+    scale = (1.0 if graph.is_directed() else 2.0) / ((n - 1) * (n - 2))
+    step = max(1, -(-n // chunks))
+    order = nodes[:]
+    random.Random(0).shuffle(order)
+
+    def top_estimate(done: int) -> Dict[str, Any]:
+        factor = scale * n / done
+        top = sorted(raw.items(), key=lambda x: x[1], reverse=True)[:10]
+        return {
+            "sources_done": done,
+            "centrality": {node: value * factor for node, value in top},
+        }
+
+    for start in range(0, n, step):
+        checkpoint()
+        sources = order[start : start + step]
+        part = nx.betweenness_centrality_subset(graph, sources, nodes, normalized=False)
+        for node, value in part.items():
+            raw[node] += value
+        done = start + len(sources)
+        report_progress(
+            done,
+            n,
+            f"{done}/{n} sources",
+            partial=lambda done=done: top_estimate(done),
+        )
 
+    return {node: value * scale for node, value in raw.items()}
 
+
+@memoized("connected_components")
 def connected_components(
     graph_name: str, graphs: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Union[int, List[int], List[List[Union[str, int]]]]]:
-    """Find connected components - compatibility function."""
+    """Find connected components - compatibility function.
+
+    Weakly connected components for directed graphs. Answered from a
+    union-find index that ``add_nodes``/``add_edges`` keep up to date (see
+    ``components.py``), so only the first call after other mutations
+    traverses the graph.
+    """
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
-    if graph.is_directed():
-        components = list(nx.weakly_connected_components(graph))
-    else:
-        components = list(nx.connected_components(graph))
-
-    # Convert sets to lists for JSON serialization
-    components_list = [list(comp) for comp in components]
-    components_list.sort(key=len, reverse=True)  # Largest first
-
-    return {
-        "num_components": len(components_list),
-        "component_sizes": [len(comp) for comp in components_list],
-        "largest_component": components_list[0] if components_list else [],
-    }
+    graph = require_graph(graphs, graph_name)
+    return component_index(graph, graph_version(graphs, graph_name)).summary()
 
 
+@memoized("pagerank")
 def pagerank(
-    graph_name: str, graphs: Optional[Dict[str, Any]] = None
+    graph_name: str,
+    graphs: Optional[Dict[str, Any]] = None,
+    tol: float = DEFAULT_TOL,
+    max_iter: int = DEFAULT_MAX_ITER,
+    engine: str = "auto",
 ) -> Dict[str, Any]:
-    """Calculate PageRank - compatibility function."""
+    """Calculate PageRank, warm-started from the graph's last vector.
+
+    Args:
+        graph_name: Graph to rank
+        graphs: Graph store
+        tol: Convergence tolerance, as in ``nx.pagerank``
+        max_iter: Maximum number of power iterations
+        engine: ``"numpy"``, ``"sparse"`` (SciPy) or ``"auto"``
+
+    Returns:
+        Top 10 nodes, the highest ranked node, the number of iterations
+        used and whether they started from an earlier vector
+    """
+    previous = last_vector(graph_name)
+    run = pagerank_run(graph_name, tol, max_iter, previous, engine, graphs)
+    return finish_pagerank(run)
+
+
+def pagerank_run(
+    graph_name: str,
+    tol: float = DEFAULT_TOL,
+    max_iter: int = DEFAULT_MAX_ITER,
+    previous: Optional[RankVector] = None,
+    engine: str = "auto",
+    graphs: Optional[Dict[str, Any]] = None,
+) -> PageRankRun:
+    """PageRank worker: the run including its full vector.
+
+    Worker processes do not share the warm start vectors of the server, so
+    the server passes ``previous`` in and keeps the returned vector with
+    ``finish_pagerank``.
+    """
+    from .csr import snapshot_of
+
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
-    pr = nx.pagerank(graph)
-    sorted_nodes = sorted(pr.items(), key=lambda x: x[1], reverse=True)
-    return {
-        "pagerank": dict(sorted_nodes[:10]),  # Top 10 nodes
-        "highest_rank": sorted_nodes[0] if sorted_nodes else None,
-    }
+    graph = require_graph(graphs, graph_name)
+    snapshot = snapshot_of(graph, graph_version(graphs, graph_name))
+    return run_pagerank(graph_name, snapshot, tol, max_iter, previous, engine)
+
+
+def finish_pagerank(run: PageRankRun) -> Dict[str, Any]:
+    """Keep the vector of ``run`` for the next warm start; the tool result."""
+    remember_vector(run.graph_name, run.vector)
+    return run.summary()
+
+
+# Process jobs of pagerank_run share the cache entries of pagerank
+pagerank_run.result_key = (  # type: ignore[attr-defined]
+    lambda graph_name, tol, max_iter, previous, engine="auto", graphs=None: (
+        pagerank.result_key(graph_name, graphs, tol, max_iter, engine)
+    )
+)
+
+
+def _pyplot() -> Any:
+    # matplotlib takes longer to import than the rest of the server, so it
+    # is only loaded for the first visualization
+    import matplotlib
+
+    matplotlib.use("Agg")  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+
+    return plt
 
 
 def visualize_graph(
@@ -203,10 +679,9 @@ def visualize_graph(
     """Visualize graph and return as base64 image - compatibility function."""
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
+    plt = _pyplot()
     plt.figure(figsize=(10, 8))
 
     # Choose layout
@@ -269,13 +744,18 @@ def import_csv(
         if len(first_row) >= 2:
             edges.append((first_row[0].strip(), first_row[1].strip()))
 
-    for row in reader:
+    for i, row in enumerate(reader):
+        if not i % CSV_CHECKPOINT_ROWS:
+            checkpoint()
         if len(row) >= 2:
             edges.append((row[0].strip(), row[1].strip()))
 
     # Create graph
+    checkpoint()
     graph: Any = nx.DiGraph() if directed else nx.Graph()
     graph.add_edges_from(edges)
+    # Last chance to stop before the graph is replaced
+    checkpoint()
     graphs[graph_name] = graph
 
     return {
@@ -292,30 +772,29 @@ def export_json(
     """Export graph as JSON - compatibility function."""
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
     # Convert to node-link format
     data = nx.node_link_data(graph)
+    # NetworkX 3.4+ names the edge list "edges" instead of "links"
+    links = data["links"] if "links" in data else data["edges"]
 
     return {
         "graph_data": data,
         "format": "node-link",
         "nodes": len(data["nodes"]),
-        "edges": len(data["links"]),
+        "edges": len(links),
     }
 
 
+@memoized("community_detection")
 def community_detection(
     graph_name: str, graphs: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Detect communities in the graph - compatibility function."""
     if graphs is None:
         graphs = {}
-    if graph_name not in graphs:
-        raise ValueError(f"Graph '{graph_name}' not found")
-    graph = graphs[graph_name]
+    graph = require_graph(graphs, graph_name)
 
     # Use Louvain method for community detection
     communities = nx_comm.louvain_communities(graph)
@@ -0,0 +1,401 @@
+"""Betweenness centrality from per-source dependencies.
+
+Brandes' algorithm sums, over all source nodes ``s``, the dependency
+``delta_s(v)`` of ``s`` on every node ``v``: one BFS and one backward
+accumulation per source. Summing over a uniform sample of ``k`` sources
+(pivots) instead and scaling by ``n/k`` gives an unbiased estimate at
+``k/n`` of the cost.
+
+``approximate_betweenness`` draws pivots in batches and after each batch
+bounds the error of every node's estimate, simultaneously for all nodes
+with probability ``1 - delta``: each pivot contributes a value in
+``[0, n/(n-1)]`` to a node's normalized estimate, so Hoeffding's
+inequality bounds the error by ``R*sqrt(ln(4n/delta)/(2k))``; the
+empirical Bernstein bound (Maurer & Pontil, 2009) uses the observed
+variance and is much tighter for the low-variance nodes that make up most
+of a large graph. The smaller of the two is reported, each taken at
+confidence ``1 - delta/2``. As the bound is checked after every batch,
+check ``i`` uses ``delta_i = delta/(i*(i+1))`` in place of ``delta``;
+these sum to ``delta``, so the bound of whichever check stops the
+sampling holds with probability ``1 - delta``. Pivots are drawn without
+replacement, which only tightens both bounds (Hoeffding, 1963; Bardenet &
+Maillard, 2015), and once every node has been a pivot the result is
+exact.
+
+Sampling stops when the bound reaches the accuracy target ``epsilon``,
+when ``max_seconds`` have passed, or when every node has been a pivot.
+
+``parallel_betweenness`` computes the exact values with the sources split
+into chunks across worker processes. The graph is sent to each worker
+once; every chunk returns its partial dependency sums, which are reduced
+in chunk order, so the result does not depend on scheduling.
+
+All values are those of ``nx.betweenness_centrality`` with
+``normalized=True`` and no weights.
+"""
+
+import math
+import multiprocessing
+import os
+import random
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+import networkx as nx
+
+DEFAULT_EPSILON = 0.05
+DEFAULT_DELTA = 0.1
+
+# Chunks of sources per worker process, for load balance
+CHUNKS_PER_WORKER = 4
+
+# Worker processes parallel_betweenness starts at most; each gets a copy
+# of the graph
+MAX_WORKERS = os.cpu_count() or 1
+
+# Pivots in the first batch; later batches grow the sample by a quarter,
+# but no further than the time left allows at the pace so far
+FIRST_BATCH = 16
+
+
+def source_dependencies(graph: nx.Graph, source: Hashable) -> Dict[Hashable, float]:
+    """Dependencies ``delta_s(v)`` of ``source`` on the nodes it reaches.
+
+    One step of Brandes' algorithm (BFS, unweighted); the source itself
+    is left out.
+    """
+    adjacency = graph.adj
+    sigma = {source: 1.0}
+    dist = {source: 0}
+    preds: Dict[Hashable, List[Hashable]] = {source: []}
+    order = []
+    queue = deque([source])
+    while queue:
+        v = queue.popleft()
+        order.append(v)
+        next_dist = dist[v] + 1
+        paths = sigma[v]
+        for w in adjacency[v]:
+            if w not in dist:
+                dist[w] = next_dist
+                sigma[w] = 0.0
+                preds[w] = []
+                queue.append(w)
+            if dist[w] == next_dist:
+                sigma[w] += paths
+                preds[w].append(v)
+
+    dependency = dict.fromkeys(order, 0.0)
+    for w in reversed(order):
+        coefficient = (1.0 + dependency[w]) / sigma[w]
+        for v in preds[w]:
+            dependency[v] += sigma[v] * coefficient
+    del dependency[source]
+    return dependency
+
+
+def normalization(graph: nx.Graph) -> float:
+    """Factor turning summed dependencies into normalized betweenness."""
+    n = graph.number_of_nodes()
+    return 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+
+
+@dataclass
+class BetweennessEstimate:
+    """Estimated normalized betweenness and how good it is."""
+
+    centrality: Dict[Hashable, float]
+    samples: int
+    error_bound: float
+    delta: float
+    seconds: float
+
+    @property
+    def exact(self) -> bool:
+        return self.error_bound == 0.0
+
+    def report(self) -> Dict[str, Any]:
+        """Sample size and error bound, as reported by the tool."""
+        return {
+            "samples": self.samples,
+            "nodes": len(self.centrality),
+            "error_bound": self.error_bound,
+            "confidence": 1.0 - self.delta,
+            "exact": self.exact,
+            "seconds": self.seconds,
+        }
+
+
+class _Sample:
+    """Running sums of the pivots' contributions to each node."""
+
+    def __init__(self, graph: nx.Graph, delta: float) -> None:
+        n = graph.number_of_nodes()
+        self.n = n
+        self.nodes = list(graph)
+        # Each pivot contributes n * delta_s(v) * normalization to v
+        self.scale = n * normalization(graph)
+        self.range = n / (n - 1)
+        self.log_hoeffding = math.log(4 * n / delta)
+        self.log_bernstein = math.log(8 * n / delta)
+        # Checks of the bound so far; see _split
+        self.checks = 0
+        self.sums: Dict[Hashable, float] = {}
+        self.squares: Dict[Hashable, float] = {}
+        self.count = 0
+
+    def add(self, dependency: Dict[Hashable, float]) -> None:
+        sums, squares = self.sums, self.squares
+        for v, value in dependency.items():
+            if value:
+                sums[v] = sums.get(v, 0.0) + value
+                squares[v] = squares.get(v, 0.0) + value * value
+        self.count += 1
+
+    @staticmethod
+    def _split(check: int) -> float:
+        """``ln(delta/delta_i)``, added to the logs at check ``i``."""
+        return math.log(check * (check + 1))
+
+    def planned(self, epsilon: float) -> int:
+        """Pivots the Hoeffding bound needs for ``epsilon`` at the next check."""
+        log = self.log_hoeffding + self._split(self.checks + 1)
+        needed = self.range**2 * log / (2 * epsilon**2)
+        return min(self.n, max(2, math.ceil(needed)))
+
+    def error_bound(self) -> float:
+        """Bound of this check, the next in the sequence of ``delta_i``."""
+        self.checks += 1
+        k = self.count
+        if k >= self.n:
+            return 0.0
+        split = self._split(self.checks)
+        log_hoeffding = self.log_hoeffding + split
+        log_bernstein = self.log_bernstein + split
+        hoeffding = self.range * math.sqrt(log_hoeffding / (2 * k))
+        if k < 2:
+            return hoeffding
+        # Largest sample variance over all nodes, in normalized units
+        variance = max(
+            (
+                (self.squares[v] - self.sums[v] * self.sums[v] / k) / (k - 1)
+                for v in self.sums
+            ),
+            default=0.0,
+        ) * (self.scale * self.scale)
+        bernstein = math.sqrt(
+            2 * max(variance, 0.0) * log_bernstein / k
+        ) + 7 * self.range * log_bernstein / (3 * (k - 1))
+        return min(hoeffding, bernstein)
+
+    def estimate(self) -> Dict[Hashable, float]:
+        factor = self.scale / self.count if self.count else 0.0
+        sums = self.sums
+        return {v: sums.get(v, 0.0) * factor for v in self.nodes}
+
+
+def approximate_betweenness(
+    graph: nx.Graph,
+    epsilon: Optional[float] = DEFAULT_EPSILON,
+    delta: float = DEFAULT_DELTA,
+    max_seconds: Optional[float] = None,
+    seed: int = 0,
+    on_batch: Optional[Callable[[int, int, Callable[[], Dict]], None]] = None,
+) -> BetweennessEstimate:
+    """Estimate normalized betweenness centrality by pivot sampling.
+
+    Args:
+        graph: Graph to analyze
+        epsilon: Accuracy target: stop once the error bound is at most
+            this; None to sample until the time is up or every node is done
+        delta: The bound holds for all nodes with probability ``1 - delta``
+        max_seconds: Time target: batches are sized to stop about then
+        seed: Seed of the pivot order
+        on_batch: Called as ``on_batch(done, planned, estimate)`` after each
+            batch, where ``planned`` is the number of pivots the Hoeffding
+            bound needs for ``epsilon`` (at most ``n``); it grows a little
+            with every check
+
+    Returns:
+        The estimate with its sample size and error bound
+    """
+    started = time.perf_counter()
+    n = graph.number_of_nodes()
+    if n <= 2:
+        return BetweennessEstimate(dict.fromkeys(graph, 0.0), n, 0.0, delta, 0.0)
+
+    sample = _Sample(graph, delta)
+    planned = sample.planned(epsilon) if epsilon else n
+    pivots = list(sample.nodes)
+    random.Random(seed).shuffle(pivots)
+
+    bound = math.inf
+    batch_end = min(planned, FIRST_BATCH)
+    while True:
+        for source in pivots[sample.count : batch_end]:
+            sample.add(source_dependencies(graph, source))
+        bound = sample.error_bound()
+        if on_batch is not None:
+            on_batch(sample.count, planned, sample.estimate)
+        elapsed = time.perf_counter() - started
+        if (
+            sample.count >= planned
+            or (epsilon and bound <= epsilon)
+            or (max_seconds is not None and elapsed >= max_seconds)
+        ):
+            break
+        if epsilon:
+            planned = sample.planned(epsilon)
+        batch_end = min(planned, max(batch_end + FIRST_BATCH, batch_end * 5 // 4))
+        if max_seconds is not None:
+            pace = elapsed / sample.count
+            fits = int((max_seconds - elapsed) / pace) if pace > 0 else batch_end
+            batch_end = min(batch_end, sample.count + max(1, fits))
+
+    return BetweennessEstimate(
+        centrality=sample.estimate(),
+        samples=sample.count,
+        error_bound=bound,
+        delta=delta,
+        seconds=time.perf_counter() - started,
+    )
+
+
+# The graph of a parallel_betweenness worker process
+_worker_graph: Optional[nx.Graph] = None
+
+
+def _set_worker_graph(graph: nx.Graph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _chunk_dependencies(sources: List[Hashable]) -> List[float]:
+    """Summed dependencies of ``sources``, in the graph's node order."""
+    graph = _worker_graph
+    assert graph is not None
+    index = {v: i for i, v in enumerate(graph)}
+    total = [0.0] * len(index)
+    for source in sources:
+        for v, value in source_dependencies(graph, source).items():
+            total[index[v]] += value
+    return total
+
+
+def parallel_betweenness(
+    graph: nx.Graph,
+    workers: int,
+    on_chunk: Optional[Callable[[int, int], None]] = None,
+) -> Dict[Hashable, float]:
+    """Exact normalized betweenness with sources split across processes.
+
+    Args:
+        graph: Graph to analyze
+        workers: Number of worker processes, at most ``MAX_WORKERS``; 1
+            computes in this process
+        on_chunk: Called as ``on_chunk(done, chunks)`` as chunks complete;
+            an exception it raises (e.g. cancellation) stops the workers
+
+    Returns:
+        Betweenness centrality of every node
+    """
+    nodes = list(graph)
+    n = len(nodes)
+    if n <= 2:
+        return dict.fromkeys(nodes, 0.0)
+    workers = min(workers, MAX_WORKERS)
+    count = min(n, max(1, workers) * CHUNKS_PER_WORKER)
+    # Strided chunks mix cheap and expensive sources evenly
+    chunks = [nodes[i::count] for i in range(count)]
+
+    if workers <= 1:
+        _set_worker_graph(graph)
+        try:
+            parts = []
+            for chunk in chunks:
+                parts.append(_chunk_dependencies(chunk))
+                if on_chunk is not None:
+                    on_chunk(len(parts), count)
+        finally:
+            _set_worker_graph(None)
+    else:
+        parts = _run_chunks(graph, chunks, workers, on_chunk)
+
+    total = [0.0] * n
+    for part in parts:
+        for i, value in enumerate(part):
+            total[i] += value
+    scale = normalization(graph)
+    return {v: value * scale for v, value in zip(nodes, total)}
+
+
+def _run_chunks(
+    graph: nx.Graph,
+    chunks: List[List[Hashable]],
+    workers: int,
+    on_chunk: Optional[Callable[[int, int], None]],
+) -> List[List[float]]:
+    pool = ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_set_worker_graph,
+        initargs=(graph,),
+    )
+    try:
+        with _terminate_on_sigterm(pool):
+            futures = [pool.submit(_chunk_dependencies, chunk) for chunk in chunks]
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if on_chunk is not None:
+                    on_chunk(len(futures) - len(pending), len(futures))
+            parts = [future.result() for future in futures]
+    except BaseException:
+        _terminate(pool)
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    return parts
+
+
+def _terminate(pool: ProcessPoolExecutor) -> None:
+    # ProcessPoolExecutor has no public way to stop a running job
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+
+
+@contextmanager
+def _terminate_on_sigterm(pool: ProcessPoolExecutor) -> Iterator[None]:
+    """Stop the workers of ``pool`` if this process gets SIGTERM.
+
+    The execution engine cancels a job by terminating the worker process
+    running it; the chunk workers started from there would outlive it.
+    Handlers can only be set from the main thread, which is where engine
+    worker processes run their jobs; on other threads this does nothing.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def stop(signum: int, frame: Any) -> None:
+        _terminate(pool)
+        # Then let the signal do what it would have done. Raising instead
+        # would not do: a pool worker reports exceptions from its job and
+        # carries on
+        signal.signal(signal.SIGTERM, previous)
+        os.kill(os.getpid(), signum)
+
+    previous = signal.signal(signal.SIGTERM, stop)
+    if previous is None:
+        # Set outside Python; the default is the best we can restore
+        previous = signal.SIG_DFL
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
@@ -0,0 +1,228 @@
+"""Incrementally maintained connected components.
+
+Graphs are built up by batches of ``add_nodes``/``add_edges`` with
+component checks in between. Instead of traversing the whole graph for
+every check, a union-find index per graph absorbs each batch as it is
+added; the component count, the sizes and the largest component are then
+read off the index.
+
+The index records the node and edge counts it reflects. A mutation that
+did not go through ``extend_components`` (a removal, or an addition made
+directly on the graph) leaves the counts out of sync, and the index is
+rebuilt from scratch on the next query. Code that removes and adds in
+one go, leaving the counts unchanged, calls ``drop_components``. Edges are unioned regardless of
+direction, which gives the weakly connected components of directed
+graphs.
+
+Ties for the largest component are broken like the full traversal
+(``nx.connected_components`` visits nodes in insertion order): the
+component whose first node was added earliest wins.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# (number of nodes, number of edges)
+GraphSize = Tuple[int, int]
+
+
+def graph_size(graph: Any) -> GraphSize:
+    return graph.number_of_nodes(), graph.number_of_edges()
+
+
+class UnionFind:
+    """Disjoint sets with union by size and path halving.
+
+    Every set keeps the list of its members and the insertion index of
+    its first member, so the largest set is known at all times.
+    """
+
+    def __init__(self) -> None:
+        self._parent: Dict[Hashable, Hashable] = {}
+        self._members: Dict[Hashable, List[Hashable]] = {}
+        self._first: Dict[Hashable, int] = {}
+        self._largest: Any = None
+        self.count = 0
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._parent
+
+    def add(self, item: Hashable) -> None:
+        """Add ``item`` as a set of its own, unless already present."""
+        if item in self._parent:
+            return
+        self._parent[item] = item
+        self._members[item] = [item]
+        self._first[item] = len(self._parent) - 1
+        self.count += 1
+        # A later singleton never beats the current largest set
+        if self._largest is None:
+            self._largest = item
+
+    @classmethod
+    def from_labels(cls, items: List[Hashable], labels: List[int]) -> "UnionFind":
+        """Sets of ``items`` by component label.
+
+        Labels must be numbered in order of first appearance, as
+        ``csr.component_labels`` does; the first item of a set is its root.
+        """
+        sets = cls()
+        roots: List[Hashable] = []
+        for position, (item, label) in enumerate(zip(items, labels)):
+            if label == len(roots):
+                roots.append(item)
+                sets._members[item] = []
+                sets._first[item] = position
+            root = roots[label]
+            sets._parent[item] = root
+            sets._members[root].append(item)
+        sets.count = len(roots)
+        sets._largest = max(roots, key=sets._rank, default=None)
+        return sets
+
+    def find(self, item: Hashable) -> Hashable:
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: Hashable, b: Hashable) -> bool:
+        """Merge the sets of ``a`` and ``b``, adding them if needed.
+
+        Returns:
+            True if two sets were merged
+        """
+        self.add(a)
+        self.add(b)
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        members = self._members
+        if len(members[root_a]) < len(members[root_b]):
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        members[root_a].extend(members.pop(root_b))
+        self._first[root_a] = min(self._first[root_a], self._first.pop(root_b))
+        self.count -= 1
+
+        best = self._largest
+        if best == root_b or self._rank(root_a) > self._rank(best):
+            self._largest = root_a
+        return True
+
+    def _rank(self, root: Hashable) -> Tuple[int, int]:
+        return len(self._members[root]), -self._first[root]
+
+    def sizes(self) -> List[int]:
+        """Sizes of all sets, largest first."""
+        return sorted((len(m) for m in self._members.values()), reverse=True)
+
+    def largest(self) -> List[Hashable]:
+        """Members of the largest set (empty if there are none)."""
+        if self._largest is None:
+            return []
+        return list(self._members[self._largest])
+
+
+class ComponentIndex:
+    """Union-find over a graph's nodes and edges, and the size it reflects."""
+
+    def __init__(self) -> None:
+        self.sets = UnionFind()
+        self.size: GraphSize = (0, 0)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def build(cls, graph: Any, version: Optional[int] = None) -> "ComponentIndex":
+        """Index of ``graph`` from scratch.
+
+        With SciPy the components are labeled on the graph's CSR snapshot
+        (shared with other algorithms at ``version``), else by a union of
+        every edge.
+        """
+        from .csr import HAS_SCIPY, component_labels, snapshot_of
+
+        index = cls()
+        if HAS_SCIPY:
+            snapshot = snapshot_of(graph, version)
+            _, labels = component_labels(snapshot)
+            index.sets = UnionFind.from_labels(snapshot.nodes, labels.tolist())
+        else:
+            for node in graph:
+                index.sets.add(node)
+            for u, v in graph.edges():
+                index.sets.union(u, v)
+        index.size = graph_size(graph)
+        return index
+
+    def summary(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "num_components": self.sets.count,
+                "component_sizes": self.sets.sizes(),
+                "largest_component": self.sets.largest(),
+            }
+
+
+_indexes: "weakref.WeakKeyDictionary[Any, ComponentIndex]" = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def component_index(graph: Any, version: Optional[int] = None) -> ComponentIndex:
+    """The component index of ``graph``, rebuilt if it is out of sync.
+
+    ``version`` is the graph's version, if known, for sharing its CSR
+    snapshot.
+    """
+    with _indexes_lock:
+        index = _indexes.get(graph)
+    if index is not None and index.size == graph_size(graph):
+        return index
+    # Built outside the lock: other graphs' queries need not wait for it
+    index = ComponentIndex.build(graph, version)
+    with _indexes_lock:
+        _indexes[graph] = index
+    return index
+
+
+def extend_components(
+    graph: Any,
+    before: GraphSize,
+    nodes: Iterable[Hashable] = (),
+    edges: Iterable[Tuple[Hashable, Hashable]] = (),
+) -> None:
+    """Fold nodes and edges just added to ``graph`` into its index.
+
+    Args:
+        graph: The graph the nodes and edges were added to
+        before: ``graph_size(graph)`` before they were added
+        nodes: Nodes added, in the order they were passed to the graph
+        edges: Edges added, in the order they were passed to the graph
+    """
+    with _indexes_lock:
+        index = _indexes.get(graph)
+    if index is None:
+        # Nothing to keep up to date until the first query
+        return
+    with index.lock:
+        if index.size != before:
+            # Changed behind our back; rebuilt on the next query
+            with _indexes_lock:
+                _indexes.pop(graph, None)
+            return
+        for node in nodes:
+            index.sets.add(node)
+        for u, v in edges:
+            index.sets.union(u, v)
+        index.size = graph_size(graph)
+
+
+def drop_components(graph: Any) -> None:
+    """Forget the index of ``graph``, e.g. after removing nodes or edges."""
+    with _indexes_lock:
+        _indexes.pop(graph, None)
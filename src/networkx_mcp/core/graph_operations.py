@@ -8,6 +8,7 @@ import networkx as nx
 
 # Import MCP error classes
 from ..errors import GraphAlreadyExistsError, GraphNotFoundError, ValidationError
+from .components import drop_components
 
 
 class GraphManager:
@@ -200,6 +201,7 @@ class GraphManager:
                 raise ValueError(msg)
 
             graph.remove_node(node_id)
+            drop_components(graph)
 
         return {"graph_id": graph_id, "node_id": node_id, "removed": True}
 
@@ -214,6 +216,7 @@ class GraphManager:
                 raise ValueError(msg)
 
             graph.remove_edge(source, target)
+            drop_components(graph)
 
         return {"graph_id": graph_id, "edge": (source, target), "removed": True}
 
@@ -353,5 +356,6 @@ class GraphManager:
         with self._lock:
             graph = self.get_graph(graph_id)
             graph.clear()
+            drop_components(graph)
 
         return {"graph_id": graph_id, "cleared": True, "num_nodes": 0, "num_edges": 0}
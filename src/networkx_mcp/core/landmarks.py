@@ -0,0 +1,449 @@
+"""Landmark (ALT) index for repeated point-to-point shortest paths.
+
+A point-to-point query with no knowledge of the graph explores every
+node closer to the source than the target; on road and dependency graphs
+that is most of the graph. ALT (A*, landmarks and the triangle
+inequality) preprocesses instead: a few landmark nodes are picked and
+the distances between each of them and every node are stored. For any
+landmark ``l`` the triangle inequality gives two lower bounds on the
+distance from ``v`` to the target ``t``::
+
+    d(l, t) - d(l, v) <= d(v, t)      d(v, l) - d(t, l) <= d(v, t)
+
+and A* with the largest of these bounds as its heuristic settles only
+the nodes near the shortest path. The bounds are consistent, so the
+first path A* finds is a shortest one. They also prune: a node that a
+landmark reaches but the target does not (or the reverse) cannot be on
+any path to the target and is never queued.
+
+Landmarks are chosen farthest-first: the first is the node farthest from
+a high-degree node, each next one the node farthest from all landmarks
+chosen so far. That spreads them over the periphery, where their bounds
+are tightest. Distances come from SciPy's ``csgraph.dijkstra`` on the
+graph's CSR snapshot when it can express the costs (hop counts, or the
+``"weight"`` attribute of a simple graph), and from NetworkX searches
+otherwise. Hop counts are stored as float32, which is exact below 2**24;
+weighted distances as float64, as rounded-up bounds could overestimate.
+
+ALT pays off on graphs with long shortest paths, such as road networks,
+where a bidirectional search settles a large part of the graph. On
+small-world graphs every node is a few hops from the landmarks, the
+bounds are close to zero and A* settles far more than the bidirectional
+search it replaces. A few random queries are therefore timed both ways
+when the index is built, and ``effective`` tells whether the index made
+them faster; the server only uses an index that did.
+
+The index belongs to one version of one graph. It is kept as an
+attribute of the graph object, so it is pickled along with the graph
+wherever the graph goes (spill files, worker processes) and is counted
+by ``estimate_graph_bytes`` against the cache's memory budget, while
+``graph.copy()`` (and so a copy-on-write) leaves it behind. A write
+committed in place drops it, and ``index_of`` hands it out only for the
+version it was built at; queries on a changed graph run without it
+until ``build_index`` refreshes it. Build time and memory are kept per
+index, and builds and queries are summarized by ``get_landmark_stats``.
+
+This module imports NumPy; import it lazily from modules the server
+loads at startup.
+"""
+
+import heapq
+import random
+import sys
+import threading
+import time
+from itertools import count
+from math import inf
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+
+from .csr import HAS_SCIPY, csgraph, snapshot_of
+from .paths import pair_path, predecessor_path, weight_function
+
+# Attribute of the graph object the index is kept in (see graph_cache.py)
+INDEX_ATTRIBUTE = "_landmark_index"
+
+DEFAULT_LANDMARKS = 8
+MAX_LANDMARKS = 64
+
+# Stored in place of infinite distances, so that differences of two
+# entries stay finite; any bound above FAR means "cannot reach"
+UNREACHABLE = float(np.finfo(np.float32).max) / 4
+FAR = UNREACHABLE / 2
+
+# Random queries an index is timed on when it is built
+CALIBRATION_QUERIES = 4
+
+
+class LandmarkIndex:
+    """Distances between a few landmarks and every node of a graph."""
+
+    def __init__(
+        self,
+        landmarks: List[Hashable],
+        index: Dict[Hashable, int],
+        forward: np.ndarray,
+        backward: Optional[np.ndarray],
+        weight: Optional[str],
+        version: Optional[int] = None,
+        build_seconds: float = 0.0,
+    ) -> None:
+        self.landmarks = landmarks
+        # Node to row of the distance arrays
+        self.index = index
+        # forward[i, k] is the distance from landmark k to node i, and
+        # backward[i, k] from node i to landmark k (None if undirected)
+        self.forward = forward
+        self.backward = backward
+        self.weight = weight
+        self.version = version
+        self.build_seconds = build_seconds
+        # Time of the calibration queries without the index over their
+        # time with it
+        self.speedup = 1.0
+
+    @property
+    def n(self) -> int:
+        return len(self.index)
+
+    @property
+    def effective(self) -> bool:
+        """Whether queries are faster with the index than without."""
+        return self.speedup > 1
+
+    @property
+    def nbytes(self) -> int:
+        """Memory of the distance arrays and the node index (approximate)."""
+        total = self.forward.nbytes + sys.getsizeof(self.index)
+        if self.backward is not None:
+            total += self.backward.nbytes
+        return total + sys.getsizeof(self.landmarks)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "nodes": self.n,
+            "landmarks": len(self.landmarks),
+            "weight": self.weight,
+            "build_seconds": self.build_seconds,
+            "memory_mb": self.nbytes / 1024 / 1024,
+            "speedup": self.speedup,
+            "effective": self.effective,
+        }
+
+    def heuristic(self, target: Hashable) -> Callable[[Hashable], float]:
+        """Lower bound on the distance from a node to ``target``."""
+        row = self.index
+        forward = self.forward
+        to_target = forward[row[target]].tolist()
+        if self.backward is None:
+            return lambda v: max(
+                abs(a - b) for a, b in zip(to_target, forward[row[v]].tolist())
+            )
+
+        backward = self.backward
+        from_target = backward[row[target]].tolist()
+
+        def bound(v: Hashable) -> float:
+            i = row[v]
+            ahead = max(a - b for a, b in zip(to_target, forward[i].tolist()))
+            behind = max(b - a for a, b in zip(from_target, backward[i].tolist()))
+            return ahead if ahead > behind else behind
+
+        return bound
+
+    def shortest_path(
+        self, graph: nx.Graph, source: Hashable, target: Hashable
+    ) -> Tuple[List[Any], Any, int]:
+        """Shortest path from ``source`` to ``target`` by A* with ALT bounds.
+
+        Args:
+            graph: The graph the index was built for, at the same version
+
+        Returns:
+            The path, its length (hops, or total weight) and the number of
+            nodes settled
+
+        Raises:
+            NodeNotFound: If ``source`` or ``target`` is not in the graph
+            NetworkXNoPath: If ``target`` cannot be reached from ``source``
+            ValueError: If the search reaches an edge with negative weight
+        """
+        if source not in graph:
+            raise nx.NodeNotFound(f"Source {source} is not in G")
+        if target not in graph:
+            raise nx.NodeNotFound(f"Target {target} is not in G")
+        path, length, settled = self._search(graph, source, target)
+        with _stats_lock:
+            _stats.queries += 1
+            _stats.settled += settled
+        if path is None:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+        return path, length, settled
+
+    def _search(
+        self,
+        graph: nx.Graph,
+        source: Hashable,
+        target: Hashable,
+        deadline: Optional[float] = None,
+    ) -> Tuple[Optional[List[Any]], Any, int]:
+        """A* from ``source`` to ``target``, given up at ``deadline``.
+
+        The path is None if there is none, or if the search was given up.
+        """
+        if source == target:
+            return [source], 0, 0
+        h = self.heuristic(target)
+        # Plain dicts behind graph.adj, as in paths.py
+        adjacency = graph._adj
+        cost = None if self.weight is None else weight_function(graph, self.weight)
+        pred: Dict[Hashable, Optional[Hashable]] = {source: None}
+        seen: Dict[Hashable, Any] = {source: 0}
+        estimates: Dict[Hashable, float] = {}
+        settled = set()
+        # Among equal estimates the node farthest from the source goes
+        # first: on grids whole rectangles of nodes tie, and this heads
+        # straight for the target instead of sweeping them
+        tie = count()
+        heap = [(h(source), 0, next(tie), source)]
+        pop, push = heapq.heappop, heapq.heappush
+        while heap:
+            _, d, _, v = pop(heap)
+            d = -d
+            if v == target:
+                return predecessor_path(pred, target), d, len(settled)
+            if v in settled:
+                continue
+            if deadline is not None and not len(settled) % 256:
+                if time.perf_counter() > deadline:
+                    break
+            settled.add(v)
+            for w, data in adjacency[v].items():
+                if w in settled:
+                    continue
+                if cost is None:
+                    length = d + 1
+                else:
+                    edge = cost(data)
+                    if edge < 0:
+                        raise ValueError(f"Negative weight on edge ({v}, {w})")
+                    length = d + edge
+                if length < seen.get(w, inf):
+                    estimate = estimates.get(w)
+                    if estimate is None:
+                        estimate = estimates[w] = h(w)
+                    if estimate > FAR:
+                        continue
+                    seen[w] = length
+                    pred[w] = v
+                    push(heap, (length + estimate, -length, next(tie), w))
+        return None, None, len(settled)
+
+
+def _searches(
+    graph: nx.Graph, weight: Optional[str], version: Optional[int]
+) -> Tuple[List[Hashable], Dict[Hashable, int], Callable[[int, bool], np.ndarray]]:
+    """Nodes, node index and a single-source search returning distances.
+
+    The search takes a node id and whether to follow edges backwards, and
+    returns the distance to (or from) every node, inf if unreachable.
+    """
+    simple_costs = weight is None or (weight == "weight" and not graph.is_multigraph())
+    if HAS_SCIPY and simple_costs:
+        # The snapshot sums the weights of parallel edges; a path takes
+        # the cheapest, so multigraph weights go through NetworkX below
+        snapshot = snapshot_of(graph, version)
+        if weight is not None and snapshot.weights is not None:
+            if len(snapshot.weights) and snapshot.weights.min() < 0:
+                raise ValueError("Landmark distances need non-negative weights")
+        matrices = {False: snapshot.to_scipy()}
+        matrices[True] = (
+            snapshot.transpose().to_scipy() if graph.is_directed() else matrices[False]
+        )
+
+        def search(i: int, backwards: bool) -> np.ndarray:
+            return csgraph.dijkstra(
+                matrices[backwards], indices=i, unweighted=weight is None
+            )
+
+        return snapshot.nodes, snapshot.index, search
+
+    nodes = list(graph)
+    index = {v: i for i, v in enumerate(nodes)}
+    reverse = graph.reverse(copy=False) if graph.is_directed() else graph
+
+    def search(i: int, backwards: bool) -> np.ndarray:
+        g = reverse if backwards else graph
+        if weight is None:
+            lengths = nx.single_source_shortest_path_length(g, nodes[i])
+        else:
+            lengths = nx.single_source_dijkstra_path_length(g, nodes[i], weight=weight)
+        distances = np.full(len(nodes), inf)
+        distances[[index[v] for v in lengths]] = list(lengths.values())
+        return distances
+
+    return nodes, index, search
+
+
+def _reach(distances: np.ndarray) -> np.ndarray:
+    """Distances with the unreachable nodes at 0, for picking landmarks."""
+    return np.where(np.isfinite(distances), distances, 0)
+
+
+def build_index(
+    graph: nx.Graph,
+    landmarks: int = DEFAULT_LANDMARKS,
+    weight: Optional[str] = None,
+    version: Optional[int] = None,
+) -> LandmarkIndex:
+    """Build a landmark index for ``graph`` and keep it on the graph.
+
+    The graph must not change while this runs (pass a pinned snapshot).
+
+    Args:
+        graph: Graph to index (directed graphs follow edge direction)
+        landmarks: Number of landmarks; fewer are used when every node is
+            already a landmark or unreachable from them
+        weight: Edge attribute of the distances (default 1 per edge); None
+            for hop counts
+        version: The graph's version, checked by ``index_of``; also shares
+            the graph's CSR snapshot
+
+    Returns:
+        The index, which replaces any index the graph had
+
+    Raises:
+        ValueError: If ``landmarks`` is not between 1 and ``MAX_LANDMARKS``
+            or an edge has a negative weight
+    """
+    if not 1 <= landmarks <= MAX_LANDMARKS:
+        raise ValueError(f"landmarks must be between 1 and {MAX_LANDMARKS}")
+    started = time.perf_counter()
+    nodes, index, search = _searches(graph, weight, version)
+    n = len(nodes)
+    directed = graph.is_directed()
+    dtype = np.float32 if weight is None else np.float64
+    forward_columns: List[np.ndarray] = []
+    backward_columns: List[np.ndarray] = []
+    chosen: List[int] = []
+
+    if n:
+        start = index[max(graph.degree, key=lambda item: item[1])[0]]
+        spread = _reach(search(start, False))
+        if directed:
+            spread += _reach(search(start, True))
+        following = int(np.argmax(spread))
+        # Smallest distance of every node to the landmarks so far
+        nearest = None
+        while len(chosen) < landmarks:
+            chosen.append(following)
+            forward = search(following, False)
+            forward_columns.append(forward)
+            spread = _reach(forward)
+            if directed:
+                backward = search(following, True)
+                backward_columns.append(backward)
+                spread += _reach(backward)
+            nearest = spread if nearest is None else np.minimum(nearest, spread)
+            following = int(np.argmax(nearest))
+            if nearest[following] <= 0:
+                break
+
+    def stack(columns: List[np.ndarray]) -> np.ndarray:
+        distances = np.empty((n, len(columns)), dtype=dtype)
+        for k, column in enumerate(columns):
+            distances[:, k] = np.where(np.isfinite(column), column, UNREACHABLE)
+        return distances
+
+    result = LandmarkIndex(
+        [nodes[i] for i in chosen],
+        index,
+        stack(forward_columns),
+        stack(backward_columns) if directed else None,
+        weight,
+        version,
+    )
+    result.speedup = _calibrate(graph, result)
+    result.build_seconds = time.perf_counter() - started
+    setattr(graph, INDEX_ATTRIBUTE, result)
+    with _stats_lock:
+        _stats.builds += 1
+        _stats.build_seconds += result.build_seconds
+    return result
+
+
+def _calibrate(graph: nx.Graph, index: LandmarkIndex) -> float:
+    """Speedup of a few random queries from using ``index``.
+
+    Each query runs as a bidirectional search, as without the index, and
+    then with the index, given up after twice the time of the former.
+    """
+    nodes = list(index.index)
+    if not nodes:
+        return 1.0
+    rng = random.Random(len(nodes))
+    plain = indexed = 0.0
+    for _ in range(CALIBRATION_QUERIES):
+        source, target = rng.choice(nodes), rng.choice(nodes)
+        started = time.perf_counter()
+        try:
+            pair_path(graph, source, target, index.weight)
+        except nx.NetworkXNoPath:
+            pass
+        seconds = time.perf_counter() - started
+        plain += seconds
+        started = time.perf_counter()
+        index._search(graph, source, target, started + 2 * seconds)
+        indexed += time.perf_counter() - started
+    return plain / indexed
+
+
+def index_of(graph: nx.Graph, version: Optional[int] = None) -> Optional[LandmarkIndex]:
+    """The landmark index of ``graph`` at ``version``, if it has one.
+
+    An index built at another version is dropped. With no version (plain
+    dicts of graphs, or a write in progress) only an index built without
+    one is used.
+    """
+    index = graph.__dict__.get(INDEX_ATTRIBUTE)
+    if index is None:
+        return None
+    # The node count catches most mutations made without a new version
+    if index.version == version and index.n == len(graph):
+        return index
+    if version is not None:
+        drop_index(graph)
+    return None
+
+
+def drop_index(graph: nx.Graph) -> bool:
+    """Remove the landmark index of ``graph``; False if it had none."""
+    return graph.__dict__.pop(INDEX_ATTRIBUTE, None) is not None
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.builds = 0
+        self.build_seconds = 0.0
+        self.queries = 0
+        self.settled = 0
+
+
+_stats_lock = threading.Lock()
+_stats = _Stats()
+
+
+def get_landmark_stats() -> Dict[str, Any]:
+    """Index builds, the time spent on them and the queries answered."""
+    with _stats_lock:
+        return {
+            "builds": _stats.builds,
+            "build_seconds": _stats.build_seconds,
+            "queries": _stats.queries,
+            "settled_per_query": (
+                _stats.settled / _stats.queries if _stats.queries else 0.0
+            ),
+        }
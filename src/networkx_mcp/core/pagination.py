@@ -0,0 +1,213 @@
+"""Cursor-based pagination over graph nodes and edges.
+
+A page is a slice of the graph's own iteration order (node insertion
+order, and adjacency order for edges). The opaque cursor records how many
+items were returned so far and which item came last:
+
+- If nothing before the cursor changed, the next page starts at the
+  recorded offset after a single check of the item before it.
+- Otherwise the last item is looked up again and the scan resumes right
+  after it, so items that survive a mutation are neither skipped nor
+  repeated. Nodes added during a scan come at the end and are returned.
+- If the last item itself has been removed, the scan resumes at the
+  position it held.
+
+For a graph version known to the store, ``GraphPositions`` indexes the
+node order once, so a page starts at its offset (or at the last item's
+node) directly instead of walking the iteration order from the start.
+"""
+
+import base64
+import binascii
+import json
+from bisect import bisect_right
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..encoding import dumps
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 10000
+
+# Yields (key, attributes) pairs from a position on; the key identifies the
+# item in cursors
+Items = Callable[[int], Iterable[Tuple[Any, Dict[str, Any]]]]
+# Position of the item with the given cursor key, None if it is gone
+Locate = Callable[[str], Optional[int]]
+
+
+def encode_cursor(offset: int, key: str) -> str:
+    raw = json.dumps([offset, key], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    try:
+        offset, key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(offset, int) or offset < 0 or not isinstance(key, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return offset, key
+
+
+def edge_key(edge: Tuple[Any, ...], directed: bool) -> str:
+    """Canonical string form of an edge, as stored in cursors.
+
+    The ends are JSON-encoded node keys, so ``GraphPositions`` can find
+    the edge's node; they are sorted for undirected graphs, where (u, v)
+    and (v, u) are the same edge.
+    """
+    ends = [dumps(edge[0]), dumps(edge[1])]
+    if not directed:
+        ends.sort()
+    return dumps([*ends, *edge[2:]])
+
+
+class GraphPositions:
+    """Positions in a graph's iteration order, for one graph version.
+
+    Built on the first page read at a version and shared by the pages
+    that follow: nodes are sliced from ``nodes``, and edges are walked
+    from the node whose adjacency holds the first edge of the page, so a
+    page costs O(page_size) rather than O(offset). The edge and lookup
+    tables are built on first use.
+    """
+
+    def __init__(self, graph: Any, version: Optional[int]) -> None:
+        self.version = version
+        self.nodes: List[Any] = list(graph)
+        self._directed = graph.is_directed()
+        self._multigraph = graph.is_multigraph()
+        # Node -> position, for telling which end lists an undirected edge
+        self._position: Optional[Dict[Any, int]] = None
+        # Node cursor key -> position, for resuming after a mutation
+        self._key_position: Optional[Dict[str, int]] = None
+        # Number of edges listed before those of each node, and in total
+        self._edge_starts: Optional[List[int]] = None
+
+    def node_items(self, graph: Any, start: int) -> Iterator[Tuple[Any, Any]]:
+        nodes, data = self.nodes, graph.nodes
+        return ((nodes[i], data[nodes[i]]) for i in range(start, len(nodes)))
+
+    def edge_items(self, graph: Any, start: int) -> Iterator[Tuple[Any, Any]]:
+        starts = self._starts(graph)
+        i = bisect_right(starts, start) - 1
+        edges = chain.from_iterable(
+            self._node_edges(graph, j) for j in range(i, len(self.nodes))
+        )
+        return islice(edges, start - starts[i], None)
+
+    def locate_node(self, key: str) -> Optional[int]:
+        position = self._keys().get(key)
+        return None if position is None else position + 1
+
+    def locate_edge(self, graph: Any, key: str) -> Optional[int]:
+        try:
+            ends = json.loads(key)[:2]
+        except (ValueError, TypeError):
+            return None
+        starts = self._starts(graph)
+        positions = self._keys()
+        # Listed with one of its ends: the source, or for undirected
+        # graphs whichever end comes first
+        for end in ends:
+            j = positions.get(end) if isinstance(end, str) else None
+            if j is None:
+                continue
+            for offset, (edge, _) in enumerate(self._node_edges(graph, j)):
+                if edge_key(edge, self._directed) == key:
+                    return starts[j] + offset + 1
+        return None
+
+    def _keys(self) -> Dict[str, int]:
+        if self._key_position is None:
+            self._key_position = {dumps(n): i for i, n in enumerate(self.nodes)}
+        return self._key_position
+
+    def _starts(self, graph: Any) -> List[int]:
+        if self._edge_starts is None:
+            if not self._directed:
+                self._position = {n: i for i, n in enumerate(self.nodes)}
+            starts = [0]
+            for j in range(len(self.nodes)):
+                starts.append(starts[-1] + sum(1 for _ in self._node_edges(graph, j)))
+            self._edge_starts = starts
+        return self._edge_starts
+
+    def _node_edges(self, graph: Any, j: int) -> Iterator[Tuple[Any, Any]]:
+        # The order of graph.edges(): an undirected edge is listed with
+        # whichever end comes first
+        node, position = self.nodes[j], self._position
+        for nbr, data in graph.adj[node].items():
+            if position is not None and position[nbr] < j:
+                continue
+            if self._multigraph:
+                for key, attributes in data.items():
+                    yield (node, nbr, key), attributes
+            else:
+                yield (node, nbr), data
+
+
+def _resume_index(
+    items: Items,
+    offset: int,
+    last: str,
+    key_of: Callable[[Any], str],
+    locate: Optional[Locate],
+) -> int:
+    # Fast path: nothing before the cursor was added or removed
+    if offset > 0:
+        for key, _ in islice(items(offset - 1), 1):
+            if key_of(key) == last:
+                return offset
+    if locate is not None:
+        position = locate(last)
+        if position is not None:
+            return position
+    else:
+        for index, (key, _) in enumerate(items(0)):
+            if key_of(key) == last:
+                return index + 1
+    # The last item is gone and its successor moved up into its place
+    return max(0, offset - 1)
+
+
+def paginate(
+    items: Items,
+    cursor: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    key_of: Callable[[Any], str] = dumps,
+    locate: Optional[Locate] = None,
+) -> Tuple[List[Tuple[Any, Dict[str, Any]]], Optional[str]]:
+    """Return one page of ``items`` and the cursor of the next page.
+
+    Args:
+        items: Called with a position (possibly more than once) to iterate
+            the collection from there
+        cursor: Cursor returned with the previous page, or None to start
+        page_size: Maximum number of items in the page
+        key_of: Canonical string form of an item key, stored in cursors
+        locate: Position right after the item with a given canonical key,
+            or None if it is gone; found by a scan of ``items(0)`` if
+            not given
+
+    Returns:
+        Tuple of (page, next_cursor); next_cursor is None on the last page
+    """
+    if isinstance(page_size, bool) or not isinstance(page_size, int):
+        raise ValueError("page_size must be an integer")
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+
+    start = 0
+    if cursor:
+        offset, last = decode_cursor(cursor)
+        start = _resume_index(items, offset, last, key_of, locate)
+
+    # One extra item tells whether there is a next page
+    page = list(islice(items(start), page_size + 1))
+    if len(page) <= page_size:
+        return page, None
+    page = page[:page_size]
+    return page, encode_cursor(start + page_size, key_of(page[-1][0]))
@@ -0,0 +1,228 @@
+"""Shortest paths for many (source, target) pairs at once.
+
+Routing clients ask for hundreds of pairs per request, many of them from
+the same source. ``shortest_paths_batch`` groups the pairs by source and
+runs one search per distinct source: a BFS for hop counts, or Dijkstra
+on an edge attribute. Each search keeps one predecessor per reached node
+and stops as soon as every target of its source is settled.
+
+One search per source is not always cheaper than one bidirectional
+search per pair, which is what ``nx.shortest_path`` runs. A bidirectional
+search for a target at distance ``d`` meets in the middle after settling
+about the ball of radius ``d/2`` around each end; the search from the
+source settles the whole ball of radius ``d``. On road-like graphs that
+ball grows with the square of the radius and one search for several
+targets wins, while on small-world graphs it grows exponentially and the
+bidirectional searches win by orders of magnitude. So the search from
+the source goes on only while the ball it has settled, of radius ``r``,
+is no larger than what the bidirectional searches would settle: two
+balls of radius ``d/2`` for each target already reached at distance
+``d``, and at least two of radius ``r/2`` for each remaining one. Once
+that no longer holds, the remaining targets are searched for pair by
+pair with ``nx.bidirectional_shortest_path`` or
+``nx.bidirectional_dijkstra``.
+
+Every pair gets its own result, in input order: the path and its length,
+or an error (a node that is not in the graph, or no path).
+"""
+
+import heapq
+from bisect import bisect_right
+from itertools import count
+from math import inf
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import networkx as nx
+
+from ..cancellation import checkpoint
+from ..progress import report_progress
+
+# Pairs accepted by one shortest_paths_batch call
+MAX_BATCH_PAIRS = 10_000
+
+# Predecessors and distances of the nodes a search settled, and whether
+# it ran to the end (rather than handing the rest over to pair searches)
+Search = Tuple[Dict[Hashable, Optional[Hashable]], Dict[Hashable, Any], bool]
+
+
+def _worth_continuing(settled: int, credit: int, half: int, remaining: int) -> bool:
+    """Whether the search from the source still beats per-pair searches.
+
+    ``settled`` nodes lie within the current radius and ``half`` within
+    half of it; ``credit`` is what bidirectional searches for the targets
+    reached so far would have settled, and ``remaining`` targets have not
+    been reached yet.
+    """
+    return settled <= credit + 2 * remaining * half
+
+
+def weight_function(graph: nx.Graph, weight: str) -> Callable[[Dict[str, Any]], float]:
+    """Cost of an edge from its data; the cheapest edge of a multigraph."""
+    if graph.is_multigraph():
+        return lambda keyed: min(data.get(weight, 1) for data in keyed.values())
+    return lambda data: data.get(weight, 1)
+
+
+def _bfs(graph: nx.Graph, source: Hashable, targets: set) -> Search:
+    """Breadth-first search from ``source`` until ``targets`` are reached."""
+    adjacency = graph.adj
+    pred: Dict[Hashable, Optional[Hashable]] = {source: None}
+    dist = {source: 0}
+    remaining = targets - {source}
+    # Nodes within each distance
+    within = [1]
+    credit = 0
+    frontier = [source]
+    level = 0
+    while frontier and remaining:
+        half = within[level // 2]
+        if not _worth_continuing(within[level], credit, half, len(remaining)):
+            return pred, dist, False
+        level += 1
+        next_frontier = []
+        for v in frontier:
+            for w in adjacency[v]:
+                if w not in pred:
+                    pred[w] = v
+                    dist[w] = level
+                    next_frontier.append(w)
+                    if w in remaining:
+                        remaining.discard(w)
+                        credit += 2 * within[level // 2]
+            if not remaining:
+                break
+        within.append(len(dist))
+        frontier = next_frontier
+    return pred, dist, True
+
+
+def _dijkstra(graph: nx.Graph, source: Hashable, targets: set, weight: str) -> Search:
+    """Dijkstra's algorithm from ``source`` until ``targets`` are settled."""
+    # The plain dicts behind graph.adj, as NetworkX's own searches use:
+    # items() of the read-only views costs a method call per edge
+    adjacency = graph._adj
+    cost = weight_function(graph, weight)
+    pred: Dict[Hashable, Optional[Hashable]] = {source: None}
+    dist: Dict[Hashable, float] = {}
+    # Distances of the settled nodes, in the order they were settled
+    radii: List[float] = []
+    credit = 0
+    seen = {source: 0}
+    remaining = set(targets)
+    tie = count()
+    heap = [(0, next(tie), source)]
+    pop, push = heapq.heappop, heapq.heappush
+    while heap and remaining:
+        d, _, v = pop(heap)
+        if v in dist:
+            continue
+        half = bisect_right(radii, d / 2)
+        if radii and not _worth_continuing(len(radii), credit, half, len(remaining)):
+            return pred, dist, False
+        dist[v] = d
+        radii.append(d)
+        if v in remaining:
+            remaining.discard(v)
+            credit += 2 * half
+            if not remaining:
+                break
+        for w, data in adjacency[v].items():
+            if w in dist:
+                continue
+            edge = cost(data)
+            if edge < 0:
+                raise ValueError(f"Negative weight on edge ({v}, {w})")
+            length = d + edge
+            if length < seen.get(w, inf):
+                seen[w] = length
+                pred[w] = v
+                push(heap, (length, next(tie), w))
+    return pred, dist, True
+
+
+def pair_path(
+    graph: nx.Graph, source: Hashable, target: Hashable, weight: Optional[str]
+) -> Tuple[List[Any], Any]:
+    """Path and length of one pair by bidirectional search."""
+    if weight is None:
+        path = nx.bidirectional_shortest_path(graph, source, target)
+        return path, len(path) - 1
+    length, path = nx.bidirectional_dijkstra(graph, source, target, weight)
+    return path, length
+
+
+def predecessor_path(
+    pred: Dict[Hashable, Optional[Hashable]], target: Hashable
+) -> List[Any]:
+    """Path to ``target`` from the root of ``pred``, whose entry is None."""
+    path = [target]
+    node = pred[target]
+    while node is not None:
+        path.append(node)
+        node = pred[node]
+    path.reverse()
+    return path
+
+
+def shortest_paths_batch(
+    graph: nx.Graph,
+    pairs: Sequence[Sequence[Any]],
+    weight: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Shortest paths for ``pairs``, one search per distinct source.
+
+    Args:
+        graph: Graph to search (directed graphs follow edge direction)
+        pairs: (source, target) pairs
+        weight: Edge attribute to minimize with Dijkstra (default 1 per
+            edge); None for BFS hop counts
+
+    Returns:
+        One result per pair, in input order: ``source``, ``target`` and
+        either ``path`` and ``length`` (hops, or total weight) or ``error``
+
+    Raises:
+        ValueError: If there are more than ``MAX_BATCH_PAIRS`` pairs, a pair
+            is not a [source, target] list or a search reaches an edge with
+            negative weight
+    """
+    if len(pairs) > MAX_BATCH_PAIRS:
+        raise ValueError(f"At most {MAX_BATCH_PAIRS} pairs per batch")
+    if any(len(pair) != 2 for pair in pairs):
+        raise ValueError("Each pair must be a [source, target] list")
+    results: List[Dict[str, Any]] = [
+        {"source": source, "target": target} for source, target in pairs
+    ]
+    by_source: Dict[Hashable, List[int]] = {}
+    for i, result in enumerate(results):
+        source, target = result["source"], result["target"]
+        missing = next((v for v in (source, target) if v not in graph), None)
+        if missing is not None:
+            result["error"] = f"Node not found: {missing}"
+        else:
+            by_source.setdefault(source, []).append(i)
+
+    for done, (source, indices) in enumerate(by_source.items(), 1):
+        checkpoint()
+        targets = {results[i]["target"] for i in indices}
+        if weight is None:
+            pred, dist, complete = _bfs(graph, source, targets)
+        else:
+            pred, dist, complete = _dijkstra(graph, source, targets, weight)
+        for i in indices:
+            result = results[i]
+            target = result["target"]
+            try:
+                if target in dist:
+                    result["path"] = predecessor_path(pred, target)
+                    result["length"] = dist[target]
+                elif complete:
+                    raise nx.NetworkXNoPath
+                else:
+                    result["path"], result["length"] = pair_path(
+                        graph, source, target, weight
+                    )
+            except nx.NetworkXNoPath:
+                result["error"] = f"No path found between {source} and {target}"
+        report_progress(done, len(by_source), f"{done}/{len(by_source)} sources")
+    return results
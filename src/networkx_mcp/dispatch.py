@@ -0,0 +1,171 @@
+"""Concurrent request dispatch helpers for the stdio server loop.
+
+When the server runs with ``max_concurrency > 1`` every ``tools/call`` is
+executed as its own task, so a slow algorithm no longer holds up the
+requests queued behind it. Calls that name the same graph are ordered
+through a per-graph reader/writer lock: read-only tools share the graph,
+write tools get it exclusively, and calls on different graphs never wait
+on each other. A read-only tool holds the lock only while it pins a
+snapshot of the graph (see ``snapshots.py``), so a write never waits for
+a long read to finish, and the read still sees no write queued after it.
+The same per-graph rule decides which calls of a JSON-RPC batch may run
+side by side (see ``plan_batch``).
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .tool_registry import TOOLS
+
+
+class AsyncRWLock:
+    """FIFO reader/writer lock for asyncio tasks.
+
+    Waiters are granted strictly in arrival order, so a write queued behind
+    a read is never overtaken by reads that arrive later. This keeps calls
+    on one graph in the order the client sent them.
+    """
+
+    def __init__(self) -> None:
+        self._readers = 0
+        self._writer = False
+        self._waiters: Deque[Tuple[bool, asyncio.Future]] = deque()
+
+    @property
+    def idle(self) -> bool:
+        """True when nobody holds or waits for the lock."""
+        return not self._readers and not self._writer and not self._waiters
+
+    def _can_grant(self, write: bool) -> bool:
+        if write:
+            return not self._writer and self._readers == 0
+        return not self._writer
+
+    def _grant(self, write: bool) -> None:
+        if write:
+            self._writer = True
+        else:
+            self._readers += 1
+
+    async def acquire(self, write: bool = False) -> None:
+        """Acquire the lock for reading or, if ``write`` is set, writing."""
+        if not self._waiters and self._can_grant(write):
+            self._grant(write)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((write, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation landed
+                self.release(write)
+            else:
+                self._wake()
+            raise
+
+    def release(self, write: bool = False) -> None:
+        """Release a previously acquired read or write hold."""
+        if write:
+            self._writer = False
+        else:
+            self._readers -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            write, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if not self._can_grant(write):
+                break
+            self._waiters.popleft()
+            self._grant(write)
+            future.set_result(None)
+            if write:
+                break
+
+
+class GraphLocks:
+    """Per-graph reader/writer locks, created on demand and dropped when idle."""
+
+    def __init__(self) -> None:
+        self._locks: Dict[str, AsyncRWLock] = {}
+
+    async def acquire(self, graph_name: str, write: bool) -> None:
+        lock = self._locks.get(graph_name)
+        if lock is None:
+            lock = self._locks[graph_name] = AsyncRWLock()
+        await lock.acquire(write)
+
+    def release(self, graph_name: str, write: bool) -> None:
+        lock = self._locks[graph_name]
+        lock.release(write)
+        if lock.idle:
+            del self._locks[graph_name]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+def graph_access(request: Dict[str, Any]) -> Tuple[Optional[str], bool]:
+    """Return ``(graph_name, writes)`` for a tools/call request.
+
+    ``graph_name`` is None when the request does not target a graph (for
+    example ``resolve_doi``) or is not a tool call at all. Both values come
+    from the tool's registry entry; unknown tools are treated as writes to
+    the graph named by ``graph``, which is always safe.
+    """
+    if request.get("method") != "tools/call":
+        return None, False
+    params = request.get("params") or {}
+    if not isinstance(params, dict):
+        return None, False
+    args = params.get("arguments") or {}
+    if not isinstance(args, dict):
+        return None, False
+    spec = TOOLS.get(params.get("name"))
+    key = spec.graph_arg if spec else "graph"
+    graph_name = args.get(key) if key else None
+    if not isinstance(graph_name, str):
+        return None, False
+    return graph_name, spec.writes if spec else True
+
+
+def plan_batch(requests: List[Any]) -> List[List[List[int]]]:
+    """Split a JSON-RPC batch into stages of independent lanes.
+
+    Returns a list of stages; each stage is a list of lanes and each lane a
+    list of request indices that must run in order. Tool calls naming the
+    same graph share a lane, tool calls that name no graph get a lane of
+    their own, and lanes within a stage may run concurrently. Any other
+    method (``initialize``, ``tools/list``, ...) and malformed entries act
+    as barriers and run alone in their own stage, so they observe every
+    call before them and none after them.
+    """
+    stages: List[List[List[int]]] = []
+    lanes: Dict[Optional[str], List[int]] = {}
+    loose: List[List[int]] = []
+
+    def close_stage() -> None:
+        if lanes or loose:
+            stages.append(list(lanes.values()) + loose)
+            lanes.clear()
+            loose.clear()
+
+    for index, request in enumerate(requests):
+        if not isinstance(request, dict) or request.get("method") != "tools/call":
+            close_stage()
+            stages.append([[index]])
+            continue
+        graph_name, _ = graph_access(request)
+        if graph_name is None:
+            loose.append([index])
+        else:
+            lanes.setdefault(graph_name, []).append(index)
+
+    close_stage()
+    return stages
@@ -0,0 +1,102 @@
+"""JSON encoding for responses written to stdout.
+
+A tool result is serialized exactly once, into the ``text`` of its MCP
+content block. That text is then escaped into the response envelope in a
+single pass and spliced in, instead of being handed back to ``json.dumps``
+along with the rest of the envelope. Responses are written as UTF-8 bytes
+straight to the buffered stdout writer.
+
+orjson is used when it is installed (``pip install networkx-mcp[fast]``);
+otherwise the stdlib encoder is used. Both produce compact JSON.
+"""
+
+import json
+import sys
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Optional, TextIO
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_SEPARATORS = (",", ":")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string."""
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Something orjson rejects (e.g. an int over 64 bits): let the
+            # stdlib encoder decide
+            pass
+    return json.dumps(obj, separators=_SEPARATORS).encode("utf-8")
+
+
+def quote(text: str) -> bytes:
+    """Encode ``text`` as a JSON string literal."""
+    if HAS_ORJSON:
+        return orjson.dumps(text)
+    return encode_basestring_ascii(text).encode("ascii")
+
+
+class PreEncoded(dict):
+    """A result dict that carries its own JSON serialization.
+
+    ``encode_response`` splices ``encoded`` into the response instead of
+    serializing the dict again. Treat instances as read-only: they may be
+    shared between responses.
+    """
+
+    def __init__(self, value: Dict[str, Any], encoded: Optional[bytes] = None) -> None:
+        super().__init__(value)
+        self.encoded = dumps_bytes(value) if encoded is None else encoded
+
+
+_TEXT_CONTENT_HEAD = b'{"content":[{"type":"text","text":'
+_TEXT_CONTENT_TAIL = b"}]}"
+
+
+def text_content(text: str) -> PreEncoded:
+    """An MCP ``{"content": [{"type": "text", ...}]}`` result for ``text``."""
+    return PreEncoded(
+        {"content": [{"type": "text", "text": text}]},
+        _TEXT_CONTENT_HEAD + quote(text) + _TEXT_CONTENT_TAIL,
+    )
+
+
+def encode_response(response: Any) -> bytes:
+    """Serialize a response (or batch), reusing pre-encoded results."""
+    if isinstance(response, list):
+        return b"[" + b",".join(encode_response(r) for r in response) + b"]"
+    result = response.get("result") if isinstance(response, dict) else None
+    if not isinstance(result, PreEncoded):
+        return dumps_bytes(response)
+
+    head = dumps_bytes({k: v for k, v in response.items() if k != "result"})
+    separator = b"," if len(head) > 2 else b""
+    return head[:-1] + separator + b'"result":' + result.encoded + b"}"
+
+
+def write_message(data: bytes, stream: Optional[TextIO] = None) -> None:
+    """Write one newline-terminated message and flush it."""
+    stream = sys.stdout if stream is None else stream
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        # A plain text stream (e.g. a StringIO in tests)
+        stream.write(data.decode("utf-8") + "\n")
+        stream.flush()
+        return
+    # Anything already written through the text layer must go out first
+    stream.flush()
+    buffer.write(data + b"\n")
+    buffer.flush()
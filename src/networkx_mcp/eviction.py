@@ -0,0 +1,107 @@
+"""Eviction policies for GraphCache.
+
+The cache evicts the unpinned in-memory graph with the lowest
+``priority``. A policy sets that priority whenever a graph is cached or
+accessed and may age the remaining graphs as others are evicted:
+
+- ``LRUPolicy``: least recently used first.
+- ``LFUPolicy``: least frequently used first, with dynamic aging (LFU-DA):
+  a graph's priority is its access count plus the priority of the last
+  evicted graph. Graphs that were popular a long time ago are then
+  overtaken by recent ones instead of staying forever.
+- ``CostAwarePolicy``: GreedyDual-Size-Frequency. Priority is the access
+  count times the cost of a miss, divided by the graph's size, plus the
+  same aging term. Large graphs that are cheap to reload go first; small
+  graphs and graphs that are slow to rebuild stay.
+
+The miss cost of a graph (``CachedGraph.miss_cost``) is estimated by the
+cache: the reload time from the disk tier when there is one, otherwise the
+time spent building the graph.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Type
+
+if TYPE_CHECKING:
+    from .graph_cache import CachedGraph
+
+
+class EvictionPolicy(ABC):
+    """Decides which graph GraphCache evicts first.
+
+    ``on_access`` is called under the graph's shard lock and ``on_evict``
+    under the cache lock, so a policy only updates the entry it is given
+    and its own scalar state.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def on_access(self, cached: "CachedGraph") -> None:
+        """Set ``cached.priority`` after the graph was cached or accessed."""
+
+    def on_evict(self, cached: "CachedGraph") -> None:
+        """Called with each graph the cache evicts."""
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used graph."""
+
+    name = "lru"
+
+    def on_access(self, cached: "CachedGraph") -> None:
+        cached.priority = cached.tick
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evict the least frequently used graph, with dynamic aging."""
+
+    name = "lfu"
+
+    def __init__(self) -> None:
+        self.age = 0.0
+
+    def on_access(self, cached: "CachedGraph") -> None:
+        cached.priority = self.age + cached.access_count + 1
+
+    def on_evict(self, cached: "CachedGraph") -> None:
+        self.age = max(self.age, cached.priority)
+
+
+class CostAwarePolicy(EvictionPolicy):
+    """Evict the graph with the lowest frequency x miss cost / size."""
+
+    name = "cost"
+
+    def __init__(self, min_cost: float = 0.001) -> None:
+        """Initialize the policy.
+
+        Args:
+            min_cost: Floor of the miss cost in seconds, the overhead of a
+                miss however small the graph
+        """
+        self.min_cost = min_cost
+        self.age = 0.0
+
+    def on_access(self, cached: "CachedGraph") -> None:
+        cost = max(cached.miss_cost, self.min_cost)
+        frequency = cached.access_count + 1
+        cached.priority = self.age + frequency * cost / max(cached.size_bytes, 1)
+
+    def on_evict(self, cached: "CachedGraph") -> None:
+        self.age = max(self.age, cached.priority)
+
+
+POLICIES: Dict[str, Type[EvictionPolicy]] = {
+    policy.name: policy for policy in (LRUPolicy, LFUPolicy, CostAwarePolicy)
+}
+
+
+def make_policy(name: str) -> EvictionPolicy:
+    """Create a policy by name (``lru``, ``lfu`` or ``cost``)."""
+    try:
+        return POLICIES[name.lower()]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown eviction policy {name!r}; choose from {sorted(POLICIES)}"
+        ) from None
@@ -0,0 +1,308 @@
+"""Execution engine for tool calls.
+
+Every tool declares a cost class. Cheap tools run inline on the event loop
+thread, I/O-bound tools on a thread pool, and CPU-bound tools in a pool of
+worker processes so that a long ``betweenness_centrality`` neither freezes
+the server nor limits it to one core. A process job receives a pickled
+snapshot of its graph, so the worker never touches the live graph store.
+
+Cancelling the awaiting task drops a job that has not started yet. A job
+already running on a thread keeps going until it reaches a cancellation
+checkpoint (see ``cancellation.py``). The context is copied onto the
+thread so those checkpoints can see the request's token. A running
+process job is stopped by killing the process pool, which is then
+restarted; other jobs that were on it are retried.
+"""
+
+import asyncio
+import contextvars
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+import networkx as nx
+
+logger = logging.getLogger(__name__)
+
+
+class CostClass(str, Enum):
+    """Where a tool runs."""
+
+    INLINE = "inline"  # cheap: run on the event loop thread
+    THREAD = "thread"  # I/O-bound or moderate: run on the thread pool
+    PROCESS = "process"  # CPU-bound: run on a graph snapshot in a worker process
+
+
+def _run_on_snapshot(
+    func: Callable[..., Any],
+    graph_name: str,
+    snapshot: bytes,
+    args: tuple,
+    kwargs: Dict[str, Any],
+) -> Any:
+    """Worker process entry point: rebuild the graph and run ``func`` on it."""
+    graph = pickle.loads(snapshot)
+    return func(graph_name, *args, graphs={graph_name: graph}, **kwargs)
+
+
+class _PoolStats:
+    """Counters for one pool, updated from the event loop thread."""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.busy_seconds = 0.0
+
+    def as_dict(self, uptime: float) -> Dict[str, Any]:
+        capacity = self.workers * uptime
+        return {
+            "workers": self.workers,
+            "running": min(self.in_flight, self.workers),
+            "queued": max(0, self.in_flight - self.workers),
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "utilization": (
+                round(min(1.0, self.busy_seconds / capacity), 4) if capacity else 0.0
+            ),
+        }
+
+
+class ExecutionEngine:
+    """Runs tool functions according to their cost class.
+
+    Pools are created on first use. Process jobs on graphs smaller than
+    ``process_min_size`` (nodes + edges) run on the thread pool instead,
+    since pickling and shipping the graph would cost more than the work.
+    If the process pool cannot be started or breaks, the engine logs it
+    and falls back to threads for the rest of its life.
+    """
+
+    def __init__(
+        self,
+        thread_workers: int = 8,
+        process_workers: Optional[int] = None,
+        process_min_size: int = 2000,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            thread_workers: Size of the thread pool
+            process_workers: Size of the process pool (0 disables it;
+                defaults to the number of CPUs, at most 4)
+            process_min_size: Smallest graph (nodes + edges) sent to a process
+        """
+        if process_workers is None:
+            process_workers = min(4, os.cpu_count() or 1)
+        self.thread_workers = max(1, thread_workers)
+        self.process_workers = max(0, process_workers)
+        self.process_min_size = process_min_size
+
+        self._lock = threading.Lock()
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._process_disabled = self.process_workers == 0
+        self.process_restarts = 0
+        self._started_at = time.monotonic()
+        self._stats = {
+            CostClass.THREAD: _PoolStats(self.thread_workers),
+            CostClass.PROCESS: _PoolStats(self.process_workers),
+        }
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    max_workers=self.thread_workers, thread_name_prefix="nxmcp-tool"
+                )
+            return self._threads
+
+    def _process_pool(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._processes is None and not self._process_disabled:
+                try:
+                    # spawn: forking a process that runs threads is unsafe
+                    self._processes = ProcessPoolExecutor(
+                        max_workers=self.process_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Process pool unavailable, using threads: {e}")
+                    self._process_disabled = True
+            return self._processes
+
+    def offloads(self, graph: nx.Graph) -> bool:
+        """True if a CPU-bound job on ``graph`` would go to a worker process."""
+        if self._process_disabled:
+            return False
+        return graph.number_of_nodes() + graph.number_of_edges() >= (
+            self.process_min_size
+        )
+
+    async def run(
+        self, cost: CostClass, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` inline or on the thread pool.
+
+        ``CostClass.PROCESS`` is accepted but runs on the thread pool, since
+        arbitrary callables cannot be shipped to a worker; use
+        ``run_on_graph`` for process jobs.
+        """
+        if cost is CostClass.INLINE:
+            return func(*args, **kwargs)
+        context = contextvars.copy_context()
+        return await self._submit(
+            CostClass.THREAD,
+            self._thread_pool(),
+            partial(context.run, func, *args, **kwargs),
+        )
+
+    async def run_on_graph(
+        self,
+        func: Callable[..., Any],
+        graph_name: str,
+        graph: nx.Graph,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a CPU-bound ``func(graph_name, *args, graphs=..., **kwargs)``.
+
+        ``func`` must be a module-level function (it is pickled by name).
+        The graph is pickled on the thread pool, so it must not change
+        until this returns: pass a pinned snapshot (see ``snapshots.py``).
+        """
+        snapshot = None
+        # A second attempt only happens after the pool was killed on purpose
+        for _attempt in range(2):
+            pool = self._process_pool() if self.offloads(graph) else None
+            if pool is None:
+                break
+            if snapshot is None:
+                snapshot = await self._submit(
+                    None,
+                    self._thread_pool(),
+                    partial(pickle.dumps, graph, pickle.HIGHEST_PROTOCOL),
+                )
+            try:
+                return await self._submit(
+                    CostClass.PROCESS,
+                    pool,
+                    partial(_run_on_snapshot, func, graph_name, snapshot, args, kwargs),
+                )
+            except BrokenProcessPool as e:
+                with self._lock:
+                    if self._processes is not pool:
+                        continue  # restarted to stop a cancelled job; retry
+                    logger.warning(f"Process pool broke, using threads: {e}")
+                    self._process_disabled = True
+                    self._processes = None
+                break
+
+        return await self.run(
+            CostClass.THREAD,
+            func,
+            graph_name,
+            *args,
+            graphs={graph_name: graph},
+            **kwargs,
+        )
+
+    async def _submit(
+        self, cost: Optional[CostClass], executor: Executor, job: Callable[[], Any]
+    ) -> Any:
+        future = executor.submit(job)
+        stats = self._stats.get(cost) if cost is not None else None
+        if stats is not None:
+            stats.in_flight += 1
+        started = time.monotonic()
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Queued jobs are dropped by the cancel; a running process job
+            # is only stopped by killing its worker
+            if not future.cancel() and cost is CostClass.PROCESS:
+                self._kill_process_pool(executor)
+            if stats is not None:
+                stats.cancelled += 1
+            raise
+        except BaseException:
+            if stats is not None:
+                stats.failed += 1
+            raise
+        else:
+            if stats is not None:
+                stats.completed += 1
+            return result
+        finally:
+            if stats is not None:
+                stats.in_flight -= 1
+                # Includes time spent queued; good enough for a utilization gauge
+                stats.busy_seconds += time.monotonic() - started
+
+    def _kill_process_pool(self, pool: Executor) -> None:
+        """Terminate every worker of ``pool``; the next job gets a fresh pool."""
+        with self._lock:
+            if self._processes is pool:
+                self._processes = None
+            self.process_restarts += 1
+        # ProcessPoolExecutor has no public way to stop a running job
+        workers = getattr(pool, "_processes", None) or {}
+        for process in list(workers.values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and worker use per pool."""
+        uptime = time.monotonic() - self._started_at
+        return {
+            "thread": self._stats[CostClass.THREAD].as_dict(uptime),
+            "process": {
+                **self._stats[CostClass.PROCESS].as_dict(uptime),
+                "enabled": not self._process_disabled,
+                "restarts": self.process_restarts,
+                "min_graph_size": self.process_min_size,
+            },
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop both pools; they are recreated if the engine is used again."""
+        with self._lock:
+            threads, self._threads = self._threads, None
+            processes, self._processes = self._processes, None
+        if threads is not None:
+            threads.shutdown(wait=wait)
+        if processes is not None:
+            processes.shutdown(wait=wait, cancel_futures=True)
+
+
+_engine: Optional[ExecutionEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_execution_engine() -> ExecutionEngine:
+    """Get the global execution engine, configured from the environment."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            process_workers = os.environ.get("NETWORKX_MCP_PROCESS_WORKERS")
+            _engine = ExecutionEngine(
+                thread_workers=int(os.environ.get("NETWORKX_MCP_THREAD_WORKERS", "8")),
+                process_workers=(
+                    int(process_workers) if process_workers is not None else None
+                ),
+                process_min_size=int(
+                    os.environ.get("NETWORKX_MCP_PROCESS_MIN_SIZE", "2000")
+                ),
+            )
+        return _engine
@@ -2,20 +2,41 @@
 
 This module provides a thread-safe graph cache with:
 - LRU (Least Recently Used) eviction
-- TTL (Time To Live) expiration
+- TTL (Time To Live) expiration, per cache or per graph, driven by a
+  heap of deadlines so cleanup only visits graphs that are due
 - Maximum size limits
-- Memory usage monitoring
+- A memory budget enforced against estimated per-graph sizes
+- Versioned copy-on-write snapshots, so readers never block writers
+  (see ``snapshots.py``)
+- An optional disk tier that evicted and expired graphs spill to, and
+  are reloaded from transparently
 """
 
+import functools
+import hashlib
+import heapq
+import itertools
 import logging
+import math
+import os
+import pickle
+import shutil
+import sys
+import tempfile
 import threading
 import time
-from collections import OrderedDict
+import weakref
+import zlib
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
 
 import networkx as nx
 
+from .eviction import EvictionPolicy, LRUPolicy, make_policy
+from .snapshots import GraphWrite, Snapshot, bound_graph, bound_view, unbind_graph
+
 try:
     import psutil
 
@@ -25,30 +46,338 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Lock stripes of a GraphCache
+DEFAULT_SHARDS = 16
+
+# Reload throughput (in-memory bytes per second) assumed for miss costs
+# until the cache has timed reloads of its own
+DEFAULT_RELOAD_BYTES_PER_SECOND = 200 * 1024 * 1024
+
+# Disk budget of a SpillStore, unless configured (NETWORKX_MCP_SPILL_MAX_MB)
+DEFAULT_MAX_DISK_MB = 4096
+
+# Nodes, and neighbours per node, sampled by estimate_graph_bytes
+SIZE_SAMPLE_NODES = 128
+SIZE_SAMPLE_NEIGHBORS = 16
+
+
+_EMPTY_DICT_BYTES = sys.getsizeof({})
+
+
+def _attr_bytes(attrs: Dict[Any, Any]) -> int:
+    if not attrs:
+        return _EMPTY_DICT_BYTES
+    # Attribute names are usually shared strings, so only values count
+    return sys.getsizeof(attrs) + sum(map(sys.getsizeof, attrs.values()))
+
+
+def estimate_graph_bytes(graph: nx.Graph) -> int:
+    """Estimate the memory held by a graph's nodes, edges and attributes.
+
+    Measures a sample of nodes spread over the node order, and the first
+    neighbours of each, with ``sys.getsizeof`` and scales the averages up
+    to the whole graph. That takes milliseconds even for millions of
+    edges and is typically within 20% of the memory actually allocated;
+    node keys repeated across adjacency dicts are counted every time, so
+    the estimate errs high when they are shared objects. A landmark index
+    attached to the graph and its cached CSR snapshot are counted as well.
+
+    Args:
+        graph: Any NetworkX graph class
+
+    Returns:
+        Estimated size in bytes
+    """
+    pred = getattr(graph, "_pred", None)
+    size = sys.getsizeof(graph._node) + sys.getsizeof(graph._adj)
+    if pred is not None:
+        size += sys.getsizeof(pred)
+    n = len(graph._node)
+    if n == 0:
+        return size
+
+    multi = graph.is_multigraph()
+    step = max(1, n // SIZE_SAMPLE_NODES)
+    nodes = node_bytes = entries = edges = edge_bytes = 0
+    for u, nbrs in islice(graph._adj.items(), 0, None, step):
+        nodes += 1
+        node_bytes += sys.getsizeof(u) + _attr_bytes(graph._node[u])
+        node_bytes += sys.getsizeof(nbrs)
+        if pred is not None:
+            node_bytes += sys.getsizeof(pred[u])
+        entries += sum(map(len, nbrs.values())) if multi else len(nbrs)
+        for v, data in islice(nbrs.items(), SIZE_SAMPLE_NEIGHBORS):
+            # Each edge has two adjacency entries (one per end, or succ and
+            # pred) sharing a single attribute dict
+            key_bytes = 2 * sys.getsizeof(v)
+            if multi:
+                edges += len(data)
+                edge_bytes += sys.getsizeof(data)
+                for k, attrs in data.items():
+                    edge_bytes += key_bytes + sys.getsizeof(k) + _attr_bytes(attrs)
+            else:
+                edges += 1
+                edge_bytes += key_bytes + _attr_bytes(data)
+
+    size += n * node_bytes // nodes
+    if edges:
+        # Undirected edges are listed under both ends
+        num_edges = n * entries // (nodes if pred is not None else 2 * nodes)
+        size += num_edges * edge_bytes // edges
+    # A landmark index kept on the graph (see core/landmarks.py)
+    index = graph.__dict__.get("_landmark_index")
+    if index is not None:
+        size += index.nbytes
+    # A CSR snapshot cached for it; the module (and NumPy) is loaded with
+    # the first snapshot
+    csr = sys.modules.get("networkx_mcp.core.csr")
+    if csr is not None:
+        size += csr.snapshot_bytes(graph)
+    return size
+
 
 @dataclass
 class CachedGraph:
-    """Container for a cached graph with metadata."""
+    """Container for a cached graph with metadata.
+
+    Timestamps are ``time.monotonic()`` seconds.
+    """
 
     graph: nx.Graph
     created_at: float
     last_accessed: float
     access_count: int = 0
+    # TTL deadline; infinite for graphs that never expire
+    expires_at: float = math.inf
+    size_bytes: int = 0
+    # Global access order across shards, set by GraphCache
+    tick: int = 0
+    # Changes with every put and committed write (see snapshots.py)
+    version: int = 0
+    # Eviction order (lowest first), set by the cache's EvictionPolicy
+    priority: float = 0.0
+    # Seconds spent building the graph, and estimated seconds a miss on it
+    # would cost (reloading it from disk, or else rebuilding it)
+    build_seconds: float = 0.0
+    miss_cost: float = 0.0
+    pinned: bool = False
 
     def touch(self) -> None:
         """Update last access time and increment counter."""
-        self.last_accessed = time.time()
+        self.last_accessed = time.monotonic()
         self.access_count += 1
 
 
+@dataclass
+class SpilledGraph:
+    """Metadata of a graph that lives in the disk tier."""
+
+    path: str
+    size_bytes: int
+    spilled_at: float
+
+
+class SpillStore:
+    """Disk tier for graphs evicted from memory.
+
+    Graphs are stored as zlib-compressed pickles, one file per graph, in a
+    private temporary directory that is created on the first spill and
+    removed when the store is closed or the process exits. The store is
+    not thread-safe on its own; ``GraphCache`` calls it under its lock,
+    except for ``save``, which writes a file no other call knows of yet.
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        max_disk_mb: Optional[float] = DEFAULT_MAX_DISK_MB,
+        compress_level: int = 1,
+    ):
+        """Initialize the store.
+
+        Args:
+            base_dir: Directory to create the spill directory in (system
+                temporary directory by default)
+            max_disk_mb: Disk budget; the oldest spilled graphs are dropped
+                beyond it. None for no limit other than free disk space
+            compress_level: zlib level; low levels favour reload latency
+        """
+        self.base_dir = base_dir
+        self.max_disk_mb = max_disk_mb
+        self.compress_level = compress_level
+        self._entries: OrderedDict[str, SpilledGraph] = OrderedDict()
+        self._dir: Optional[str] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._names = itertools.count()
+        self.total_bytes = 0
+        self.dropped = 0
+
+    def _directory(self) -> str:
+        if self._dir is None:
+            self._dir = tempfile.mkdtemp(
+                prefix="networkx-mcp-spill-", dir=self.base_dir
+            )
+            self._finalizer = weakref.finalize(
+                self, shutil.rmtree, self._dir, ignore_errors=True
+            )
+        return self._dir
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> List[str]:
+        return list(self._entries)
+
+    def write(self, key: str, graph: nx.Graph) -> int:
+        """Spill ``graph`` under ``key``; returns the size on disk."""
+        path = self.path_for(key)
+        size = self.save(path, graph)
+        self.add(key, path, size)
+        return size
+
+    def path_for(self, key: str) -> str:
+        """A new file for a spill of ``key``, to be passed to ``save``."""
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory(), f"{name}-{next(self._names)}")
+
+    def save(self, path: str, graph: nx.Graph) -> int:
+        """Write ``graph`` to ``path``; returns the size on disk.
+
+        The graph is not part of the store until ``add``ed.
+        """
+        data = zlib.compress(
+            pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL),
+            self.compress_level,
+        )
+        # Write then rename, so a failed write never leaves half a graph
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            _remove_file(tmp_path)
+            raise
+        return len(data)
+
+    def add(self, key: str, path: str, size: int) -> None:
+        """Make the file ``save``d at ``path`` the disk copy of ``key``."""
+        self.discard(key)
+        self._entries[key] = SpilledGraph(path, size, time.time())
+        self.total_bytes += size
+        self._enforce_budget()
+
+    def read(self, key: str) -> nx.Graph:
+        """Load a spilled graph (it stays on disk until discarded)."""
+        with open(self._entries[key].path, "rb") as f:
+            return pickle.loads(zlib.decompress(f.read()))
+
+    def discard(self, key: str) -> bool:
+        """Remove a spilled graph; False if there is none."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.total_bytes -= entry.size_bytes
+        _remove_file(entry.path)
+        return True
+
+    def clear(self) -> None:
+        for key in list(self._entries):
+            self.discard(key)
+
+    def close(self) -> None:
+        """Remove every spilled graph and the spill directory."""
+        self._entries.clear()
+        self.total_bytes = 0
+        if self._finalizer is not None:
+            self._finalizer()
+        self._dir = None
+        self._finalizer = None
+
+    def _enforce_budget(self) -> None:
+        if self.max_disk_mb is None:
+            return
+        budget = self.max_disk_mb * 1024 * 1024
+        # Keep at least the graph just written
+        while self.total_bytes > budget and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self.discard(key)
+            self.dropped += 1
+            logger.warning(f"Dropped spilled graph {key}: disk budget exceeded")
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove spill file {path}: {e}")
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _spills_after(method: F) -> F:
+    """Write the graphs a ``GraphCache`` method evicted to disk once it returns.
+
+    Calls nested in another such method (``commit`` putting a copy,
+    ``snapshot`` reloading a spilled graph) leave them to the outermost
+    one, which no longer holds ``_lock`` by then.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "GraphCache", *args: Any, **kwargs: Any) -> Any:
+        calls = self._calls
+        calls.depth = getattr(calls, "depth", 0) + 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            calls.depth -= 1
+            if not calls.depth and self._spill_queue:
+                self._write_spills()
+
+    return wrapper  # type: ignore[return-value]
+
+
+class _Shard:
+    """One stripe of the cache: its entries, in LRU order, and their lock."""
+
+    __slots__ = ("lock", "entries", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, CachedGraph] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
 class GraphCache:
     """Thread-safe graph cache with automatic cleanup.
 
     Features:
     - LRU eviction when max_size is reached
     - TTL expiration for old graphs
-    - Memory-based eviction when threshold exceeded
+    - Eviction when the estimated size of the cached graphs exceeds
+      ``max_memory_mb`` (see ``estimate_graph_bytes`` and ``resize``)
+    - Pluggable eviction order (see ``eviction``) and pinned graphs that
+      are never evicted or expired
     - Thread-safe operations
+    - With a ``SpillStore``, evicted and expired graphs move to disk and
+      ``get`` reloads them, so graphs are limited by disk space, not RAM
+
+    Entries are striped over shards by key hash, each with its own lock
+    and hit counters. A lookup of a live graph takes only its shard's
+    lock, so readers never wait for writers or readers of other keys.
+    Everything that changes the set of cached graphs (put, delete,
+    eviction, expiry, spilling and reloading) is serialized by ``_lock``,
+    which is always taken before a shard lock. A global tick stamped on
+    every access orders entries by recency across shards. Evicted graphs
+    are only queued for the disk tier under ``_lock``; they are pickled
+    and written once the call that evicted them has let go of it.
     """
 
     def __init__(
@@ -57,37 +386,125 @@ class GraphCache:
         ttl_seconds: float = 3600,  # 1 hour default
         max_memory_mb: int = 500,
         cleanup_interval: float = 300,  # 5 minutes
+        spill: Optional[SpillStore] = None,
+        shards: int = DEFAULT_SHARDS,
+        policy: Optional[EvictionPolicy] = None,
     ):
         """Initialize the graph cache.
 
         Args:
             max_size: Maximum number of graphs to cache
-            ttl_seconds: Time to live for cached graphs in seconds
-            max_memory_mb: Maximum memory usage in MB before eviction
-            cleanup_interval: Interval between cleanup runs in seconds
+            ttl_seconds: Time to live for cached graphs in seconds, unless
+                overridden per graph (see ``put`` and ``set_ttl``)
+            max_memory_mb: Budget in MB for the estimated size of the graphs
+                held in memory; graphs are evicted beyond it
+            cleanup_interval: Longest interval between cleanup runs in
+                seconds; cleanup also runs as TTL deadlines fall due
+            spill: Disk tier for evicted and expired graphs; without one
+                they are dropped
+            shards: Number of lock stripes
+            policy: Which graph to evict first; LRU by default
         """
-        self._cache: OrderedDict[str, CachedGraph] = OrderedDict()
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._shards = [_Shard() for _ in range(shards)]
         self._lock = threading.RLock()
+        self._ticks = itertools.count(1)
         self._shutdown = False
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
         self.max_memory_mb = max_memory_mb
         self.cleanup_interval = cleanup_interval
-
-        # Stats
-        self.hits = 0
-        self.misses = 0
+        self.total_bytes = 0
+        self._size = 0
+        self.policy = policy if policy is not None else LRUPolicy()
+        # Pins and TTL overrides outlive the entry, e.g. across a put that
+        # replaces the graph or a reload from disk
+        self._pinned: set = set()
+        self._ttl_overrides: Dict[str, float] = {}
+        # Min-heap of (deadline, tick, key). Entries go stale when a graph
+        # is renewed, replaced or removed; they are skipped when popped.
+        self._expiry: List[Tuple[float, int, str]] = []
+
+        # Versions are unique across keys, so (key, version) names one
+        # state of one graph even across a delete and re-create
+        self._versions = itertools.count(1)
+        # Snapshot pins per (key, version), and the write in progress per
+        # key. Readers wait (on _written) only for writes done in place.
+        self._readers: Dict[Tuple[str, int], int] = {}
+        self._writers: Dict[str, GraphWrite] = {}
+        self._written = threading.Condition(self._lock)
+        self._spilled_versions: Dict[str, int] = {}
+
+        # Disk tier. Spilled graphs that are still referenced elsewhere
+        # (e.g. by a tool call that is mutating them) are reloaded from
+        # memory rather than from their possibly stale disk copy.
+        self.spill = spill
+        self._spilled_live: "weakref.WeakValueDictionary[str, nx.Graph]" = (
+            weakref.WeakValueDictionary()
+        )
+        # Evicted graphs waiting to be written (see _write_spills), and the
+        # entry each key was evicted as: a write whose entry is no longer
+        # there (reloaded, replaced or deleted meanwhile) is thrown away
+        self._spill_queue: Deque[Tuple[str, CachedGraph]] = deque()
+        self._spilling: Dict[str, CachedGraph] = {}
+        # Nesting of _spills_after methods, per thread
+        self._calls = threading.local()
+        # Called with the key of each dropped graph (see on_drop)
+        self._drop_callbacks: List[Callable[[str], None]] = []
+
+        # Stats (hits and misses are counted per shard)
         self.evictions = 0
-
-        # Start cleanup thread
+        self.disk_hits = 0
+        self.spills = 0
+        self.reload_seconds = 0.0
+        self.max_reload_seconds = 0.0
+        self.disk_read_seconds = 0.0
+        self.disk_read_bytes = 0
+        self.copied_writes = 0
+
+        # Cleanup thread, started by the first put(): an empty cache has
+        # nothing to clean, and importing the server should not spawn it.
+        # It sleeps until the next deadline, at most cleanup_interval.
         self._cleanup_thread = threading.Thread(target=self._cleanup_loop, daemon=True)
-        self._cleanup_thread.start()
+        self._cleanup_started = False
+        self._wakeup = threading.Event()
 
         logger.info(
             f"GraphCache initialized: max_size={max_size}, "
-            f"ttl={ttl_seconds}s, max_memory={max_memory_mb}MB"
+            f"ttl={ttl_seconds}s, max_memory={max_memory_mb}MB, shards={shards}"
         )
 
+    @property
+    def hits(self) -> int:
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        return sum(shard.misses for shard in self._shards)
+
+    @property
+    def _cache(self) -> "OrderedDict[str, CachedGraph]":
+        """Snapshot of the in-memory entries, least recently used first."""
+        entries = []
+        for shard in self._shards:
+            with shard.lock:
+                entries.extend(shard.entries.items())
+        entries.sort(key=lambda item: item[1].tick)
+        return OrderedDict(entries)
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _touch(self, shard: _Shard, key: str, cached: CachedGraph) -> None:
+        # Caller holds shard.lock
+        shard.entries.move_to_end(key)
+        cached.touch()
+        cached.tick = next(self._ticks)
+        self.policy.on_access(cached)
+        shard.hits += 1
+
+    @_spills_after
     def get(self, key: str) -> Optional[nx.Graph]:
         """Get a graph from cache.
 
@@ -97,54 +514,425 @@ class GraphCache:
         Returns:
             Graph if found and valid, None otherwise
         """
+        # Fast path: a live entry needs only its shard's lock
+        shard = self._shard(key)
+        with shard.lock:
+            cached = shard.entries.get(key)
+            if cached is not None and not self._is_expired(cached):
+                self._touch(shard, key, cached)
+                return cached.graph
+
         with self._lock:
-            if key not in self._cache:
-                self.misses += 1
-                return None
+            with shard.lock:
+                cached = shard.entries.get(key)
+                if cached is not None and not self._is_expired(cached):
+                    self._touch(shard, key, cached)
+                    return cached.graph
+            if cached is None:
+                return self._reload(key)
+
+            if self.spill is not None:
+                # With a disk tier, expiry only moves idle graphs out of
+                # memory (see _cleanup); an access renews the graph instead
+                with shard.lock:
+                    self._touch(shard, key, cached)
+                self._schedule(key, cached, cached.last_accessed)
+                return cached.graph
+
+            self._remove(key)
+            self.evictions += 1
+            with shard.lock:
+                shard.misses += 1
+            logger.debug(f"Graph {key} expired (TTL)")
+            return None
 
-            cached = self._cache[key]
+    def get_or_raise(self, key: str) -> nx.Graph:
+        """Get a graph with a single lookup, raising KeyError if absent.
 
-            # Check TTL
-            if self._is_expired(cached):
-                del self._cache[key]
-                self.evictions += 1
-                self.misses += 1
-                logger.debug(f"Graph {key} expired (TTL)")
-                return None
+        Replaces the ``key in cache`` check followed by a ``get``, which
+        looked the graph up twice and counted two hits.
+        """
+        graph = self.get(key)
+        if graph is None:
+            raise KeyError(key)
+        return graph
+
+    def contains(self, key: str) -> bool:
+        """Whether ``get(key)`` would find the graph, in memory or on disk.
+
+        Neither touches LRU order nor counts a hit or miss.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            cached = shard.entries.get(key)
+            if cached is not None and (
+                self.spill is not None or not self._is_expired(cached)
+            ):
+                return True
+        with self._lock:
+            return self._on_disk(key)
 
-            # Update LRU position
-            self._cache.move_to_end(key)
-            cached.touch()
-            self.hits += 1
+    def peek(self, key: str) -> Optional[nx.Graph]:
+        """The graph object under ``key`` if it is in memory.
 
-            return cached.graph
+        Unlike ``get`` this neither reloads from disk nor touches LRU order
+        or stats. Also returns a spilled graph that is still referenced
+        elsewhere, since that object is what a reload would return.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            cached = shard.entries.get(key)
+            if cached is not None:
+                return cached.graph
+        with self._lock:
+            return self._spilled_live.get(key)
 
-    def put(self, key: str, graph: nx.Graph) -> None:
+    @_spills_after
+    def put(
+        self,
+        key: str,
+        graph: nx.Graph,
+        build_seconds: float = 0.0,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
         """Add or update a graph in cache.
 
         Args:
             key: Graph identifier
             graph: NetworkX graph to cache
+            build_seconds: Time it took to build the graph, the cost of
+                rebuilding it after an eviction without a disk tier
+            ttl_seconds: Time to live of this graph, overriding the cache
+                default until changed with ``set_ttl``; None keeps the
+                current setting
         """
+        size = estimate_graph_bytes(graph)
         with self._lock:
+            if not self._cleanup_started and not self._shutdown:
+                self._cleanup_started = True
+                self._cleanup_thread.start()
+
             # Remove existing entry if present
-            if key in self._cache:
-                del self._cache[key]
+            self._remove(key)
+            self._discard_spilled(key)
+            if ttl_seconds is not None:
+                self._ttl_overrides[key] = ttl_seconds
 
             # Check size limit
-            if len(self._cache) >= self.max_size:
-                self._evict_lru()
+            if self._size >= self.max_size:
+                self._evict()
 
-            # Check memory limit
-            if self._get_memory_usage_mb() > self.max_memory_mb:
-                self._evict_until_memory_ok()
+            # Check memory budget; a graph larger than the whole budget
+            # is still cached, on its own
+            self._evict_until_memory_ok(incoming=size)
 
             # Add to cache
-            self._cache[key] = CachedGraph(
-                graph=graph, created_at=time.time(), last_accessed=time.time()
+            now = time.monotonic()
+            cached = CachedGraph(
+                graph=graph,
+                created_at=now,
+                last_accessed=now,
+                size_bytes=size,
+                tick=next(self._ticks),
+                build_seconds=build_seconds,
+                version=next(self._versions),
+                pinned=key in self._pinned,
             )
+            cached.miss_cost = self._miss_cost(cached)
+            self.policy.on_access(cached)
+            shard = self._shard(key)
+            with shard.lock:
+                shard.entries[key] = cached
+            self._size += 1
+            self.total_bytes += size
+            self._schedule(key, cached, now)
+
+            logger.debug(
+                f"Cached graph {key} ({graph.number_of_nodes()} nodes, ~{size} bytes)"
+            )
+
+    @_spills_after
+    def resize(self, key: str, build_seconds: float = 0.0) -> Optional[int]:
+        """Re-estimate the size of a graph that was mutated in place.
+
+        Graphs are measured when they are put; callers that change a
+        cached graph call this afterwards so the memory budget follows.
+        Evicts other graphs if the cache no longer fits the budget.
+
+        Args:
+            key: Graph identifier
+            build_seconds: Time the mutation took, added to the cost of
+                rebuilding the graph
 
-            logger.debug(f"Cached graph {key} ({graph.number_of_nodes()} nodes)")
+        Returns:
+            The new size in bytes, or None if the graph is not in memory
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            cached = shard.entries.get(key)
+        if cached is None:
+            return None
+        # Measured outside the locks; the entry may be replaced meanwhile
+        size = estimate_graph_bytes(cached.graph)
+        with self._lock:
+            with shard.lock:
+                if shard.entries.get(key) is not cached:
+                    return None
+                shard.entries.move_to_end(key)
+                cached.tick = next(self._ticks)
+                self.total_bytes += size - cached.size_bytes
+                cached.size_bytes = size
+                cached.build_seconds += build_seconds
+                cached.miss_cost = self._miss_cost(cached)
+                self.policy.on_access(cached)
+            self._evict_until_memory_ok(keep=key)
+        return size
+
+    def version(self, key: str) -> Optional[int]:
+        """Current version of a graph, None if it is not cached.
+
+        Versions are unique across graphs and change with every put and
+        committed write, so ``(key, version)`` identifies a graph's state.
+        """
+        shard = self._shard(key)
+        with self._lock:
+            with shard.lock:
+                cached = shard.entries.get(key)
+            if cached is not None:
+                return cached.version
+            return self._spilled_versions.get(key)
+
+    @_spills_after
+    def snapshot(self, key: str, timeout: Optional[float] = None) -> Optional[Snapshot]:
+        """Pin the current version of a graph for reading.
+
+        Until the snapshot is released, writers to the graph work on a copy
+        and the pinned graph object does not change. Waits if a write is
+        mutating the graph in place.
+
+        Args:
+            key: Graph identifier
+            timeout: Seconds to wait at most (None waits for good, 0 not
+                at all)
+
+        Returns:
+            The snapshot, or None if the graph is not cached
+
+        Raises:
+            TimeoutError: If the write was not over within ``timeout``
+        """
+        with self._written:
+            if not self._written.wait_for(
+                lambda: key not in self._writers or self._writers[key].copied,
+                timeout,
+            ):
+                raise TimeoutError(f"Graph '{key}' is being written")
+            graph = self.get(key)
+            if graph is None:
+                return None
+            shard = self._shard(key)
+            with shard.lock:
+                version = shard.entries[key].version
+            pin = (key, version)
+            self._readers[pin] = self._readers.get(pin, 0) + 1
+            return Snapshot(key, version, graph, self._release_snapshot)
+
+    def _release_snapshot(self, snapshot: Snapshot) -> None:
+        pin = (snapshot.key, snapshot.version)
+        with self._lock:
+            count = self._readers.get(pin, 0) - 1
+            if count > 0:
+                self._readers[pin] = count
+            else:
+                self._readers.pop(pin, None)
+
+    @_spills_after
+    def begin_write(
+        self, key: str, timeout: Optional[float] = None
+    ) -> Optional[GraphWrite]:
+        """Start a write to a graph, to be published with ``commit``.
+
+        The write mutates the cached graph in place unless a snapshot pins
+        the current version; it then works on a copy, so it never waits for
+        readers. Waits for an earlier write to the same graph to commit.
+
+        Args:
+            key: Graph identifier
+            timeout: Seconds to wait at most (None waits for good, 0 not
+                at all)
+
+        Returns:
+            The write, or None if the graph is not cached
+
+        Raises:
+            TimeoutError: If the earlier write was not over within ``timeout``
+        """
+        with self._written:
+            if not self._written.wait_for(lambda: key not in self._writers, timeout):
+                raise TimeoutError(f"Graph '{key}' is being written")
+            graph = self.get(key)
+            if graph is None:
+                return None
+            shard = self._shard(key)
+            with shard.lock:
+                version = shard.entries[key].version
+            write = GraphWrite(key, version, graph, (key, version) in self._readers)
+            self._writers[key] = write
+            return write
+
+    @_spills_after
+    def commit(
+        self, write: GraphWrite, build_seconds: float = 0.0
+    ) -> Optional[nx.Graph]:
+        """Publish a write as the next version of its graph.
+
+        The write is dropped if the graph was replaced or deleted since
+        ``begin_write``, and a copy that was never made means nothing
+        changed.
+
+        Args:
+            write: Write returned by ``begin_write``
+            build_seconds: Time the write took, added to the cost of
+                rebuilding the graph
+
+        Returns:
+            The graph as published, or None if the write was dropped
+        """
+        key = write.key
+        with self._written:
+            if self._writers.get(key) is write:
+                del self._writers[key]
+                self._written.notify_all()
+            if self.version(key) != write.version:
+                return None
+            if write.pending_copy:
+                return write.base
+            shard = self._shard(key)
+            with shard.lock:
+                cached = shard.entries.get(key)
+                in_place = cached is not None and cached.graph is write.graph
+                if in_place:
+                    cached.version = next(self._versions)
+                    # A landmark index (core/landmarks.py) is only valid for
+                    # the version it was built at
+                    write.graph.__dict__.pop("_landmark_index", None)
+            self.copied_writes += write.copied
+            if not in_place:
+                # A copy, or a graph spilled meanwhile: replace the entry
+                # and the possibly stale disk copy
+                if cached is not None:
+                    build_seconds += cached.build_seconds
+                self.put(key, write.graph, build_seconds)
+                return write.graph
+        self.resize(key, build_seconds)
+        return write.graph
+
+    def abort(self, write: GraphWrite) -> bool:
+        """Drop a write that worked on a copy, leaving the graph as it was.
+
+        A write made in place has already changed the cached graph and
+        cannot be dropped; the caller commits it instead.
+
+        Args:
+            write: Write returned by ``begin_write``
+
+        Returns:
+            True if the write was dropped, False if it has to be committed
+        """
+        if not write.copied:
+            return False
+        with self._written:
+            if self._writers.get(write.key) is write:
+                del self._writers[write.key]
+                self._written.notify_all()
+        return True
+
+    @_spills_after
+    def pin(self, key: str) -> bool:
+        """Keep a graph in memory: never evict, expire or spill it.
+
+        A spilled graph is reloaded first. Pinned graphs still count
+        towards ``max_size`` and the memory budget, so pinning too many
+        leaves the cache over its limits rather than evicting them.
+
+        Args:
+            key: Graph identifier
+
+        Returns:
+            True if pinned, False if there is no such graph
+        """
+        with self._lock:
+            if self.get(key) is None:
+                return False
+            self._pinned.add(key)
+            shard = self._shard(key)
+            with shard.lock:
+                shard.entries[key].pinned = True
+            return True
+
+    def unpin(self, key: str) -> bool:
+        """Make a pinned graph evictable again; False if it was not pinned."""
+        with self._lock:
+            if key not in self._pinned:
+                return False
+            self._pinned.discard(key)
+            shard = self._shard(key)
+            with shard.lock:
+                cached = shard.entries.get(key)
+                if cached is not None:
+                    cached.pinned = False
+            if cached is not None:
+                # Its deadline was dropped from the heap while pinned
+                self._push_deadline(key, cached.expires_at)
+            return True
+
+    def set_ttl(self, key: str, ttl_seconds: Optional[float]) -> bool:
+        """Override the time to live of one graph.
+
+        The TTL counts from when the graph was cached, so a shorter TTL may
+        make it due right away. ``math.inf`` means the graph never expires.
+
+        Args:
+            key: Graph identifier
+            ttl_seconds: New TTL in seconds, or None for the cache default
+
+        Returns:
+            False if there is no such graph
+        """
+        with self._lock:
+            shard = self._shard(key)
+            with shard.lock:
+                cached = shard.entries.get(key)
+            if cached is None and not self._on_disk(key):
+                return False
+            if ttl_seconds is None:
+                self._ttl_overrides.pop(key, None)
+            else:
+                self._ttl_overrides[key] = ttl_seconds
+            if cached is not None:
+                self._schedule(key, cached, cached.created_at)
+            return True
+
+    def on_drop(self, callback: Callable[[str], None]) -> None:
+        """Call ``callback(key)`` whenever a graph is dropped.
+
+        That is when it is deleted, cleared, evicted or expired (spilled to
+        disk or not), so state kept per graph outside the cache can go with
+        it. Replacing a graph with ``put`` does not count. Callbacks run
+        with the cache locked and must not call back into it.
+        """
+        with self._lock:
+            self._drop_callbacks.append(callback)
+
+    def _dropped(self, key: str) -> None:
+        # Caller holds _lock
+        for callback in self._drop_callbacks:
+            callback(key)
+
+    def pinned(self) -> List[str]:
+        """Keys of the pinned graphs."""
+        with self._lock:
+            return sorted(self._pinned)
 
     def delete(self, key: str) -> bool:
         """Remove a graph from cache.
@@ -156,60 +944,274 @@ class GraphCache:
             True if removed, False if not found
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            self._pinned.discard(key)
+            self._ttl_overrides.pop(key, None)
+            spilled = self._discard_spilled(key)
+            removed = self._remove(key) is not None
+            if removed or spilled:
+                self._dropped(key)
+            if removed:
                 logger.debug(f"Deleted graph {key} from cache")
-                return True
-            return False
+            return removed or spilled
 
     def clear(self) -> None:
         """Clear all cached graphs."""
         with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
+            for key in self.list_graphs():
+                self._dropped(key)
+            count = 0
+            for shard in self._shards:
+                with shard.lock:
+                    count += len(shard.entries)
+                    shard.entries.clear()
+            self._size = 0
+            self.total_bytes = 0
+            self._pinned.clear()
+            self._ttl_overrides.clear()
+            self._expiry.clear()
+            if self.spill is not None:
+                count += len(self.spill) + len(self._spilling)
+                self.spill.clear()
+            self._spill_queue.clear()
+            self._spilling.clear()
+            self._spilled_live.clear()
+            self._spilled_versions.clear()
             self.evictions += count
             logger.info(f"Cleared {count} graphs from cache")
 
     def list_graphs(self) -> List[str]:
-        """Get list of cached graph keys."""
+        """Get list of cached graph keys, in memory or on disk."""
         with self._lock:
-            return list(self._cache.keys())
+            keys = list(self._cache)
+            if self.spill is not None:
+                keys.extend(self._spilling)
+                keys.extend(self.spill.keys())
+            return keys
 
     def get_stats(self) -> Dict[str, any]:
         """Get cache statistics."""
         with self._lock:
-            total_requests = self.hits + self.misses
-            hit_rate = self.hits / total_requests if total_requests > 0 else 0
+            hits, misses = self.hits, self.misses
+            total_requests = hits + misses
+            hit_rate = hits / total_requests if total_requests > 0 else 0
 
-            return {
-                "size": len(self._cache),
+            stats = {
+                "size": self._size,
                 "max_size": self.max_size,
-                "hits": self.hits,
-                "misses": self.misses,
+                "hits": hits,
+                "misses": misses,
                 "evictions": self.evictions,
                 "hit_rate": hit_rate,
-                "memory_mb": self._get_memory_usage_mb(),
+                "memory_mb": self.total_bytes / 1024 / 1024,
+                "max_memory_mb": self.max_memory_mb,
+                # Largest first, so the graphs worth evicting stand out
+                "graph_bytes": dict(
+                    sorted(
+                        ((key, c.size_bytes) for key, c in self._cache.items()),
+                        key=lambda item: item[1],
+                        reverse=True,
+                    )
+                ),
+                "process_memory_mb": self._get_memory_usage_mb(),
+                "ram_hits": hits - self.disk_hits,
+                "disk_hits": self.disk_hits,
+                "shards": len(self._shards),
+                "policy": self.policy.name,
+                "pinned": sorted(self._pinned),
+                "snapshots": sum(self._readers.values()),
+                "writes_in_progress": len(self._writers),
+                "copied_writes": self.copied_writes,
             }
+            if self.spill is not None:
+                stats["disk"] = {
+                    "graphs": len(self.spill) + len(self._spilling),
+                    "bytes": self.spill.total_bytes,
+                    "spills": self.spills,
+                    "dropped": self.spill.dropped,
+                    "reload_ms_avg": (
+                        self.reload_seconds / self.disk_hits * 1000
+                        if self.disk_hits
+                        else 0.0
+                    ),
+                    "reload_ms_max": self.max_reload_seconds * 1000,
+                }
+            return stats
 
     def _is_expired(self, cached: CachedGraph) -> bool:
-        """Check if a cached graph has expired."""
-        age = time.time() - cached.created_at
-        return age > self.ttl_seconds
-
-    def _evict_lru(self) -> None:
-        """Evict least recently used graph."""
-        if self._cache:
-            key, _ = self._cache.popitem(last=False)
-            self.evictions += 1
-            logger.debug(f"Evicted LRU graph {key}")
+        """Check if a cached graph has expired (pinned graphs never do)."""
+        return not cached.pinned and time.monotonic() >= cached.expires_at
+
+    def _schedule(self, key: str, cached: CachedGraph, start: float) -> None:
+        """Set the TTL deadline of an entry, counting from ``start``."""
+        # Caller holds _lock
+        cached.expires_at = start + self._ttl_overrides.get(key, self.ttl_seconds)
+        self._push_deadline(key, cached.expires_at)
+
+    def _push_deadline(self, key: str, deadline: float) -> None:
+        if math.isinf(deadline):
+            return
+        if not self._expiry or deadline < self._expiry[0][0]:
+            # The cleanup thread is sleeping until a later deadline
+            self._wakeup.set()
+        heapq.heappush(self._expiry, (deadline, next(self._ticks), key))
+
+    def _remove(self, key: str) -> Optional[CachedGraph]:
+        # Caller holds _lock
+        shard = self._shard(key)
+        with shard.lock:
+            cached = shard.entries.pop(key, None)
+        if cached is not None:
+            self._size -= 1
+            self.total_bytes -= cached.size_bytes
+        return cached
+
+    def _evict(self, keep: Optional[str] = None) -> bool:
+        """Evict the graph the policy ranks lowest (to disk, with a spill store).
+
+        Args:
+            keep: Key that must not be evicted
+
+        Returns:
+            False if every graph is pinned (or kept), so nothing was evicted
+        """
+        victim: Optional[str] = None
+        lowest = None
+        for shard in self._shards:
+            with shard.lock:
+                for key, cached in shard.entries.items():
+                    if cached.pinned or key == keep:
+                        continue
+                    rank = (cached.priority, cached.tick)
+                    if lowest is None or rank < lowest:
+                        victim, lowest = key, rank
+        if victim is None:
+            return False
+        cached = self._remove(victim)
+        self.policy.on_evict(cached)
+        self._dropped(victim)
+        self.evictions += 1
+        logger.debug(f"Evicted graph {victim} ({self.policy.name})")
+        if self.spill is not None:
+            self._spill(victim, cached)
+        return True
+
+    def _miss_cost(self, cached: CachedGraph) -> float:
+        if self.spill is None:
+            return cached.build_seconds
+        throughput = (
+            self.disk_read_bytes / self.disk_read_seconds
+            if self.disk_read_seconds > 0
+            else DEFAULT_RELOAD_BYTES_PER_SECOND
+        )
+        return cached.size_bytes / throughput
+
+    def _spill(self, key: str, cached: CachedGraph) -> None:
+        # Caller holds _lock. The graph counts as spilled from here on; until
+        # _write_spills has written it, a reload takes it from memory.
+        self._spilled_live[key] = cached.graph
+        # A reload is the same version, not a new one
+        self._spilled_versions[key] = cached.version
+        self._spilling[key] = cached
+        self._spill_queue.append((key, cached))
+
+    def _write_spills(self) -> None:
+        """Write the graphs queued by ``_spill`` to disk, outside ``_lock``.
+
+        Pickling a large graph takes long; under the lock every put,
+        reload and eviction would wait for it.
+        """
+        while True:
+            with self._lock:
+                if not self._spill_queue:
+                    return
+                key, cached = self._spill_queue.popleft()
+                if self._spilling.get(key) is not cached:
+                    continue
+                path = self.spill.path_for(key)
+            try:
+                size = self.spill.save(path, cached.graph)
+            except Exception as e:
+                # Out of disk space or an unpicklable attribute: the graph is lost
+                logger.error(f"Failed to spill graph {key} to disk: {e}")
+                with self._lock:
+                    if self._spilling.get(key) is cached:
+                        self._discard_spilled(key)
+                continue
+            with self._lock:
+                if self._spilling.get(key) is not cached:
+                    _remove_file(path)
+                    continue
+                del self._spilling[key]
+                self.spill.add(key, path, size)
+                self.spills += 1
+            logger.debug(f"Spilled graph {key} to disk ({size} bytes)")
+
+    def _on_disk(self, key: str) -> bool:
+        # Caller holds _lock; a graph waiting to be written counts
+        return self.spill is not None and (key in self._spilling or key in self.spill)
+
+    def _discard_spilled(self, key: str) -> bool:
+        self._spilled_live.pop(key, None)
+        self._spilled_versions.pop(key, None)
+        pending = self._spilling.pop(key, None) is not None
+        return self.spill is not None and (self.spill.discard(key) or pending)
+
+    def _reload(self, key: str) -> Optional[nx.Graph]:
+        """Bring a spilled graph back into memory; None (a miss) if absent."""
+        shard = self._shard(key)
+        if not self._on_disk(key):
+            with shard.lock:
+                shard.misses += 1
+            return None
+        start = time.perf_counter()
+        graph = self._spilled_live.get(key)
+        from_disk = graph is None
+        if from_disk:
+            try:
+                graph = self.spill.read(key)
+            except Exception as e:
+                logger.error(f"Failed to reload graph {key} from disk: {e}")
+                self._discard_spilled(key)
+                with shard.lock:
+                    shard.misses += 1
+                return None
+        read_seconds = time.perf_counter() - start
+        version = self._spilled_versions.get(key)
+        # put() drops the disk copy and may spill others to make room
+        self.put(key, graph)
+        elapsed = time.perf_counter() - start
+        self.disk_hits += 1
+        self.reload_seconds += elapsed
+        self.max_reload_seconds = max(self.max_reload_seconds, elapsed)
+        with shard.lock:
+            cached = shard.entries[key]
+            if version is not None:
+                cached.version = version
+            self._touch(shard, key, cached)
+        if from_disk:
+            # Read throughput prices misses for the cost-aware policy
+            self.disk_read_seconds += read_seconds
+            self.disk_read_bytes += cached.size_bytes
+        logger.debug(f"Reloaded graph {key} from disk in {elapsed * 1000:.1f} ms")
+        return graph
+
+    def _evict_until_memory_ok(
+        self, incoming: int = 0, keep: Optional[str] = None
+    ) -> None:
+        """Evict graphs until they fit the memory budget.
 
-    def _evict_until_memory_ok(self) -> None:
-        """Evict graphs until memory usage is acceptable."""
-        while self._cache and self._get_memory_usage_mb() > self.max_memory_mb:
-            self._evict_lru()
+        Args:
+            incoming: Bytes about to be added to the cache
+            keep: Key that must not be evicted
+        """
+        budget = self.max_memory_mb * 1024 * 1024
+        while self.total_bytes + incoming > budget:
+            if not self._evict(keep):
+                logger.debug("Over the memory budget, but all graphs are pinned")
+                return
 
     def _get_memory_usage_mb(self) -> float:
-        """Get current process memory usage in MB."""
+        """Get current process memory usage (RSS) in MB, for stats only."""
         if not HAS_PSUTIL:
             # If psutil is not available, return 0 to skip memory checks
             return 0
@@ -221,46 +1223,101 @@ class GraphCache:
             return 0
 
     def _cleanup_loop(self) -> None:
-        """Background thread for periodic cleanup."""
+        """Background thread: clean up at each deadline, or every interval."""
         while not self._shutdown:
+            with self._lock:
+                timeout = self.cleanup_interval
+                if self._expiry:
+                    due_in = self._expiry[0][0] - time.monotonic()
+                    timeout = min(timeout, max(due_in, 0.0))
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+            if self._shutdown:
+                break
             try:
-                time.sleep(self.cleanup_interval)
-                if not self._shutdown:
-                    self._cleanup()
+                self._cleanup()
             except Exception as e:
                 logger.error(f"Cleanup error: {e}")
-                if self._shutdown:
-                    break
 
+    @_spills_after
     def _cleanup(self) -> None:
-        """Clean up expired graphs."""
+        """Clean up expired graphs, visiting only those that are due."""
         with self._lock:
-            expired_keys = []
-
-            for key, cached in self._cache.items():
-                if self._is_expired(cached):
-                    expired_keys.append(key)
-
-            for key in expired_keys:
-                del self._cache[key]
+            now = time.monotonic()
+            expired = 0
+            while self._expiry and self._expiry[0][0] <= now:
+                deadline, _, key = heapq.heappop(self._expiry)
+                shard = self._shard(key)
+                with shard.lock:
+                    cached = shard.entries.get(key)
+                # Stale: renewed, replaced or removed since it was pushed.
+                # Pinned graphs get their deadline back when unpinned.
+                if cached is None or cached.expires_at != deadline or cached.pinned:
+                    continue
+                self._remove(key)
+                self._dropped(key)
                 self.evictions += 1
+                expired += 1
+                if self.spill is not None:
+                    self._spill(key, cached)
 
-            if expired_keys:
-                logger.info(f"Cleaned up {len(expired_keys)} expired graphs")
+            if expired:
+                logger.info(f"Cleaned up {expired} expired graphs")
 
-            # Check memory limit
-            if self._get_memory_usage_mb() > self.max_memory_mb:
-                self._evict_until_memory_ok()
+            # Stale deadlines pile up when graphs are renewed or replaced
+            if len(self._expiry) > 2 * self._size + 64:
+                self._expiry = [
+                    (cached.expires_at, cached.tick, key)
+                    for key, cached in self._cache.items()
+                    if not cached.pinned and not math.isinf(cached.expires_at)
+                ]
+                heapq.heapify(self._expiry)
+
+            # Check memory budget
+            self._evict_until_memory_ok()
 
     def shutdown(self) -> None:
         """Shutdown the cache and stop background thread."""
         self._shutdown = True
+        self._wakeup.set()
         if hasattr(self, "_cleanup_thread") and self._cleanup_thread.is_alive():
             self._cleanup_thread.join(timeout=1.0)
+        if self.spill is not None:
+            with self._lock:
+                self._spill_queue.clear()
+                self._spilling.clear()
+                self.spill.close()
 
 
 # Global cache instance (replaces the simple dict)
-_graph_cache = GraphCache(max_size=100, ttl_seconds=3600, max_memory_mb=500)
+def _spill_store_from_env() -> Optional[SpillStore]:
+    """Disk tier of the global cache, configured from the environment."""
+    if os.environ.get("NETWORKX_MCP_SPILL", "true").lower() != "true":
+        return None
+    max_disk_mb = os.environ.get("NETWORKX_MCP_SPILL_MAX_MB")
+    return SpillStore(
+        base_dir=os.environ.get("NETWORKX_MCP_SPILL_DIR") or None,
+        max_disk_mb=float(max_disk_mb) if max_disk_mb else DEFAULT_MAX_DISK_MB,
+    )
+
+
+def _policy_from_env() -> EvictionPolicy:
+    """Eviction policy of the global cache (NETWORKX_MCP_CACHE_POLICY)."""
+    name = os.environ.get("NETWORKX_MCP_CACHE_POLICY", "lru")
+    try:
+        return make_policy(name)
+    except ValueError as e:
+        logger.warning(f"{e}; using lru")
+        return LRUPolicy()
+
+
+_graph_cache = GraphCache(
+    max_size=100,
+    ttl_seconds=3600,
+    max_memory_mb=500,
+    spill=_spill_store_from_env(),
+    policy=_policy_from_env(),
+)
 
 
 def get_graph_cache() -> GraphCache:
@@ -276,23 +1333,26 @@ class GraphDict(dict):
         super().__init__()
         self._cache = cache
 
+    # Lookups return the graph bound to the key for the current tool call
+    # (its snapshot or working copy, see snapshots.py) before the cache's
+
     def __getitem__(self, key: str) -> nx.Graph:
-        graph = self._cache.get(key)
-        if graph is None:
-            raise KeyError(key)
-        return graph
+        graph = bound_graph(key)
+        return graph if graph is not None else self._cache.get_or_raise(key)
 
     def __setitem__(self, key: str, graph: nx.Graph) -> None:
+        unbind_graph(key)
         self._cache.put(key, graph)
 
     def __delitem__(self, key: str) -> None:
+        unbind_graph(key)
         if not self._cache.delete(key):
             raise KeyError(key)
 
     def __contains__(self, key: object) -> bool:
         if not isinstance(key, str):
             return False
-        return self._cache.get(key) is not None
+        return bound_graph(key) is not None or self._cache.contains(key)
 
     def __len__(self) -> int:
         return len(self._cache.list_graphs())
@@ -304,9 +1364,53 @@ class GraphDict(dict):
         return self._cache.list_graphs()
 
     def get(self, key: str, default=None):
-        graph = self._cache.get(key)
+        graph = bound_graph(key)
+        if graph is None:
+            graph = self._cache.get(key)
         return graph if graph is not None else default
 
+    def peek(self, key: str) -> Optional[nx.Graph]:
+        graph = bound_graph(key)
+        return graph if graph is not None else self._cache.peek(key)
+
+    def version(self, key: str) -> Optional[int]:
+        view = bound_view(key)
+        if view is None:
+            return self._cache.version(key)
+        # A write in progress has no version yet
+        return view.version if isinstance(view, Snapshot) else None
+
+    def snapshot(self, key: str, timeout: Optional[float] = None) -> Optional[Snapshot]:
+        return self._cache.snapshot(key, timeout)
+
+    def begin_write(
+        self, key: str, timeout: Optional[float] = None
+    ) -> Optional[GraphWrite]:
+        return self._cache.begin_write(key, timeout)
+
+    def commit(
+        self, write: GraphWrite, build_seconds: float = 0.0
+    ) -> Optional[nx.Graph]:
+        return self._cache.commit(write, build_seconds)
+
+    def abort(self, write: GraphWrite) -> bool:
+        return self._cache.abort(write)
+
+    def resize(self, key: str, build_seconds: float = 0.0) -> Optional[int]:
+        return self._cache.resize(key, build_seconds)
+
+    def on_drop(self, callback: Callable[[str], None]) -> None:
+        self._cache.on_drop(callback)
+
+    def set_ttl(self, key: str, ttl_seconds: Optional[float]) -> bool:
+        return self._cache.set_ttl(key, ttl_seconds)
+
+    def pin(self, key: str) -> bool:
+        return self._cache.pin(key)
+
+    def unpin(self, key: str) -> bool:
+        return self._cache.unpin(key)
+
     def clear(self) -> None:
         self._cache.clear()
 
@@ -24,6 +24,8 @@ class HealthMonitor:
         self.request_count = 0
         self.error_count = 0
         self.tool_usage = {}
+        self.tool_calls: Dict[str, int] = {}
+        self.cost_class_calls: Dict[str, int] = {}
         if HAS_PSUTIL:
             self.process = psutil.Process(os.getpid())
         else:
@@ -39,6 +41,11 @@ class HealthMonitor:
         if method == "tools/call":
             self.tool_usage[method] = self.tool_usage.get(method, 0) + 1
 
+    def record_tool_call(self, tool_name: str, cost_class: str) -> None:
+        """Record a call of a registered tool and the cost class it ran in."""
+        self.tool_calls[tool_name] = self.tool_calls.get(tool_name, 0) + 1
+        self.cost_class_calls[cost_class] = self.cost_class_calls.get(cost_class, 0) + 1
+
     def get_health_status(self) -> Dict[str, Any]:
         """Get current health status."""
         uptime = time.time() - self.start_time
@@ -74,6 +81,10 @@ class HealthMonitor:
                     "pid": os.getpid(),
                     "psutil_available": HAS_PSUTIL,
                 },
+                "tools": {
+                    "calls": dict(self.tool_calls),
+                    "by_cost_class": dict(self.cost_class_calls),
+                },
                 "graphs": {
                     "count": len(getattr(self, "graphs", {})),
                     "total_nodes": sum(
@@ -0,0 +1,126 @@
+"""MCP progress notifications for long-running tool calls.
+
+A client that puts ``_meta.progressToken`` in its ``tools/call`` params
+receives ``notifications/progress`` messages while the call runs. With
+``_meta.partialResults`` set as well, each notification also carries a
+``partial`` field with the best answer so far (for example the current
+top-k of a centrality computed from a growing sample of sources), so an
+agent can stop early once that is good enough.
+
+Tool code reports through ``report_progress()``, which finds the reporter
+of the request being served in a context variable (copied onto worker
+threads by the execution engine) and is a no-op when there is none.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+# Seconds between two notifications of one request
+DEFAULT_MIN_INTERVAL = 0.1
+
+ProgressToken = Union[str, int]
+
+
+class ProgressReporter:
+    """Sends rate-limited progress notifications for one request.
+
+    Args:
+        token: The client's ``progressToken``
+        send: Thread-safe callable that writes one notification
+        partial_results: Whether notifications carry partial results
+        min_interval: Minimum seconds between notifications; the final one
+            (``progress == total``) is always sent
+    """
+
+    def __init__(
+        self,
+        token: ProgressToken,
+        send: Callable[[Dict[str, Any]], None],
+        partial_results: bool = False,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+    ) -> None:
+        self.token = token
+        self.partial_results = partial_results
+        self.min_interval = min_interval
+        self._send = send
+        self._lock = threading.Lock()
+        self._last_sent: Optional[float] = None
+        self._last_progress: Optional[float] = None
+        self.sent = 0
+
+    def report(
+        self,
+        progress: float,
+        total: Optional[float] = None,
+        message: Optional[str] = None,
+        partial: Optional[Callable[[], Any]] = None,
+    ) -> bool:
+        """Send a notification unless one went out too recently.
+
+        ``partial`` is only called when the notification is actually sent
+        with partial results, so it may be expensive. Returns whether a
+        notification was sent.
+        """
+        final = total is not None and progress >= total
+        now = time.monotonic()
+        with self._lock:
+            # Progress must increase from one notification to the next
+            if self._last_progress is not None and progress <= self._last_progress:
+                return False
+            if (
+                not final
+                and self._last_sent is not None
+                and now - self._last_sent < self.min_interval
+            ):
+                return False
+            self._last_sent = now
+            self._last_progress = progress
+            self.sent += 1
+
+        params: Dict[str, Any] = {"progressToken": self.token, "progress": progress}
+        if total is not None:
+            params["total"] = total
+        if message is not None:
+            params["message"] = message
+        if self.partial_results and partial is not None:
+            params["partial"] = partial()
+        self._send(
+            {"jsonrpc": "2.0", "method": "notifications/progress", "params": params}
+        )
+        return True
+
+
+_current_reporter: ContextVar[Optional[ProgressReporter]] = ContextVar(
+    "networkx_mcp_progress_reporter", default=None
+)
+
+
+def current_reporter() -> Optional[ProgressReporter]:
+    """Reporter of the request being served, if the client asked for one."""
+    return _current_reporter.get()
+
+
+@contextmanager
+def reporting(reporter: Optional[ProgressReporter]) -> Iterator[None]:
+    """Make ``reporter`` current for the duration of the block."""
+    reset = _current_reporter.set(reporter)
+    try:
+        yield
+    finally:
+        _current_reporter.reset(reset)
+
+
+def report_progress(
+    progress: float,
+    total: Optional[float] = None,
+    message: Optional[str] = None,
+    partial: Optional[Callable[[], Any]] = None,
+) -> bool:
+    """Report progress of the current request; see ``ProgressReporter.report``."""
+    reporter = _current_reporter.get()
+    if reporter is None:
+        return False
+    return reporter.report(progress, total, message, partial)
@@ -0,0 +1,209 @@
+"""Memoization of algorithm results per graph version.
+
+Agents often ask the same question about a graph several times in one
+session. Results of the memoized algorithms are kept under the key
+``(graph name, graph version, tool, normalized arguments)``; graph
+versions change with every write (see ``snapshots.py``), so a result can
+only be served for the exact graph state it was computed on. After a
+write the server drops the entries of the graph's older versions.
+
+Arguments are normalized by applying the function's defaults and sorting
+them, so ``pagerank(g)`` and ``pagerank(g, alpha=0.85)`` share an entry.
+Entries are evicted least recently used first once their encoded JSON
+size exceeds the budget. Results are shared between callers and must not
+be mutated.
+
+Only lookups through a store that knows versions (the server's ``graphs``)
+are memoized; plain dicts of graphs are always computed.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from .encoding import dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 64
+
+ResultKey = Tuple[str, int, str, str]
+
+# Default of ResultCache.get that tells a miss from a cached None
+MISS = object()
+
+
+def result_key(
+    graph_name: str, version: int, tool: str, arguments: Dict[str, Any]
+) -> ResultKey:
+    """Cache key of a result; ``arguments`` exclude the graph."""
+    normalized = json.dumps(arguments, sort_keys=True, default=repr)
+    return (graph_name, version, tool, normalized)
+
+
+class ResultCache:
+    """Thread-safe LRU cache of algorithm results with a byte budget."""
+
+    def __init__(self, max_mb: float = DEFAULT_MAX_MB) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_mb: Budget in MB for the encoded size of the cached
+                results; 0 disables the cache
+        """
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._entries: "OrderedDict[ResultKey, Tuple[Any, int]]" = OrderedDict()
+        self._by_graph: Dict[str, Set[ResultKey]] = {}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: ResultKey, default: Any = None) -> Any:
+        """Cached result for ``key``, counting a hit or a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: ResultKey, result: Any) -> bool:
+        """Cache a result; False if it is larger than the whole budget."""
+        try:
+            size = len(dumps_bytes(result))
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching unserializable result of {key[2]}: {e}")
+            return False
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (result, size)
+            self._by_graph.setdefault(key[0], set()).add(key)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+        return True
+
+    def invalidate(self, graph_name: str, keep_version: Optional[int] = None) -> int:
+        """Drop the results of a graph, except those of ``keep_version``.
+
+        Returns:
+            Number of results dropped
+        """
+        with self._lock:
+            stale = [
+                key
+                for key in self._by_graph.get(graph_name, ())
+                if key[1] != keep_version
+            ]
+            for key in stale:
+                self._discard(key)
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_graph.clear()
+            self.total_bytes = 0
+
+    def _discard(self, key: ResultKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.total_bytes -= entry[1]
+        keys = self._by_graph[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._by_graph[key[0]]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "graphs": len(self._by_graph),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "memory_mb": self.total_bytes / 1024 / 1024,
+                "max_memory_mb": self.max_bytes / 1024 / 1024,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def memoized(tool: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize ``func(graph_name, ..., graphs=None)`` per graph version.
+
+    The wrapper gets a ``result_key(*args, **kwargs)`` attribute returning
+    the cache key of a call, or None when the call cannot be memoized; the
+    server uses it to look up results of jobs it runs in worker processes.
+    """
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
+        def key_of(*args: Any, **kwargs: Any) -> Optional[ResultKey]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            graph_name = arguments.pop("graph_name")
+            version_of = getattr(arguments.pop("graphs", None), "version", None)
+            if not callable(version_of) or not isinstance(graph_name, str):
+                return None
+            version = version_of(graph_name)
+            if version is None:
+                return None
+            return result_key(graph_name, version, tool, arguments)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache = get_result_cache()
+            key = key_of(*args, **kwargs) if cache.enabled else None
+            if key is None:
+                return func(*args, **kwargs)
+            result = cache.get(key, MISS)
+            if result is MISS:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.result_key = key_of  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorate
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Get the global result cache, sized from NETWORKX_MCP_RESULT_CACHE_MB."""
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            _result_cache = ResultCache(
+                float(os.environ.get("NETWORKX_MCP_RESULT_CACHE_MB", DEFAULT_MAX_MB))
+            )
+        return _result_cache
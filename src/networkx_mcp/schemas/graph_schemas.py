@@ -88,9 +88,11 @@ class CentralityRequest(BaseModel):
 
     graph_id: str
     measures: List[
-        Literal["degree", "betweenness", "closeness", "eigenvector", "pagerank"]
+        Literal["degree", "betweenness", "closeness", "eigenvector", "katz", "pagerank"]
     ] = Field(default=["degree"])
     top_k: int | None = 10
+    # The engines of core/pagerank.py (ENGINES)
+    engine: Literal["auto", "numpy", "sparse"] = "auto"
 
 
 class CommunityDetectionRequest(BaseModel):
@@ -221,6 +221,7 @@ def check_operation_feasibility(graph: nx.Graph, operation: str) -> None:
         "shortest_path": 10000,  # O(V + E)
         "all_pairs_shortest_path": 1000,  # O(V^3)
         "betweenness_centrality": 5000,  # O(VE)
+        "approximate_betweenness_centrality": 1000000,  # O(kE), k sampled sources
         "clustering": 50000,  # O(V)
         "diameter": 1000,  # O(V^3)
         "pagerank": 100000,  # O(V + E)
@@ -8,22 +8,25 @@ import asyncio
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import networkx as nx
 
-# Import academic functions from plugin
-from .academic import (
-    analyze_author_impact,
-    build_citation_network,
-    detect_research_trends,
-    export_bibtex,
-    find_collaboration_patterns,
-    recommend_papers,
-    resolve_doi,
-)
+# Academic plugin; its citation functions load requests on first use
+from . import academic
+from .cancellation import CancelToken, set_current_token
 
 # Import basic operations
+from .core.basic_operations import (
+    SPECTRAL_MEASURES,
+    betweenness_job,
+    finish_pagerank,
+    graph_summary,
+    invalidate_summary,
+    pagerank_run,
+)
 from .core.basic_operations import (
     add_edges as _add_edges,
 )
@@ -54,19 +57,47 @@ from .core.basic_operations import (
 from .core.basic_operations import (
     import_csv as _import_csv,
 )
+from .core.basic_operations import (
+    list_edges as _list_edges,
+)
+from .core.basic_operations import (
+    list_nodes as _list_nodes,
+)
 from .core.basic_operations import (
     pagerank as _pagerank,
 )
 from .core.basic_operations import (
     shortest_path as _shortest_path,
 )
+from .core.basic_operations import (
+    spectral_centrality as _spectral_centrality,
+)
 from .core.basic_operations import (
     visualize_graph as _visualize_graph,
 )
+from .core.betweenness import DEFAULT_DELTA, DEFAULT_EPSILON, MAX_WORKERS
+from .core.components import extend_components, graph_size
+from .core.pagerank import (
+    DEFAULT_MAX_ITER,
+    DEFAULT_TOL,
+    ENGINES,
+    forget_vector,
+    last_vector,
+)
+from .core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from .core.paths import MAX_BATCH_PAIRS, shortest_paths_batch
+from .dispatch import GraphLocks, graph_access, plan_batch
+from .encoding import PreEncoded, dumps, encode_response, text_content, write_message
+from .execution import CostClass, get_execution_engine
 
 # Global state - simple and effective
 # Import the new thread-safe graph cache with memory management
 from .graph_cache import graphs
+from .progress import ProgressReporter, current_reporter, reporting
+from .result_cache import MISS, get_result_cache
+from .snapshots import Snapshot, bind_graph, bound_graph, bound_view
+from .tool_registry import TOOLS, ToolSpec
+from .transport import DEFAULT_MAX_MESSAGE_BYTES, StdioTransport
 
 
 class GraphManager:
@@ -104,6 +135,59 @@ try:
 except ImportError:
     HAS_MONITORING = False
 
+# Warm start vectors (core/pagerank.py) go with their graph
+graphs.on_drop(forget_vector)
+
+
+@contextmanager
+def _writing(graph_name: str) -> Iterator[None]:
+    """Publish an in-place mutation as a new version of the graph.
+
+    Tool calls already run in a write of their own (see ``_call_tool``);
+    this covers the module-level functions when called directly.
+    """
+    write = graphs.begin_write(graph_name) if bound_view(graph_name) is None else None
+    if write is None:
+        yield
+        return
+    try:
+        with bind_graph(graph_name, write):
+            yield
+    finally:
+        graphs.commit(write)
+        get_result_cache().invalidate(graph_name, graphs.version(graph_name))
+
+
+async def _acquire(acquire: Callable[..., Any], graph_name: str) -> Any:
+    """Pin a snapshot of, or begin a write to, a graph off the event loop.
+
+    ``graphs.snapshot`` and ``graphs.begin_write`` wait while another write
+    holds the graph. Only then do they move to a worker thread, so the loop
+    keeps serving other requests; if the caller is cancelled meanwhile,
+    what the thread acquires is handed back once it has it.
+    """
+    try:
+        return acquire(graph_name, timeout=0)
+    except TimeoutError:
+        pass
+    task = asyncio.ensure_future(asyncio.to_thread(acquire, graph_name))
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        task.add_done_callback(_hand_back)
+        raise
+
+
+def _hand_back(task: "asyncio.Future[Any]") -> None:
+    if task.cancelled() or task.exception() is not None:
+        return
+    view = task.result()
+    if isinstance(view, Snapshot):
+        view.release()
+    elif view is not None:
+        # Never handed to a tool; committing it lets the next write start
+        graphs.commit(view)
+
 
 # Re-export functions with graphs parameter bound
 def create_graph(name: str, directed: bool = False) -> Any:
@@ -111,15 +195,35 @@ def create_graph(name: str, directed: bool = False) -> Any:
 
 
 def add_nodes(graph_name: str, nodes: List) -> Any:
-    return _add_nodes(graph_name, nodes, graphs)
+    with _writing(graph_name):
+        return _add_nodes(graph_name, nodes, graphs)
 
 
 def add_edges(graph_name: str, edges: List) -> Any:
-    return _add_edges(graph_name, edges, graphs)
+    with _writing(graph_name):
+        return _add_edges(graph_name, edges, graphs)
+
 
+def get_graph_info(graph_name: str, include_elements: bool = False) -> Any:
+    return _get_graph_info(graph_name, graphs, include_elements)
 
-def get_graph_info(graph_name: str) -> Any:
-    return _get_graph_info(graph_name, graphs)
+
+def list_nodes(
+    graph_name: str,
+    cursor: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    attributes: Optional[List[str]] = None,
+) -> Any:
+    return _list_nodes(graph_name, cursor, page_size, attributes, graphs)
+
+
+def list_edges(
+    graph_name: str,
+    cursor: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    attributes: Optional[List[str]] = None,
+) -> Any:
+    return _list_edges(graph_name, cursor, page_size, attributes, graphs)
 
 
 def shortest_path(graph_name: str, source: Any, target: Any) -> Any:
@@ -130,16 +234,37 @@ def degree_centrality(graph_name: str) -> Any:
     return _degree_centrality(graph_name, graphs)
 
 
-def betweenness_centrality(graph_name: str) -> Any:
-    return _betweenness_centrality(graph_name, graphs)
+def betweenness_centrality(
+    graph_name: str,
+    approximate: bool = False,
+    epsilon: Optional[float] = DEFAULT_EPSILON,
+    delta: float = DEFAULT_DELTA,
+    max_seconds: Optional[float] = None,
+    seed: int = 0,
+    workers: int = 1,
+) -> Any:
+    return _betweenness_centrality(
+        graph_name, graphs, approximate, epsilon, delta, max_seconds, seed, workers
+    )
 
 
 def connected_components(graph_name: str) -> Any:
     return _connected_components(graph_name, graphs)
 
 
-def pagerank(graph_name: str) -> Any:
-    return _pagerank(graph_name, graphs)
+def pagerank(
+    graph_name: str,
+    tol: float = DEFAULT_TOL,
+    max_iter: int = DEFAULT_MAX_ITER,
+    engine: str = "auto",
+) -> Any:
+    return _pagerank(graph_name, graphs, tol, max_iter, engine)
+
+
+def spectral_centrality(
+    graph_name: str, measure: str = "eigenvector", engine: str = "auto"
+) -> Any:
+    return _spectral_centrality(graph_name, measure, engine, graphs)
 
 
 def visualize_graph(graph_name: str, layout: str = "spring") -> Any:
@@ -156,10 +281,10 @@ def export_json(graph_name: str) -> Any:
 
 def delete_graph(graph_name: str) -> Any:
     """Delete a graph - compatibility function."""
-    if graph_name not in graphs:
+    try:
+        del graphs[graph_name]
+    except KeyError:
         return {"success": False, "error": f"Graph '{graph_name}' not found"}
-
-    del graphs[graph_name]
     return {"success": True, "graph_id": graph_name, "deleted": True}
 
 
@@ -167,6 +292,723 @@ def community_detection(graph_name: str) -> Any:
     return _community_detection(graph_name, graphs)
 
 
+# Tool table: handler, schema, read/write class and cost class of every tool.
+# Handlers look up the module-level wrappers above at call time.
+
+_GRAPH_ONLY = {
+    "type": "object",
+    "properties": {"graph": {"type": "string"}},
+    "required": ["graph"],
+}
+
+
+def _require_graph(graph_name: str) -> nx.Graph:
+    try:
+        return graphs[graph_name]
+    except KeyError:
+        raise ValueError(
+            f"Graph '{graph_name}' not found. Available graphs: {list(graphs.keys())}"
+        ) from None
+
+
+def _snapshot_bytes(graph: Optional[nx.Graph]) -> int:
+    """Memory held by the CSR snapshot cached for ``graph``, if any."""
+    # Only graphs given a snapshot have loaded the module (and NumPy)
+    csr = sys.modules.get("networkx_mcp.core.csr")
+    if csr is None or graph is None:
+        return 0
+    return csr.snapshot_bytes(graph)
+
+
+_UNMONITORED = frozenset({"health_status"})
+
+
+async def _run_to_end(awaitable: Any) -> Any:
+    """Await ``awaitable``, letting it finish first if the caller is cancelled.
+
+    A job already running on a worker thread cannot be stopped from the
+    event loop; once its request is cancelled it stops at its next
+    ``checkpoint()``. The caller's ``CancelledError`` is raised only then,
+    so nothing the job touches is handed over while it still runs.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        while not task.done():
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                pass
+        if not task.cancelled():
+            # Retrieved, or asyncio logs it as never retrieved
+            task.exception()
+        raise
+
+
+def _visualization_result(viz_result: Dict[str, Any]) -> Dict[str, Any]:
+    # Rename 'image' key to 'visualization' for backward compatibility
+    return {
+        "visualization": viz_result["image"],
+        "format": viz_result["format"],
+        "layout": viz_result["layout"],
+    }
+
+
+@TOOLS.tool(
+    "create_graph",
+    "Create a new graph",
+    {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "directed": {"type": "boolean", "default": False},
+            "ttl_seconds": {
+                "type": "number",
+                "exclusiveMinimum": 0,
+                "description": "Time to live of this graph instead of the "
+                "cache default",
+            },
+        },
+        "required": ["name"],
+    },
+    writes=True,
+    graph_arg="name",
+)
+def _tool_create_graph(server: Any, args: Dict[str, Any]) -> Any:
+    name = args["name"]
+    directed = args.get("directed", False)
+    graphs[name] = nx.DiGraph() if directed else nx.Graph()
+    # Clears the TTL of a previous graph of that name if none is given
+    graphs.set_ttl(name, args.get("ttl_seconds"))
+    return {"created": name, "type": "directed" if directed else "undirected"}
+
+
+@TOOLS.tool(
+    "add_nodes",
+    "Add nodes to a graph",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "nodes": {"type": "array", "items": {"type": ["string", "number"]}},
+        },
+        "required": ["graph", "nodes"],
+    },
+    writes=True,
+)
+def _tool_add_nodes(server: Any, args: Dict[str, Any]) -> Any:
+    graph = _require_graph(args["graph"])
+    before = graph_size(graph)
+    graph.add_nodes_from(args["nodes"])
+    extend_components(graph, before, nodes=args["nodes"])
+    return {"added": len(args["nodes"]), "total": graph.number_of_nodes()}
+
+
+@TOOLS.tool(
+    "add_edges",
+    "Add edges to a graph",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "edges": {
+                "type": "array",
+                "items": {"type": "array", "items": {"type": ["string", "number"]}},
+            },
+        },
+        "required": ["graph", "edges"],
+    },
+    writes=True,
+)
+def _tool_add_edges(server: Any, args: Dict[str, Any]) -> Any:
+    graph = _require_graph(args["graph"])
+    edges = [tuple(e) for e in args["edges"]]
+    before = graph_size(graph)
+    graph.add_edges_from(edges)
+    extend_components(graph, before, edges=[(e[0], e[1]) for e in edges])
+    return {"added": len(edges), "total": graph.number_of_edges()}
+
+
+@TOOLS.tool(
+    "shortest_path",
+    "Find shortest path between nodes",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "source": {"type": ["string", "number"]},
+            "target": {"type": ["string", "number"]},
+            "weight": {
+                "type": "string",
+                "description": "Edge attribute to minimize (Dijkstra); "
+                "hop counts if omitted",
+            },
+        },
+        "required": ["graph", "source", "target"],
+    },
+    cost=CostClass.THREAD,
+)
+def _tool_shortest_path(server: Any, args: Dict[str, Any]) -> Any:
+    graph = _require_graph(args["graph"])
+    source, target, weight = args["source"], args["target"], args.get("weight")
+    # Only graphs given a landmark index have loaded it (and NumPy)
+    landmarks = sys.modules.get("networkx_mcp.core.landmarks")
+    index = None
+    if landmarks is not None:
+        index = landmarks.index_of(graph, graphs.version(args["graph"]))
+    if index is not None and index.effective and index.weight == weight:
+        path, length, settled = index.shortest_path(graph, source, target)
+        return {
+            "path": path,
+            "length": length,
+            "index": "landmarks",
+            "settled": settled,
+        }
+    if weight is None:
+        path = nx.shortest_path(graph, source, target)
+        return {"path": path, "length": len(path) - 1}
+    length, path = nx.bidirectional_dijkstra(graph, source, target, weight)
+    return {"path": path, "length": length}
+
+
+@TOOLS.tool(
+    "landmark_index",
+    "Build (or refresh) a landmark index of a mostly static graph that "
+    "speeds up its shortest_path queries; reports build time and memory. "
+    "The index lasts until the graph changes",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "landmarks": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 64,
+                "default": 8,
+                "description": "More landmarks give tighter bounds and "
+                "fewer explored nodes, at one search and one distance "
+                "array (two if directed) each",
+            },
+            "weight": {
+                "type": "string",
+                "description": "Edge attribute the indexed queries minimize; "
+                "hop counts if omitted",
+            },
+            "rebuild": {
+                "type": "boolean",
+                "default": False,
+                "description": "Rebuild even if the graph has an up-to-date index",
+            },
+            "drop": {
+                "type": "boolean",
+                "default": False,
+                "description": "Remove the index instead",
+            },
+        },
+        "required": ["graph"],
+    },
+    cost=CostClass.THREAD,
+)
+def _tool_landmark_index(server: Any, args: Dict[str, Any]) -> Any:
+    from .core.landmarks import DEFAULT_LANDMARKS, build_index, drop_index, index_of
+
+    graph_name = args["graph"]
+    graph = _require_graph(graph_name)
+    if args.get("drop", False):
+        dropped = drop_index(graph)
+        graphs.resize(graph_name)
+        return {"dropped": dropped}
+    landmarks = args.get("landmarks", DEFAULT_LANDMARKS)
+    weight = args.get("weight")
+    version = graphs.version(graph_name)
+    index = index_of(graph, version)
+    if (
+        index is not None
+        and not args.get("rebuild", False)
+        and index.weight == weight
+        and len(index.landmarks) == landmarks
+    ):
+        return {"built": False, **index.stats()}
+    index = build_index(graph, landmarks, weight, version)
+    # The index is kept on the graph and counts against the memory budget
+    graphs.resize(graph_name)
+    return {"built": True, **index.stats()}
+
+
+@TOOLS.tool(
+    "shortest_paths_batch",
+    "Find shortest paths for many (source, target) pairs, one search per "
+    "distinct source; results or per-pair errors come back in input order",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "pairs": {
+                "type": "array",
+                "items": {
+                    "type": "array",
+                    "items": {"type": ["string", "number"]},
+                    "minItems": 2,
+                    "maxItems": 2,
+                },
+                "maxItems": MAX_BATCH_PAIRS,
+            },
+            "weight": {
+                "type": "string",
+                "description": "Edge attribute to minimize (Dijkstra); "
+                "hop counts if omitted",
+            },
+        },
+        "required": ["graph", "pairs"],
+    },
+    cost=CostClass.THREAD,
+    progress=True,
+)
+def _tool_shortest_paths_batch(server: Any, args: Dict[str, Any]) -> Any:
+    graph = _require_graph(args["graph"])
+    return {"results": shortest_paths_batch(graph, args["pairs"], args.get("weight"))}
+
+
+@TOOLS.tool(
+    "get_info",
+    "Get graph summary: node and edge counts, density and degree statistics",
+    _GRAPH_ONLY,
+    cost=CostClass.THREAD,
+)
+def _tool_get_info(server: Any, args: Dict[str, Any]) -> Any:
+    graph = _require_graph(args["graph"])
+    summary = graph_summary(graph)
+    return {
+        "nodes": summary["num_nodes"],
+        "edges": summary["num_edges"],
+        "directed": graph.is_directed(),
+        "density": summary["density"],
+        "degree": summary["degree"],
+    }
+
+
+_PAGE = {
+    "type": "object",
+    "properties": {
+        "graph": {"type": "string"},
+        "cursor": {
+            "type": "string",
+            "description": "next_cursor of the previous page; omit for the first",
+        },
+        "page_size": {
+            "type": "integer",
+            "minimum": 1,
+            "maximum": MAX_PAGE_SIZE,
+            "default": DEFAULT_PAGE_SIZE,
+        },
+        "attributes": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Attributes to include; ids only when omitted",
+        },
+    },
+    "required": ["graph"],
+}
+
+
+@TOOLS.tool(
+    "list_nodes",
+    "List graph nodes one page at a time",
+    _PAGE,
+    cost=CostClass.THREAD,
+)
+def _tool_list_nodes(server: Any, args: Dict[str, Any]) -> Any:
+    return list_nodes(
+        args["graph"],
+        args.get("cursor"),
+        args.get("page_size", DEFAULT_PAGE_SIZE),
+        args.get("attributes"),
+    )
+
+
+@TOOLS.tool(
+    "list_edges",
+    "List graph edges one page at a time",
+    _PAGE,
+    cost=CostClass.THREAD,
+)
+def _tool_list_edges(server: Any, args: Dict[str, Any]) -> Any:
+    return list_edges(
+        args["graph"],
+        args.get("cursor"),
+        args.get("page_size", DEFAULT_PAGE_SIZE),
+        args.get("attributes"),
+    )
+
+
+@TOOLS.tool(
+    "degree_centrality",
+    "Calculate degree centrality for all nodes",
+    _GRAPH_ONLY,
+    cost=CostClass.THREAD,
+)
+def _tool_degree_centrality(server: Any, args: Dict[str, Any]) -> Any:
+    return degree_centrality(args["graph"])
+
+
+def _betweenness_options(args: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        args.get("approximate", False),
+        args.get("epsilon", DEFAULT_EPSILON),
+        args.get("delta", DEFAULT_DELTA),
+        args.get("max_seconds"),
+        args.get("seed", 0),
+        args.get("workers", 1),
+    )
+
+
+@TOOLS.tool(
+    "betweenness_centrality",
+    "Calculate betweenness centrality for all nodes; approximate=true "
+    "estimates it from sampled sources with an error bound, for large graphs; "
+    "workers>1 computes it exactly across processes",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "approximate": {"type": "boolean", "default": False},
+            "epsilon": {
+                "type": "number",
+                "exclusiveMinimum": 0,
+                "default": DEFAULT_EPSILON,
+                "description": "Target error bound (approximate mode)",
+            },
+            "delta": {
+                "type": "number",
+                "exclusiveMinimum": 0,
+                "exclusiveMaximum": 1,
+                "default": DEFAULT_DELTA,
+                "description": "Bound holds with probability 1 - delta",
+            },
+            "max_seconds": {
+                "type": "number",
+                "exclusiveMinimum": 0,
+                "description": "Time target (approximate mode)",
+            },
+            "seed": {"type": "integer", "default": 0},
+            "workers": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": MAX_WORKERS,
+                "default": 1,
+                "description": "Exact mode: worker processes to split sources over",
+            },
+        },
+        "required": ["graph"],
+    },
+    cost=CostClass.PROCESS,
+    worker=betweenness_job,
+    worker_args=_betweenness_options,
+    progress=True,
+)
+def _tool_betweenness_centrality(server: Any, args: Dict[str, Any]) -> Any:
+    return betweenness_centrality(args["graph"], *_betweenness_options(args))
+
+
+@TOOLS.tool(
+    "connected_components",
+    "Find connected components in the graph",
+    _GRAPH_ONLY,
+    cost=CostClass.THREAD,
+)
+def _tool_connected_components(server: Any, args: Dict[str, Any]) -> Any:
+    return connected_components(args["graph"])
+
+
+@TOOLS.tool(
+    "pagerank",
+    "Calculate PageRank for all nodes, warm-started from the last result "
+    "on the graph; reports the power iterations used. engine='sparse' "
+    "iterates with a cached SciPy transition matrix, chosen automatically "
+    "for large graphs",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "tol": {
+                "type": "number",
+                "exclusiveMinimum": 0,
+                "default": DEFAULT_TOL,
+            },
+            "max_iter": {"type": "integer", "minimum": 1, "default": DEFAULT_MAX_ITER},
+            "engine": {"type": "string", "enum": list(ENGINES), "default": "auto"},
+        },
+        "required": ["graph"],
+    },
+    cost=CostClass.PROCESS,
+    worker=pagerank_run,
+    worker_args=lambda args: (
+        args.get("tol", DEFAULT_TOL),
+        args.get("max_iter", DEFAULT_MAX_ITER),
+        last_vector(args["graph"]),
+        args.get("engine", "auto"),
+    ),
+    finish=finish_pagerank,
+)
+def _tool_pagerank(server: Any, args: Dict[str, Any]) -> Any:
+    return pagerank(
+        args["graph"],
+        args.get("tol", DEFAULT_TOL),
+        args.get("max_iter", DEFAULT_MAX_ITER),
+        args.get("engine", "auto"),
+    )
+
+
+def _spectral_options(args: Dict[str, Any]) -> Tuple[str, str]:
+    return args.get("measure", "eigenvector"), args.get("engine", "auto")
+
+
+@TOOLS.tool(
+    "spectral_centrality",
+    "Calculate eigenvector or Katz centrality for all nodes. engine='sparse' "
+    "uses SciPy sparse solvers, chosen automatically for large graphs",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "measure": {
+                "type": "string",
+                "enum": list(SPECTRAL_MEASURES),
+                "default": "eigenvector",
+            },
+            "engine": {"type": "string", "enum": list(ENGINES), "default": "auto"},
+        },
+        "required": ["graph"],
+    },
+    cost=CostClass.PROCESS,
+    worker=_spectral_centrality,
+    worker_args=_spectral_options,
+)
+def _tool_spectral_centrality(server: Any, args: Dict[str, Any]) -> Any:
+    return spectral_centrality(args["graph"], *_spectral_options(args))
+
+
+@TOOLS.tool(
+    "community_detection",
+    "Detect communities in the graph using Louvain method",
+    _GRAPH_ONLY,
+    cost=CostClass.PROCESS,
+    worker=_community_detection,
+)
+def _tool_community_detection(server: Any, args: Dict[str, Any]) -> Any:
+    return community_detection(args["graph"])
+
+
+@TOOLS.tool(
+    "visualize_graph",
+    "Create a visualization of the graph",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "layout": {
+                "type": "string",
+                "enum": ["spring", "circular", "kamada_kawai"],
+                "default": "spring",
+            },
+        },
+        "required": ["graph"],
+    },
+    cost=CostClass.PROCESS,
+    worker=_visualize_graph,
+    worker_args=lambda args: (args.get("layout", "spring"),),
+    finish=_visualization_result,
+)
+def _tool_visualize_graph(server: Any, args: Dict[str, Any]) -> Any:
+    layout = args.get("layout", "spring")
+    return _visualization_result(visualize_graph(args["graph"], layout))
+
+
+@TOOLS.tool(
+    "import_csv",
+    "Import graph from CSV edge List[Any] (format: source,target per line)",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "csv_data": {"type": "string"},
+            "directed": {"type": "boolean", "default": False},
+        },
+        "required": ["graph", "csv_data"],
+    },
+    writes=True,
+    cost=CostClass.THREAD,
+)
+def _tool_import_csv(server: Any, args: Dict[str, Any]) -> Any:
+    return import_csv(args["graph"], args["csv_data"], args.get("directed", False))
+
+
+@TOOLS.tool(
+    "export_json",
+    "Export graph as JSON in node-link format",
+    _GRAPH_ONLY,
+    cost=CostClass.THREAD,
+)
+def _tool_export_json(server: Any, args: Dict[str, Any]) -> Any:
+    return export_json(args["graph"])
+
+
+@TOOLS.tool(
+    "build_citation_network",
+    "Build citation network from DOIs using CrossRef API",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "seed_dois": {"type": "array", "items": {"type": "string"}},
+            "max_depth": {"type": "integer", "default": 2},
+        },
+        "required": ["graph", "seed_dois"],
+    },
+    writes=True,
+    cost=CostClass.THREAD,
+    progress=True,
+)
+def _tool_build_citation_network(server: Any, args: Dict[str, Any]) -> Any:
+    return academic.build_citation_network(
+        args["graph"], args["seed_dois"], args.get("max_depth", 2), graphs
+    )
+
+
+@TOOLS.tool(
+    "analyze_author_impact",
+    "Analyze author impact metrics including h-index",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "author_name": {"type": "string"},
+        },
+        "required": ["graph", "author_name"],
+    },
+    cost=CostClass.THREAD,
+)
+def _tool_analyze_author_impact(server: Any, args: Dict[str, Any]) -> Any:
+    return academic.analyze_author_impact(args["graph"], args["author_name"], graphs)
+
+
+@TOOLS.tool(
+    "find_collaboration_patterns",
+    "Find collaboration patterns in citation network",
+    _GRAPH_ONLY,
+    cost=CostClass.THREAD,
+)
+def _tool_find_collaboration_patterns(server: Any, args: Dict[str, Any]) -> Any:
+    return academic.find_collaboration_patterns(args["graph"], graphs)
+
+
+@TOOLS.tool(
+    "detect_research_trends",
+    "Detect research trends over time",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "time_window": {"type": "integer", "default": 5},
+        },
+        "required": ["graph"],
+    },
+    cost=CostClass.THREAD,
+)
+def _tool_detect_research_trends(server: Any, args: Dict[str, Any]) -> Any:
+    return academic.detect_research_trends(
+        args["graph"], args.get("time_window", 5), graphs
+    )
+
+
+@TOOLS.tool(
+    "export_bibtex",
+    "Export citation network as BibTeX format",
+    _GRAPH_ONLY,
+    cost=CostClass.THREAD,
+)
+def _tool_export_bibtex(server: Any, args: Dict[str, Any]) -> Any:
+    return academic.export_bibtex(args["graph"], graphs)
+
+
+@TOOLS.tool(
+    "recommend_papers",
+    "Recommend papers based on citation network analysis",
+    {
+        "type": "object",
+        "properties": {
+            "graph": {"type": "string"},
+            "seed_doi": {"type": "string"},
+            "max_recommendations": {"type": "integer", "default": 10},
+        },
+        "required": ["graph", "seed_doi"],
+    },
+    cost=CostClass.THREAD,
+)
+def _tool_recommend_papers(server: Any, args: Dict[str, Any]) -> Any:
+    # Handle alternative parameter names for backward compatibility
+    seed = args.get("seed_doi") or args.get("seed_paper")
+    max_recs = args.get("max_recommendations") or args.get("top_n", 10)
+
+    if not seed:
+        raise ValueError("Missing required parameter: seed_doi or seed_paper")
+
+    return academic.recommend_papers(args["graph"], seed, max_recs, graphs)
+
+
+@TOOLS.tool(
+    "resolve_doi",
+    "Resolve DOI to publication metadata using CrossRef API",
+    {
+        "type": "object",
+        "properties": {"doi": {"type": "string"}},
+        "required": ["doi"],
+    },
+    cost=CostClass.THREAD,
+    graph_arg=None,
+)
+def _tool_resolve_doi(server: Any, args: Dict[str, Any]) -> Any:
+    result, error = academic.resolve_doi(args["doi"])
+    if result is None:
+        error_msg = error or "Unknown error"
+        raise ValueError(f"Could not resolve DOI: {args['doi']} - {error_msg}")
+    return result
+
+
+# Listed only when monitoring is enabled (see _get_tools)
+@TOOLS.tool(
+    "health_status",
+    "Get server health and performance metrics",
+    {"type": "object", "properties": {}, "required": []},
+    # Samples CPU usage for 0.1s, so keep it off the event loop
+    cost=CostClass.THREAD,
+    graph_arg=None,
+)
+def _tool_health_status(server: Any, args: Dict[str, Any]) -> Any:
+    if not server.monitor:
+        return {"status": "monitoring_disabled"}
+    result = server.monitor.get_health_status()
+    result["execution"] = server.engine.get_stats()
+    result["result_cache"] = get_result_cache().get_stats()
+    # Only once an algorithm has loaded it: importing it pulls in NumPy
+    csr = sys.modules.get("networkx_mcp.core.csr")
+    if csr is not None:
+        result["csr_snapshots"] = csr.get_csr_stats()
+    landmarks = sys.modules.get("networkx_mcp.core.landmarks")
+    if landmarks is not None:
+        result["landmark_indexes"] = landmarks.get_landmark_stats()
+    return result
+
+
+def _invalid_request(req_id: Any, reason: str) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "error": {"code": -32600, "message": f"Invalid Request: {reason}"},
+    }
+
+
 class NetworkXMCPServer:
     """Minimal MCP server - no unnecessary abstraction."""
 
@@ -174,12 +1016,31 @@ class NetworkXMCPServer:
         self,
         auth_required: bool = False,
         enable_monitoring: bool = False,  # Changed default to False for MCP
+        max_concurrency: int = 1,
+        stream_transport: bool = True,
+        max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
     ) -> None:
         self.running = True
         self.initialized = False  # Track initialization state
         self.mcp = self  # For test compatibility
         self.graphs = graphs  # Reference to global graphs
 
+        # Concurrent dispatch: with more than one slot, run() keeps reading
+        # while tool calls execute on worker threads and answers them out of
+        # order (matched by JSON-RPC id).
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.engine = get_execution_engine()
+        self._graph_locks = GraphLocks()
+        self._slots: Optional[asyncio.Semaphore] = None
+        # In-flight tool calls by request id, for notifications/cancelled
+        self._in_flight: Dict[Any, Tuple[asyncio.Task, CancelToken]] = {}
+
+        # run() talks to stdin/stdout through asyncio streams when they are
+        # pipes, and falls back to a reader thread + print otherwise
+        self.stream_transport = stream_transport
+        self.max_message_bytes = max_message_bytes
+        self._transport: Optional[StdioTransport] = None
+
         # Set up authentication if enabled
         self.auth_required = auth_required and HAS_AUTH
         if self.auth_required:
@@ -214,8 +1075,17 @@ class NetworkXMCPServer:
         """Mock tool decorator for test compatibility."""
         return func
 
-    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Route requests to handlers."""
+    async def handle_request(self, request: Any) -> Any:
+        """Route requests to handlers.
+
+        A list is treated as a JSON-RPC 2.0 batch and answered with a list
+        of responses (or None when the batch held only notifications).
+        """
+        if isinstance(request, list):
+            return await self._handle_batch(request)
+        if not isinstance(request, dict):
+            return _invalid_request(None, "request must be an object")
+
         method = request.get("method", "")
         params = request.get("params", {})
         req_id = request.get("id")
@@ -253,6 +1123,10 @@ class NetworkXMCPServer:
                 },
                 "serverInfo": {"name": "networkx-mcp-server", "version": "1.0.0"},
             }
+        elif method == "notifications/cancelled":
+            # Notification: never answered, even for an unknown request id
+            self._cancel_request(params.get("requestId"), params.get("reason"))
+            return None
         elif method == "initialized":
             # This is a notification, no response needed
             if req_id is None:
@@ -266,20 +1140,15 @@ class NetworkXMCPServer:
                     "id": req_id,
                     "error": {"code": -32002, "message": "Server not initialized"},
                 }
-            result = {"tools": self._get_tools()}
+            result = self._tool_listing()
         elif method == "tools/call":
             # Check permissions for write operations
             if auth_data and self.auth:
-                tool_name = params.get("name", "")
-                write_tools = [
-                    "create_graph",
-                    "add_nodes",
-                    "add_edges",
-                    "import_csv",
-                    "build_citation_network",
-                ]
-                if tool_name in write_tools and not self.auth.check_permission(
-                    auth_data, "write"
+                spec = TOOLS.get(params.get("name", ""))
+                if (
+                    spec
+                    and spec.writes
+                    and not self.auth.check_permission(auth_data, "write")
                 ):
                     return {
                         "jsonrpc": "2.0",
@@ -326,6 +1195,109 @@ class NetworkXMCPServer:
 
         return {"jsonrpc": "2.0", "id": req_id, "result": result}
 
+    async def _handle_batch(self, batch: List[Any]) -> Any:
+        """Answer a JSON-RPC batch with a single response array.
+
+        Calls on different graphs run concurrently (on worker threads when
+        ``max_concurrency > 1``); calls on the same graph, and everything
+        around a non-tool method, keep the order they had in the batch.
+        Responses come back in batch order; notifications get none.
+        """
+        if not batch:
+            return _invalid_request(None, "empty batch")
+
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+
+        async def run_lane(lane: List[int]) -> None:
+            for index in lane:
+                responses[index] = await self._execute(batch[index])
+
+        for stage in plan_batch(batch):
+            if len(stage) == 1:
+                await run_lane(stage[0])
+            else:
+                await asyncio.gather(*(run_lane(lane) for lane in stage))
+
+        answered = [
+            response
+            for request, response in zip(batch, responses)
+            if response is not None
+            and not (isinstance(request, dict) and "id" not in request)
+        ]
+        return answered or None
+
+    async def _execute(self, request: Any) -> Any:
+        """Handle one request under its graph lock (and a slot, when running).
+
+        Tool calls with an id run as their own task so that a
+        ``notifications/cancelled`` for that id can stop them; a cancelled
+        call gets no response.
+        """
+        if not isinstance(request, dict):
+            return _invalid_request(None, "batch entry must be an object")
+
+        req_id = request.get("id")
+        if request.get("method") != "tools/call" or not isinstance(req_id, (str, int)):
+            return await self._execute_locked(request)
+
+        token = CancelToken()
+        task = asyncio.ensure_future(self._execute_locked(request, token))
+        entry = (task, token)
+        self._in_flight[req_id] = entry
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if token.cancelled and task.cancelled():
+                return None
+            raise
+        finally:
+            if self._in_flight.get(req_id) is entry:
+                del self._in_flight[req_id]
+
+    def _cancel_request(self, req_id: Any, reason: Optional[str] = None) -> bool:
+        """Cancel the in-flight tool call ``req_id``; False if there is none."""
+        entry = self._in_flight.get(req_id) if isinstance(req_id, (str, int)) else None
+        if entry is None:
+            return False
+        task, token = entry
+        token.cancel(reason)
+        task.cancel()
+        return True
+
+    async def _execute_locked(
+        self, request: Dict[str, Any], token: Optional[CancelToken] = None
+    ) -> Any:
+        # Runs in its own task context when tracked, so the token stays local
+        if token is not None:
+            set_current_token(token)
+        graph_name, writes = graph_access(request)
+        snapshot = None
+        if graph_name is not None:
+            await self._graph_locks.acquire(graph_name, writes)
+            if not writes:
+                # A reader holds the lock only until it has pinned its
+                # snapshot; writes queued behind it then work on a copy
+                # instead of waiting for it to finish
+                try:
+                    snapshot = await _acquire(graphs.snapshot, graph_name)
+                finally:
+                    self._graph_locks.release(graph_name, False)
+        try:
+            with (
+                bind_graph(graph_name, snapshot)
+                if snapshot is not None
+                else nullcontext()
+            ):
+                if self._slots is not None and request.get("method") == "tools/call":
+                    async with self._slots:
+                        return await self.handle_request(request)
+                return await self.handle_request(request)
+        finally:
+            if snapshot is not None:
+                snapshot.release()
+            elif graph_name is not None and writes:
+                self._graph_locks.release(graph_name, True)
+
     async def handle_message(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Handle MCP message (alias for handle_request for compatibility).
 
@@ -340,432 +1312,264 @@ class NetworkXMCPServer:
 
     def _get_tools(self) -> List[Dict[str, Any]]:
         """List available tools."""
-        tools = [
-            {
-                "name": "create_graph",
-                "description": "Create a new graph",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "directed": {"type": "boolean", "default": False},
-                    },
-                    "required": ["name"],
-                },
-            },
-            {
-                "name": "add_nodes",
-                "description": "Add nodes to a graph",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "nodes": {
-                            "type": "array",
-                            "items": {"type": ["string", "number"]},
-                        },
-                    },
-                    "required": ["graph", "nodes"],
-                },
-            },
-            {
-                "name": "add_edges",
-                "description": "Add edges to a graph",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "edges": {
-                            "type": "array",
-                            "items": {
-                                "type": "array",
-                                "items": {"type": ["string", "number"]},
-                            },
-                        },
-                    },
-                    "required": ["graph", "edges"],
-                },
-            },
-            {
-                "name": "shortest_path",
-                "description": "Find shortest path between nodes",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "source": {"type": ["string", "number"]},
-                        "target": {"type": ["string", "number"]},
-                    },
-                    "required": ["graph", "source", "target"],
-                },
-            },
-            {
-                "name": "get_info",
-                "description": "Get graph information",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "degree_centrality",
-                "description": "Calculate degree centrality for all nodes",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "betweenness_centrality",
-                "description": "Calculate betweenness centrality for all nodes",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "connected_components",
-                "description": "Find connected components in the graph",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "pagerank",
-                "description": "Calculate PageRank for all nodes",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "community_detection",
-                "description": "Detect communities in the graph using Louvain method",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "visualize_graph",
-                "description": "Create a visualization of the graph",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "layout": {
-                            "type": "string",
-                            "enum": ["spring", "circular", "kamada_kawai"],
-                            "default": "spring",
-                        },
-                    },
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "import_csv",
-                "description": "Import graph from CSV edge List[Any] (format: source,target per line)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "csv_data": {"type": "string"},
-                        "directed": {"type": "boolean", "default": False},
-                    },
-                    "required": ["graph", "csv_data"],
-                },
-            },
-            {
-                "name": "export_json",
-                "description": "Export graph as JSON in node-link format",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "build_citation_network",
-                "description": "Build citation network from DOIs using CrossRef API",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "seed_dois": {"type": "array", "items": {"type": "string"}},
-                        "max_depth": {"type": "integer", "default": 2},
-                    },
-                    "required": ["graph", "seed_dois"],
-                },
-            },
-            {
-                "name": "analyze_author_impact",
-                "description": "Analyze author impact metrics including h-index",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "author_name": {"type": "string"},
-                    },
-                    "required": ["graph", "author_name"],
-                },
-            },
-            {
-                "name": "find_collaboration_patterns",
-                "description": "Find collaboration patterns in citation network",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "detect_research_trends",
-                "description": "Detect research trends over time",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "time_window": {"type": "integer", "default": 5},
-                    },
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "export_bibtex",
-                "description": "Export citation network as BibTeX format",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"graph": {"type": "string"}},
-                    "required": ["graph"],
-                },
-            },
-            {
-                "name": "recommend_papers",
-                "description": "Recommend papers based on citation network analysis",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "graph": {"type": "string"},
-                        "seed_doi": {"type": "string"},
-                        "max_recommendations": {"type": "integer", "default": 10},
-                    },
-                    "required": ["graph", "seed_doi"],
-                },
-            },
-            {
-                "name": "resolve_doi",
-                "description": "Resolve DOI to publication metadata using CrossRef API",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {"doi": {"type": "string"}},
-                    "required": ["doi"],
-                },
-            },
-        ]
+        return list(self._tool_listing()["tools"])
 
-        # Add health endpoint if monitoring is enabled
+    def _tool_listing(self) -> PreEncoded:
+        # health_status is only advertised when monitoring is enabled
         if self.monitoring_enabled and self.monitor:
-            tools.append(
-                {
-                    "name": "health_status",
-                    "description": "Get server health and performance metrics",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                }
-            )
-
-        return tools
+            return TOOLS.listing()
+        return TOOLS.listing(_UNMONITORED)
 
     async def _call_tool(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool."""
         tool_name = params.get("name")
         args = params.get("arguments", {})
 
-        try:
-            if tool_name == "create_graph":
-                name = args["name"]
-                directed = args.get("directed", False)
-                graphs[name] = nx.DiGraph() if directed else nx.Graph()
-                result = {
-                    "created": name,
-                    "type": "directed" if directed else "undirected",
-                }
-
-            elif tool_name == "add_nodes":
-                graph_name = args["graph"]
-                if graph_name not in graphs:
-                    raise ValueError(
-                        f"Graph '{graph_name}' not found. Available graphs: {list(graphs.keys())}"
-                    )
-                graph = graphs[graph_name]
-                graph.add_nodes_from(args["nodes"])
-                result = {"added": len(args["nodes"]), "total": graph.number_of_nodes()}
-
-            elif tool_name == "add_edges":
-                graph_name = args["graph"]
-                if graph_name not in graphs:
-                    raise ValueError(
-                        f"Graph '{graph_name}' not found. Available graphs: {list(graphs.keys())}"
-                    )
-                graph = graphs[graph_name]
-                edges = [tuple(e) for e in args["edges"]]
-                graph.add_edges_from(edges)
-                result = {"added": len(edges), "total": graph.number_of_edges()}
-
-            elif tool_name == "shortest_path":
-                graph_name = args["graph"]
-                if graph_name not in graphs:
-                    raise ValueError(
-                        f"Graph '{graph_name}' not found. Available graphs: {list(graphs.keys())}"
-                    )
-                graph = graphs[graph_name]
-                path = nx.shortest_path(graph, args["source"], args["target"])
-                result = {"path": path, "length": len(path) - 1}
-
-            elif tool_name == "get_info":
-                graph_name = args["graph"]
-                if graph_name not in graphs:
-                    raise ValueError(
-                        f"Graph '{graph_name}' not found. Available graphs: {list(graphs.keys())}"
-                    )
-                graph = graphs[graph_name]
-                result = {
-                    "nodes": graph.number_of_nodes(),
-                    "edges": graph.number_of_edges(),
-                    "directed": graph.is_directed(),
-                }
-
-            elif tool_name == "degree_centrality":
-                result = degree_centrality(args["graph"])
-
-            elif tool_name == "betweenness_centrality":
-                result = betweenness_centrality(args["graph"])
-
-            elif tool_name == "connected_components":
-                result = connected_components(args["graph"])
-
-            elif tool_name == "pagerank":
-                result = pagerank(args["graph"])
-
-            elif tool_name == "community_detection":
-                result = community_detection(args["graph"])
-
-            elif tool_name == "visualize_graph":
-                layout = args.get("layout", "spring")
-                viz_result = visualize_graph(args["graph"], layout)
-                # Rename 'image' key to 'visualization' for backward compatibility
-                result = {
-                    "visualization": viz_result["image"],
-                    "format": viz_result["format"],
-                    "layout": viz_result["layout"],
-                }
-
-            elif tool_name == "import_csv":
-                result = import_csv(
-                    args["graph"], args["csv_data"], args.get("directed", False)
-                )
-
-            elif tool_name == "export_json":
-                result = export_json(args["graph"])
-
-            elif tool_name == "build_citation_network":
-                result = build_citation_network(
-                    args["graph"], args["seed_dois"], args.get("max_depth", 2), graphs
-                )
-
-            elif tool_name == "analyze_author_impact":
-                result = analyze_author_impact(
-                    args["graph"], args["author_name"], graphs
-                )
-
-            elif tool_name == "find_collaboration_patterns":
-                result = find_collaboration_patterns(args["graph"], graphs)
-
-            elif tool_name == "detect_research_trends":
-                result = detect_research_trends(
-                    args["graph"], args.get("time_window", 5), graphs
-                )
-
-            elif tool_name == "export_bibtex":
-                result = export_bibtex(args["graph"], graphs)
-
-            elif tool_name == "recommend_papers":
-                # Handle alternative parameter names for backward compatibility
-                seed = args.get("seed_doi") or args.get("seed_paper")
-                max_recs = args.get("max_recommendations") or args.get("top_n", 10)
-
-                if not seed:
-                    raise ValueError(
-                        "Missing required parameter: seed_doi or seed_paper"
-                    )
+        spec = TOOLS.get(tool_name)
+        if spec is None:
+            # Return proper error for unknown tool
+            return {"error": {"code": -32601, "message": f"Unknown tool: {tool_name}"}}
+        if self.monitor:
+            self.monitor.record_tool_call(spec.name, spec.cost.value)
 
-                result = recommend_papers(args["graph"], seed, max_recs, graphs)
+        graph_name = (
+            args.get(spec.graph_arg)
+            if spec.graph_arg and isinstance(args, dict)
+            else None
+        )
+        # Writes go to a new version of the graph, reads to a pinned
+        # snapshot (unless the dispatcher already bound one)
+        cost = spec.cost
+        write = snapshot = view = None
+        if isinstance(graph_name, str):
+            if spec.writes:
+                view = write = await _acquire(graphs.begin_write, graph_name)
+                if write is not None and write.pending_copy:
+                    # Copying the graph is not cheap; keep it off the loop
+                    if cost is CostClass.INLINE:
+                        cost = CostClass.THREAD
+            elif bound_graph(graph_name) is None:
+                view = snapshot = await _acquire(graphs.snapshot, graph_name)
+        # A read may cache a CSR snapshot on the graph, which the memory
+        # budget of the cache has to follow
+        reading = None
+        if isinstance(graph_name, str) and not spec.writes:
+            reading = view.graph if view is not None else bound_graph(graph_name)
+        held = _snapshot_bytes(reading)
+        start = time.perf_counter()
+        cancelled = False
 
-            elif tool_name == "resolve_doi":
-                result, error = resolve_doi(args["doi"])
-                if result is None:
-                    error_msg = error or "Unknown error"
-                    raise ValueError(
-                        f"Could not resolve DOI: {args['doi']} - {error_msg}"
+        try:
+            with (
+                reporting(self._progress_reporter(params)),
+                bind_graph(graph_name, view) if view is not None else nullcontext(),
+            ):
+                if cost is CostClass.PROCESS:
+                    result = await self._run_cpu_tool(spec, args)
+                elif write is not None and cost is CostClass.THREAD:
+                    # The write must be over before it is committed (or
+                    # dropped) and its graph lock released
+                    result = await _run_to_end(
+                        self.engine.run(cost, spec.handler, self, args)
                     )
-
-            elif tool_name == "health_status":
-                if self.monitor:
-                    result = self.monitor.get_health_status()
                 else:
-                    result = {"status": "monitoring_disabled"}
+                    result = await self.engine.run(cost, spec.handler, self, args)
 
-            else:
-                # Return proper error for unknown tool
-                return {
-                    "error": {"code": -32601, "message": f"Unknown tool: {tool_name}"}
-                }
+            # Encoded once here; the envelope splices it in (see encoding.py)
+            return text_content(dumps(result))
 
-            return {"content": [{"type": "text", "text": json.dumps(result)}]}
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
 
         except Exception as e:
             # Return proper JSON-RPC error format
             return {"error": {"code": -32603, "message": f"Internal error: {str(e)}"}}
 
+        finally:
+            # A cancelled write on a copy is thrown away; one made in place
+            # has changed the graph and is published like any other
+            if write is not None and not (cancelled and graphs.abort(write)):
+                # Write time is what rebuilding the graph would cost
+                graph = graphs.commit(write, time.perf_counter() - start)
+                if graph is not None:
+                    # Cached summaries describe the graph as it was
+                    invalidate_summary(graph)
+                # Results of older versions can no longer be served
+                get_result_cache().invalidate(graph_name, graphs.version(graph_name))
+            if reading is not None and _snapshot_bytes(reading) != held:
+                graphs.resize(graph_name)
+            if snapshot is not None:
+                snapshot.release()
+
+    def _progress_reporter(self, params: Dict[str, Any]) -> Optional[ProgressReporter]:
+        """Reporter for a call whose ``_meta`` carries a progress token."""
+        meta = params.get("_meta")
+        token = meta.get("progressToken") if isinstance(meta, dict) else None
+        if not isinstance(token, (str, int)) or isinstance(token, bool):
+            return None
+        loop = asyncio.get_running_loop()
+
+        def send(notification: Dict[str, Any]) -> None:
+            # Called from worker threads; responses are written on the loop
+            loop.call_soon_threadsafe(self._write_response, notification)
+
+        return ProgressReporter(token, send, bool(meta.get("partialResults")))
+
+    async def _run_cpu_tool(self, spec: ToolSpec, args: Dict[str, Any]) -> Any:
+        """Run a PROCESS-class tool on a snapshot of its graph in a worker."""
+        graph_name = args.get(spec.graph_arg) if spec.graph_arg else None
+        graph = graphs.get(graph_name) if isinstance(graph_name, str) else None
+        if (
+            graph is None
+            or not self.engine.offloads(graph)
+            or (spec.progress and current_reporter() is not None)
+        ):
+            # Small graph (or an error to report): not worth a round trip.
+            # Progress can only be reported from a thread of this process.
+            return await self.engine.run(CostClass.THREAD, spec.handler, self, args)
+
+        worker_args = spec.worker_args(args)
+        # The worker process sees a plain dict of graphs, which is never
+        # memoized, so results of memoized workers are looked up here.
+        # Entries hold tool results, shared with calls run on threads.
+        result_key = getattr(spec.worker, "result_key", None)
+        key = (
+            result_key(graph_name, *worker_args, graphs=graphs) if result_key else None
+        )
+        results = get_result_cache()
+        if key is not None and results.enabled:
+            result = results.get(key, MISS)
+            if result is not MISS:
+                return result
+
+        result = spec.finish(
+            await self.engine.run_on_graph(spec.worker, graph_name, graph, *worker_args)
+        )
+        if key is not None and results.enabled:
+            results.put(key, result)
+        return result
+
     async def run(self) -> None:
         """Main server loop - read stdin, write stdout."""
+        if self.stream_transport:
+            self._transport = await StdioTransport.open(
+                max_message_bytes=self.max_message_bytes
+            )
+        try:
+            if self.max_concurrency > 1:
+                await self._run_concurrent()
+            else:
+                await self._run_sequential()
+        finally:
+            if self._transport is not None:
+                await self._transport.close()
+                self._transport = None
+
+    async def _run_sequential(self) -> None:
+        """Server loop that handles one request at a time."""
         while self.running:
             try:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                line = await self._read_line()
                 if not line:
                     break
 
                 request = json.loads(line.strip())
-                response = await self.handle_request(request)
-                if response is not None:
-                    print(json.dumps(response), flush=True)
+                self._write_response(await self.handle_request(request))
+
+            except Exception as e:
+                print(json.dumps({"error": str(e)}), file=sys.stderr, flush=True)
+
+    async def _run_concurrent(self) -> None:
+        """Server loop that keeps reading while tool calls are executing.
+
+        Up to ``max_concurrency`` tool calls run at once; each response is
+        written as soon as it is ready, so responses may leave in a different
+        order than the requests arrived. Lifecycle and listing methods are
+        cheap and handled inline, which keeps ``initialize`` ordered before
+        anything that follows it.
+        """
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        in_flight: Set[asyncio.Task] = set()
+
+        while self.running:
+            try:
+                line = await self._read_line()
+            except (OSError, ValueError) as e:
+                # Stdin is closed or unreadable; nothing more will arrive
+                print(json.dumps({"error": str(e)}), file=sys.stderr, flush=True)
+                break
+            if not line:
+                break
+
+            try:
+                request = json.loads(line.strip())
+                if isinstance(request, list) or (
+                    isinstance(request, dict) and request.get("method") == "tools/call"
+                ):
+                    task = asyncio.create_task(self._dispatch(request))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                else:
+                    self._write_response(await self.handle_request(request))
 
             except Exception as e:
                 print(json.dumps({"error": str(e)}), file=sys.stderr, flush=True)
 
+        # Stdin closed: let the calls that are still running finish
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
-# Create module-level mcp instance for test compatibility
-# Suppress auth warning for this default instance
-_original_env = os.environ.get("NETWORKX_MCP_SUPPRESS_AUTH_WARNING")
-os.environ["NETWORKX_MCP_SUPPRESS_AUTH_WARNING"] = "1"
-mcp = NetworkXMCPServer()
-# Restore original env value
-if _original_env is None:
-    del os.environ["NETWORKX_MCP_SUPPRESS_AUTH_WARNING"]
-else:
-    os.environ["NETWORKX_MCP_SUPPRESS_AUTH_WARNING"] = _original_env
+    async def _dispatch(self, request: Any) -> None:
+        """Run a tools/call request or a batch and write its response."""
+        try:
+            if isinstance(request, list):
+                response = await self.handle_request(request)
+            else:
+                response = await self._execute(request)
+            self._write_response(response)
+        except Exception as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr, flush=True)
+
+    async def _read_line(self) -> Any:
+        """Next request line (str or bytes); empty at end of input."""
+        if self._transport is not None:
+            # Stop reading while the client is not reading our responses
+            await self._transport.drain()
+            return await self._transport.read_message()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, sys.stdin.readline
+        )
+
+    def _write_response(self, response: Any) -> None:
+        if response is None:
+            return
+        data = encode_response(response)
+        if self._transport is not None:
+            req_id = response.get("id") if isinstance(response, dict) else None
+            self._transport.send(data, req_id)
+        else:
+            write_message(data)
+
+
+def __getattr__(name: str) -> Any:
+    # Module-level mcp instance for test compatibility, created on first
+    # access rather than at import
+    if name != "mcp":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    global mcp
+    # Suppress auth warning for this default instance
+    _original_env = os.environ.get("NETWORKX_MCP_SUPPRESS_AUTH_WARNING")
+    os.environ["NETWORKX_MCP_SUPPRESS_AUTH_WARNING"] = "1"
+    try:
+        mcp = NetworkXMCPServer()
+    finally:
+        # Restore original env value
+        if _original_env is None:
+            del os.environ["NETWORKX_MCP_SUPPRESS_AUTH_WARNING"]
+        else:
+            os.environ["NETWORKX_MCP_SUPPRESS_AUTH_WARNING"] = _original_env
+    return mcp
 
 
 def main() -> None:
@@ -775,6 +1579,15 @@ def main() -> None:
     enable_monitoring = (
         os.environ.get("NETWORKX_MCP_MONITORING", "false").lower() == "true"
     )
+    # Tool calls allowed to run at once; 1 restores the sequential loop
+    max_concurrency = int(os.environ.get("NETWORKX_MCP_MAX_CONCURRENCY", "4"))
+    # asyncio stream transport for stdio; "false" restores the reader thread
+    stream_transport = (
+        os.environ.get("NETWORKX_MCP_STREAM_TRANSPORT", "true").lower() == "true"
+    )
+    max_message_bytes = int(
+        os.environ.get("NETWORKX_MCP_MAX_MESSAGE_BYTES", DEFAULT_MAX_MESSAGE_BYTES)
+    )
 
     import logging
 
@@ -827,9 +1640,16 @@ def main() -> None:
         logging.info("Health status available via 'health_status' tool")
 
     server = NetworkXMCPServer(
-        auth_required=auth_required, enable_monitoring=enable_monitoring
+        auth_required=auth_required,
+        enable_monitoring=enable_monitoring,
+        max_concurrency=max_concurrency,
+        stream_transport=stream_transport,
+        max_message_bytes=max_message_bytes,
     )
-    asyncio.run(server.run())
+    try:
+        asyncio.run(server.run())
+    finally:
+        server.engine.shutdown(wait=False)
 
 
 # Run the server
@@ -0,0 +1,140 @@
+"""Versioned copy-on-write snapshots of cached graphs.
+
+Every graph in the cache has a version, a number that changes whenever the
+graph is replaced or a write through the server completes. Readers pin a
+``Snapshot``: the graph object of the current version, which nobody
+mutates while it is pinned. A writer calls ``GraphCache.begin_write``; if
+a reader has the current version pinned, the writer gets a copy to mutate
+and publishes it as the next version when done, so it never waits for the
+reader to finish. Without readers the writer mutates the graph in place,
+which costs nothing.
+
+A snapshot is also the graph to hand to a worker thread or process: it
+stays consistent for as long as it is pinned.
+
+Tool functions look graphs up by name in the global ``graphs`` store.
+While a call runs, the graph it should see (its snapshot, or the working
+copy of a write) is bound to that name in a context variable, which the
+execution engine copies onto worker threads.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+import networkx as nx
+
+
+class Snapshot:
+    """A pinned, immutable version of a cached graph.
+
+    Release it (or use it as a context manager) when done; until then
+    writers to the graph work on a copy.
+    """
+
+    __slots__ = ("key", "version", "graph", "_release")
+
+    def __init__(
+        self,
+        key: str,
+        version: int,
+        graph: nx.Graph,
+        release: Callable[["Snapshot"], None],
+    ) -> None:
+        self.key = key
+        self.version = version
+        self.graph = graph
+        self._release: Optional[Callable[["Snapshot"], None]] = release
+
+    @property
+    def released(self) -> bool:
+        return self._release is None
+
+    def release(self) -> None:
+        """Unpin the snapshot; releasing twice is a no-op."""
+        release, self._release = self._release, None
+        if release is not None:
+            release(self)
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return f"Snapshot({self.key!r}, version={self.version})"
+
+
+class GraphWrite:
+    """A write in progress, returned by ``GraphCache.begin_write``.
+
+    ``graph`` is the object to mutate. Without readers it is the cached
+    graph itself. If a reader had the version pinned (``copied``) it is a
+    copy of it, made on first access so that the caller chooses the
+    thread that pays for it. ``GraphCache.commit`` publishes the write.
+    """
+
+    __slots__ = ("key", "version", "base", "copied", "_graph")
+
+    def __init__(self, key: str, version: int, base: nx.Graph, copied: bool) -> None:
+        self.key = key
+        self.version = version
+        self.base = base
+        self.copied = copied
+        self._graph: Optional[nx.Graph] = None if copied else base
+
+    @property
+    def pending_copy(self) -> bool:
+        """True if accessing ``graph`` will copy the base graph first."""
+        return self._graph is None
+
+    @property
+    def graph(self) -> nx.Graph:
+        if self._graph is None:
+            self._graph = self.base.copy()
+        return self._graph
+
+    def __repr__(self) -> str:
+        return f"GraphWrite({self.key!r}, base={self.version}, copied={self.copied})"
+
+
+View = Union[nx.Graph, Snapshot, GraphWrite]
+
+_views: ContextVar[Optional[Dict[str, View]]] = ContextVar(
+    "networkx_mcp_graph_views", default=None
+)
+
+
+def bound_view(key: str) -> Optional[View]:
+    """What is bound to ``key`` in this context, if anything."""
+    views = _views.get()
+    return views.get(key) if views else None
+
+
+def bound_graph(key: str) -> Optional[nx.Graph]:
+    """The graph bound to ``key`` in this context, if any."""
+    view = bound_view(key)
+    return view.graph if isinstance(view, (Snapshot, GraphWrite)) else view
+
+
+def unbind_graph(key: str) -> None:
+    """Drop the binding of ``key``, e.g. after the graph was replaced."""
+    views = _views.get()
+    if views:
+        views.pop(key, None)
+
+
+@contextmanager
+def bind_graph(key: str, graph: View) -> Iterator[None]:
+    """Make lookups of ``key`` in this context return ``graph``.
+
+    A bound ``Snapshot`` also provides the version of the graph; binding a
+    ``GraphWrite`` defers its copy to the first lookup.
+    """
+    views = _views.get()
+    token = _views.set({**views, key: graph} if views else {key: graph})
+    try:
+        yield
+    finally:
+        _views.reset(token)
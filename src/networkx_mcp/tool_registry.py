@@ -0,0 +1,129 @@
+"""Table-driven tool registry.
+
+Each tool is registered once with its handler, input schema, read/write
+class and cost class. The server dispatches through a dict lookup, derives
+auth write checks and graph locking from ``writes``/``graph_arg``, routes
+calls by ``cost``, and answers ``tools/list`` from a listing that is built
+and serialized only once.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from .encoding import PreEncoded
+from .execution import CostClass
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Everything the server needs to know about one tool.
+
+    Attributes:
+        name: Tool name as used in ``tools/call``
+        description: Human-readable description for ``tools/list``
+        input_schema: JSON schema of the tool arguments
+        handler: ``handler(server, args)`` returning the raw result
+        writes: Whether the tool creates or mutates the graph it names
+        cost: Where the tool runs (see ``execution.CostClass``)
+        graph_arg: Argument that names the graph, or None if there is none
+        worker: Module-level ``worker(graph_name, *worker_args(args), graphs=)``
+            run on a graph snapshot for PROCESS tools
+        worker_args: Maps the call arguments to the worker's extra arguments
+        finish: Post-processes the worker result into the tool result
+        progress: Whether the handler reports progress; a PROCESS tool then
+            runs on a thread when the client asked for progress, since
+            worker processes cannot report it
+    """
+
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    handler: Callable[[Any, Dict[str, Any]], Any]
+    writes: bool = False
+    cost: CostClass = CostClass.INLINE
+    graph_arg: Optional[str] = "graph"
+    worker: Optional[Callable[..., Any]] = None
+    worker_args: Callable[[Dict[str, Any]], Tuple[Any, ...]] = field(
+        default=lambda args: ()
+    )
+    finish: Callable[[Any], Any] = field(default=lambda result: result)
+    progress: bool = False
+
+    def schema(self) -> Dict[str, Any]:
+        """The tool's ``tools/list`` entry."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "inputSchema": self.input_schema,
+        }
+
+
+class ToolRegistry:
+    """Tools by name, in registration order."""
+
+    def __init__(self) -> None:
+        self._tools: Dict[str, ToolSpec] = {}
+        self._listings: Dict[FrozenSet[str], PreEncoded] = {}
+
+    def register(self, spec: ToolSpec) -> ToolSpec:
+        """Add a tool; registering a name twice is an error."""
+        if spec.name in self._tools:
+            raise ValueError(f"Tool '{spec.name}' is already registered")
+        if spec.cost is CostClass.PROCESS and spec.worker is None:
+            raise ValueError(f"Process tool '{spec.name}' needs a worker function")
+        self._tools[spec.name] = spec
+        self._listings.clear()
+        return spec
+
+    def tool(
+        self, name: str, description: str, input_schema: Dict[str, Any], **options: Any
+    ) -> Callable[[Callable[[Any, Dict[str, Any]], Any]], Callable]:
+        """Decorator form of ``register`` for a handler function."""
+
+        def decorator(handler: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
+            self.register(
+                ToolSpec(
+                    name=name,
+                    description=description,
+                    input_schema=input_schema,
+                    handler=handler,
+                    **options,
+                )
+            )
+            return handler
+
+        return decorator
+
+    def get(self, name: Any) -> Optional[ToolSpec]:
+        """Look up a tool by name (None if unknown)."""
+        return self._tools.get(name) if isinstance(name, str) else None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tools
+
+    def __iter__(self) -> Iterator[ToolSpec]:
+        return iter(self._tools.values())
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    @property
+    def write_tools(self) -> FrozenSet[str]:
+        """Names of the tools that create or mutate a graph."""
+        return frozenset(spec.name for spec in self._tools.values() if spec.writes)
+
+    def listing(self, exclude: FrozenSet[str] = frozenset()) -> PreEncoded:
+        """The ``tools/list`` result, built and serialized once per ``exclude``."""
+        listing = self._listings.get(exclude)
+        if listing is None:
+            tools: List[Dict[str, Any]] = [
+                spec.schema()
+                for spec in self._tools.values()
+                if spec.name not in exclude
+            ]
+            listing = self._listings[exclude] = PreEncoded({"tools": tools})
+        return listing
+
+
+# Global registry; the built-in tools are registered by server.py
+TOOLS = ToolRegistry()
@@ -0,0 +1,240 @@
+"""Native asyncio stdio transport.
+
+Reads requests with an ``asyncio.StreamReader`` attached to stdin and
+writes responses through an ``asyncio.StreamWriter`` attached to stdout,
+so a message costs neither a hop through the default thread pool nor a
+``print`` + flush syscall of its own:
+
+- Lines are bounded: a request longer than ``max_message_bytes`` is
+  discarded without being buffered whole and answered with an
+  Invalid Request error.
+- Responses written during one event loop iteration are coalesced into a
+  single write.
+- A response larger than ``max_message_bytes`` is replaced by an error,
+  so a runaway result cannot flood the client.
+
+``StdioTransport.open`` returns None when stdin/stdout cannot be attached
+to the event loop (regular files, terminals, in-process test streams) or
+when stderr writes to the same pipe as stdout, which must not be made
+non-blocking under it; the server then keeps using its thread-based loop.
+Closing the transport puts fds 0 and 1 back in blocking mode.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from typing import Any, List, Optional, Sequence, TextIO
+
+from .encoding import dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+# Default bound on a single request or response line (64 MiB)
+DEFAULT_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+def _same_file(fd: int, stream: TextIO) -> bool:
+    """Whether ``stream`` writes to the file (or pipe) open as ``fd``."""
+    try:
+        ours, theirs = os.fstat(fd), os.fstat(stream.fileno())
+    except (AttributeError, OSError, ValueError):
+        return False
+    return (ours.st_dev, ours.st_ino) == (theirs.st_dev, theirs.st_ino)
+
+
+def _error(req_id: Any, code: int, message: str) -> bytes:
+    return dumps_bytes(
+        {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
+    )
+
+
+class _WriteProtocol(asyncio.streams.FlowControlMixin):
+    """Flow control for the stdout pipe, with a waiter for ``wait_closed``."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__(loop=loop)
+        self._closed = loop.create_future()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        super().connection_lost(exc)
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def _get_close_waiter(self, stream: asyncio.StreamWriter) -> asyncio.Future:
+        return self._closed
+
+
+class StdioTransport:
+    """Line-delimited JSON-RPC over stdin/stdout streams."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+        read_transport: Optional[asyncio.BaseTransport] = None,
+        restore_blocking: Sequence[int] = (),
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self._read_transport = read_transport
+        # The event loop sets O_NONBLOCK on the pipes, which the dups share
+        # with these fds (and with whatever else has them open)
+        self._restore_blocking = restore_blocking
+        self.max_message_bytes = max_message_bytes
+        self._pending: List[bytes] = []
+        self._closed = False
+
+        # Stats
+        self.messages_read = 0
+        self.messages_written = 0
+        self.writes = 0
+        self.oversized = 0
+
+    @classmethod
+    async def open(
+        cls,
+        stdin: Optional[TextIO] = None,
+        stdout: Optional[TextIO] = None,
+        max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+        stderr: Optional[TextIO] = None,
+    ) -> Optional["StdioTransport"]:
+        """Attach to stdin/stdout, or return None if they cannot be attached."""
+        stdin = sys.stdin if stdin is None else stdin
+        stdout = sys.stdout if stdout is None else stdout
+        stderr = sys.stderr if stderr is None else stderr
+        try:
+            in_fd, out_fd = stdin.fileno(), stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+        if os.isatty(in_fd) or os.isatty(out_fd):
+            # Non-blocking mode would leak to the terminal shared with stderr
+            return None
+        if _same_file(out_fd, stderr):
+            # Logging to a non-blocking stderr fails with EAGAIN once the
+            # pipe is full (e.g. ``2>&1``)
+            return None
+        blocking = [fd for fd in (in_fd, out_fd) if os.get_blocking(fd)]
+
+        loop = asyncio.get_running_loop()
+        # Work on duplicates so closing the transport leaves fds 0/1 alone
+        in_pipe = os.fdopen(os.dup(in_fd), "rb", buffering=0)
+        out_pipe = os.fdopen(os.dup(out_fd), "wb", buffering=0)
+        reader = asyncio.StreamReader(limit=max_message_bytes, loop=loop)
+        read_transport = None
+        try:
+            read_transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader, loop=loop), in_pipe
+            )
+            write_transport, protocol = await loop.connect_write_pipe(
+                lambda: _WriteProtocol(loop), out_pipe
+            )
+        except (OSError, ValueError) as e:
+            # Regular files cannot be watched by the event loop
+            logger.debug(f"Stream transport unavailable: {e}")
+            if read_transport is not None:
+                read_transport.close()
+            else:
+                in_pipe.close()
+            out_pipe.close()
+            for fd in blocking:
+                os.set_blocking(fd, True)
+            return None
+
+        # Flush anything printed before the transport took over
+        stdout.flush()
+        writer = asyncio.StreamWriter(write_transport, protocol, reader, loop)
+        return cls(reader, writer, max_message_bytes, read_transport, blocking)
+
+    async def read_message(self) -> bytes:
+        """Return the next request line, or b"" at end of input.
+
+        Oversized lines are skipped (and answered with an error) rather
+        than returned.
+        """
+        while True:
+            try:
+                line = await self.reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                # End of input; a final line without newline still counts
+                line = e.partial
+            except asyncio.LimitOverrunError as e:
+                await self._discard_line(e.consumed)
+                self.oversized += 1
+                self.send(
+                    _error(
+                        None,
+                        -32600,
+                        "Invalid Request: message exceeds "
+                        f"{self.max_message_bytes} bytes",
+                    )
+                )
+                continue
+            if line:
+                self.messages_read += 1
+            return line
+
+    async def _discard_line(self, consumed: int) -> None:
+        """Drop the rest of an oversized line, one buffer at a time."""
+        while True:
+            await self.reader.readexactly(consumed)
+            try:
+                await self.reader.readuntil(b"\n")
+                return
+            except asyncio.IncompleteReadError:
+                return
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
+
+    def send(self, data: bytes, req_id: Any = None) -> None:
+        """Queue one message; queued messages go out in a single write."""
+        if self._closed:
+            return
+        if len(data) > self.max_message_bytes:
+            self.oversized += 1
+            data = _error(
+                req_id,
+                -32603,
+                f"Internal error: response exceeds {self.max_message_bytes} bytes",
+            )
+        if not self._pending:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._pending.append(data)
+        self._pending.append(b"\n")
+        self.messages_written += 1
+
+    def _flush(self) -> None:
+        if self._pending and not self.writer.is_closing():
+            self.writer.write(b"".join(self._pending))
+            self.writes += 1
+        self._pending.clear()
+
+    async def drain(self) -> None:
+        """Wait while the client is not keeping up with our output."""
+        if not self.writer.is_closing():
+            await self.writer.drain()
+
+    async def close(self) -> None:
+        """Flush queued messages and detach from stdin/stdout."""
+        if self._closed:
+            return
+        self._flush()
+        self._closed = True
+        try:
+            await self.drain()
+        except (ConnectionError, OSError):
+            pass
+        self.writer.close()
+        if self._read_transport is not None:
+            self._read_transport.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+        for fd in self._restore_blocking:
+            try:
+                os.set_blocking(fd, True)
+            except OSError:
+                # Closed already
+                pass
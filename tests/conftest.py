@@ -6,6 +6,28 @@ import networkx as nx
 import pytest
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: spawns worker processes or waits on them (--runslow)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the slow tests unless ``--runslow`` is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -23,6 +45,32 @@ def sample_graph() -> nx.Graph:
     return G
 
 
+@pytest.fixture
+def assert_valid_path():
+    """Check that a path runs from ``source`` to ``target`` along edges."""
+
+    def check(graph, path, source, target):
+        assert path[0] == source and path[-1] == target
+        assert all(graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+    return check
+
+
+@pytest.fixture(scope="module")
+def process_engine():
+    """One single-worker process pool shared by the tests of a module.
+
+    Spawning a pool starts fresh interpreters, so tests that only need a
+    tool to run in a worker process reuse this one; compare its stats
+    before and after rather than against absolute counts.
+    """
+    from networkx_mcp.execution import ExecutionEngine
+
+    engine = ExecutionEngine(process_workers=1, process_min_size=0)
+    yield engine
+    engine.shutdown()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def cleanup_background_threads():
     """Cleanup background threads after test session."""
@@ -214,6 +214,16 @@ class MCPFactory:
             "params": {"name": tool_name, "arguments": arguments},
         }
 
+    @staticmethod
+    def tool_call(request_id: Any, tool_name: str, **arguments: Any) -> dict[str, Any]:
+        """Create a tool request message with a given id."""
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": tool_name, "arguments": arguments},
+        }
+
     @staticmethod
     def resource_request(uri: str) -> dict[str, Any]:
         """Create a resource request message."""
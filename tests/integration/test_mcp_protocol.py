@@ -103,7 +103,7 @@ class MCPProtocolTester:
 
         tools = response["result"]["tools"]
         assert isinstance(tools, list)
-        assert len(tools) == 20  # Expected number of tools
+        assert len(tools) == 25  # Expected number of tools
 
         # Verify tool structure
         for tool in tools:
@@ -258,7 +258,7 @@ class TestMCPProtocol:
         mcp_tester.test_initialize_handshake()
 
         tools = mcp_tester.test_tools_list()
-        assert len(tools) == 20
+        assert len(tools) == 25
 
         # Verify specific tools exist
         tool_names = [tool["name"] for tool in tools]
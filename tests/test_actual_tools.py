@@ -110,8 +110,8 @@ class TestActualTools:
         add_nodes("info_test", ["X", "Y", "Z"])
         add_edges("info_test", [["X", "Y"], ["Y", "Z"]])
 
-        # Get info
-        result = get_graph_info("info_test")
+        # Get info, with the full node and edge lists
+        result = get_graph_info("info_test", include_elements=True)
 
         # Verify result
         assert result is not None
@@ -0,0 +1,257 @@
+"""Tests for approximate and parallel betweenness centrality."""
+
+import json
+import math
+import multiprocessing
+import signal
+import time
+
+import networkx as nx
+import pytest
+
+from networkx_mcp.core import betweenness
+from networkx_mcp.core.algorithms import GraphAlgorithms
+from networkx_mcp.core.basic_operations import betweenness_centrality
+from networkx_mcp.core.betweenness import (
+    CHUNKS_PER_WORKER,
+    approximate_betweenness,
+    normalization,
+    parallel_betweenness,
+    source_dependencies,
+)
+from networkx_mcp.server import NetworkXMCPServer, graphs
+
+
+def _max_error(estimate, graph):
+    exact = nx.betweenness_centrality(graph)
+    return max(abs(estimate.centrality[v] - exact[v]) for v in graph)
+
+
+class TestSourceDependencies:
+    """Summed over all sources, dependencies give Brandes' betweenness."""
+
+    @pytest.mark.parametrize(
+        "graph",
+        [
+            nx.karate_club_graph(),
+            nx.gnp_random_graph(60, 0.08, seed=1, directed=True),
+            nx.MultiGraph([(0, 1), (0, 1), (1, 2), (2, 3), (3, 3)]),
+        ],
+    )
+    def test_sum_matches_networkx(self, graph):
+        total = dict.fromkeys(graph, 0.0)
+        for source in graph:
+            for v, value in source_dependencies(graph, source).items():
+                total[v] += value
+        expected = nx.betweenness_centrality(graph)
+        for v in graph:
+            assert total[v] * normalization(graph) == pytest.approx(expected[v])
+
+
+class TestApproximateBetweenness:
+    """Adaptive pivot sampling with an error bound."""
+
+    def test_all_pivots_is_exact(self):
+        graph = nx.karate_club_graph()
+        estimate = approximate_betweenness(graph, epsilon=None)
+        assert estimate.exact
+        assert estimate.samples == graph.number_of_nodes()
+        assert _max_error(estimate, graph) < 1e-12
+
+    def test_accuracy_target(self):
+        graph = nx.barabasi_albert_graph(800, 2, seed=3)
+        estimate = approximate_betweenness(graph, epsilon=0.1)
+        assert 0 < estimate.error_bound <= 0.1
+        assert estimate.samples < graph.number_of_nodes()
+        assert _max_error(estimate, graph) <= estimate.error_bound
+
+    def test_time_target(self):
+        graph = nx.barabasi_albert_graph(3000, 2, seed=4)
+        estimate = approximate_betweenness(graph, epsilon=None, max_seconds=0.2)
+        assert estimate.samples < graph.number_of_nodes()
+        assert estimate.seconds < 2
+        assert 0 < estimate.error_bound < 1.5
+
+    def test_seeded(self):
+        graph = nx.barabasi_albert_graph(300, 2, seed=5)
+        first = approximate_betweenness(graph, epsilon=0.2, seed=1)
+        second = approximate_betweenness(graph, epsilon=0.2, seed=1)
+        assert second.centrality == first.centrality
+        assert second.error_bound == first.error_bound
+
+    def test_checks_split_delta(self):
+        graph = nx.barabasi_albert_graph(200, 2, seed=7)
+        sample = betweenness._Sample(graph, 0.1)
+        for source in list(graph)[:20]:
+            sample.add(source_dependencies(graph, source))
+        # The same sample is bounded at a higher confidence the second time
+        assert sample.error_bound() < sample.error_bound()
+        assert sum(math.exp(-sample._split(i)) for i in range(1, 10**5)) < 1
+
+    def test_stops_at_planned_within_epsilon(self):
+        graph = nx.barabasi_albert_graph(800, 2, seed=3)
+        calls = []
+        estimate = approximate_betweenness(
+            graph,
+            epsilon=0.3,
+            on_batch=lambda done, planned, _: calls.append((done, planned)),
+        )
+        # Later checks need a few more pivots than earlier ones
+        assert calls[-1][1] >= calls[0][1]
+        assert estimate.error_bound <= 0.3
+
+    def test_tiny_graph(self):
+        estimate = approximate_betweenness(nx.path_graph(2))
+        assert estimate.exact and estimate.centrality == {0: 0.0, 1: 0.0}
+
+
+class TestApproximateMode:
+    """betweenness_centrality(approximate=True) and the tool."""
+
+    def test_reports_approximation(self):
+        store = {"g": nx.barabasi_albert_graph(500, 2, seed=6)}
+        result = betweenness_centrality("g", store, approximate=True, epsilon=0.15)
+        report = result["approximation"]
+        assert report["error_bound"] <= 0.15
+        assert report["confidence"] == pytest.approx(0.9)
+        assert report["nodes"] == 500
+        assert len(result["centrality"]) == 10
+        assert "approximation" not in betweenness_centrality("g", store)
+
+    @pytest.mark.asyncio
+    async def test_tool_in_worker_process(self, monkeypatch, process_engine):
+        graphs.clear()
+        graphs["g"] = nx.barabasi_albert_graph(400, 2, seed=7)
+        server = NetworkXMCPServer()
+        monkeypatch.setattr(server, "engine", process_engine)
+        before = process_engine.get_stats()["process"]["completed"]
+        try:
+            response = await server._call_tool(
+                {
+                    "name": "betweenness_centrality",
+                    "arguments": {"graph": "g", "approximate": True, "epsilon": 0.2},
+                }
+            )
+        finally:
+            graphs.clear()
+
+        result = json.loads(response["content"][0]["text"])
+        assert result["approximation"]["error_bound"] <= 0.2
+        assert process_engine.get_stats()["process"]["completed"] == before + 1
+
+
+def _betweenness_in_child(workers):
+    """Target of a forked process that starts chunk workers of its own."""
+    betweenness.MAX_WORKERS = workers
+    parallel_betweenness(nx.barabasi_albert_graph(20_000, 3, seed=1), workers)
+
+
+class TestParallelBetweenness:
+    """Exact betweenness with sources split across processes."""
+
+    @pytest.fixture(autouse=True)
+    def _two_workers(self, monkeypatch):
+        # Process workers are capped at the CPU count, which may be 1 here
+        monkeypatch.setattr(betweenness, "MAX_WORKERS", 2)
+
+    @pytest.fixture
+    def pool_sizes(self, monkeypatch):
+        """Run the chunks in this process, recording the pool size asked for."""
+        sizes = []
+
+        def run_here(graph, chunks, workers, on_chunk):
+            sizes.append(workers)
+            betweenness._set_worker_graph(graph)
+            try:
+                return [betweenness._chunk_dependencies(chunk) for chunk in chunks]
+            finally:
+                betweenness._set_worker_graph(None)
+
+        monkeypatch.setattr(betweenness, "_run_chunks", run_here)
+        return sizes
+
+    def test_workers_are_capped(self, monkeypatch):
+        started = []
+        monkeypatch.setattr(
+            betweenness,
+            "_run_chunks",
+            lambda graph, chunks, workers, on_chunk: (
+                started.append(workers) or [[0.0] * len(graph)]
+            ),
+        )
+        parallel_betweenness(nx.path_graph(5), workers=1000)
+        assert started == [2]
+
+    @pytest.mark.slow
+    def test_sigterm_stops_chunk_workers(self):
+        psutil = pytest.importorskip("psutil")
+        context = multiprocessing.get_context("fork")
+        child = context.Process(target=_betweenness_in_child, args=(2,))
+        child.start()
+        try:
+            # Wait for two chunk workers to be busy with their chunks
+            deadline = time.monotonic() + 60
+            workers = []
+            while len(workers) < 2 and time.monotonic() < deadline:
+                time.sleep(0.2)
+                workers = [
+                    process
+                    for process in psutil.Process(child.pid).children(recursive=True)
+                    if process.cpu_times().user > 1
+                ]
+            assert len(workers) >= 2
+            # What the execution engine does to cancel a running job
+            child.terminate()
+            child.join(5)
+            assert child.exitcode == -signal.SIGTERM
+            _, alive = psutil.wait_procs(workers, timeout=5)
+            assert alive == []
+        finally:
+            if child.is_alive():
+                child.kill()
+
+    @pytest.mark.parametrize(
+        "graph",
+        [
+            nx.karate_club_graph(),
+            nx.gnp_random_graph(80, 0.06, seed=2, directed=True),
+        ],
+    )
+    def test_matches_networkx(self, graph, pool_sizes):
+        centrality = parallel_betweenness(graph, workers=2)
+        expected = nx.betweenness_centrality(graph)
+        assert centrality == pytest.approx(expected)
+        assert pool_sizes == [2]
+
+    def test_worker_pool_matches_networkx(self):
+        graph = nx.gnp_random_graph(60, 0.08, seed=2, directed=True)
+        centrality = parallel_betweenness(graph, workers=2)
+        assert centrality == pytest.approx(nx.betweenness_centrality(graph))
+
+    def test_in_process_is_deterministic(self):
+        graph = nx.barabasi_albert_graph(200, 2, seed=8)
+        chunks = []
+        first = parallel_betweenness(
+            graph, 1, on_chunk=lambda done, total: chunks.append((done, total))
+        )
+        assert parallel_betweenness(graph, 1) == first
+        assert first == pytest.approx(nx.betweenness_centrality(graph))
+        assert chunks[-1] == (CHUNKS_PER_WORKER, CHUNKS_PER_WORKER)
+
+    def test_callback_error_stops_workers(self):
+        def cancel(done, total):
+            raise RuntimeError("cancelled")
+
+        with pytest.raises(RuntimeError):
+            parallel_betweenness(nx.karate_club_graph(), 2, on_chunk=cancel)
+
+    def test_operations_and_centrality_measures(self, pool_sizes):
+        graph = nx.barabasi_albert_graph(120, 2, seed=9)
+        expected = nx.betweenness_centrality(graph)
+
+        result = betweenness_centrality("g", {"g": graph}, workers=2)
+        assert result["most_central"][1] == pytest.approx(max(expected.values()))
+
+        measures = GraphAlgorithms.centrality_measures(graph, ["betweenness"], 2)
+        assert measures["betweenness_centrality"] == pytest.approx(expected)
+        assert pool_sizes == [2, 2]
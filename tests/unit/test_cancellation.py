@@ -0,0 +1,213 @@
+"""Tests for cooperative cancellation of tool calls."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from dataclasses import replace
+
+import networkx as nx
+import pytest
+
+from networkx_mcp import server as server_module
+from networkx_mcp.cancellation import (
+    CancelToken,
+    RequestCancelled,
+    checkpoint,
+    set_current_token,
+)
+from networkx_mcp.core.basic_operations import betweenness_centrality
+from networkx_mcp.execution import CostClass, ExecutionEngine
+from networkx_mcp.server import NetworkXMCPServer, graphs
+from networkx_mcp.tool_registry import TOOLS
+from tests.factories import MCPFactory
+
+
+def _cancel(req_id):
+    return {
+        "jsonrpc": "2.0",
+        "method": "notifications/cancelled",
+        "params": {"requestId": req_id, "reason": "client gave up"},
+    }
+
+
+class TestCheckpoint:
+    """Tokens, checkpoints and their propagation onto worker threads."""
+
+    def test_checkpoint_without_token_is_noop(self):
+        checkpoint()
+
+    @pytest.mark.asyncio
+    async def test_token_reaches_worker_thread(self):
+        engine = ExecutionEngine(process_workers=0)
+        token = CancelToken()
+
+        async def serve():
+            set_current_token(token)
+            token.cancel("stop")
+            return await engine.run(CostClass.THREAD, checkpoint)
+
+        try:
+            with pytest.raises(RequestCancelled, match="stop"):
+                await asyncio.create_task(serve())
+        finally:
+            engine.shutdown()
+
+
+class TestServerCancellation:
+    """notifications/cancelled stops the call and frees its slot."""
+
+    def setup_method(self):
+        graphs.clear()
+
+    def test_cancelled_call_gets_no_response(self, monkeypatch, capsys):
+        graphs["g"] = nx.path_graph(3)
+        stopped = threading.Event()
+
+        def cancellable(graph_name, *options):
+            deadline = time.monotonic() + 2
+            try:
+                while time.monotonic() < deadline:
+                    checkpoint()
+                    time.sleep(0.01)
+            except RequestCancelled:
+                stopped.set()
+                raise
+            return {"centrality": {}, "most_central": None}
+
+        monkeypatch.setattr(server_module, "betweenness_centrality", cancellable)
+        # Two slots, both taken by slow calls until one is cancelled
+        server = NetworkXMCPServer(max_concurrency=2)
+        server.initialized = True
+        requests = [
+            MCPFactory.tool_call(1, "betweenness_centrality", graph="g"),
+            MCPFactory.tool_call(2, "betweenness_centrality", graph="g"),
+            _cancel(1),
+            MCPFactory.tool_call(3, "get_info", graph="g"),
+        ]
+        lines = "".join(json.dumps(r) + "\n" for r in requests)
+        monkeypatch.setattr("sys.stdin", io.StringIO(lines))
+
+        asyncio.run(server.run())
+
+        out = capsys.readouterr().out
+        responses = [json.loads(line) for line in out.splitlines() if line.strip()]
+        assert [r["id"] for r in responses] == [3, 2]
+        assert stopped.wait(timeout=1)
+        assert server._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_request_id_is_ignored(self):
+        server = NetworkXMCPServer()
+        assert await server.handle_request(_cancel("nope")) is None
+        assert server._cancel_request("nope") is False
+
+
+class TestWriteCancellation:
+    """A cancelled write is over before its graph is published."""
+
+    def setup_method(self):
+        graphs.clear()
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+
+    def _slow_add_nodes(self, monkeypatch):
+        def slow(server, args):
+            graph = server_module._require_graph(args["graph"])
+            self.started.set()
+            try:
+                for i in range(500):
+                    checkpoint()
+                    graph.add_node(("new", i))
+                    time.sleep(0.005)
+            finally:
+                self.stopped.set()
+            return {}
+
+        spec = TOOLS.get("add_nodes")
+        monkeypatch.setitem(
+            TOOLS._tools,
+            "add_nodes",
+            replace(spec, handler=slow, cost=CostClass.THREAD),
+        )
+
+    async def _cancel_write(self, server):
+        server.initialized = True
+        task = asyncio.ensure_future(
+            server._execute(MCPFactory.tool_call(1, "add_nodes", graph="g", nodes=[]))
+        )
+        assert await asyncio.to_thread(self.started.wait, 5)
+        await asyncio.sleep(0.05)
+        assert server._cancel_request(1)
+        assert await task is None
+        # The handler stopped before the call returned
+        assert self.stopped.is_set()
+
+    @pytest.mark.asyncio
+    async def test_in_place_write_is_stable_once_published(self, monkeypatch):
+        self._slow_add_nodes(monkeypatch)
+        graphs["g"] = nx.path_graph(3)
+        version = graphs.version("g")
+        server = NetworkXMCPServer()
+
+        await self._cancel_write(server)
+
+        nodes = graphs["g"].number_of_nodes()
+        assert nodes > 3 and graphs.version("g") != version
+        reader = graphs.snapshot("g")
+        try:
+            await asyncio.sleep(0.05)
+            assert reader.graph.number_of_nodes() == nodes
+        finally:
+            reader.release()
+
+    @pytest.mark.asyncio
+    async def test_write_on_a_copy_is_dropped(self, monkeypatch):
+        self._slow_add_nodes(monkeypatch)
+        graphs["g"] = nx.path_graph(3)
+        version = graphs.version("g")
+        # A reader pins the version, so the write works on a copy
+        reader = graphs.snapshot("g")
+        server = NetworkXMCPServer()
+        try:
+            await self._cancel_write(server)
+            assert reader.graph.number_of_nodes() == 3
+        finally:
+            reader.release()
+
+        assert graphs.version("g") == version
+        assert graphs["g"].number_of_nodes() == 3
+        # The write lock was released: the next write goes through
+        write = graphs.begin_write("g")
+        graphs.commit(write)
+
+
+class TestProcessCancellation:
+    """A running process job is stopped by restarting the pool."""
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_running_process_job_is_killed(self):
+        engine = ExecutionEngine(process_workers=1, process_min_size=0)
+        big = nx.gnm_random_graph(3000, 15000, seed=1)
+        try:
+            job = asyncio.create_task(
+                engine.run_on_graph(betweenness_centrality, "big", big)
+            )
+            # Long enough for the worker to start and pick the job up
+            await asyncio.sleep(3)
+            job.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await job
+            assert engine.process_restarts == 1
+
+            small = nx.path_graph(4)
+            result = await engine.run_on_graph(betweenness_centrality, "s", small)
+            assert result["most_central"][0] in (1, 2)
+        finally:
+            engine.shutdown()
+
+        stats = engine.get_stats()["process"]
+        assert stats["cancelled"] == 1
+        assert stats["completed"] == 1
@@ -0,0 +1,159 @@
+"""Tests for incrementally maintained connected components."""
+
+import json
+import random
+
+import networkx as nx
+import pytest
+
+from networkx_mcp.core import components
+from networkx_mcp.core.basic_operations import (
+    add_edges,
+    add_nodes,
+    connected_components,
+)
+from networkx_mcp.core.components import UnionFind, component_index
+from networkx_mcp.core.graph_operations import GraphManager
+from networkx_mcp.server import NetworkXMCPServer, graphs
+
+
+def _traversal(graph):
+    """connected_components as computed by a full traversal."""
+    if graph.is_directed():
+        found = [list(c) for c in nx.weakly_connected_components(graph)]
+    else:
+        found = [list(c) for c in nx.connected_components(graph)]
+    found.sort(key=len, reverse=True)
+    return {
+        "num_components": len(found),
+        "component_sizes": [len(c) for c in found],
+        "largest_component": found[0] if found else [],
+    }
+
+
+def _assert_consistent(result, graph):
+    expected = _traversal(graph)
+    assert result["num_components"] == expected["num_components"]
+    assert result["component_sizes"] == expected["component_sizes"]
+    assert set(result["largest_component"]) == set(expected["largest_component"])
+
+
+class TestUnionFind:
+    """Disjoint sets and the largest set."""
+
+    def test_union_and_find(self):
+        sets = UnionFind()
+        for item in "abcde":
+            sets.add(item)
+        assert sets.union("a", "b")
+        assert sets.union("c", "b")
+        assert not sets.union("a", "c")
+
+        assert sets.count == 3
+        assert sets.find("a") == sets.find("c")
+        assert sets.sizes() == [3, 1, 1]
+        assert sorted(sets.largest()) == ["a", "b", "c"]
+
+    def test_ties_go_to_earliest_set(self):
+        sets = UnionFind()
+        assert sets.largest() == []
+        for item in range(6):
+            sets.add(item)
+        sets.union(4, 5)
+        sets.union(0, 1)
+        assert sorted(sets.largest()) == [0, 1]
+
+
+class TestIncrementalComponents:
+    """Batches of additions keep the index in step with the graph."""
+
+    @pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph])
+    def test_matches_traversal_after_each_batch(self, graph_class):
+        rng = random.Random(7)
+        graphs = {"g": graph_class()}
+        for batch in range(30):
+            if batch % 5 == 0:
+                add_nodes("g", [rng.randrange(400) for _ in range(5)], graphs)
+            edges = [[rng.randrange(400), rng.randrange(400)] for _ in range(20)]
+            add_edges("g", edges, graphs)
+            _assert_consistent(connected_components("g", graphs), graphs["g"])
+
+    def test_batches_do_not_rebuild(self, monkeypatch):
+        graphs = {"g": nx.path_graph(10)}
+        connected_components("g", graphs)
+        builds = []
+        build = components.ComponentIndex.build
+        monkeypatch.setattr(
+            components.ComponentIndex,
+            "build",
+            classmethod(lambda cls, graph: builds.append(graph) or build(graph)),
+        )
+
+        add_edges("g", [[20, 21], [9, 10]], graphs)
+        add_nodes("g", [30], graphs)
+        result = connected_components("g", graphs)
+
+        assert builds == []
+        assert result["num_components"] == 3
+        assert result["component_sizes"] == [11, 2, 1]
+
+    def test_rebuilt_after_removal(self):
+        graphs = {"g": nx.path_graph(6)}
+        assert connected_components("g", graphs)["num_components"] == 1
+
+        graphs["g"].remove_edge(2, 3)
+        _assert_consistent(connected_components("g", graphs), graphs["g"])
+        assert connected_components("g", graphs)["num_components"] == 2
+
+    def test_unchanged_counts_need_drop(self):
+        manager = GraphManager()
+        manager.create_graph("g")
+        graph = manager.get_graph("g")
+        graph.add_edges_from([(0, 1), (2, 3)])
+        assert component_index(graph).sets.count == 2
+
+        manager.remove_edge("g", 0, 1)
+        graph.add_edge(1, 2)
+        assert component_index(graph).sets.count == 2
+        assert component_index(graph).summary()["component_sizes"] == [3, 1]
+
+    def test_empty_graph(self):
+        assert connected_components("g", {"g": nx.Graph()}) == {
+            "num_components": 0,
+            "component_sizes": [],
+            "largest_component": [],
+        }
+
+
+class TestServerTools:
+    """The add_nodes/add_edges tools keep the index up to date too."""
+
+    async def _call(self, server, name, **arguments):
+        response = await server._call_tool({"name": name, "arguments": arguments})
+        return json.loads(response["content"][0]["text"])
+
+    @pytest.mark.asyncio
+    async def test_batches_do_not_rebuild(self, monkeypatch):
+        builds = []
+        build = components.ComponentIndex.build
+        monkeypatch.setattr(
+            components.ComponentIndex,
+            "build",
+            classmethod(lambda cls, *args: builds.append(args) or build(*args)),
+        )
+        graphs.clear()
+        graphs["g"] = nx.Graph()
+        server = NetworkXMCPServer()
+        try:
+            await self._call(server, "add_edges", graph="g", edges=[[0, 1], [2, 3]])
+            first = await self._call(server, "connected_components", graph="g")
+            await self._call(server, "add_edges", graph="g", edges=[[1, 2], [4, 5]])
+            await self._call(server, "add_nodes", graph="g", nodes=[6])
+            second = await self._call(server, "connected_components", graph="g")
+        finally:
+            graphs.clear()
+
+        assert len(builds) == 1
+        assert first["num_components"] == 2
+        assert second["num_components"] == 3
+        assert second["component_sizes"] == [4, 2, 1]
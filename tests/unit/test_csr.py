@@ -0,0 +1,393 @@
+"""Tests for CSR snapshots and their vectorized kernels."""
+
+from typing import get_args
+
+import networkx as nx
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from networkx_mcp.core import csr
+from networkx_mcp.core.algorithms import GraphAlgorithms
+from networkx_mcp.core.basic_operations import (
+    SPECTRAL_MEASURES,
+    degree_centrality,
+    pagerank,
+    spectral_centrality,
+)
+from networkx_mcp.core.components import ComponentIndex, UnionFind
+from networkx_mcp.core.csr import (
+    CSRGraph,
+    bfs_distances,
+    cached_snapshot,
+    clustering,
+    component_labels,
+    degrees,
+    eigenvector,
+    in_adjacency,
+    katz,
+    pagerank_step,
+    snapshot_of,
+    transition_matrix,
+    use_sparse,
+)
+from networkx_mcp.core.pagerank import ENGINES, power_iteration
+from networkx_mcp.graph_cache import (
+    GraphCache,
+    GraphDict,
+    estimate_graph_bytes,
+    get_graph_cache,
+)
+from networkx_mcp.schemas import CentralityRequest
+from networkx_mcp.server import NetworkXMCPServer
+from networkx_mcp.server import graphs as server_graphs
+
+
+def _graphs():
+    directed = nx.gnp_random_graph(80, 0.04, seed=1, directed=True)
+    undirected = nx.gnp_random_graph(80, 0.05, seed=2)
+    undirected.add_edge(3, 3)
+    return [directed, undirected, nx.Graph([("a", "b"), ("c", "d")])]
+
+
+class TestCSRGraph:
+    """Relabeled compressed sparse rows."""
+
+    def test_arrays(self):
+        graph = nx.DiGraph([("a", "b"), ("a", "c"), ("c", "a")])
+        graph.add_node("d")
+        snapshot = CSRGraph.from_graph(graph)
+
+        assert snapshot.nodes == ["a", "b", "c", "d"]
+        assert snapshot.indptr.tolist() == [0, 2, 2, 3, 3]
+        assert snapshot.indices.tolist() == [1, 2, 0]
+        assert snapshot.weights is None
+        assert snapshot.rows.tolist() == [0, 0, 2]
+        transpose = snapshot.transpose()
+        assert transpose.indptr.tolist() == [0, 1, 2, 3, 3]
+        assert transpose.indices.tolist() == [2, 0, 0]
+
+    def test_weights_and_parallel_edges(self):
+        graph = nx.MultiDiGraph()
+        graph.add_edge(0, 1, weight=2.0)
+        graph.add_edge(0, 1)
+        graph.add_edge(1, 0, weight=0.5)
+        snapshot = CSRGraph.from_graph(graph)
+        assert snapshot.indices.tolist() == [1, 0]
+        assert snapshot.weights.tolist() == [3.0, 0.5]
+
+    def test_stats(self):
+        snapshot = CSRGraph.from_graph(nx.path_graph(100))
+        stats = snapshot.stats()
+        assert stats["nodes"] == 100 and stats["entries"] == 198
+        assert stats["memory_mb"] > 0
+        assert stats["build_seconds"] >= 0
+
+
+class TestKernels:
+    """Kernels agree with NetworkX."""
+
+    @pytest.mark.parametrize("graph", _graphs())
+    def test_bfs(self, graph):
+        snapshot = CSRGraph.from_graph(graph)
+        dist = bfs_distances(snapshot, 0)
+        expected = nx.single_source_shortest_path_length(graph, snapshot.nodes[0])
+        assert {
+            v: d for v, d in zip(snapshot.nodes, dist.tolist()) if d >= 0
+        } == expected
+
+    def test_bfs_both_ways(self):
+        graph = nx.DiGraph()
+        graph.add_nodes_from([0, 1, 2])
+        graph.add_edges_from([(1, 0), (1, 2)])
+        snapshot = CSRGraph.from_graph(graph)
+        assert bfs_distances(snapshot, 0).tolist() == [0, -1, -1]
+        assert bfs_distances(snapshot, 0, undirected=True).tolist() == [0, 1, 2]
+
+    @pytest.mark.parametrize("graph", _graphs())
+    def test_degrees(self, graph):
+        snapshot = CSRGraph.from_graph(graph)
+        assert degrees(snapshot).tolist() == [graph.degree(v) for v in snapshot.nodes]
+
+    @pytest.mark.parametrize("graph", _graphs())
+    @pytest.mark.parametrize("scipy", [True, False])
+    def test_components(self, graph, scipy, monkeypatch):
+        monkeypatch.setattr(csr, "HAS_SCIPY", scipy)
+        snapshot = CSRGraph.from_graph(graph)
+        count, labels = component_labels(snapshot)
+
+        expected = list(nx.connected_components(graph.to_undirected()))
+        assert count == len(expected)
+        found = {}
+        for node, label in zip(snapshot.nodes, labels.tolist()):
+            found.setdefault(label, set()).add(node)
+        assert list(found) == list(range(count))
+        assert sorted(map(sorted, found.values())) == sorted(map(sorted, expected))
+
+    @pytest.mark.parametrize("graph", _graphs())
+    def test_clustering(self, graph):
+        snapshot = CSRGraph.from_graph(graph)
+        expected = nx.clustering(graph.to_undirected())
+        assert clustering(snapshot).tolist() == pytest.approx(
+            [expected[v] for v in snapshot.nodes]
+        )
+
+    def test_weighted_pagerank(self):
+        graph = nx.MultiDiGraph()
+        graph.add_weighted_edges_from(
+            [(0, 1, 2.0), (0, 1, 1.0), (1, 2, 1.0), (2, 0, 4.0)]
+        )
+        graph.add_edge(2, 3)
+        (nodes, x), _, _ = power_iteration(CSRGraph.from_graph(graph), tol=1e-10)
+        expected = nx.pagerank(graph, tol=1e-10)
+        assert x.tolist() == pytest.approx([expected[v] for v in nodes])
+
+
+class TestSparseKernels:
+    """SciPy sparse PageRank, eigenvector and Katz centrality."""
+
+    def test_pagerank_steps_agree(self):
+        snapshot = CSRGraph.from_graph(_graphs()[0])
+        x = np.linspace(1, 2, snapshot.n)
+        x /= x.sum()
+        assert pagerank_step(snapshot, x, 0.85, sparse=True) == pytest.approx(
+            pagerank_step(snapshot, x, 0.85)
+        )
+        (nodes, values), _, _ = power_iteration(snapshot, tol=1e-10, engine="sparse")
+        expected = nx.pagerank(_graphs()[0], tol=1e-10)
+        assert values.tolist() == pytest.approx([expected[v] for v in nodes])
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            power_iteration(nx.path_graph(3), engine="gpu")
+        with pytest.raises(ValueError):
+            GraphAlgorithms.centrality_measures(nx.path_graph(3), engine="gpu")
+
+    def test_request_schema_engines(self):
+        field = CentralityRequest.model_fields["engine"]
+        assert get_args(field.annotation) == ENGINES
+        assert CentralityRequest(graph_id="g", engine="numpy").engine == "numpy"
+        with pytest.raises(ValidationError):
+            CentralityRequest(graph_id="g", engine="networkx")
+
+    @pytest.mark.parametrize(
+        "graph",
+        [
+            nx.karate_club_graph(),
+            nx.DiGraph(nx.cycle_graph(12)).reverse().copy(),
+            nx.gnp_random_graph(60, 0.15, seed=5, directed=True),
+        ],
+    )
+    def test_eigenvector(self, graph):
+        snapshot = CSRGraph.from_graph(graph)
+        expected = nx.eigenvector_centrality_numpy(graph)
+        assert eigenvector(snapshot).tolist() == pytest.approx(
+            [expected[v] for v in snapshot.nodes], abs=1e-8
+        )
+
+    def test_eigenvector_too_small_for_arpack(self):
+        values = eigenvector(CSRGraph.from_graph(nx.path_graph(2)))
+        assert values.tolist() == pytest.approx([0.5**0.5, 0.5**0.5])
+
+    @pytest.mark.parametrize("graph", _graphs())
+    def test_katz(self, graph):
+        snapshot = CSRGraph.from_graph(graph)
+        expected = nx.katz_centrality_numpy(graph, alpha=0.05)
+        assert katz(snapshot, alpha=0.05).tolist() == pytest.approx(
+            [expected[v] for v in snapshot.nodes]
+        )
+        raw = nx.katz_centrality_numpy(graph, alpha=0.05, beta=2.0, normalized=False)
+        assert katz(snapshot, 0.05, 2.0, normalized=False).tolist() == pytest.approx(
+            [raw[v] for v in snapshot.nodes]
+        )
+
+    @pytest.mark.parametrize("engine", ["auto", "numpy"])
+    def test_small_graphs_stay_on_networkx(self, engine):
+        graph = nx.karate_club_graph()
+        builds = csr.get_csr_stats()["builds"]
+        result = GraphAlgorithms.centrality_measures(
+            graph, ["eigenvector", "katz"], engine=engine
+        )
+        assert result["eigenvector_centrality"] == nx.eigenvector_centrality(
+            graph, max_iter=1000
+        )
+        assert result["katz_centrality"] == nx.katz_centrality(graph, max_iter=1000)
+        assert csr.get_csr_stats()["builds"] == builds
+
+    def test_no_snapshot_for_skipped_measures(self):
+        builds = csr.get_csr_stats()["builds"]
+        graph = nx.path_graph(5)
+        # PageRank is only computed for directed graphs, eigenvector
+        # centrality only with edges
+        result = GraphAlgorithms.centrality_measures(
+            graph, ["pagerank"], engine="sparse"
+        )
+        assert result == {}
+        GraphAlgorithms.centrality_measures(
+            nx.empty_graph(5), ["eigenvector"], engine="sparse"
+        )
+        assert csr.get_csr_stats()["builds"] == builds
+
+    def test_matrices_are_kept_on_the_snapshot(self):
+        snapshot = CSRGraph.from_graph(_graphs()[0])
+        before = snapshot.nbytes
+        assert in_adjacency(snapshot) is in_adjacency(snapshot)
+        assert transition_matrix(snapshot) is transition_matrix(snapshot)
+        assert snapshot.nbytes > before
+
+    def test_use_sparse(self, monkeypatch):
+        assert not use_sparse("auto", csr.SPARSE_MIN_NODES - 1)
+        assert use_sparse("auto", csr.SPARSE_MIN_NODES)
+        assert use_sparse("sparse", 1)
+        assert not use_sparse("numpy", 10**6)
+        monkeypatch.setattr(csr, "HAS_SCIPY", False)
+        assert not use_sparse("auto", 10**6)
+        with pytest.raises(ImportError):
+            use_sparse("sparse", 1)
+
+    @pytest.mark.parametrize("measure", ["eigenvector", "katz", "pagerank"])
+    def test_centrality_measures_engines_agree(self, measure):
+        graph = nx.gnp_random_graph(80, 0.1, seed=6, directed=True)
+        key = measure if measure == "pagerank" else f"{measure}_centrality"
+        sparse = GraphAlgorithms.centrality_measures(graph, [measure], engine="sparse")
+        expected = GraphAlgorithms.centrality_measures(graph, [measure], engine="numpy")
+        assert sparse[key] == pytest.approx(expected[key], abs=1e-5)
+
+    def test_pagerank_tool_engine(self):
+        graph = nx.gnp_random_graph(100, 0.05, seed=7, directed=True)
+        numpy_result = pagerank("g", {"g": graph}, tol=1e-10, engine="numpy")
+        sparse_result = pagerank("g", {"g": graph}, tol=1e-10, engine="sparse")
+        assert sparse_result["pagerank"] == pytest.approx(numpy_result["pagerank"])
+
+    @pytest.mark.parametrize("measure", SPECTRAL_MEASURES)
+    def test_spectral_centrality_tool(self, measure):
+        graph = nx.karate_club_graph()
+        graphs = {"g": graph}
+        numpy_result = spectral_centrality("g", measure, "numpy", graphs=graphs)
+        sparse_result = spectral_centrality("g", measure, "sparse", graphs=graphs)
+        assert numpy_result["measure"] == measure
+        assert len(numpy_result["centrality"]) == 10
+        assert numpy_result["most_central"][0] == sparse_result["most_central"][0]
+        assert sparse_result["centrality"] == pytest.approx(
+            numpy_result["centrality"], abs=1e-5
+        )
+        with pytest.raises(ValueError):
+            spectral_centrality("g", measure, "networkx", graphs=graphs)
+
+
+class TestSnapshotCache:
+    """One snapshot per graph version."""
+
+    def setup_method(self):
+        self.cache = GraphCache(cleanup_interval=3600)
+        self.graphs = GraphDict(self.cache)
+        self.graphs["g"] = nx.path_graph(5)
+
+    def teardown_method(self):
+        self.cache.shutdown()
+
+    def test_cached_per_version(self):
+        graph = self.graphs["g"]
+        version = self.graphs.version("g")
+        assert cached_snapshot(graph, version) is None
+        first = snapshot_of(graph, version)
+        assert snapshot_of(graph, version) is first
+        assert cached_snapshot(graph, version) is first
+
+        write = self.cache.begin_write("g")
+        write.graph.add_edge(4, 5)
+        self.cache.commit(write)
+        version = self.graphs.version("g")
+        assert cached_snapshot(graph, version) is None
+        assert snapshot_of(graph, version).n == 6
+
+    def test_unversioned_is_not_cached(self):
+        graph = nx.path_graph(3)
+        assert snapshot_of(graph) is not snapshot_of(graph)
+        assert cached_snapshot(graph, None) is None
+
+    def test_node_count_mismatch_is_stale(self):
+        graph = self.graphs["g"]
+        version = self.graphs.version("g")
+        snapshot_of(graph, version)
+        graph.add_node(99)
+        assert cached_snapshot(graph, version) is None
+
+    def test_stats_report_cached_snapshots(self):
+        snapshot_of(self.graphs["g"], self.graphs.version("g"))
+        stats = csr.get_csr_stats()
+        assert stats["builds"] >= 1
+        assert any(s["version"] == self.graphs.version("g") for s in stats["cached"])
+        assert stats["memory_mb"] > 0
+
+    def test_cached_snapshot_counts_toward_the_graph(self):
+        graph = self.graphs["g"]
+        plain = estimate_graph_bytes(graph)
+        snapshot = snapshot_of(graph, self.graphs.version("g"))
+        assert csr.snapshot_bytes(graph) == snapshot.nbytes
+        assert estimate_graph_bytes(graph) == plain + snapshot.nbytes
+        assert csr.snapshot_bytes(nx.path_graph(3)) == 0
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_resize_the_graph(self):
+        server_graphs.clear()
+        server_graphs["g"] = nx.path_graph(2000)
+        cache = get_graph_cache()
+        before = cache.total_bytes
+        try:
+            await NetworkXMCPServer()._call_tool(
+                {"name": "connected_components", "arguments": {"graph": "g"}}
+            )
+            held = csr.snapshot_bytes(server_graphs["g"])
+            after = cache.total_bytes
+        finally:
+            server_graphs.clear()
+
+        assert held > 0
+        assert after - before == held
+
+    def test_degree_centrality_uses_cached_snapshot(self):
+        self.graphs["h"] = nx.gnp_random_graph(50, 0.1, seed=3)
+        expected = degree_centrality("h", {"h": self.graphs["h"]})
+        snapshot_of(self.graphs["h"], self.graphs.version("h"))
+        hits = csr.get_csr_stats()["hits"]
+
+        assert degree_centrality("h", self.graphs) == expected
+        assert csr.get_csr_stats()["hits"] == hits + 1
+
+
+class TestUsers:
+    """Algorithms that run on snapshots."""
+
+    def test_components_from_labels(self):
+        graph = nx.Graph([(0, 1), (2, 3), (3, 4)])
+        graph.add_node(5)
+        index = ComponentIndex.build(graph)
+        assert index.summary() == {
+            "num_components": 3,
+            "component_sizes": [3, 2, 1],
+            "largest_component": [2, 3, 4],
+        }
+        # Still a working union-find
+        assert index.sets.union(1, 5)
+        assert index.sets.sizes() == [3, 3]
+
+    def test_from_labels_ties_go_to_earliest_set(self):
+        sets = UnionFind.from_labels(list("abcd"), [0, 1, 1, 0])
+        assert sets.largest() == ["a", "d"]
+        assert sets.find("c") == "b"
+
+    @pytest.mark.parametrize("sparse", [True, False])
+    def test_clustering_coefficients(self, monkeypatch, sparse):
+        if sparse:
+            monkeypatch.setattr(csr, "SPARSE_MIN_NODES", 0)
+        graph = nx.gnp_random_graph(60, 0.1, seed=4, directed=True)
+        builds = csr.get_csr_stats()["builds"]
+        result = GraphAlgorithms.clustering_coefficients(graph)
+        # Small graphs stay on nx.clustering
+        assert (csr.get_csr_stats()["builds"] > builds) == sparse
+        undirected = graph.to_undirected()
+        assert result["node_clustering"] == pytest.approx(nx.clustering(undirected))
+        assert result["average_clustering"] == pytest.approx(
+            nx.average_clustering(undirected)
+        )
@@ -0,0 +1,93 @@
+"""Tests for the single-pass response encoder."""
+
+import io
+import json
+
+import networkx as nx
+import pytest
+
+from networkx_mcp import encoding
+from networkx_mcp.encoding import (
+    PreEncoded,
+    dumps_bytes,
+    encode_response,
+    text_content,
+    write_message,
+)
+from networkx_mcp.server import NetworkXMCPServer, graphs
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param and not encoding.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(encoding, "HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestEncoding:
+    """Output of both encoders matches the stdlib round trip."""
+
+    def test_text_content_envelope(self, encoder):
+        text = json.dumps({"quote": 'say "hi"\n', "unicode": "naïve ✓"})
+        content = text_content(text)
+
+        assert json.loads(content.encoded) == {
+            "content": [{"type": "text", "text": text}]
+        }
+        assert content["content"][0]["text"] == text
+
+    def test_response_splices_pre_encoded_result(self, encoder):
+        result = text_content("[1, 2]")
+        response = {"jsonrpc": "2.0", "id": "a", "result": result}
+
+        assert json.loads(encode_response(response)) == json.loads(json.dumps(response))
+
+    def test_batch_and_plain_responses(self, encoder):
+        responses = [
+            {"jsonrpc": "2.0", "id": 1, "result": PreEncoded({"tools": []})},
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32601, "message": "x"}},
+        ]
+        assert json.loads(encode_response(responses)) == [
+            {"jsonrpc": "2.0", "id": 1, "result": {"tools": []}},
+            responses[1],
+        ]
+        assert encode_response({"result": PreEncoded({})}) == b'{"result":{}}'
+
+    def test_non_string_keys_and_big_ints(self, encoder):
+        assert json.loads(dumps_bytes({1: 2**70})) == {"1": 2**70}
+
+    def test_write_message_text_and_binary_streams(self):
+        text_stream = io.StringIO()
+        write_message(b'{"a":1}', text_stream)
+        assert text_stream.getvalue() == '{"a":1}\n'
+
+        binary_stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        binary_stream.write("x")
+        write_message(b'{"b":"\xc3\xa9"}', binary_stream)
+        assert binary_stream.buffer.getvalue() == b'x{"b":"\xc3\xa9"}\n'
+
+
+class TestToolResultEncoding:
+    """Tool results are encoded once and written as-is."""
+
+    @pytest.mark.asyncio
+    async def test_export_json_round_trip(self):
+        graphs.clear()
+        graphs["export"] = nx.path_graph(50)
+        server = NetworkXMCPServer()
+        server.initialized = True
+
+        response = await server.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": "export_json", "arguments": {"graph": "export"}},
+            }
+        )
+
+        assert isinstance(response["result"], PreEncoded)
+        decoded = json.loads(encode_response(response))
+        data = json.loads(decoded["result"]["content"][0]["text"])
+        assert data["edges"] == 49
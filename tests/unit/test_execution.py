@@ -0,0 +1,107 @@
+"""Tests for the cost-class execution engine."""
+
+import json
+import threading
+
+import networkx as nx
+import pytest
+
+from networkx_mcp.core.basic_operations import betweenness_centrality
+from networkx_mcp.execution import CostClass, ExecutionEngine
+from networkx_mcp.server import NetworkXMCPServer, graphs
+from networkx_mcp.tool_registry import TOOLS
+
+
+def _current_thread_name(*args, **kwargs):
+    return threading.current_thread().name
+
+
+class TestExecutionEngine:
+    """Placement of jobs and the stats reported for them."""
+
+    @pytest.mark.asyncio
+    async def test_inline_and_thread(self):
+        engine = ExecutionEngine(thread_workers=2, process_workers=0)
+        try:
+            inline = await engine.run(CostClass.INLINE, _current_thread_name)
+            threaded = await engine.run(CostClass.THREAD, _current_thread_name)
+        finally:
+            engine.shutdown()
+
+        assert inline == threading.current_thread().name
+        assert threaded.startswith("nxmcp-tool")
+        stats = engine.get_stats()
+        assert stats["thread"]["completed"] == 1
+        assert stats["thread"]["running"] == stats["thread"]["queued"] == 0
+        assert stats["process"]["enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_small_graph_stays_on_threads(self):
+        engine = ExecutionEngine(process_workers=1, process_min_size=100)
+        graph = nx.path_graph(5)
+        try:
+            assert not engine.offloads(graph)
+            result = await engine.run_on_graph(betweenness_centrality, "g", graph)
+        finally:
+            engine.shutdown()
+
+        assert result["most_central"][0] == 2
+        assert engine.get_stats()["process"]["completed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_process_job_runs_on_snapshot(self, process_engine):
+        graph = nx.karate_club_graph()
+        before = process_engine.get_stats()["process"]["completed"]
+        result = await process_engine.run_on_graph(
+            betweenness_centrality, "karate", graph
+        )
+
+        expected = betweenness_centrality("karate", graphs={"karate": graph})
+        assert result == expected
+        assert process_engine.get_stats()["process"]["completed"] == before + 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted(self):
+        engine = ExecutionEngine(process_workers=0)
+
+        def boom():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError):
+                await engine.run(CostClass.THREAD, boom)
+        finally:
+            engine.shutdown()
+        assert engine.get_stats()["thread"]["failed"] == 1
+
+
+class TestServerCostClasses:
+    """The server routes tools through the engine by cost class."""
+
+    def setup_method(self):
+        graphs.clear()
+
+    def test_cpu_heavy_tools_use_processes(self):
+        process_tools = {spec.name for spec in TOOLS if spec.cost is CostClass.PROCESS}
+        assert {"betweenness_centrality", "community_detection"} <= process_tools
+        assert TOOLS.get("add_nodes").cost is CostClass.INLINE
+
+    @pytest.mark.asyncio
+    async def test_visualize_runs_in_worker_process(self, monkeypatch, process_engine):
+        graphs["big"] = nx.karate_club_graph()
+        server = NetworkXMCPServer()
+        monkeypatch.setattr(server, "engine", process_engine)
+        result = await server._call_tool(
+            {"name": "visualize_graph", "arguments": {"graph": "big"}}
+        )
+
+        data = json.loads(result["content"][0]["text"])
+        assert data["visualization"].startswith("data:image/png;base64,")
+        assert data["layout"] == "spring"
+
+    @pytest.mark.asyncio
+    async def test_health_status_reports_engine(self):
+        server = NetworkXMCPServer(enable_monitoring=True)
+        result = await server._call_tool({"name": "health_status", "arguments": {}})
+        status = json.loads(result["content"][0]["text"])
+        assert {"thread", "process"} <= set(status["execution"])
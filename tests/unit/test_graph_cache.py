@@ -1,13 +1,31 @@
 """Comprehensive tests for graph_cache.py module - Target: 95%+ coverage."""
 
+import heapq
 import threading
 import time
+import tracemalloc
 from unittest.mock import MagicMock, patch
 
 import networkx as nx
 import pytest
 
-from networkx_mcp.graph_cache import CachedGraph, GraphCache, GraphDict, get_graph_cache
+from networkx_mcp.eviction import (
+    CostAwarePolicy,
+    EvictionPolicy,
+    LFUPolicy,
+    make_policy,
+)
+from networkx_mcp.graph_cache import (
+    DEFAULT_MAX_DISK_MB,
+    CachedGraph,
+    GraphCache,
+    GraphDict,
+    SpillStore,
+    _spill_store_from_env,
+    estimate_graph_bytes,
+    get_graph_cache,
+)
+from networkx_mcp.snapshots import bind_graph
 
 
 class TestCachedGraph:
@@ -20,8 +38,8 @@ class TestCachedGraph:
 
         cached = CachedGraph(
             graph=graph,
-            created_at=time.time(),
-            last_accessed=time.time(),
+            created_at=time.monotonic(),
+            last_accessed=time.monotonic(),
             access_count=0,
         )
 
@@ -35,8 +53,8 @@ class TestCachedGraph:
         graph = nx.Graph()
         cached = CachedGraph(
             graph=graph,
-            created_at=time.time(),
-            last_accessed=time.time(),
+            created_at=time.monotonic(),
+            last_accessed=time.monotonic(),
             access_count=0,
         )
 
@@ -195,23 +213,20 @@ class TestGraphCache:
         assert "memory_mb" in stats
         assert stats["evictions"] >= 0
 
-    @patch("networkx_mcp.graph_cache.psutil.Process")
-    def test_memory_limit_eviction(self, mock_process_class):
-        """Test eviction based on memory limit."""
-        # Mock memory usage to be over limit
-        mock_process = MagicMock()
-        mock_process.memory_info.return_value.rss = 600 * 1024 * 1024  # 600 MB
-        mock_process_class.return_value = mock_process
-
-        cache = GraphCache(max_size=100, ttl_seconds=3600, max_memory_mb=500)
+    def test_memory_limit_eviction(self):
+        """Test eviction based on the memory budget."""
+        size = estimate_graph_bytes(nx.complete_graph(10))
+        # Room for four of the graphs below
+        cache = GraphCache(
+            max_size=100, ttl_seconds=3600, max_memory_mb=4.5 * size / 1024 / 1024
+        )
 
-        # Add graphs - should trigger memory eviction
         for i in range(10):
-            graph = nx.complete_graph(10)
-            cache.put(f"large_{i}", graph)
+            cache.put(f"large_{i}", nx.complete_graph(10))
 
-        # Should have evicted some graphs due to memory limit
-        assert cache.evictions > 0
+        assert cache.evictions == 6
+        assert cache.list_graphs() == [f"large_{i}" for i in range(6, 10)]
+        assert cache.total_bytes == 4 * size
 
     def test_cleanup_expired(self):
         """Test cleanup of expired entries."""
@@ -231,6 +246,28 @@ class TestGraphCache:
         assert len(cache._cache) == 0
         assert cache.evictions >= 3
 
+    def test_drop_callbacks(self):
+        cache = GraphCache(max_size=2, ttl_seconds=0.1, cleanup_interval=10)
+        dropped = []
+        cache.on_drop(dropped.append)
+
+        cache.put("a", nx.path_graph(2))
+        cache.put("a", nx.path_graph(3))  # replaced, not dropped
+        cache.put("b", nx.path_graph(2))
+        cache.put("c", nx.path_graph(2))  # evicts "a"
+        assert cache.delete("b")
+        assert not cache.delete("missing")
+        assert dropped == ["a", "b"]
+
+        time.sleep(0.2)
+        cache._cleanup()
+        assert dropped == ["a", "b", "c"]
+
+        cache.put("d", nx.path_graph(2))
+        cache.clear()
+        assert dropped == ["a", "b", "c", "d"]
+        cache.shutdown()
+
     def test_thread_safety(self):
         """Test thread-safe operations."""
         results = []
@@ -280,17 +317,19 @@ class TestGraphCache:
         # Create expired cached graph
         old_cached = CachedGraph(
             graph=graph,
-            created_at=time.time() - 100,  # Created 100 seconds ago
-            last_accessed=time.time(),
+            created_at=time.monotonic() - 100,  # Created 100 seconds ago
+            last_accessed=time.monotonic(),
             access_count=0,
+            expires_at=time.monotonic() - 90,
         )
 
         # Create fresh cached graph
         new_cached = CachedGraph(
             graph=graph,
-            created_at=time.time(),
-            last_accessed=time.time(),
+            created_at=time.monotonic(),
+            last_accessed=time.monotonic(),
             access_count=0,
+            expires_at=time.monotonic() + 10,
         )
 
         cache = GraphCache(ttl_seconds=10)
@@ -298,8 +337,8 @@ class TestGraphCache:
         assert cache._is_expired(old_cached) is True
         assert cache._is_expired(new_cached) is False
 
-    def test_evict_lru(self):
-        """Test _evict_lru method."""
+    def test_evict(self):
+        """Test _evict method."""
         # Add multiple graphs
         for i in range(3):
             graph = nx.Graph()
@@ -309,7 +348,7 @@ class TestGraphCache:
         initial_size = len(self.cache._cache)
 
         # Evict LRU
-        self.cache._evict_lru()
+        assert self.cache._evict()
 
         assert len(self.cache._cache) == initial_size - 1
         assert self.cache.evictions == initial_evictions + 1
@@ -505,5 +544,656 @@ class TestGlobalCache:
         del graphs["test_global"]
 
 
+class TestSpillTier:
+    """Evicted and expired graphs move to disk and come back on access."""
+
+    def setup_method(self):
+        self.cache = None
+
+    def teardown_method(self):
+        if self.cache is not None:
+            self.cache.shutdown()
+
+    def _cache(self, tmp_path, **options):
+        options.setdefault("max_memory_mb", 10**6)
+        self.cache = GraphCache(spill=SpillStore(base_dir=str(tmp_path)), **options)
+        return self.cache
+
+    def test_evicted_graph_is_reloaded(self, tmp_path):
+        cache = self._cache(tmp_path, max_size=2)
+        cache.put("a", nx.path_graph(5))
+        cache.put("b", nx.path_graph(3))
+        cache.put("c", nx.path_graph(4))
+
+        assert cache.list_graphs() == ["b", "c", "a"]
+        assert cache.get_stats()["disk"]["graphs"] == 1
+
+        graph = cache.get("a")
+        assert graph is not None
+        assert list(graph.edges()) == [(0, 1), (1, 2), (2, 3), (3, 4)]
+
+        stats = cache.get_stats()
+        assert stats["disk_hits"] == 1
+        assert stats["ram_hits"] == 0
+        assert stats["disk"]["spills"] == 2  # "a", then "b" to make room
+        assert stats["disk"]["reload_ms_max"] > 0
+        assert cache.get("a") is graph
+        assert cache.get_stats()["ram_hits"] == 1
+
+    def test_mutation_after_spill_is_kept(self, tmp_path):
+        cache = self._cache(tmp_path, max_size=1)
+        graph = nx.Graph()
+        cache.put("a", graph)
+        cache.put("b", nx.Graph())
+
+        # Still referenced, so a reload returns the live object
+        graph.add_edge(1, 2)
+        assert cache.peek("a") is graph
+        assert cache.get("a").number_of_edges() == 1
+
+    def test_unreferenced_graph_reloads_from_disk(self, tmp_path):
+        cache = self._cache(tmp_path, max_size=1)
+        cache.put("a", nx.karate_club_graph())
+        cache.put("b", nx.Graph())
+
+        assert cache.peek("a") is None
+        assert cache.get("a").number_of_edges() == 78
+
+    def test_expired_graph_is_spilled(self, tmp_path):
+        cache = self._cache(tmp_path, ttl_seconds=0.05)
+        cache.put("a", nx.path_graph(3))
+        time.sleep(0.1)
+        cache._cleanup()
+
+        assert cache.get_stats()["size"] == 0
+        assert cache.get("a").number_of_nodes() == 3
+
+    def test_delete_and_clear_remove_disk_copies(self, tmp_path):
+        cache = self._cache(tmp_path, max_size=1)
+        for key in "abc":
+            cache.put(key, nx.path_graph(3))
+
+        assert cache.delete("a") is True
+        assert cache.get("a") is None
+        cache.clear()
+        assert cache.list_graphs() == []
+        assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+    def test_disk_budget_drops_oldest(self, tmp_path):
+        store = SpillStore(base_dir=str(tmp_path), max_disk_mb=0)
+        store.write("a", nx.path_graph(3))
+        store.write("b", nx.path_graph(3))
+        assert store.keys() == ["b"]
+        assert store.dropped == 1
+
+    def test_disk_budget_is_finite_by_default(self, monkeypatch):
+        assert SpillStore().max_disk_mb == DEFAULT_MAX_DISK_MB
+        monkeypatch.delenv("NETWORKX_MCP_SPILL_MAX_MB", raising=False)
+        assert _spill_store_from_env().max_disk_mb == DEFAULT_MAX_DISK_MB
+        monkeypatch.setenv("NETWORKX_MCP_SPILL", "false")
+        assert _spill_store_from_env() is None
+
+    def test_spill_is_written_outside_the_lock(self, tmp_path, monkeypatch):
+        cache = self._cache(tmp_path, max_size=2)
+        graph = nx.path_graph(5)
+        cache.put("a", graph)
+        cache.put("b", nx.path_graph(3))
+        reloaded, saves = [], []
+        save = SpillStore.save
+
+        def save_while_reloading(store, path, spilled):
+            saves.append(spilled)
+            if len(saves) == 1:
+                # Another thread gets the graph while it is being written
+                thread = threading.Thread(
+                    target=lambda: reloaded.append(cache.get("a"))
+                )
+                thread.start()
+                thread.join(timeout=5)
+            return save(store, path, spilled)
+
+        monkeypatch.setattr(SpillStore, "save", save_while_reloading)
+        cache.put("c", nx.path_graph(4))
+
+        assert reloaded == [graph]
+        # Reloaded before its write finished, so that disk copy is dropped
+        assert cache.peek("a") is graph
+        assert cache.list_graphs() == ["c", "a", "b"]
+        assert len([path for path in tmp_path.rglob("*") if path.is_file()]) == 1
+
+    def test_close_removes_directory(self, tmp_path):
+        store = SpillStore(base_dir=str(tmp_path))
+        store.write("a", nx.path_graph(3))
+        assert len(list(tmp_path.iterdir())) == 1
+        store.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_graph_dict_reloads_transparently(self, tmp_path):
+        graphs = GraphDict(self._cache(tmp_path, max_size=1))
+        graphs["a"] = nx.path_graph(3)
+        graphs["b"] = nx.path_graph(4)
+
+        assert "a" in graphs
+        assert graphs["a"].number_of_nodes() == 3
+        assert sorted(graphs) == ["a", "b"]
+
+
+class TestMemoryAccounting:
+    """Estimated per-graph sizes drive the memory budget."""
+
+    @pytest.mark.parametrize("graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph])
+    def test_estimate_is_close_to_allocated_memory(self, graph_class):
+        edges = list(nx.gnm_random_graph(5000, 20000, seed=1).edges())
+        tracemalloc.start()
+        graph = graph_class(edges)
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert 0.7 < estimate_graph_bytes(graph) / allocated < 1.5
+
+    def test_estimate_counts_attributes(self):
+        plain = nx.path_graph(100)
+        weighted = nx.path_graph(100)
+        nx.set_edge_attributes(weighted, "x" * 100, "label")
+
+        assert estimate_graph_bytes(nx.Graph()) < estimate_graph_bytes(plain)
+        assert estimate_graph_bytes(plain) < estimate_graph_bytes(weighted)
+
+    @patch("networkx_mcp.graph_cache.psutil.Process")
+    def test_budget_ignores_process_rss(self, mock_process_class):
+        mock_process_class.return_value.memory_info.return_value.rss = 10**12
+        cache = GraphCache(max_memory_mb=1)
+
+        for i in range(5):
+            cache.put(f"g{i}", nx.path_graph(10))
+
+        assert cache.evictions == 0
+        mock_process_class.assert_not_called()
+
+    def test_resize_follows_mutation_and_evicts_others(self):
+        cache = GraphCache(max_memory_mb=1)
+        cache.put("small", nx.path_graph(10))
+        graph = nx.path_graph(10)
+        cache.put("growing", graph)
+        before = cache.total_bytes
+
+        graph.add_edges_from(nx.path_graph(20000).edges())
+        size = cache.resize("growing")
+
+        assert size > 1024 * 1024
+        assert cache.total_bytes == size
+        assert cache.list_graphs() == ["growing"]
+        assert before < size
+        assert cache.resize("missing") is None
+
+    def test_delete_and_clear_release_bytes(self):
+        cache = GraphCache()
+        cache.put("a", nx.path_graph(10))
+        cache.put("b", nx.path_graph(20))
+        cache.put("a", nx.path_graph(30))
+        assert cache.total_bytes == sum(c.size_bytes for c in cache._cache.values())
+
+        cache.delete("a")
+        assert cache.total_bytes == cache._cache["b"].size_bytes
+        cache.clear()
+        assert cache.total_bytes == 0
+
+    def test_stats_list_graph_sizes_largest_first(self):
+        cache = GraphCache()
+        cache.put("small", nx.path_graph(5))
+        cache.put("large", nx.path_graph(500))
+
+        stats = cache.get_stats()
+
+        assert list(stats["graph_bytes"]) == ["large", "small"]
+        assert stats["memory_mb"] * 1024 * 1024 == sum(stats["graph_bytes"].values())
+        assert stats["max_memory_mb"] == 500
+
+
+class TestLockStriping:
+    """Sharded entries and the single-lookup read path."""
+
+    def test_get_or_raise_is_one_lookup(self):
+        cache = GraphCache()
+        graph = nx.path_graph(3)
+        cache.put("g", graph)
+
+        assert cache.contains("g")
+        assert cache.get_or_raise("g") is graph
+        assert (cache.hits, cache.misses) == (1, 0)
+        with pytest.raises(KeyError):
+            cache.get_or_raise("missing")
+        assert not cache.contains("missing")
+        assert cache.misses == 1
+
+    def test_graph_dict_access_counts_one_hit(self):
+        cache = GraphCache()
+        graphs = GraphDict(cache)
+        graphs["g"] = nx.path_graph(3)
+
+        if "g" in graphs:
+            graphs["g"]
+
+        assert cache.hits == 1
+
+    def test_reads_do_not_wait_for_writers(self):
+        cache = GraphCache()
+        cache.put("g", nx.path_graph(3))
+        held, release = threading.Event(), threading.Event()
+
+        def writer():
+            with cache._lock:
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        held.wait(5)
+        try:
+            assert cache.get("g") is not None
+            assert cache.contains("g")
+        finally:
+            release.set()
+            thread.join()
+
+    def test_lru_order_spans_shards(self):
+        cache = GraphCache(max_size=4, shards=8)
+        for key in "abcd":
+            cache.put(key, nx.Graph())
+        cache.get("a")
+        cache.get("b")
+
+        cache.put("e", nx.Graph())
+        cache.put("f", nx.Graph())
+
+        assert cache.list_graphs() == ["a", "b", "e", "f"]
+
+    def test_shards_must_be_positive(self):
+        with pytest.raises(ValueError, match="shards"):
+            GraphCache(shards=0)
+
+
+class TestEvictionPolicies:
+    """Pluggable eviction order and pinning."""
+
+    def test_lfu_keeps_frequently_used_graphs(self):
+        cache = GraphCache(max_size=3, policy=LFUPolicy())
+        cache.put("popular", nx.Graph())
+        for _ in range(5):
+            cache.get("popular")
+        for key in ("scratch_1", "scratch_2", "scratch_3"):
+            cache.put(key, nx.Graph())
+
+        assert "popular" in cache.list_graphs()
+        assert "scratch_1" not in cache.list_graphs()
+
+    def test_lfu_aging_lets_new_graphs_overtake(self):
+        cache = GraphCache(max_size=2, policy=LFUPolicy())
+        cache.put("old", nx.Graph())
+        for _ in range(3):
+            cache.get("old")
+        for i in range(10):
+            cache.put(f"scratch_{i}", nx.Graph())
+            cache.get(f"scratch_{i}")
+
+        assert "old" not in cache.list_graphs()
+
+    def test_cost_aware_keeps_expensive_graphs(self):
+        cache = GraphCache(max_size=2, policy=CostAwarePolicy())
+        graph = nx.path_graph(100)
+        cache.put("expensive", graph, build_seconds=30.0)
+        cache.put("cheap", nx.path_graph(100), build_seconds=0.01)
+        cache.put("new", nx.path_graph(100), build_seconds=0.01)
+
+        assert cache.list_graphs() == ["expensive", "new"]
+
+    def test_cost_aware_prices_reloads_when_spilling(self, tmp_path):
+        cache = GraphCache(
+            policy=CostAwarePolicy(), spill=SpillStore(base_dir=str(tmp_path))
+        )
+        cache.put("g", nx.path_graph(100), build_seconds=30.0)
+
+        cached = cache._cache["g"]
+        assert 0 < cached.miss_cost < 0.01
+        cache.shutdown()
+
+    def test_resize_adds_build_time(self):
+        cache = GraphCache()
+        cache.put("g", nx.Graph(), build_seconds=1.0)
+        cache.resize("g", build_seconds=2.0)
+        assert cache._cache["g"].build_seconds == 3.0
+
+    def test_pinned_graphs_are_never_evicted(self):
+        cache = GraphCache(max_size=2, max_memory_mb=1)
+        cache.put("pinned", nx.path_graph(10))
+        assert cache.pin("pinned")
+        for i in range(5):
+            cache.put(f"g{i}", nx.path_graph(10))
+        cache.put("big", nx.path_graph(20000))
+
+        assert cache.list_graphs() == ["pinned", "big"]
+        assert cache.get_stats()["pinned"] == ["pinned"]
+
+    def test_pinned_graphs_do_not_expire(self):
+        cache = GraphCache(ttl_seconds=0.01)
+        cache.put("pinned", nx.Graph())
+        cache.pin("pinned")
+        cache.put("pinned", nx.path_graph(3))
+        time.sleep(0.05)
+        cache._cleanup()
+
+        assert cache.get("pinned").number_of_nodes() == 3
+
+    def test_pin_reloads_spilled_graph(self, tmp_path):
+        cache = GraphCache(max_size=1, spill=SpillStore(base_dir=str(tmp_path)))
+        cache.put("a", nx.path_graph(3))
+        cache.put("b", nx.path_graph(4))
+
+        assert cache.pin("a")
+        cache.put("c", nx.path_graph(5))
+        assert "a" in cache._cache
+        assert not cache.pin("missing")
+        cache.shutdown()
+
+    def test_unpin_and_delete(self):
+        cache = GraphCache(max_size=1)
+        cache.put("a", nx.Graph())
+        cache.pin("a")
+        assert cache.unpin("a")
+        assert not cache.unpin("a")
+
+        cache.put("b", nx.Graph())
+        assert cache.list_graphs() == ["b"]
+        cache.pin("b")
+        cache.delete("b")
+        assert cache.pinned() == []
+
+    def test_make_policy(self):
+        assert isinstance(make_policy("LFU"), LFUPolicy)
+        assert GraphCache().get_stats()["policy"] == "lru"
+        with pytest.raises(ValueError, match="Unknown eviction policy"):
+            make_policy("random")
+
+    def test_policies_must_set_priorities(self):
+        class Incomplete(EvictionPolicy):
+            name = "incomplete"
+
+        with pytest.raises(TypeError):
+            EvictionPolicy()
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_spilling_same_key_twice_keeps_file(self, tmp_path):
+        store = SpillStore(base_dir=str(tmp_path))
+        store.write("a", nx.path_graph(3))
+        store.write("a", nx.path_graph(4))
+
+        assert store.read("a").number_of_nodes() == 4
+        assert len(store) == 1
+        store.close()
+
+
+class TestExpiryHeap:
+    """Cleanup only visits graphs whose TTL is due."""
+
+    def setup_method(self):
+        self.cache = GraphCache(max_size=1000, ttl_seconds=60, cleanup_interval=3600)
+
+    def teardown_method(self):
+        self.cache.shutdown()
+
+    def _age(self, seconds):
+        """Move every deadline ``seconds`` into the past."""
+        with self.cache._lock:
+            for cached in self.cache._cache.values():
+                cached.expires_at -= seconds
+            self.cache._expiry = [
+                (deadline - seconds, tick, key)
+                for deadline, tick, key in self.cache._expiry
+            ]
+
+    def test_cleanup_only_touches_due_entries(self):
+        for i in range(100):
+            self.cache.put(f"long_{i}", nx.Graph())
+        self.cache.put("scratch", nx.Graph(), ttl_seconds=1)
+        self._age(2)
+
+        with patch(
+            "networkx_mcp.graph_cache.heapq.heappop", wraps=heapq.heappop
+        ) as pop:
+            self.cache._cleanup()
+
+        assert pop.call_count == 1
+        assert "scratch" not in self.cache._cache
+        assert len(self.cache._cache) == 100
+
+    def test_per_graph_ttl(self):
+        self.cache.put("reference", nx.Graph(), ttl_seconds=float("inf"))
+        self.cache.put("default", nx.Graph())
+        self.cache.put("scratch", nx.Graph(), ttl_seconds=5)
+        self._age(30)
+
+        assert self.cache.get("scratch") is None
+        assert self.cache.get("default") is not None
+        self._age(60)
+        self.cache._cleanup()
+
+        assert self.cache.list_graphs() == ["reference"]
+        assert self.cache._expiry == []
+
+    def test_put_keeps_override(self):
+        self.cache.put("g", nx.Graph(), ttl_seconds=5)
+        self.cache.put("g", nx.path_graph(3))
+        assert self.cache._cache["g"].expires_at <= time.monotonic() + 5
+
+        self.cache.delete("g")
+        self.cache.put("g", nx.Graph())
+        assert self.cache._cache["g"].expires_at > time.monotonic() + 5
+
+    def test_set_ttl(self):
+        self.cache.put("g", nx.Graph())
+        assert self.cache.set_ttl("g", 0)
+        assert self.cache.get("g") is None
+        assert not self.cache.set_ttl("missing", 10)
+
+        self.cache.put("h", nx.Graph(), ttl_seconds=0)
+        assert self.cache.set_ttl("h", None)
+        assert self.cache.get("h") is not None
+
+    def test_stale_entries_are_skipped(self):
+        self.cache.put("g", nx.Graph(), ttl_seconds=1)
+        self.cache.set_ttl("g", 120)
+        self.cache.put("h", nx.Graph(), ttl_seconds=1)
+        self.cache.delete("h")
+        self._age(2)
+        self.cache._cleanup()
+
+        assert self.cache.list_graphs() == ["g"]
+        assert len(self.cache._expiry) == 1
+
+        self.cache.put("h", nx.Graph(), ttl_seconds=1)
+        self._age(60)
+        self.cache._cleanup()
+        assert self.cache.list_graphs() == ["g"]
+
+    def test_heap_is_compacted(self):
+        self.cache.put("g", nx.Graph())
+        for _ in range(200):
+            self.cache.set_ttl("g", 120)
+        self.cache._cleanup()
+        # The cleanup thread may have compacted it first, leaving a few
+        assert len(self.cache._expiry) <= 2 + 64
+
+    def test_pinned_graph_expires_after_unpin(self):
+        self.cache.put("g", nx.Graph(), ttl_seconds=1)
+        self.cache.pin("g")
+        self._age(2)
+        self.cache._cleanup()
+        assert self.cache.get("g") is not None
+
+        self.cache.unpin("g")
+        self.cache._cleanup()
+        assert "g" not in self.cache._cache
+
+    def test_cleanup_thread_wakes_for_earlier_deadline(self):
+        self.cache.put("long", nx.Graph())
+        # The thread is now asleep for up to cleanup_interval (an hour)
+        time.sleep(0.05)
+        self.cache.put("scratch", nx.Graph(), ttl_seconds=0.05)
+
+        deadline = time.monotonic() + 5
+        while "scratch" in self.cache._cache and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert list(self.cache._cache) == ["long"]
+
+    def test_shutdown_wakes_cleanup_thread(self):
+        self.cache.put("g", nx.Graph())
+        start = time.monotonic()
+        self.cache.shutdown()
+        assert not self.cache._cleanup_thread.is_alive()
+        assert time.monotonic() - start < 1
+
+    def test_expired_graph_spills_with_disk_tier(self, tmp_path):
+        cache = GraphCache(
+            ttl_seconds=60,
+            cleanup_interval=3600,
+            spill=SpillStore(base_dir=str(tmp_path)),
+        )
+        cache.put("g", nx.path_graph(3), ttl_seconds=0)
+        cache._cleanup()
+        assert "g" not in cache._cache
+        assert cache.set_ttl("g", 60)
+
+        assert cache.get("g").number_of_nodes() == 3
+        assert cache._cache["g"].expires_at > time.monotonic() + 30
+        cache.shutdown()
+
+
+class TestSnapshots:
+    """Readers pin versions; writers copy instead of waiting for them."""
+
+    def setup_method(self):
+        self.cache = GraphCache(max_memory_mb=10**6, cleanup_interval=3600)
+        self.cache.put("g", nx.path_graph(3))
+
+    def teardown_method(self):
+        self.cache.shutdown()
+
+    def test_write_in_place_without_readers(self):
+        original = self.cache.get("g")
+        version = self.cache.version("g")
+
+        write = self.cache.begin_write("g")
+        assert not write.copied and write.graph is original
+        write.graph.add_edge(2, 3)
+
+        assert self.cache.commit(write) is original
+        assert self.cache.version("g") > version
+        assert self.cache.get("g").number_of_edges() == 3
+
+    def test_write_copies_pinned_version(self):
+        snapshot = self.cache.snapshot("g")
+        write = self.cache.begin_write("g")
+        assert write.copied and write.pending_copy
+        write.graph.add_edge(2, 3)
+
+        published = self.cache.commit(write)
+        assert published is not snapshot.graph
+        assert snapshot.graph.number_of_edges() == 2
+        assert self.cache.get("g") is published
+        assert self.cache.version("g") > snapshot.version
+
+        snapshot.release()
+        snapshot.release()
+        assert self.cache._readers == {}
+        # Nobody pins the new version: the next write is in place
+        assert not self.cache.begin_write("g").copied
+
+    def test_untouched_copy_is_never_made(self):
+        with self.cache.snapshot("g") as snapshot:
+            version = self.cache.version("g")
+            write = self.cache.begin_write("g")
+            assert self.cache.commit(write) is snapshot.graph
+            assert write.pending_copy
+            assert self.cache.version("g") == version
+
+    def test_replaced_or_deleted_graph_drops_write(self):
+        write = self.cache.begin_write("g")
+        self.cache.put("g", nx.complete_graph(4))
+        assert self.cache.commit(write) is None
+        assert self.cache.get("g").number_of_edges() == 6
+
+        write = self.cache.begin_write("g")
+        self.cache.delete("g")
+        assert self.cache.commit(write) is None
+        assert self.cache.version("g") is None
+        assert self.cache.snapshot("g") is None
+        assert self.cache.begin_write("missing") is None
+
+    def test_versions_are_unique_across_keys(self):
+        first = self.cache.version("g")
+        self.cache.delete("g")
+        self.cache.put("g", nx.path_graph(3))
+        self.cache.put("h", nx.path_graph(3))
+        assert len({first, self.cache.version("g"), self.cache.version("h")}) == 3
+
+    def test_reader_waits_for_in_place_write(self):
+        write = self.cache.begin_write("g")
+        pinned = []
+        reader = threading.Thread(
+            target=lambda: pinned.append(self.cache.snapshot("g"))
+        )
+        reader.start()
+        write.graph.add_edge(2, 3)
+        time.sleep(0.05)
+        assert pinned == []
+        self.cache.commit(write)
+        reader.join(timeout=5)
+
+        assert pinned[0].graph.number_of_edges() == 3
+        assert pinned[0].version == self.cache.version("g")
+        pinned[0].release()
+
+    def test_timeout_while_written(self):
+        write = self.cache.begin_write("g")
+        with pytest.raises(TimeoutError):
+            self.cache.snapshot("g", timeout=0)
+        with pytest.raises(TimeoutError):
+            self.cache.begin_write("g", timeout=0.01)
+        self.cache.commit(write)
+
+        with self.cache.snapshot("g", timeout=0) as snapshot:
+            assert snapshot.version == self.cache.version("g")
+            # A write on a copy does not hold readers up
+            write = self.cache.begin_write("g", timeout=0)
+            assert write.copied
+            self.cache.snapshot("g", timeout=0).release()
+            self.cache.commit(write)
+
+    def test_version_survives_spill(self, tmp_path):
+        cache = GraphCache(max_size=1, spill=SpillStore(base_dir=str(tmp_path)))
+        cache.put("a", nx.path_graph(3))
+        version = cache.version("a")
+        cache.put("b", nx.path_graph(3))
+
+        assert cache.version("a") == version
+        assert cache.get("a") is not None
+        assert cache.version("a") == version
+        cache.shutdown()
+
+    def test_graph_dict_returns_bound_graph(self):
+        graphs = GraphDict(self.cache)
+        with self.cache.snapshot("g") as snapshot:
+            with bind_graph("g", snapshot.graph):
+                self.cache.put("g", nx.complete_graph(4))
+                assert graphs["g"] is snapshot.graph
+                assert graphs.get("g") is snapshot.graph
+                assert "g" in graphs
+
+                graphs["g"] = nx.empty_graph(7)
+                assert graphs["g"].number_of_nodes() == 7
+            assert graphs.peek("g").number_of_nodes() == 7
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
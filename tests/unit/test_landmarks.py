@@ -0,0 +1,235 @@
+"""Tests for the landmark (ALT) shortest path index."""
+
+import json
+import pickle
+
+import networkx as nx
+import pytest
+
+from networkx_mcp.core import landmarks
+from networkx_mcp.core.csr import snapshot_bytes
+from networkx_mcp.core.landmarks import (
+    MAX_LANDMARKS,
+    build_index,
+    drop_index,
+    get_landmark_stats,
+    index_of,
+)
+from networkx_mcp.graph_cache import GraphCache, SpillStore, estimate_graph_bytes
+from networkx_mcp.server import NetworkXMCPServer, graphs
+
+
+def _weighted(graph):
+    for i, (_, _, data) in enumerate(graph.edges(data=True)):
+        data["weight"] = 1 + (i * 7) % 5
+    return graph
+
+
+def _graphs():
+    grid = nx.convert_node_labels_to_integers(nx.grid_2d_graph(12, 12))
+    digraph = nx.gnp_random_graph(150, 0.03, seed=2, directed=True)
+    multigraph = nx.MultiGraph(nx.gnp_random_graph(100, 0.05, seed=3))
+    multigraph.add_edges_from((u, v, {"weight": 0.5}) for u, v in list(grid.edges)[:20])
+    # An unreachable part
+    for graph in (grid, digraph, multigraph):
+        graph.add_edge("x", "y")
+    return [_weighted(grid), _weighted(digraph), _weighted(multigraph)]
+
+
+class TestLandmarkIndex:
+    """A* with landmark bounds agrees with NetworkX."""
+
+    @pytest.mark.parametrize("graph", _graphs(), ids=["grid", "digraph", "multi"])
+    @pytest.mark.parametrize("weight", [None, "weight"])
+    def test_matches_networkx(self, graph, weight, assert_valid_path):
+        index = build_index(graph, 4, weight)
+        nodes = list(graph)
+        for i in range(0, len(nodes), 7):
+            source, target = nodes[i], nodes[(i * 13 + 5) % len(nodes)]
+            try:
+                expected = nx.shortest_path_length(graph, source, target, weight)
+            except nx.NetworkXNoPath:
+                with pytest.raises(nx.NetworkXNoPath):
+                    index.shortest_path(graph, source, target)
+                continue
+            path, length, _ = index.shortest_path(graph, source, target)
+            assert length == pytest.approx(expected)
+            assert_valid_path(graph, path, source, target)
+
+    @pytest.mark.parametrize("scipy", [True, False])
+    def test_distances(self, monkeypatch, scipy):
+        monkeypatch.setattr(landmarks, "HAS_SCIPY", scipy)
+        graph = _weighted(nx.gnp_random_graph(60, 0.08, seed=4, directed=True))
+        index = build_index(graph, 3, "weight")
+
+        for k, landmark in enumerate(index.landmarks):
+            forward = nx.single_source_dijkstra_path_length(graph, landmark)
+            backward = nx.single_source_dijkstra_path_length(graph.reverse(), landmark)
+            for v, i in index.index.items():
+                assert index.forward[i, k] == forward.get(v, landmarks.UNREACHABLE)
+                assert index.backward[i, k] == backward.get(v, landmarks.UNREACHABLE)
+
+    def test_landmarks_are_spread_out(self):
+        graph = nx.path_graph(101)
+        index = build_index(graph, 3)
+        # Both ends, then the middle
+        assert sorted(index.landmarks) == [0, 50, 100]
+        assert index.backward is None
+        assert index.forward.shape == (101, 3)
+
+    def test_fewer_landmarks_than_nodes(self):
+        index = build_index(nx.path_graph(3), MAX_LANDMARKS)
+        assert sorted(index.landmarks) == [0, 1, 2]
+
+    def test_heads_for_the_target(self):
+        graph = nx.convert_node_labels_to_integers(nx.grid_2d_graph(30, 30))
+        index = build_index(graph)
+        path, length, settled = index.shortest_path(graph, 0, 899)
+        assert length == 58
+        # BFS would settle nearly all 900 nodes
+        assert settled < 2 * length
+
+    def test_errors(self):
+        graph = nx.path_graph(4)
+        index = build_index(graph)
+        assert index.shortest_path(graph, 2, 2) == ([2], 0, 0)
+        with pytest.raises(nx.NodeNotFound):
+            index.shortest_path(graph, 0, 9)
+        with pytest.raises(ValueError):
+            build_index(graph, 0)
+        with pytest.raises(ValueError):
+            build_index(nx.Graph([(0, 1, {"weight": -1})]), weight="weight")
+
+    def test_stats(self):
+        graph = nx.convert_node_labels_to_integers(nx.grid_2d_graph(20, 20))
+        before = get_landmark_stats()
+        index = build_index(graph, 4)
+        index.shortest_path(graph, 0, 399)
+
+        stats = index.stats()
+        assert stats["landmarks"] == 4 and stats["nodes"] == 400
+        assert stats["build_seconds"] > 0
+        assert stats["memory_mb"] * 1024 * 1024 >= index.forward.nbytes
+        assert stats["speedup"] > 0
+        after = get_landmark_stats()
+        assert after["builds"] == before["builds"] + 1
+        assert after["queries"] == before["queries"] + 1
+
+    def test_calibration(self):
+        grid = nx.convert_node_labels_to_integers(nx.grid_2d_graph(80, 80))
+        assert build_index(grid).effective
+        # Bidirectional BFS meets after a few hops on small-world graphs
+        scale_free = nx.barabasi_albert_graph(2000, 3, seed=1)
+        assert not build_index(scale_free).effective
+
+
+class TestPersistence:
+    """The index lives on the graph object for one version."""
+
+    def test_index_of_checks_version(self):
+        graph = nx.path_graph(10)
+        index = build_index(graph, 2, version=1)
+        assert index_of(graph, 1) is index
+        assert index_of(graph, None) is None
+        assert index_of(graph, 1) is index
+        # A newer version drops it
+        assert index_of(graph, 2) is None
+        assert index_of(graph, 1) is None
+
+    def test_node_count_change_is_stale(self):
+        graph = nx.path_graph(10)
+        build_index(graph)
+        graph.add_node("new")
+        assert index_of(graph) is None
+
+    def test_pickled_with_graph_but_not_copied(self):
+        graph = nx.path_graph(10)
+        build_index(graph, 2, version=1)
+        assert index_of(pickle.loads(pickle.dumps(graph)), 1) is not None
+        assert index_of(graph.copy(), 1) is None
+        assert drop_index(graph) and not drop_index(graph)
+
+    def test_cache_counts_spills_and_invalidates(self, tmp_path):
+        cache = GraphCache(
+            max_size=1, max_memory_mb=10**6, spill=SpillStore(base_dir=str(tmp_path))
+        )
+        try:
+            graph = nx.path_graph(1000)
+            cache.put("a", graph)
+            version = cache.version("a")
+            plain = estimate_graph_bytes(graph)
+            index = build_index(graph, 8, version=version)
+            # The build also caches the graph's CSR snapshot
+            assert estimate_graph_bytes(graph) == (
+                plain + index.nbytes + snapshot_bytes(graph)
+            )
+
+            # Spilled and reloaded as a new object, index included
+            del graph, index
+            cache.put("b", nx.Graph())
+            reloaded = cache.get("a")
+            assert index_of(reloaded, cache.version("a")) is not None
+
+            write = cache.begin_write("a")
+            write.graph.add_edge(0, 999)
+            cache.commit(write)
+            assert index_of(cache.get("a"), cache.version("a")) is None
+        finally:
+            cache.shutdown()
+
+
+class TestTools:
+    """The landmark_index tool and indexed shortest_path queries."""
+
+    async def _call(self, server, name, **arguments):
+        response = await server._call_tool({"name": name, "arguments": arguments})
+        return json.loads(response["content"][0]["text"])
+
+    @pytest.mark.asyncio
+    async def test_build_query_and_invalidate(self, monkeypatch):
+        # Timings on a small grid are too close to call
+        monkeypatch.setattr(landmarks, "_calibrate", lambda graph, index: 2.0)
+        graphs.clear()
+        graphs["g"] = nx.convert_node_labels_to_integers(nx.grid_2d_graph(20, 20))
+        server = NetworkXMCPServer()
+        try:
+            plain = await self._call(
+                server, "shortest_path", graph="g", source=0, target=399
+            )
+            built = await self._call(server, "landmark_index", graph="g", landmarks=4)
+            again = await self._call(server, "landmark_index", graph="g", landmarks=4)
+            indexed = await self._call(
+                server, "shortest_path", graph="g", source=0, target=399
+            )
+            await self._call(server, "add_edges", graph="g", edges=[[0, 399]])
+            changed = await self._call(
+                server, "shortest_path", graph="g", source=0, target=399
+            )
+        finally:
+            graphs.clear()
+
+        assert "index" not in plain and plain["length"] == 38
+        assert built["built"] and built["landmarks"] == 4 and built["memory_mb"] > 0
+        assert not again["built"] and again["version"] == built["version"]
+        assert indexed["index"] == "landmarks" and indexed["length"] == 38
+        assert indexed["settled"] < 400
+        assert changed == {"path": [0, 399], "length": 1}
+
+    @pytest.mark.asyncio
+    async def test_weighted_query_and_drop(self):
+        graphs.clear()
+        graphs["g"] = nx.Graph(
+            [("a", "b", {"w": 5}), ("a", "c", {"w": 1}), ("c", "b", {"w": 1})]
+        )
+        server = NetworkXMCPServer()
+        try:
+            path = await self._call(
+                server, "shortest_path", graph="g", source="a", target="b", weight="w"
+            )
+            await self._call(server, "landmark_index", graph="g", weight="w")
+            dropped = await self._call(server, "landmark_index", graph="g", drop=True)
+        finally:
+            graphs.clear()
+
+        assert path == {"path": ["a", "c", "b"], "length": 2}
+        assert dropped == {"dropped": True}
@@ -0,0 +1,47 @@
+"""Importing the server must not load optional stacks or start threads."""
+
+import json
+import subprocess
+import sys
+
+HEAVY = ["matplotlib", "requests", "bibtexparser", "pandas", "yaml", "numpy"]
+
+
+def _run(code):
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(proc.stdout)
+
+
+class TestLazyImports:
+    """Cold start of networkx_mcp.server."""
+
+    def test_server_import_is_lean(self):
+        state = _run(
+            "import json, sys, threading\n"
+            "import networkx_mcp.server\n"
+            f"print(json.dumps({{'loaded': [m for m in {HEAVY!r} "
+            "if m in sys.modules], 'threads': threading.active_count()}))"
+        )
+        assert state == {"loaded": [], "threads": 1}
+
+    def test_stacks_load_on_first_use(self):
+        state = _run(
+            "import json, sys\n"
+            "from networkx_mcp import academic, server\n"
+            "server.create_graph('g')\n"
+            "server.add_edges('g', [[1, 2]])\n"
+            "server.visualize_graph('g')\n"
+            "academic.resolve_doi\n"
+            "print(json.dumps({'mcp': server.mcp is server.mcp, 'loaded': "
+            "[m for m in ('matplotlib', 'requests') if m in sys.modules]}))"
+        )
+        assert state == {"mcp": True, "loaded": ["matplotlib", "requests"]}
+
+    def test_lazy_package_attributes(self):
+        from networkx_mcp import GraphAlgorithms
+        from networkx_mcp.core import GraphManager
+
+        assert GraphAlgorithms.__name__ == "GraphAlgorithms"
+        assert GraphManager.__name__ == "GraphManager"
@@ -0,0 +1,195 @@
+"""Tests for warm-started PageRank."""
+
+import json
+import random
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
+
+from networkx_mcp.core import pagerank as pagerank_module
+from networkx_mcp.core.basic_operations import add_edges, pagerank
+from networkx_mcp.core.pagerank import (
+    last_vector,
+    power_iteration,
+    remember_vector,
+)
+from networkx_mcp.result_cache import ResultCache
+from networkx_mcp.server import NetworkXMCPServer, graphs
+
+
+@pytest.fixture(autouse=True)
+def _no_vectors():
+    pagerank_module._vectors.clear()
+    yield
+    pagerank_module._vectors.clear()
+
+
+def _random_graph(seed, directed=True):
+    rng = random.Random(seed)
+    graph = nx.DiGraph() if directed else nx.Graph()
+    graph.add_nodes_from(range(300))
+    graph.add_edges_from((rng.randrange(300), rng.randrange(300)) for _ in range(1200))
+    return graph
+
+
+def _assert_matches_networkx(vector, graph, tol=1e-6):
+    nodes, x = vector
+    expected = nx.pagerank(graph, tol=tol)
+    assert nodes == list(graph)
+    for node, score in zip(nodes, x.tolist()):
+        assert score == pytest.approx(expected[node], abs=10 * tol)
+
+
+class TestPowerIteration:
+    """The iteration of nx.pagerank, with iterations counted."""
+
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_matches_networkx(self, directed):
+        graph = _random_graph(1, directed)
+        vector, iterations, warm = power_iteration(graph)
+        _assert_matches_networkx(vector, graph)
+        assert 0 < iterations <= 100
+        assert not warm
+
+    def test_weights_and_dangling_nodes(self):
+        graph = nx.DiGraph()
+        graph.add_weighted_edges_from([(0, 1, 3.0), (0, 2, 1.0), (1, 2, 1.0)])
+        graph.add_node(3)
+        vector, _, _ = power_iteration(graph)
+        _assert_matches_networkx(vector, graph)
+
+    def test_warm_start_after_additions(self):
+        graph = _random_graph(2)
+        previous, cold, _ = power_iteration(graph)
+        rng = random.Random(3)
+        graph.add_edges_from(
+            (rng.randrange(310), rng.randrange(310)) for _ in range(10)
+        )
+
+        vector, warm_iterations, warm = power_iteration(graph, previous=previous)
+        assert warm
+        assert warm_iterations < cold
+        _assert_matches_networkx(vector, graph)
+
+    def test_warm_start_after_removal(self):
+        graph = _random_graph(4)
+        previous, _, _ = power_iteration(graph)
+        graph.remove_nodes_from([0, 1, 2])
+
+        vector, _, warm = power_iteration(graph, previous=previous)
+        assert warm
+        _assert_matches_networkx(vector, graph)
+
+    def test_max_iter_exceeded(self):
+        with pytest.raises(nx.PowerIterationFailedConvergence):
+            power_iteration(_random_graph(5), max_iter=2)
+
+    def test_empty_graph(self):
+        (nodes, x), iterations, _ = power_iteration(nx.Graph())
+        assert nodes == [] and len(x) == 0 and iterations == 0
+
+
+class TestWarmStartVectors:
+    """The last vector per graph name seeds the next run."""
+
+    def test_pagerank_reports_iterations(self):
+        store = {"g": _random_graph(6)}
+        cold = pagerank("g", store)
+        assert not cold["warm_start"]
+        assert len(cold["pagerank"]) == 10
+        assert cold["highest_rank"][1] == max(cold["pagerank"].values())
+
+        add_edges("g", [[1, 2], [3, 4], [5, 301]], store)
+        warm = pagerank("g", store)
+        assert warm["warm_start"]
+        assert warm["iterations"] < cold["iterations"]
+
+    def test_knobs(self):
+        store = {"g": _random_graph(7)}
+        loose = pagerank("g", store, tol=1e-3)
+        pagerank_module._vectors.clear()
+        tight = pagerank("g", store, tol=1e-10, max_iter=500)
+        assert loose["iterations"] < tight["iterations"]
+        pagerank_module._vectors.clear()
+        with pytest.raises(nx.PowerIterationFailedConvergence):
+            pagerank("g", store, tol=1e-10, max_iter=1)
+
+    def test_vectors_are_bounded(self):
+        for i in range(pagerank_module.MAX_WARM_VECTORS + 2):
+            remember_vector(f"g{i}", ([0], None))
+        assert last_vector("g0") is None
+        assert last_vector("g2") is not None
+        assert len(pagerank_module._vectors) == pagerank_module.MAX_WARM_VECTORS
+
+
+class TestServerWarmStart:
+    """Warm starts work for calls run in worker processes too."""
+
+    def setup_method(self):
+        graphs.clear()
+        self.patch = patch(
+            "networkx_mcp.server.get_result_cache", return_value=ResultCache()
+        )
+        self.patch.start()
+
+    def teardown_method(self):
+        self.patch.stop()
+        graphs.clear()
+
+    @staticmethod
+    async def _call(server, tool, **arguments):
+        result = await server._call_tool({"name": tool, "arguments": arguments})
+        return json.loads(result["content"][0]["text"])
+
+    @pytest.mark.asyncio
+    async def test_vectors_go_with_their_graph(self):
+        server = NetworkXMCPServer()
+        for name in ("kept", "deleted"):
+            graphs[name] = _random_graph(9)
+            await self._call(server, "pagerank", graph=name)
+        del graphs["deleted"]
+
+        assert last_vector("deleted") is None
+        assert last_vector("kept") is not None
+        graphs.clear()
+        assert last_vector("kept") is None
+
+    @pytest.mark.asyncio
+    async def test_process_runs_are_warm_started(self, monkeypatch, process_engine):
+        graphs["g"] = _random_graph(8)
+        server = NetworkXMCPServer()
+        monkeypatch.setattr(server, "engine", process_engine)
+        before = process_engine.get_stats()["process"]["completed"]
+        cold = await self._call(server, "pagerank", graph="g", tol=1e-8)
+        await self._call(server, "add_edges", graph="g", edges=[[1, 2], [3, 4]])
+        warm = await self._call(server, "pagerank", graph="g", tol=1e-8)
+
+        assert process_engine.get_stats()["process"]["completed"] == before + 2
+        assert not cold["warm_start"]
+        assert warm["warm_start"]
+        assert warm["iterations"] < cold["iterations"]
+        assert last_vector("g") is not None
+
+    @pytest.mark.asyncio
+    async def test_spectral_centrality_tool(self, monkeypatch, process_engine):
+        graphs["g"] = nx.karate_club_graph()
+        server = NetworkXMCPServer()
+        monkeypatch.setattr(server, "engine", process_engine)
+        katz = await self._call(
+            server, "spectral_centrality", graph="g", measure="katz"
+        )
+        eigenvector = await self._call(
+            server, "spectral_centrality", graph="g", engine="sparse"
+        )
+        unknown = await server._call_tool(
+            {
+                "name": "spectral_centrality",
+                "arguments": {"graph": "g", "measure": "closeness"},
+            }
+        )
+
+        assert katz["measure"] == "katz" and katz["most_central"][0] == 33
+        assert eigenvector["measure"] == "eigenvector"
+        assert eigenvector["most_central"][0] == 33
+        assert "Unknown measure" in unknown["error"]["message"]
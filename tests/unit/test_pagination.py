@@ -0,0 +1,305 @@
+"""Tests for summary-only graph info and cursor-paginated listings."""
+
+import json
+
+import networkx as nx
+import pytest
+
+from networkx_mcp.core.basic_operations import (
+    graph_positions,
+    graph_summary,
+    invalidate_summary,
+    list_edges,
+    list_nodes,
+)
+from networkx_mcp.core.pagination import GraphPositions, decode_cursor, encode_cursor
+from networkx_mcp.server import NetworkXMCPServer, graphs
+
+
+def _all_pages(lister, graphs, name, page_size, between_pages=None, **options):
+    key = "nodes" if lister is list_nodes else "edges"
+    items, cursor = [], None
+    while True:
+        page = lister(name, cursor, page_size, graphs=graphs, **options)
+        items.extend(page[key])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+        if between_pages is not None:
+            between_pages()
+            between_pages = None
+
+
+class _Versioned(dict):
+    """A dict of graphs with versions, like the server's GraphDict."""
+
+    def __init__(self, **graphs):
+        super().__init__(graphs)
+        self.versions = dict.fromkeys(graphs, 1)
+
+    def version(self, name):
+        return self.versions[name]
+
+    def bump(self, name):
+        self.versions[name] += 1
+
+
+def _mixed(graph):
+    graph.add_edges_from(nx.gnm_random_graph(40, 120, seed=6, directed=True).edges)
+    graph.add_edges_from([(3, 3), (7, 2), (2, 7)])
+    graph.add_node("isolated")
+    return graph
+
+
+class TestGraphSummary:
+    """Counts, density and degree stats, cached per graph."""
+
+    def test_summary_is_cached_until_invalidated(self):
+        graph = nx.path_graph(4)
+        summary = graph_summary(graph)
+        assert summary["num_edges"] == 3
+        assert summary["degree"] == {"min": 1, "max": 2, "mean": 1.5}
+        assert graph_summary(graph) is summary
+
+        graph.add_edge(0, 3)
+        assert graph_summary(graph) is summary
+        invalidate_summary(graph)
+        assert graph_summary(graph)["degree"]["min"] == 2
+
+    def test_empty_graph(self):
+        summary = graph_summary(nx.Graph())
+        assert summary["degree"] == {"min": 0, "max": 0, "mean": 0.0}
+        assert summary["density"] == 0
+
+
+class TestListNodes:
+    """Stable cursors over nodes."""
+
+    def test_pages_cover_all_nodes(self):
+        store = {"g": nx.path_graph(25)}
+        assert _all_pages(list_nodes, store, "g", 10) == list(range(25))
+
+    def test_last_page_has_no_cursor(self):
+        store = {"g": nx.path_graph(10)}
+        page = list_nodes("g", page_size=10, graphs=store)
+        assert page["next_cursor"] is None
+        assert page["total"] == 10
+
+    def test_removal_before_cursor_skips_nothing(self):
+        store = {"g": nx.path_graph(30)}
+
+        nodes = _all_pages(
+            list_nodes,
+            store,
+            "g",
+            10,
+            between_pages=lambda: store["g"].remove_nodes_from([0, 1, 2]),
+        )
+
+        assert nodes == list(range(30))
+
+    def test_removed_cursor_node_resumes_at_its_position(self):
+        store = {"g": nx.path_graph(30)}
+
+        nodes = _all_pages(
+            list_nodes,
+            store,
+            "g",
+            10,
+            between_pages=lambda: store["g"].remove_node(9),
+        )
+
+        assert nodes == list(range(30))
+
+    def test_nodes_added_during_scan_are_returned(self):
+        store = {"g": nx.path_graph(20)}
+
+        nodes = _all_pages(
+            list_nodes,
+            store,
+            "g",
+            10,
+            between_pages=lambda: store["g"].add_node("new"),
+        )
+
+        assert nodes == list(range(20)) + ["new"]
+
+    def test_attribute_projection(self):
+        graph = nx.Graph()
+        graph.add_node("a", color="red", weight=2)
+        graph.add_node("b")
+        page = list_nodes("g", attributes=["color"], graphs={"g": graph})
+        assert page["nodes"] == [
+            {"id": "a", "attributes": {"color": "red"}},
+            {"id": "b", "attributes": {}},
+        ]
+
+    @pytest.mark.parametrize("page_size", [0, 10001, "5"])
+    def test_bad_page_size(self, page_size):
+        with pytest.raises(ValueError, match="page_size"):
+            list_nodes("g", page_size=page_size, graphs={"g": nx.Graph()})
+
+    def test_bad_cursor(self):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            list_nodes("g", cursor="not a cursor", graphs={"g": nx.path_graph(3)})
+
+    def test_cursor_round_trip(self):
+        assert decode_cursor(encode_cursor(7, '"x"')) == (7, '"x"')
+
+
+class TestListEdges:
+    """Stable cursors over edges."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_pages_cover_all_edges(self, directed):
+        graph = nx.gnm_random_graph(30, 80, seed=5, directed=directed)
+        edges = _all_pages(list_edges, {"g": graph}, "g", 7)
+        assert edges == [list(edge) for edge in graph.edges()]
+
+    def test_edge_removal_before_cursor_skips_nothing(self):
+        graph = nx.gnm_random_graph(30, 80, seed=5)
+        expected = [list(edge) for edge in graph.edges()]
+        removed = expected[:3]
+
+        edges = _all_pages(
+            list_edges,
+            {"g": graph},
+            "g",
+            20,
+            between_pages=lambda: graph.remove_edges_from(removed),
+        )
+
+        assert edges == expected
+
+    def test_multigraph_edges_and_attributes(self):
+        graph = nx.MultiGraph()
+        graph.add_edge(1, 2, weight=3)
+        graph.add_edge(1, 2, weight=4)
+        page = list_edges("g", attributes=["weight"], graphs={"g": graph})
+        assert page["edges"] == [
+            {"source": 1, "target": 2, "key": 0, "attributes": {"weight": 3}},
+            {"source": 1, "target": 2, "key": 1, "attributes": {"weight": 4}},
+        ]
+
+
+class TestPositions:
+    """Pages of a known graph version start at their position directly."""
+
+    @pytest.mark.parametrize(
+        "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+    )
+    @pytest.mark.parametrize("page_size", [1, 7, 500])
+    def test_pages_match_iteration_order(self, graph_class, page_size):
+        graph = _mixed(graph_class())
+        store = _Versioned(g=graph)
+        nodes = _all_pages(list_nodes, store, "g", page_size)
+        edges = _all_pages(list_edges, store, "g", page_size)
+        assert nodes == list(graph)
+        assert edges == _all_pages(list_edges, {"g": graph}, "g", 1000)
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_mutations_between_versions(self, directed):
+        graph = _mixed(nx.DiGraph() if directed else nx.Graph())
+        expected_nodes, expected_edges = list(graph), [list(e) for e in graph.edges]
+        store = _Versioned(g=graph)
+
+        def change(mutate):
+            def between_pages():
+                mutate()
+                store.bump("g")
+
+            return between_pages
+
+        removed = expected_nodes[:3]
+        nodes = _all_pages(
+            list_nodes, store, "g", 10, change(lambda: graph.remove_nodes_from(removed))
+        )
+        assert nodes == expected_nodes
+
+        graph = _mixed(nx.DiGraph() if directed else nx.Graph())
+        store = _Versioned(g=graph)
+        # Before and after the cursor
+        removed = expected_edges[:3] + expected_edges[22:25]
+        edges = _all_pages(
+            list_edges, store, "g", 20, change(lambda: graph.remove_edges_from(removed))
+        )
+        assert edges == expected_edges[:22] + expected_edges[25:]
+
+    def test_index_is_kept_per_version(self):
+        graph = nx.path_graph(5)
+        positions = graph_positions(graph, 1)
+        assert graph_positions(graph, 1) is positions
+        assert graph_positions(graph, 2) is not positions
+        assert graph_positions(graph, None) is None
+        invalidate_summary(graph)
+        assert graph_positions(graph, 2).version == 2
+
+    def test_page_cost_does_not_grow_with_offset(self, monkeypatch):
+        graph = nx.path_graph(10000)
+        store = _Versioned(g=graph)
+        cursor = list_edges("g", page_size=9000, graphs=store)["next_cursor"]
+        nodes_cursor = list_nodes("g", page_size=9000, graphs=store)["next_cursor"]
+        walked = []
+        node_edges = GraphPositions._node_edges
+        monkeypatch.setattr(
+            GraphPositions,
+            "_node_edges",
+            lambda self, graph, j: walked.append(j) or node_edges(self, graph, j),
+        )
+        monkeypatch.setattr(
+            GraphPositions, "__init__", lambda *args: pytest.fail("index rebuilt")
+        )
+
+        page = list_edges("g", cursor, page_size=10, graphs=store)
+        nodes = list_nodes("g", nodes_cursor, page_size=10, graphs=store)
+
+        assert page["edges"][0] == [9000, 9001]
+        assert len(walked) <= 13
+        assert nodes["nodes"] == list(range(9000, 9010))
+
+
+class TestServerTools:
+    """get_info and the listing tools through tools/call."""
+
+    def setup_method(self):
+        graphs.clear()
+
+    async def _call(self, server, tool, **arguments):
+        response = await server.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": tool, "arguments": arguments},
+            }
+        )
+        return json.loads(response["result"]["content"][0]["text"])
+
+    @pytest.mark.asyncio
+    async def test_get_info_summary_follows_writes(self):
+        server = NetworkXMCPServer()
+        server.initialized = True
+        await self._call(server, "create_graph", name="g")
+        await self._call(server, "add_edges", graph="g", edges=[[1, 2], [2, 3]])
+        info = await self._call(server, "get_info", graph="g")
+        assert info["degree"]["max"] == 2
+
+        # Same node count, so only the write invalidation can catch this
+        await self._call(server, "add_edges", graph="g", edges=[[1, 3]])
+        info = await self._call(server, "get_info", graph="g")
+        assert info["edges"] == 3
+        assert info["degree"] == {"min": 2, "max": 2, "mean": 2.0}
+
+    @pytest.mark.asyncio
+    async def test_list_nodes_tool(self):
+        graphs["g"] = nx.path_graph(5)
+        server = NetworkXMCPServer()
+        server.initialized = True
+
+        first = await self._call(server, "list_nodes", graph="g", page_size=3)
+        second = await self._call(
+            server, "list_nodes", graph="g", cursor=first["next_cursor"]
+        )
+
+        assert first["nodes"] + second["nodes"] == [0, 1, 2, 3, 4]
+        assert second["next_cursor"] is None
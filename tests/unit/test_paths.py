@@ -0,0 +1,133 @@
+"""Tests for batched shortest paths."""
+
+import json
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
+
+from networkx_mcp.core import paths
+from networkx_mcp.core.paths import MAX_BATCH_PAIRS, shortest_paths_batch
+from networkx_mcp.server import NetworkXMCPServer, graphs
+
+
+def _weighted_graph(directed):
+    graph = nx.gnp_random_graph(120, 0.04, seed=1, directed=directed)
+    for i, (u, v) in enumerate(graph.edges()):
+        graph.edges[u, v]["weight"] = 1 + (i * 7) % 5
+    return graph
+
+
+def _pairs(graph, count=60):
+    nodes = list(graph)
+    # Few sources, many targets each
+    return [(nodes[i % 6], nodes[(i * 13) % len(nodes)]) for i in range(count)]
+
+
+class TestShortestPathsBatch:
+    """Grouped searches agree with NetworkX pair by pair."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    @pytest.mark.parametrize("weight", [None, "weight"])
+    def test_matches_networkx(self, directed, weight, assert_valid_path):
+        graph = _weighted_graph(directed)
+        pairs = _pairs(graph)
+        results = shortest_paths_batch(graph, pairs, weight)
+
+        assert [(r["source"], r["target"]) for r in results] == pairs
+        for (source, target), result in zip(pairs, results):
+            try:
+                expected = nx.shortest_path_length(graph, source, target, weight)
+            except nx.NetworkXNoPath:
+                assert result["error"].startswith("No path found")
+                continue
+            assert result["length"] == expected
+            assert_valid_path(graph, result["path"], source, target)
+
+    def test_multigraph_uses_cheapest_edge(self):
+        graph = nx.MultiGraph()
+        graph.add_edge("a", "b", weight=5)
+        graph.add_edge("a", "b", weight=1)
+        graph.add_edge("b", "c", weight=1)
+        [result] = shortest_paths_batch(graph, [("a", "c")], "weight")
+        assert result["length"] == 2 and result["path"] == ["a", "b", "c"]
+
+    def test_errors_in_input_order(self):
+        graph = nx.Graph([(1, 2), (3, 4)])
+        results = shortest_paths_batch(graph, [(1, 2), (1, 9), (1, 3), (2, 2)])
+        assert results[0]["path"] == [1, 2]
+        assert results[1]["error"] == "Node not found: 9"
+        assert results[2]["error"] == "No path found between 1 and 3"
+        assert results[3] == {"source": 2, "target": 2, "path": [2], "length": 0}
+
+    def test_one_search_per_source(self):
+        graph = nx.path_graph(50)
+        pairs = [(0, 10), (5, 1), (0, 3), (5, 40), (0, 10)]
+        with patch.object(paths, "_bfs", wraps=paths._bfs) as bfs:
+            shortest_paths_batch(graph, pairs)
+        assert [call.args[1] for call in bfs.call_args_list] == [0, 5]
+        assert bfs.call_args_list[0].args[2] == {3, 10}
+
+    @staticmethod
+    def _search(graph, source, targets, weight):
+        if weight is None:
+            return paths._bfs(graph, source, targets)
+        return paths._dijkstra(graph, source, targets, weight)
+
+    @pytest.mark.parametrize("weight", [None, "weight"])
+    def test_stops_once_targets_are_settled(self, weight):
+        graph = nx.grid_2d_graph(100, 100)
+        targets = {(1, 2), (2, 1), (3, 0), (0, 3)}
+        pred, dist, complete = self._search(graph, (0, 0), targets, weight)
+        assert complete and targets <= dist.keys()
+        assert len(pred) < 30
+
+    @pytest.mark.parametrize("weight", [None, "weight"])
+    def test_hands_far_targets_to_pair_searches(self, weight, assert_valid_path):
+        graph = nx.barabasi_albert_graph(3000, 3, seed=2)
+        targets = {2999, 2998}
+        _, dist, complete = self._search(graph, 0, targets, weight)
+        assert not complete and not targets <= dist.keys()
+
+        results = shortest_paths_batch(graph, [(0, 2999), (0, 2998)], weight)
+        for result in results:
+            expected = nx.shortest_path_length(graph, 0, result["target"], weight)
+            assert result["length"] == expected
+            assert_valid_path(graph, result["path"], 0, result["target"])
+
+    def test_unreachable_after_complete_search(self):
+        graph = nx.Graph([(0, 1), (1, 2)])
+        graph.add_node(3)
+        _, _, complete = paths._bfs(graph, 0, {2, 3})
+        assert complete
+
+    def test_invalid_input(self):
+        graph = nx.Graph([(0, 1, {"weight": -1})])
+        with pytest.raises(ValueError):
+            shortest_paths_batch(graph, [(0, 1)], "weight")
+        with pytest.raises(ValueError):
+            shortest_paths_batch(graph, [(0, 1, 2)])
+        with pytest.raises(ValueError):
+            shortest_paths_batch(graph, [(0, 1)] * (MAX_BATCH_PAIRS + 1))
+
+
+class TestTool:
+    """The shortest_paths_batch tool."""
+
+    @pytest.mark.asyncio
+    async def test_tool(self):
+        graphs.clear()
+        graphs["g"] = nx.DiGraph([("a", "b"), ("b", "c")])
+        try:
+            response = await NetworkXMCPServer()._call_tool(
+                {
+                    "name": "shortest_paths_batch",
+                    "arguments": {"graph": "g", "pairs": [["a", "c"], ["c", "a"]]},
+                }
+            )
+        finally:
+            graphs.clear()
+
+        results = json.loads(response["content"][0]["text"])["results"]
+        assert results[0]["path"] == ["a", "b", "c"]
+        assert results[1]["error"] == "No path found between c and a"
@@ -0,0 +1,140 @@
+"""Tests for progress notifications and partial results."""
+
+import asyncio
+import io
+import json
+
+import networkx as nx
+import pytest
+
+from networkx_mcp.core.basic_operations import _betweenness_with_progress
+from networkx_mcp.progress import ProgressReporter, report_progress, reporting
+from networkx_mcp.server import NetworkXMCPServer, graphs
+
+
+def _betweenness_call(req_id, meta=None):
+    params = {"name": "betweenness_centrality", "arguments": {"graph": "g"}}
+    if meta is not None:
+        params["_meta"] = meta
+    return {"jsonrpc": "2.0", "id": req_id, "method": "tools/call", "params": params}
+
+
+def _serve(server, monkeypatch, capsys, requests):
+    lines = "".join(json.dumps(r) + "\n" for r in requests)
+    monkeypatch.setattr("sys.stdin", io.StringIO(lines))
+    asyncio.run(server.run())
+    out = capsys.readouterr().out
+    return [json.loads(line) for line in out.splitlines() if line.strip()]
+
+
+class TestProgressReporter:
+    """Rate limiting and partial results of a single reporter."""
+
+    def test_rate_limited_but_final_always_sent(self):
+        sent = []
+        reporter = ProgressReporter("t", sent.append, min_interval=60)
+
+        assert reporter.report(1, 10)
+        assert not reporter.report(5, 10)
+        assert reporter.report(10, 10, "done")
+
+        assert [n["params"]["progress"] for n in sent] == [1, 10]
+        assert sent[-1]["method"] == "notifications/progress"
+        assert sent[-1]["params"] == {
+            "progressToken": "t",
+            "progress": 10,
+            "total": 10,
+            "message": "done",
+        }
+
+    def test_progress_must_increase(self):
+        sent = []
+        reporter = ProgressReporter(1, sent.append, min_interval=0)
+
+        assert reporter.report(3)
+        assert not reporter.report(3)
+        assert not reporter.report(2)
+        assert len(sent) == 1
+
+    def test_partial_computed_only_when_requested(self):
+        calls = []
+
+        def partial():
+            calls.append(1)
+            return {"top": 1}
+
+        plain, with_partial = [], []
+        ProgressReporter("a", plain.append).report(1, partial=partial)
+        ProgressReporter("b", with_partial.append, True).report(1, partial=partial)
+
+        assert "partial" not in plain[0]["params"]
+        assert with_partial[0]["params"]["partial"] == {"top": 1}
+        assert len(calls) == 1
+
+    def test_report_without_reporter_is_noop(self):
+        assert report_progress(1, 2) is False
+        with reporting(ProgressReporter("t", lambda n: None)):
+            assert report_progress(1, 2) is True
+        assert report_progress(2, 2) is False
+
+
+class TestBetweennessWithProgress:
+    """Chunked betweenness matches NetworkX and reports every chunk."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_matches_networkx(self, directed):
+        graph = nx.gnm_random_graph(80, 300, seed=3, directed=directed)
+        sent = []
+        with reporting(ProgressReporter("t", sent.append, True, min_interval=0)):
+            centrality = _betweenness_with_progress(graph, chunks=8)
+
+        expected = nx.betweenness_centrality(graph)
+        assert centrality == pytest.approx(expected)
+        assert [n["params"]["progress"] for n in sent] == list(range(10, 81, 10))
+        partial = sent[0]["params"]["partial"]
+        assert partial["sources_done"] == 10
+        assert len(partial["centrality"]) == 10
+
+    def test_tiny_graph(self):
+        assert _betweenness_with_progress(nx.path_graph(2)) == {0: 0.0, 1: 0.0}
+
+
+class TestServerProgress:
+    """notifications/progress around a tools/call that asked for them."""
+
+    def setup_method(self):
+        graphs.clear()
+
+    def test_notifications_precede_response(self, monkeypatch, capsys):
+        graphs["g"] = nx.karate_club_graph()
+        server = NetworkXMCPServer()
+        server.initialized = True
+
+        messages = _serve(
+            server,
+            monkeypatch,
+            capsys,
+            [_betweenness_call(7, {"progressToken": "p7", "partialResults": True})],
+        )
+
+        *notifications, response = messages
+        assert notifications
+        assert all(n["method"] == "notifications/progress" for n in notifications)
+        assert all(n["params"]["progressToken"] == "p7" for n in notifications)
+        assert "partial" in notifications[0]["params"]
+        assert notifications[-1]["params"]["progress"] == 34
+        assert notifications[-1]["params"]["total"] == 34
+
+        assert response["id"] == 7
+        result = json.loads(response["result"]["content"][0]["text"])
+        assert result["most_central"][0] == 0
+
+    @pytest.mark.parametrize("meta", [None, {}, {"progressToken": True}, "p"])
+    def test_no_notifications_without_token(self, monkeypatch, capsys, meta):
+        graphs["g"] = nx.karate_club_graph()
+        server = NetworkXMCPServer()
+        server.initialized = True
+
+        messages = _serve(server, monkeypatch, capsys, [_betweenness_call(1, meta)])
+
+        assert [m.get("id") for m in messages] == [1]
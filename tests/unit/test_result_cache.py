@@ -0,0 +1,204 @@
+"""Tests for version-keyed memoization of algorithm results."""
+
+import json
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
+
+from networkx_mcp import server as server_module
+from networkx_mcp.core import basic_operations
+from networkx_mcp.graph_cache import GraphCache, GraphDict
+from networkx_mcp.result_cache import MISS, ResultCache, memoized, result_key
+from networkx_mcp.server import NetworkXMCPServer, graphs
+from networkx_mcp.snapshots import bind_graph
+
+
+class TestResultCache:
+    """LRU cache with a byte budget and per-graph invalidation."""
+
+    def test_hit_and_miss(self):
+        cache = ResultCache()
+        key = result_key("g", 1, "pagerank", {})
+
+        assert cache.get(key, MISS) is MISS
+        cache.put(key, {"pagerank": {"a": 1.0}})
+        assert cache.get(key) == {"pagerank": {"a": 1.0}}
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_budget_evicts_least_recently_used(self):
+        cache = ResultCache(max_mb=300 / 1024 / 1024)
+        keys = [result_key("g", 1, "tool", {"i": i}) for i in range(3)]
+        for key in keys[:2]:
+            cache.put(key, "x" * 100)
+        cache.get(keys[0])
+        cache.put(keys[2], "x" * 100)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.evictions == 1
+        assert cache.total_bytes <= cache.max_bytes
+        # Larger than the whole budget: not cached at all
+        assert not cache.put(keys[1], "x" * 1000)
+
+    def test_invalidate_keeps_current_version(self):
+        cache = ResultCache()
+        for version in (1, 2):
+            cache.put(result_key("g", version, "tool", {}), version)
+        cache.put(result_key("h", 1, "tool", {}), 0)
+
+        assert cache.invalidate("g", keep_version=2) == 1
+        assert cache.get(result_key("g", 2, "tool", {})) == 2
+        assert cache.invalidate("g") == 1
+        assert cache.get_stats()["graphs"] == 1
+
+    def test_unserializable_result_is_not_cached(self):
+        cache = ResultCache()
+        assert not cache.put(result_key("g", 1, "tool", {}), object())
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        assert not ResultCache(max_mb=0).enabled
+
+
+@memoized("scaled_order")
+def _scaled_order(graph_name, factor=1, graphs=None):
+    _scaled_order.calls += 1
+    return graphs[graph_name].number_of_nodes() * factor
+
+
+_scaled_order.calls = 0
+
+
+class TestMemoized:
+    """Calls through a versioned store are served per graph version."""
+
+    def setup_method(self):
+        self.results = ResultCache()
+        self.patch = patch(
+            "networkx_mcp.result_cache.get_result_cache", return_value=self.results
+        )
+        self.patch.start()
+        self.cache = GraphCache(cleanup_interval=3600)
+        self.graphs = GraphDict(self.cache)
+        self.graphs["g"] = nx.path_graph(4)
+        _scaled_order.calls = 0
+
+    def teardown_method(self):
+        self.patch.stop()
+        self.cache.shutdown()
+
+    def test_repeated_call_is_served_from_cache(self):
+        assert _scaled_order("g", graphs=self.graphs) == 4
+        assert _scaled_order("g", 1, self.graphs) == 4
+        assert _scaled_order("g", factor=2, graphs=self.graphs) == 8
+        assert _scaled_order.calls == 2
+
+    def test_new_version_is_recomputed(self):
+        _scaled_order("g", graphs=self.graphs)
+        write = self.cache.begin_write("g")
+        write.graph.add_node(99)
+        self.cache.commit(write)
+
+        assert _scaled_order("g", graphs=self.graphs) == 5
+        assert _scaled_order.calls == 2
+
+    def test_plain_dict_is_not_memoized(self):
+        plain = {"g": nx.path_graph(4)}
+        _scaled_order("g", graphs=plain)
+        _scaled_order("g", graphs=plain)
+        assert _scaled_order.calls == 2
+        assert len(self.results) == 0
+
+    def test_bound_snapshot_version_is_used(self):
+        with self.cache.snapshot("g") as snapshot:
+            write = self.cache.begin_write("g")
+            write.graph.add_node(99)
+            self.cache.commit(write)
+            with bind_graph("g", snapshot):
+                assert _scaled_order("g", graphs=self.graphs) == 4
+            assert self.graphs.version("g") != snapshot.version
+        assert _scaled_order("g", graphs=self.graphs) == 5
+
+    def test_write_in_progress_is_not_memoized(self):
+        write = self.cache.begin_write("g")
+        with bind_graph("g", write):
+            assert self.graphs.version("g") is None
+            _scaled_order("g", graphs=self.graphs)
+        self.cache.commit(write)
+        assert len(self.results) == 0
+
+
+class TestServerMemoization:
+    """Tool results are reused until the graph is written to."""
+
+    def setup_method(self):
+        graphs.clear()
+        self.results = ResultCache()
+        self.patches = [
+            patch(f"{module}.get_result_cache", return_value=self.results)
+            for module in ("networkx_mcp.result_cache", "networkx_mcp.server")
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self.patches:
+            p.stop()
+
+    @staticmethod
+    async def _call(server, tool, **arguments):
+        result = await server._call_tool({"name": tool, "arguments": arguments})
+        return json.loads(result["content"][0]["text"])
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_results(self):
+        graphs["g"] = nx.path_graph(3)
+        server = NetworkXMCPServer()
+        with patch.object(
+            basic_operations, "run_pagerank", wraps=basic_operations.run_pagerank
+        ) as computed:
+            first = await self._call(server, "pagerank", graph="g")
+            assert await self._call(server, "pagerank", graph="g") == first
+            assert computed.call_count == 1
+
+            await self._call(server, "add_edges", graph="g", edges=[[2, 3]])
+            assert len(self.results) == 0
+            changed = await self._call(server, "pagerank", graph="g")
+
+        assert computed.call_count == 2
+        assert len(changed["pagerank"]) == 4
+
+    @pytest.mark.asyncio
+    async def test_process_results_are_memoized(self, monkeypatch, process_engine):
+        graphs["big"] = nx.karate_club_graph()
+        server = NetworkXMCPServer()
+        monkeypatch.setattr(server, "engine", process_engine)
+        before = process_engine.get_stats()["process"]["completed"]
+        first = await self._call(server, "community_detection", graph="big")
+        second = await self._call(server, "community_detection", graph="big")
+
+        assert first == second
+        assert process_engine.get_stats()["process"]["completed"] == before + 1
+        assert self.results.hits == 1
+
+    def test_direct_mutation_bumps_version(self):
+        server_module.create_graph("g")
+        server_module.add_edges("g", [[1, 2]])
+        assert server_module.connected_components("g")["num_components"] == 1
+        server_module.add_edges("g", [[3, 4]])
+        assert server_module.connected_components("g")["num_components"] == 2
+
+    @pytest.mark.asyncio
+    async def test_health_status_reports_result_cache(self):
+        graphs["g"] = nx.path_graph(3)
+        server = NetworkXMCPServer(enable_monitoring=True)
+        await self._call(server, "degree_centrality", graph="g")
+        await self._call(server, "degree_centrality", graph="g")
+
+        status = await self._call(server, "health_status")
+        assert status["result_cache"]["hits"] == 1
+        assert status["result_cache"]["misses"] == 1
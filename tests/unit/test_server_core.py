@@ -696,8 +696,8 @@ class TestGetToolsMethod:
         """Test _get_tools returns expected number of tools."""
         tools = self.server._get_tools()
 
-        # Should have 20 tools based on actual count
-        assert len(tools) == 20
+        # Should have 25 tools based on actual count
+        assert len(tools) == 25
 
     def test_get_tools_structure(self):
         """Test each tool has required MCP schema structure."""
@@ -0,0 +1,371 @@
+"""Tests for concurrent request dispatch in the stdio server loop."""
+
+import asyncio
+import io
+import json
+import time
+
+import networkx as nx
+import pytest
+
+from networkx_mcp import server as server_module
+from networkx_mcp.dispatch import AsyncRWLock, GraphLocks, graph_access, plan_batch
+from networkx_mcp.server import NetworkXMCPServer, graphs
+from tests.factories import MCPFactory
+
+
+def _run_server(server, monkeypatch, capsys, requests):
+    lines = "".join(json.dumps(r) + "\n" for r in requests)
+    monkeypatch.setattr("sys.stdin", io.StringIO(lines))
+    asyncio.run(server.run())
+    out = capsys.readouterr().out
+    return [json.loads(line) for line in out.splitlines() if line.strip()]
+
+
+class TestAsyncRWLock:
+    """Reader/writer lock semantics."""
+
+    @pytest.mark.asyncio
+    async def test_readers_share(self):
+        lock = AsyncRWLock()
+        await lock.acquire(write=False)
+        await asyncio.wait_for(lock.acquire(write=False), timeout=1)
+        lock.release(write=False)
+        lock.release(write=False)
+        assert lock.idle
+
+    @pytest.mark.asyncio
+    async def test_fifo_order_preserved(self):
+        lock = AsyncRWLock()
+        order = []
+
+        async def worker(name, write, hold):
+            await lock.acquire(write)
+            order.append(name)
+            await asyncio.sleep(hold)
+            lock.release(write)
+
+        tasks = [
+            asyncio.create_task(worker("read1", False, 0.05)),
+            asyncio.create_task(worker("write", True, 0.01)),
+            asyncio.create_task(worker("read2", False, 0.01)),
+        ]
+        await asyncio.gather(*tasks)
+
+        # read2 must not overtake the queued write
+        assert order == ["read1", "write", "read2"]
+        assert lock.idle
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_block(self):
+        lock = AsyncRWLock()
+        await lock.acquire(write=True)
+        waiter = asyncio.create_task(lock.acquire(write=True))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        lock.release(write=True)
+        assert lock.idle
+
+    @pytest.mark.asyncio
+    async def test_graph_locks_dropped_when_idle(self):
+        locks = GraphLocks()
+        await locks.acquire("g", write=True)
+        assert len(locks) == 1
+        locks.release("g", write=True)
+        assert len(locks) == 0
+
+
+class TestGraphAccess:
+    """Graph/read-write classification of requests."""
+
+    def test_tool_call_on_graph(self):
+        assert graph_access(MCPFactory.tool_call(1, "get_info", graph="g")) == (
+            "g",
+            False,
+        )
+        assert graph_access(
+            MCPFactory.tool_call(1, "add_edges", graph="g", edges=[])
+        ) == (
+            "g",
+            True,
+        )
+
+    def test_create_graph_uses_name(self):
+        assert graph_access(MCPFactory.tool_call(1, "create_graph", name="g")) == (
+            "g",
+            True,
+        )
+
+    def test_non_graph_requests(self):
+        assert graph_access(MCPFactory.tool_call(1, "resolve_doi", doi="10.1/x")) == (
+            None,
+            False,
+        )
+        assert graph_access({"method": "tools/list", "id": 1}) == (None, False)
+
+
+class TestConcurrentRun:
+    """The concurrent server loop answers cheap calls ahead of slow ones."""
+
+    def setup_method(self):
+        graphs.clear()
+
+    def test_sequential_by_default(self):
+        server = NetworkXMCPServer()
+        assert server.max_concurrency == 1
+
+    def test_cheap_call_not_blocked_by_slow_call(self, monkeypatch, capsys):
+        graphs["slow"] = nx.path_graph(5)
+        graphs["fast"] = nx.path_graph(3)
+
+        def slow_betweenness(graph_name, *options):
+            time.sleep(0.5)
+            return {"centrality": {}, "most_central": None}
+
+        monkeypatch.setattr(server_module, "betweenness_centrality", slow_betweenness)
+
+        server = NetworkXMCPServer(max_concurrency=4)
+        server.initialized = True
+        responses = _run_server(
+            server,
+            monkeypatch,
+            capsys,
+            [
+                MCPFactory.tool_call(1, "betweenness_centrality", graph="slow"),
+                MCPFactory.tool_call(2, "get_info", graph="fast"),
+            ],
+        )
+
+        assert [r["id"] for r in responses] == [2, 1]
+        assert all("result" in r for r in responses)
+
+    def test_same_graph_calls_stay_ordered(self, monkeypatch, capsys):
+        server = NetworkXMCPServer(max_concurrency=4)
+        server.initialized = True
+        responses = _run_server(
+            server,
+            monkeypatch,
+            capsys,
+            [
+                MCPFactory.tool_call(1, "create_graph", name="ordered"),
+                MCPFactory.tool_call(
+                    2, "add_edges", graph="ordered", edges=[[1, 2], [2, 3]]
+                ),
+                MCPFactory.tool_call(3, "get_info", graph="ordered"),
+            ],
+        )
+
+        by_id = {r["id"]: r for r in responses}
+        info = json.loads(by_id[3]["result"]["content"][0]["text"])
+        assert info["nodes"] == 3
+        assert info["edges"] == 2
+
+    def test_write_does_not_wait_for_slow_read(self, monkeypatch, capsys):
+        graphs["snap"] = nx.path_graph(5)
+        seen = []
+
+        def slow_betweenness(graph_name, *options):
+            graph = graphs[graph_name]
+            time.sleep(0.5)
+            seen.append(graph.number_of_edges())
+            return {"centrality": {}, "most_central": None}
+
+        monkeypatch.setattr(server_module, "betweenness_centrality", slow_betweenness)
+
+        server = NetworkXMCPServer(max_concurrency=4)
+        server.initialized = True
+        responses = _run_server(
+            server,
+            monkeypatch,
+            capsys,
+            [
+                MCPFactory.tool_call(1, "betweenness_centrality", graph="snap"),
+                MCPFactory.tool_call(2, "add_edges", graph="snap", edges=[[4, 5]]),
+                MCPFactory.tool_call(3, "get_info", graph="snap"),
+            ],
+        )
+
+        # The write and the read after it finish first; the slow read
+        # keeps seeing the version it started on
+        assert [r["id"] for r in responses] == [2, 3, 1]
+        info = json.loads(responses[1]["result"]["content"][0]["text"])
+        assert info["edges"] == 5
+        assert seen == [4]
+        assert graphs["snap"].number_of_edges() == 5
+
+    @pytest.mark.asyncio
+    async def test_waiting_for_a_write_does_not_block_the_loop(self):
+        graphs["held"] = nx.path_graph(3)
+        graphs["free"] = nx.path_graph(4)
+        server = NetworkXMCPServer()
+        write = graphs.begin_write("held")
+        try:
+            read = asyncio.create_task(
+                server._call_tool({"name": "get_info", "arguments": {"graph": "held"}})
+            )
+            added = asyncio.create_task(
+                server._call_tool(
+                    {
+                        "name": "add_nodes",
+                        "arguments": {"graph": "held", "nodes": [9]},
+                    }
+                )
+            )
+            # Both wait for the write; calls on other graphs go on
+            other = await asyncio.wait_for(
+                server._call_tool({"name": "get_info", "arguments": {"graph": "free"}}),
+                timeout=5,
+            )
+            assert json.loads(other["content"][0]["text"])["nodes"] == 4
+            assert not read.done() and not added.done()
+        finally:
+            graphs.commit(write)
+
+        info = json.loads((await read)["content"][0]["text"])
+        await added
+        assert info["nodes"] in (3, 4)
+        assert graphs["held"].number_of_nodes() == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_hands_the_graph_back(self, monkeypatch):
+        handed_back = []
+        release = server_module._hand_back
+
+        def hand_back(task):
+            release(task)
+            handed_back.append(task.result())
+
+        monkeypatch.setattr(server_module, "_hand_back", hand_back)
+        graphs["held"] = nx.path_graph(3)
+        server = NetworkXMCPServer()
+        write = graphs.begin_write("held")
+        calls = [
+            asyncio.create_task(
+                server._call_tool({"name": name, "arguments": arguments})
+            )
+            for name, arguments in [
+                ("get_info", {"graph": "held"}),
+                ("add_nodes", {"graph": "held", "nodes": [9]}),
+            ]
+        ]
+        await asyncio.sleep(0.05)
+        for call in calls:
+            call.cancel()
+        graphs.commit(write)
+        await asyncio.gather(*calls, return_exceptions=True)
+
+        # The snapshot and the write acquired after cancelling are released
+        deadline = time.monotonic() + 5
+        while len(handed_back) < 2 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        assert len(handed_back) == 2
+        assert graphs._cache._readers == {} and graphs._cache._writers == {}
+        assert graphs["held"].number_of_nodes() == 3
+
+    def test_initialize_handled_before_tool_calls(self, monkeypatch, capsys):
+        server = NetworkXMCPServer(max_concurrency=2)
+        responses = _run_server(
+            server,
+            monkeypatch,
+            capsys,
+            [
+                {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+                MCPFactory.tool_call(2, "create_graph", name="after_init"),
+            ],
+        )
+
+        by_id = {r["id"]: r for r in responses}
+        assert "result" in by_id[1]
+        assert "result" in by_id[2]
+
+
+class TestPlanBatch:
+    """Grouping of batch entries into stages and lanes."""
+
+    def test_same_graph_shares_lane(self):
+        batch = [
+            MCPFactory.tool_call(1, "add_nodes", graph="a", nodes=[1]),
+            MCPFactory.tool_call(2, "add_nodes", graph="b", nodes=[1]),
+            MCPFactory.tool_call(3, "get_info", graph="a"),
+        ]
+        assert plan_batch(batch) == [[[0, 2], [1]]]
+
+    def test_non_tool_methods_are_barriers(self):
+        batch = [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize"},
+            MCPFactory.tool_call(2, "get_info", graph="a"),
+            {"jsonrpc": "2.0", "id": 3, "method": "tools/list"},
+            MCPFactory.tool_call(4, "resolve_doi", doi="10.1/x"),
+            MCPFactory.tool_call(5, "resolve_doi", doi="10.1/y"),
+        ]
+        assert plan_batch(batch) == [[[0]], [[1]], [[2]], [[3], [4]]]
+
+
+class TestBatchRequests:
+    """JSON-RPC 2.0 batch handling in handle_request."""
+
+    def setup_method(self):
+        graphs.clear()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    async def test_batch_returns_responses_in_order(self, max_concurrency):
+        server = NetworkXMCPServer(max_concurrency=max_concurrency)
+        batch = [{"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {}}]
+        for name in ("a", "b"):
+            batch.append(
+                MCPFactory.tool_call(f"{name}-create", "create_graph", name=name)
+            )
+            batch.append(
+                MCPFactory.tool_call(
+                    f"{name}-edges", "add_edges", graph=name, edges=[[1, 2], [2, 3]]
+                )
+            )
+            batch.append(MCPFactory.tool_call(f"{name}-info", "get_info", graph=name))
+
+        responses = await server.handle_request(batch)
+
+        assert [r["id"] for r in responses] == [r["id"] for r in batch]
+        info = json.loads(responses[3]["result"]["content"][0]["text"])
+        assert (info["nodes"], info["edges"], info["directed"]) == (3, 2, False)
+
+    @pytest.mark.asyncio
+    async def test_notifications_get_no_response(self):
+        server = NetworkXMCPServer()
+        server.initialized = True
+        batch = [
+            {"jsonrpc": "2.0", "method": "initialized"},
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {"name": "create_graph", "arguments": {"name": "n"}},
+            },
+        ]
+
+        assert await server.handle_request(batch) is None
+        assert "n" in graphs
+
+    @pytest.mark.asyncio
+    async def test_invalid_batches(self):
+        server = NetworkXMCPServer()
+
+        response = await server.handle_request([])
+        assert response["error"]["code"] == -32600
+
+        responses = await server.handle_request([1, {"id": 2, "method": "bogus"}])
+        assert responses[0]["error"]["code"] == -32600
+        assert responses[1]["error"]["code"] == -32601
+
+    def test_batch_over_stdio(self, monkeypatch, capsys):
+        server = NetworkXMCPServer(max_concurrency=2)
+        server.initialized = True
+        batch = [
+            MCPFactory.tool_call(1, "create_graph", name="stdio_batch"),
+            MCPFactory.tool_call(2, "add_nodes", graph="stdio_batch", nodes=[1, 2, 3]),
+        ]
+
+        (responses,) = _run_server(server, monkeypatch, capsys, [batch])
+
+        assert [r["id"] for r in responses] == [1, 2]
@@ -0,0 +1,74 @@
+"""Tests for the table-driven tool registry."""
+
+import json
+
+import pytest
+
+from networkx_mcp.encoding import PreEncoded, encode_response
+from networkx_mcp.execution import CostClass
+from networkx_mcp.server import NetworkXMCPServer
+from networkx_mcp.tool_registry import TOOLS, ToolRegistry, ToolSpec
+
+
+def _handler(server, args):
+    return {"ok": True}
+
+
+class TestToolRegistry:
+    """Registration, lookup and the cached listing."""
+
+    def test_register_and_lookup(self):
+        registry = ToolRegistry()
+        registry.register(ToolSpec("ping", "Ping", {"type": "object"}, _handler))
+
+        assert "ping" in registry
+        assert registry.get("ping").handler is _handler
+        assert registry.get("missing") is None
+        assert registry.get(None) is None
+
+    def test_duplicate_and_invalid_registrations(self):
+        registry = ToolRegistry()
+        registry.register(ToolSpec("ping", "Ping", {}, _handler))
+        with pytest.raises(ValueError):
+            registry.register(ToolSpec("ping", "Ping", {}, _handler))
+        with pytest.raises(ValueError):
+            registry.register(
+                ToolSpec("heavy", "Heavy", {}, _handler, cost=CostClass.PROCESS)
+            )
+
+    def test_listing_is_built_once(self):
+        registry = ToolRegistry()
+        registry.register(ToolSpec("a", "A", {}, _handler))
+        registry.register(ToolSpec("b", "B", {}, _handler, writes=True))
+
+        listing = registry.listing()
+        assert registry.listing() is listing
+        assert json.loads(listing.encoded) == listing
+        assert [t["name"] for t in registry.listing(frozenset({"a"}))["tools"]] == ["b"]
+        assert registry.write_tools == {"b"}
+
+    def test_builtin_write_tools(self):
+        assert TOOLS.write_tools == {
+            "create_graph",
+            "add_nodes",
+            "add_edges",
+            "import_csv",
+            "build_citation_network",
+        }
+
+
+class TestServerListing:
+    """tools/list is answered from the cached, pre-encoded listing."""
+
+    @pytest.mark.asyncio
+    async def test_tools_list_is_pre_encoded(self):
+        server = NetworkXMCPServer()
+        server.initialized = True
+        response = await server.handle_request(
+            {"jsonrpc": "2.0", "id": 7, "method": "tools/list"}
+        )
+
+        assert isinstance(response["result"], PreEncoded)
+        names = [tool["name"] for tool in response["result"]["tools"]]
+        assert "health_status" not in names
+        assert json.loads(encode_response(response)) == json.loads(json.dumps(response))
@@ -0,0 +1,135 @@
+"""Tests for the asyncio stdio stream transport."""
+
+import asyncio
+import io
+import json
+import os
+
+import pytest
+
+from networkx_mcp.server import NetworkXMCPServer, graphs
+from networkx_mcp.transport import StdioTransport
+from tests.factories import MCPFactory
+
+
+def _serve_over_pipes(server, monkeypatch, lines):
+    """Run ``server`` with stdin/stdout connected to OS pipes."""
+    in_read, in_write = os.pipe()
+    out_read, out_write = os.pipe()
+    with os.fdopen(in_write, "wb") as feed:
+        feed.write(b"".join(line + b"\n" for line in lines))
+
+    stdin = os.fdopen(in_read, "r")
+    stdout = os.fdopen(out_write, "w")
+    monkeypatch.setattr("sys.stdin", stdin)
+    monkeypatch.setattr("sys.stdout", stdout)
+    try:
+        asyncio.run(server.run())
+    finally:
+        stdin.close()
+        stdout.close()
+
+    with os.fdopen(out_read, "rb") as output:
+        return [json.loads(line) for line in output.read().splitlines()]
+
+
+class TestStdioTransport:
+    """Reading, bounding and coalescing messages on real pipes."""
+
+    def setup_method(self):
+        graphs.clear()
+
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    def test_round_trip(self, monkeypatch, max_concurrency):
+        server = NetworkXMCPServer(max_concurrency=max_concurrency)
+        server.initialized = True
+        requests = [
+            MCPFactory.tool_call(1, "create_graph", name="piped"),
+            MCPFactory.tool_call(2, "add_nodes", graph="piped", nodes=[1, 2, 3]),
+            MCPFactory.tool_call(3, "get_info", graph="piped"),
+        ]
+
+        responses = _serve_over_pipes(
+            server, monkeypatch, [json.dumps(r).encode() for r in requests]
+        )
+
+        by_id = {r["id"]: r for r in responses}
+        assert sorted(by_id) == [1, 2, 3]
+        info = json.loads(by_id[3]["result"]["content"][0]["text"])
+        assert info["nodes"] == 3
+
+    def test_oversized_request_is_rejected_and_skipped(self, monkeypatch):
+        server = NetworkXMCPServer(max_message_bytes=256)
+        server.initialized = True
+        lines = [
+            json.dumps({"padding": "x" * 5000}).encode(),
+            json.dumps({"jsonrpc": "2.0", "id": 1, "method": "prompts/list"}).encode(),
+        ]
+
+        responses = _serve_over_pipes(server, monkeypatch, lines)
+
+        assert responses[0]["error"]["code"] == -32600
+        assert responses[0]["id"] is None
+        assert responses[1] == {"jsonrpc": "2.0", "id": 1, "result": {"prompts": []}}
+
+    def test_oversized_response_is_replaced(self, monkeypatch):
+        server = NetworkXMCPServer(max_message_bytes=200)
+        server.initialized = True
+        request = {"jsonrpc": "2.0", "id": 9, "method": "tools/list"}
+
+        (response,) = _serve_over_pipes(
+            server, monkeypatch, [json.dumps(request).encode()]
+        )
+
+        assert response["id"] == 9
+        assert response["error"]["code"] == -32603
+
+    @pytest.mark.asyncio
+    async def test_messages_coalesced_into_one_write(self):
+        out_read, out_write = os.pipe()
+        in_read, in_write = os.pipe()
+        os.close(in_write)
+        with os.fdopen(in_read, "r") as stdin, os.fdopen(out_write, "w") as stdout:
+            transport = await StdioTransport.open(stdin, stdout)
+            assert transport is not None
+            for i in range(10):
+                transport.send(json.dumps({"id": i}).encode())
+            await asyncio.sleep(0)
+            assert await transport.read_message() == b""
+            await transport.close()
+
+        assert transport.messages_written == 10
+        assert transport.writes == 1
+        with os.fdopen(out_read, "rb") as output:
+            assert len(output.read().splitlines()) == 10
+
+    @pytest.mark.asyncio
+    async def test_close_restores_blocking_mode(self):
+        out_read, out_write = os.pipe()
+        in_read, in_write = os.pipe()
+        with os.fdopen(in_read, "r") as stdin, os.fdopen(out_write, "w") as stdout:
+            transport = await StdioTransport.open(stdin, stdout)
+            assert transport is not None
+            assert not os.get_blocking(in_read) and not os.get_blocking(out_write)
+            await transport.close()
+            assert os.get_blocking(in_read) and os.get_blocking(out_write)
+        os.close(in_write)
+        os.close(out_read)
+
+    @pytest.mark.asyncio
+    async def test_stderr_on_stdout_pipe_falls_back(self):
+        out_read, out_write = os.pipe()
+        in_read, in_write = os.pipe()
+        with (
+            os.fdopen(in_read, "r") as stdin,
+            os.fdopen(out_write, "w") as stdout,
+            os.fdopen(os.dup(out_write), "w") as stderr,
+        ):
+            assert await StdioTransport.open(stdin, stdout, stderr=stderr) is None
+            assert os.get_blocking(in_read) and os.get_blocking(out_write)
+        os.close(in_write)
+        os.close(out_read)
+
+    @pytest.mark.asyncio
+    async def test_unsupported_streams_fall_back(self):
+        assert await StdioTransport.open(io.StringIO(), io.StringIO()) is None
@@ -76,9 +76,13 @@ class TestGraphOperations:
 
         assert result["num_nodes"] == 3
         assert result["num_edges"] == 2
+        assert result["degree"] == {"min": 1, "max": 2, "mean": 4 / 3}
+        assert "nodes" not in result
+        assert not result["directed"]
+
+        result = get_graph_info("test_info", include_elements=True)
         assert len(result["nodes"]) == 3
         assert len(result["edges"]) == 2
-        assert not result["directed"]
 
     def test_shortest_path(self):
         """Test shortest path calculation."""